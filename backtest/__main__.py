@@ -0,0 +1,39 @@
+import json
+import time
+
+import typer
+
+from backtest.engine import STRATEGIES, BacktestEngine, load_agg_trades_csv
+from utils.fileutils import get_inputs_from_file
+
+
+def main(
+    trades_file: str,
+    config_file: str = "my_trading.json",
+    initial_balance: float = 1000.0,
+    interval_seconds: float = 0.0,
+    maker_fee: float = 0.0002,
+    taker_fee: float = 0.0005,
+    fill_on_touch: bool = False,
+) -> None:
+    file_input = get_inputs_from_file(file_name=config_file)
+    trades = load_agg_trades_csv(trades_file)
+    started = time.perf_counter()
+    report = BacktestEngine(
+        file_input=file_input,
+        strategy_class=STRATEGIES[file_input.strategy],
+        trades=trades,
+        initial_balance=initial_balance,
+        interval_seconds=interval_seconds or None,
+        maker_fee=maker_fee,
+        taker_fee=taker_fee,
+        fill_on_touch=fill_on_touch,
+    ).run()
+    summary = report.summary()
+    summary["trades"] = len(trades)
+    summary["seconds"] = time.perf_counter() - started
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    typer.run(function=main)
@@ -0,0 +1,207 @@
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from backtest.matching import FILL_DTYPE, MatchingEngine
+from backtest.repository import SimulatedTradeRepo
+from base.models.FileInput import FileInput
+from data.enums import ExecutorBackend, Strategy
+from strategy.TradeStrategy import TradeStrategy
+from strategy.all_price_match_queue import AllPriceMatchQueueStrategy
+from strategy.executor import OrderExecutor
+from strategy.fixed_range import FixedRangeStrategy
+
+STRATEGIES: dict[Strategy, type[TradeStrategy]] = {
+    Strategy.FIXED_RANGE: FixedRangeStrategy,
+    Strategy.PRICE_MATCH_QUEUE: AllPriceMatchQueueStrategy,
+}
+TRADE_DTYPE = np.dtype(
+    [
+        ("time", np.int64),
+        ("price", np.float64),
+        ("quantity", np.float64),
+        ("is_buyer_maker", np.bool_),
+    ]
+)
+SNAPSHOT_DTYPE = np.dtype(
+    [
+        ("time", np.int64),
+        ("price", np.float64),
+        ("position", np.float64),
+        ("entry_price", np.float64),
+        ("wallet_balance", np.float64),
+        ("unrealized", np.float64),
+        ("equity", np.float64),
+        ("fees", np.float64),
+        ("open_orders", np.int64),
+        ("fills", np.int64),
+    ]
+)
+
+
+def load_agg_trades_csv(file_name: str) -> np.ndarray:
+    with open(file=file_name, mode="r", encoding="utf-8") as f:
+        skip_header = 0 if f.readline()[:1].isdigit() else 1
+    raw = np.genfromtxt(
+        file_name,
+        delimiter=",",
+        skip_header=skip_header,
+        usecols=(1, 2, 5, 6),
+        dtype=[
+            ("price", np.float64),
+            ("quantity", np.float64),
+            ("time", np.int64),
+            ("is_buyer_maker", "U5"),
+        ],
+        ndmin=1,
+    )
+    trades = np.empty(len(raw), dtype=TRADE_DTYPE)
+    trades["time"] = raw["time"]
+    trades["price"] = raw["price"]
+    trades["quantity"] = raw["quantity"]
+    trades["is_buyer_maker"] = np.char.lower(raw["is_buyer_maker"]) == "true"
+    return trades
+
+
+@dataclass
+class BacktestReport:
+    initial_balance: float
+    snapshots: np.ndarray
+    fills: np.ndarray
+
+    @property
+    def pnl(self) -> float:
+        if len(self.snapshots) == 0:
+            return 0.0
+        return float(self.snapshots["equity"][-1]) - self.initial_balance
+
+    @property
+    def fees(self) -> float:
+        return float(self.fills["fee"].sum())
+
+    @property
+    def volume(self) -> float:
+        return float((self.fills["price"] * self.fills["quantity"]).sum())
+
+    @property
+    def max_inventory(self) -> float:
+        if len(self.snapshots) == 0:
+            return 0.0
+        return float(np.abs(self.snapshots["position"]).max())
+
+    @property
+    def max_drawdown(self) -> float:
+        if len(self.snapshots) == 0:
+            return 0.0
+        equity = self.snapshots["equity"]
+        return float((np.maximum.accumulate(equity) - equity).max())
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "pnl": self.pnl,
+            "fees": self.fees,
+            "fills": len(self.fills),
+            "maker_fills": int(self.fills["maker"].sum()),
+            "volume": self.volume,
+            "final_position": float(self.snapshots["position"][-1])
+            if len(self.snapshots)
+            else 0.0,
+            "max_inventory": self.max_inventory,
+            "max_drawdown": self.max_drawdown,
+            "cycles": len(self.snapshots),
+        }
+
+
+class BacktestEngine:
+    def __init__(
+        self,
+        file_input: FileInput,
+        strategy_class: type[TradeStrategy],
+        trades: np.ndarray,
+        initial_balance: float = 1000.0,
+        interval_seconds: float | None = None,
+        tick_size: float = 0.1,
+        maker_fee: float = 0.0002,
+        taker_fee: float = 0.0005,
+        fill_on_touch: bool = False,
+    ) -> None:
+        if len(trades) == 0:
+            raise ValueError("trades must not be empty")
+        self.file_input = file_input
+        self.strategy_class = strategy_class
+        self.trades = trades
+        self.interval_ms = int(
+            1000 * (interval_seconds or self.file_input.delay_seconds)
+        )
+        if self.interval_ms <= 0:
+            raise ValueError("interval_seconds must be positive")
+        self.matching = MatchingEngine(
+            tick_size=tick_size,
+            maker_fee=maker_fee,
+            taker_fee=taker_fee,
+            fill_on_touch=fill_on_touch,
+        )
+        self.repo = SimulatedTradeRepo(
+            engine=self.matching,
+            initial_balance=initial_balance,
+            leverage=self.file_input.leverage,
+            position_side=self.file_input.position_side,
+        )
+
+    def get_bucket_bounds(self) -> np.ndarray:
+        times = self.trades["time"]
+        boundaries = np.arange(times[0], times[-1] + self.interval_ms, self.interval_ms)
+        bounds = np.searchsorted(times, boundaries, side="left")
+        return np.append(bounds, len(times))
+
+    def run(self) -> BacktestReport:
+        trades = self.trades
+        bounds = self.get_bucket_bounds()
+        snapshots = np.empty(len(bounds) - 1, dtype=SNAPSHOT_DTYPE)
+        executor = OrderExecutor(backend=ExecutorBackend.THREAD, max_workers=1)
+        strategy = self.strategy_class(
+            file_input=self.file_input, repo=self.repo, executor=executor
+        )
+        self.matching.set_market(
+            trades["time"][0], trades["price"][0], trades["is_buyer_maker"][0]
+        )
+        count = 0
+        try:
+            for start, end in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+                if start == end:
+                    continue
+                if (
+                    not self.file_input.reconcile
+                    or self.file_input.strategy is not Strategy.FIXED_RANGE
+                ):
+                    self.repo.cancel_all_orders(self.file_input.symbol)
+                strategy.run_loop()
+                self.matching.match_trades(
+                    trades["time"][start:end],
+                    trades["price"][start:end],
+                    trades["is_buyer_maker"][start:end],
+                    trades["quantity"][start:end],
+                )
+                snapshots[count] = (
+                    self.matching.time,
+                    self.matching.last_price,
+                    self.repo.position_amount,
+                    self.repo.entry_price,
+                    self.repo.wallet_balance,
+                    self.repo.unrealized_pnl,
+                    self.repo.equity,
+                    self.repo.fees,
+                    len(self.matching.orders),
+                    len(self.matching.fills),
+                )
+                count += 1
+        finally:
+            executor.shutdown()
+        return BacktestReport(
+            initial_balance=self.repo.initial_balance,
+            snapshots=snapshots[:count],
+            fills=self.matching.get_fills()
+            if self.matching.fills
+            else np.empty(0, dtype=FILL_DTYPE),
+        )
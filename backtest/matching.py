@@ -0,0 +1,290 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import numpy as np
+
+from data.enums import OrderStatus, OrderType, Side, TimeInForce
+from utils.reconcileutils import enum_value
+
+FILL_DTYPE = np.dtype(
+    [
+        ("time", np.int64),
+        ("order_id", np.int64),
+        ("side", np.int8),
+        ("price", np.float64),
+        ("quantity", np.float64),
+        ("fee", np.float64),
+        ("maker", np.bool_),
+    ]
+)
+POST_ONLY_REJECTED = {
+    "code": -5022,
+    "msg": "Due to the order could not be executed as maker, the Post Only order will be rejected.",
+}
+UNKNOWN_ORDER = {"code": -2011, "msg": "Unknown order sent."}
+QUANTITY_EPSILON = 1e-12
+
+
+@dataclass
+class SimulatedOrder:
+    order_id: int
+    symbol: str
+    side: str
+    position_side: str
+    price: float
+    quantity: float
+    order_type: str = OrderType.LIMIT.value
+    time_in_force: str = TimeInForce.GTC.value
+    price_match: str = "NONE"
+    executed_quantity: float = 0.0
+    status: str = OrderStatus.NEW.value
+    time: int = 0
+
+    @property
+    def remaining(self) -> float:
+        return self.quantity - self.executed_quantity
+
+    def to_response(self) -> dict[str, Any]:
+        return {
+            "orderId": self.order_id,
+            "symbol": self.symbol,
+            "status": self.status,
+            "clientOrderId": f"backtest-{self.order_id}",
+            "price": str(self.price),
+            "avgPrice": str(self.price if self.executed_quantity else 0.0),
+            "origQty": str(self.quantity),
+            "executedQty": str(self.executed_quantity),
+            "type": self.order_type,
+            "timeInForce": self.time_in_force,
+            "side": self.side,
+            "positionSide": self.position_side,
+            "priceMatch": self.price_match,
+            "updateTime": self.time,
+        }
+
+
+class MatchingEngine:
+    def __init__(
+        self,
+        tick_size: float = 0.1,
+        maker_fee: float = 0.0002,
+        taker_fee: float = 0.0005,
+        fill_on_touch: bool = False,
+        on_fill: Callable[[tuple], None] | None = None,
+    ) -> None:
+        self.tick_size = tick_size
+        self.maker_fee = maker_fee
+        self.taker_fee = taker_fee
+        self.fill_on_touch = fill_on_touch
+        self.on_fill = on_fill
+        self.time = 0
+        self.best_bid = 0.0
+        self.best_ask = 0.0
+        self.last_price = 0.0
+        self.orders: dict[int, SimulatedOrder] = {}
+        self.fills: list[tuple] = []
+        self._next_order_id = 1
+
+    def set_market(self, time: int, price: float, is_buyer_maker: bool) -> None:
+        self.time = int(time)
+        self.last_price = float(price)
+        if is_buyer_maker:
+            self.best_bid, self.best_ask = self.last_price, self.last_price + self.tick_size
+        else:
+            self.best_bid, self.best_ask = self.last_price - self.tick_size, self.last_price
+
+    def resolve_price(self, side: str, price: float, price_match: str) -> float:
+        if price_match in ["NONE", None]:
+            return price
+        levels = int(price_match.rpartition("_")[2]) if "_" in price_match else 1
+        offset = (levels - 1) * self.tick_size
+        queue = price_match.startswith("QUEUE")
+        if side == Side.BUY.value:
+            return self.best_bid - offset if queue else self.best_ask + offset
+        return self.best_ask + offset if queue else self.best_bid - offset
+
+    def crosses(self, side: str, price: float) -> bool:
+        if side == Side.BUY.value:
+            return price >= self.best_ask
+        return price <= self.best_bid
+
+    def submit(self, order: dict[str, Any]) -> dict[str, Any]:
+        side = enum_value(order["side"])
+        price_match = enum_value(order.get("priceMatch", "NONE"))
+        simulated = SimulatedOrder(
+            order_id=self._next_order_id,
+            symbol=enum_value(order["symbol"]),
+            side=side,
+            position_side=enum_value(order.get("positionSide", "BOTH")),
+            price=self.resolve_price(side, float(order.get("price", 0.0)), price_match),
+            quantity=float(order["quantity"]),
+            order_type=enum_value(order.get("type", OrderType.LIMIT.value)),
+            time_in_force=enum_value(order.get("timeInForce", TimeInForce.GTC.value)),
+            price_match=price_match,
+            time=self.time,
+        )
+        if simulated.quantity <= 0.0:
+            return {"code": -4003, "msg": "Quantity less than or equal to zero."}
+        self._next_order_id += 1
+        if self.crosses(simulated.side, simulated.price):
+            if simulated.time_in_force == TimeInForce.GTX.value:
+                simulated.status = OrderStatus.EXPIRED.value
+                return POST_ONLY_REJECTED
+            fill_price = self.best_ask if side == Side.BUY.value else self.best_bid
+            self._fill(simulated, self.time, fill_price, maker=False)
+            return simulated.to_response()
+        self.orders[simulated.order_id] = simulated
+        return simulated.to_response()
+
+    def modify(self, order: dict[str, Any]) -> dict[str, Any]:
+        simulated = self.orders.get(int(order["orderId"]))
+        if simulated is None:
+            return UNKNOWN_ORDER
+        price = float(order["price"])
+        if self.crosses(simulated.side, price):
+            if simulated.time_in_force == TimeInForce.GTX.value:
+                self.orders.pop(simulated.order_id)
+                simulated.status = OrderStatus.EXPIRED.value
+                return POST_ONLY_REJECTED
+        simulated.price = price
+        simulated.quantity = float(order["quantity"])
+        simulated.time = self.time
+        if simulated.remaining <= 0.0:
+            self.orders.pop(simulated.order_id)
+            simulated.status = OrderStatus.FILLED.value
+        elif self.crosses(simulated.side, price):
+            fill_price = self.best_ask if simulated.side == Side.BUY.value else self.best_bid
+            self.orders.pop(simulated.order_id)
+            self._fill(simulated, self.time, fill_price, maker=False)
+        return simulated.to_response()
+
+    def cancel(self, order_id: int) -> dict[str, Any]:
+        simulated = self.orders.pop(int(order_id), None)
+        if simulated is None:
+            return UNKNOWN_ORDER
+        simulated.status = OrderStatus.CANCELED.value
+        return simulated.to_response()
+
+    def cancel_all(self) -> None:
+        for order_id in list(self.orders):
+            self.cancel(order_id)
+
+    def open_orders(self) -> list[dict[str, Any]]:
+        return [o.to_response() for o in self.orders.values()]
+
+    def match_trades(
+        self,
+        times: np.ndarray,
+        prices: np.ndarray,
+        is_buyer_maker: np.ndarray,
+        quantities: np.ndarray | None = None,
+    ) -> int:
+        if len(prices) == 0:
+            return 0
+        fills = 0
+        if self.orders and quantities is not None:
+            fills = self.match_trade_quantities(times, prices, quantities)
+        elif self.orders:
+            orders = list(self.orders.values())
+            order_prices = np.fromiter((o.price for o in orders), np.float64, len(orders))
+            is_buy = np.fromiter(
+                (o.side == Side.BUY.value for o in orders), np.bool_, len(orders)
+            )
+            search_side = "left" if self.fill_on_touch else "right"
+            lows = -np.minimum.accumulate(prices)
+            highs = np.maximum.accumulate(prices)
+            indexes = np.where(
+                is_buy,
+                np.searchsorted(lows, -order_prices, side=search_side),
+                np.searchsorted(highs, order_prices, side=search_side),
+            )
+            filled = np.flatnonzero(indexes < len(prices))
+            for i in filled[np.argsort(indexes[filled], kind="stable")]:
+                order = orders[i]
+                self.orders.pop(order.order_id)
+                self._fill(order, int(times[indexes[i]]), order.price, maker=True)
+                fills += 1
+        self.set_market(times[-1], prices[-1], bool(is_buyer_maker[-1]))
+        return fills
+
+    def match_trade_quantities(
+        self, times: np.ndarray, prices: np.ndarray, quantities: np.ndarray
+    ) -> int:
+        orders = list(self.orders.values())
+        buys = [o for o in orders if o.side == Side.BUY.value]
+        sells = [o for o in orders if o.side != Side.BUY.value]
+        buys = deque(sorted(buys, key=lambda o: -o.price))
+        sells = deque(sorted(sells, key=lambda o: o.price))
+        max_buy = buys[0].price if buys else -np.inf
+        min_sell = sells[0].price if sells else np.inf
+        if self.fill_on_touch:
+            active = np.flatnonzero((prices <= max_buy) | (prices >= min_sell))
+        else:
+            active = np.flatnonzero((prices < max_buy) | (prices > min_sell))
+        fills = 0
+        for time, price, quantity in zip(
+            times[active].tolist(), prices[active].tolist(), quantities[active].tolist()
+        ):
+            fills += self.fill_queue(buys, 1.0, time, price, quantity)
+            fills += self.fill_queue(sells, -1.0, time, price, quantity)
+            if not buys and not sells:
+                break
+        return fills
+
+    def fill_queue(
+        self,
+        queue: deque[SimulatedOrder],
+        sign: float,
+        time: int,
+        price: float,
+        quantity: float,
+    ) -> int:
+        fills = 0
+        while queue and quantity > QUANTITY_EPSILON:
+            order = queue[0]
+            gap = sign * (order.price - price)
+            if gap < 0.0 or (gap == 0.0 and not self.fill_on_touch):
+                break
+            filled = min(order.remaining, quantity)
+            quantity -= filled
+            if order.remaining - filled <= QUANTITY_EPSILON:
+                queue.popleft()
+                self.orders.pop(order.order_id)
+                filled = order.remaining
+            self._fill(order, time, order.price, maker=True, quantity=filled)
+            fills += 1
+        return fills
+
+    def _fill(
+        self,
+        order: SimulatedOrder,
+        time: int,
+        price: float,
+        maker: bool,
+        quantity: float | None = None,
+    ) -> None:
+        quantity = order.remaining if quantity is None else quantity
+        fee = price * quantity * (self.maker_fee if maker else self.taker_fee)
+        order.executed_quantity += quantity
+        if order.remaining <= QUANTITY_EPSILON:
+            order.executed_quantity = order.quantity
+            order.status = OrderStatus.FILLED.value
+        else:
+            order.status = OrderStatus.PARTIALLY_FILLED.value
+        order.time = time
+        fill = (
+            time,
+            order.order_id,
+            1 if order.side == Side.BUY.value else -1,
+            price,
+            quantity,
+            fee,
+            maker,
+        )
+        self.fills.append(fill)
+        if self.on_fill is not None:
+            self.on_fill(fill)
+
+    def get_fills(self) -> np.ndarray:
+        return np.array(self.fills, dtype=FILL_DTYPE)
@@ -0,0 +1,215 @@
+import threading
+from typing import Any
+
+from backtest.matching import MatchingEngine
+from data.enums import (
+    OrderType,
+    PositionSide,
+    PriceMatch,
+    PriceMatchNone,
+    Side,
+    TickerSymbol,
+    TimeInForce,
+)
+from model import ChangeInitialLeverage
+from network.responses.responses import (
+    AccountInfoResponse,
+    CancelAllOrdersResponse,
+    MarkPriceResponse,
+    PositionInformationResponse,
+)
+
+
+class SimulatedTradeRepo:
+    def __init__(
+        self,
+        engine: MatchingEngine,
+        initial_balance: float = 1000.0,
+        leverage: int = 1,
+        max_notional_value: float = 1_000_000_000.0,
+        position_side: PositionSide = PositionSide.BOTH,
+    ) -> None:
+        self.engine = engine
+        self.engine.on_fill = self.on_fill
+        self.initial_balance = initial_balance
+        self.wallet_balance = initial_balance
+        self.leverage = leverage
+        self.max_notional_value = max_notional_value
+        self.position_side = position_side
+        self.position_amount = 0.0
+        self.entry_price = 0.0
+        self.realized_pnl = 0.0
+        self.fees = 0.0
+        self._lock = threading.RLock()
+
+    def on_fill(self, fill: tuple) -> None:
+        _, _, side, price, quantity, fee, _ = fill
+        signed_quantity = side * quantity
+        self.fees += fee
+        self.wallet_balance -= fee
+        if self.position_amount == 0.0 or self.position_amount * signed_quantity > 0.0:
+            total = abs(self.position_amount) + quantity
+            self.entry_price = (
+                self.entry_price * abs(self.position_amount) + price * quantity
+            ) / total
+            self.position_amount += signed_quantity
+            return
+        closed = min(quantity, abs(self.position_amount))
+        direction = 1.0 if self.position_amount > 0.0 else -1.0
+        realized = closed * (price - self.entry_price) * direction
+        self.realized_pnl += realized
+        self.wallet_balance += realized
+        self.position_amount += signed_quantity
+        if abs(self.position_amount) < 1e-12:
+            self.position_amount = 0.0
+            self.entry_price = 0.0
+        elif self.position_amount * direction < 0.0:
+            self.entry_price = price
+
+    @property
+    def unrealized_pnl(self) -> float:
+        return self.position_amount * (self.engine.last_price - self.entry_price)
+
+    @property
+    def equity(self) -> float:
+        return self.wallet_balance + self.unrealized_pnl
+
+    def get_available_balance(self) -> float:
+        position_margin = (
+            abs(self.position_amount) * self.engine.last_price / self.leverage
+        )
+        order_margin = (
+            sum(
+                o.price * o.remaining
+                for o in self.engine.orders.values()
+                if o.side == Side.BUY.value
+            )
+            / self.leverage
+        )
+        return max(self.equity - position_margin - order_margin, 0.0)
+
+    def get_account_info(
+        self, fields: list[str] | None = None
+    ) -> AccountInfoResponse:
+        with self._lock:
+            return AccountInfoResponse.model_construct(
+                totalWalletBalance=self.wallet_balance,
+                totalCrossWalletBalance=str(self.wallet_balance),
+                totalUnrealizedProfit=str(self.unrealized_pnl),
+                totalMarginBalance=str(self.equity),
+                totalMaintMargin=0.0,
+                totalCrossUnPnl=self.unrealized_pnl,
+                availableBalance=self.get_available_balance(),
+                updateTime=self.engine.time,
+                assets=[],
+                positions=[],
+            )
+
+    def get_cross_wallet_balance(self) -> float:
+        return self.wallet_balance
+
+    def get_mark_price(self, symbol: TickerSymbol) -> MarkPriceResponse:
+        return MarkPriceResponse.model_construct(
+            symbol=symbol.name,
+            markPrice=self.engine.last_price,
+            indexPrice=self.engine.last_price,
+            time=self.engine.time,
+        )
+
+    def get_ticker_price(self, symbol: TickerSymbol) -> float:
+        return self.engine.last_price
+
+    def get_position_risk(self, symbol: TickerSymbol) -> PositionInformationResponse:
+        with self._lock:
+            return PositionInformationResponse.model_construct(
+                symbol=symbol.name,
+                positionAmt=self.position_amount,
+                entryPrice=self.entry_price,
+                breakEvenPrice=self.entry_price,
+                markPrice=self.engine.last_price,
+                unRealizedProfit=self.unrealized_pnl,
+                liquidationPrice=0.0,
+                leverage=self.leverage,
+                maxNotionalValue=self.max_notional_value,
+                marginType="cross",
+                isolatedMargin=0.0,
+                isAutoAddMargin=False,
+                positionSide=self.position_side.name,
+                notional=self.position_amount * self.engine.last_price,
+                isolatedWallet="0",
+                updateTime=self.engine.time,
+            )
+
+    def new_order(
+        self,
+        symbol: TickerSymbol,
+        side: Side,
+        quantity: float,
+        position_side: PositionSide,
+        price: float = -1.0,
+        order_type: OrderType = OrderType.LIMIT,
+        time_in_force: TimeInForce = TimeInForce.GTC,
+        price_match: PriceMatch = PriceMatchNone.NONE,
+    ) -> Any | dict[Any, Any]:
+        with self._lock:
+            return self.engine.submit(
+                {
+                    "symbol": symbol,
+                    "side": side,
+                    "type": order_type,
+                    "quantity": quantity,
+                    "timeInForce": time_in_force,
+                    "positionSide": position_side,
+                    "price": price,
+                    "priceMatch": price_match,
+                }
+            )
+
+    def new_batch_order(self, orders: list) -> Any | dict[Any, Any]:
+        with self._lock:
+            return [self.engine.submit(order) for order in orders]
+
+    def modify_batch_order(self, orders: list) -> Any | dict[Any, Any]:
+        with self._lock:
+            return [self.engine.modify(order) for order in orders]
+
+    def cancel_batch_order(
+        self, symbol: TickerSymbol, order_ids: list[int]
+    ) -> Any | dict[Any, Any]:
+        with self._lock:
+            return [self.engine.cancel(order_id) for order_id in order_ids]
+
+    def cancel_all_orders(self, symbol: TickerSymbol) -> CancelAllOrdersResponse:
+        with self._lock:
+            self.engine.cancel_all()
+        return CancelAllOrdersResponse(
+            code=200, msg="The operation of cancel all open order is done."
+        )
+
+    def get_open_orders(self, symbol: TickerSymbol) -> Any | dict[Any, Any]:
+        with self._lock:
+            return self.engine.open_orders()
+
+    def get_time(
+        self,
+    ) -> int:
+        return self.engine.time
+
+    def get_depth(self, symbol: TickerSymbol, limit: int = 5):
+        return {
+            "lastUpdateId": self.engine.time,
+            "E": self.engine.time,
+            "T": self.engine.time,
+            "bids": [[str(self.engine.best_bid), "1.0"]],
+            "asks": [[str(self.engine.best_ask), "1.0"]],
+        }
+
+    def change_initial_leverage(
+        self, symbol: TickerSymbol, leverage: int
+    ) -> ChangeInitialLeverage:
+        self.leverage = leverage
+        return ChangeInitialLeverage(
+            leverage=leverage,
+            maxNotionalValue=str(self.max_notional_value),
+            symbol=symbol.name,
+        )
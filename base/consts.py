@@ -10,3 +10,4 @@ class Settings(BaseSettings):
     SECRET: str = Field(default="", alias="SECRET")
     BASE_URL: str = Field(default="", alias="BASE_URL")
     STREAM_URL: str = Field(default="", alias="STREAM_URL")
+    WS_API_URL: str = Field(default="", alias="WS_API_URL")
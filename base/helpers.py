@@ -1,4 +1,6 @@
+import contextlib
 from enum import Enum
+from typing import Any, Iterator
 
 
 class Singleton(type):
@@ -10,6 +12,18 @@ class Singleton(type):
         return cls._instances[cls]
 
 
+@contextlib.contextmanager
+def replace_singleton(cls: type, *args, **kwargs) -> Iterator[Any]:
+    previous = Singleton._instances.pop(cls, None)
+    instance = cls(*args, **kwargs)
+    try:
+        yield instance
+    finally:
+        Singleton._instances.pop(cls, None)
+        if previous is not None:
+            Singleton._instances[cls] = previous
+
+
 class AutoName(Enum):
     # noinspection PyMethodParameters
     def _generate_next_value_(name, start, count, last_values):
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from base.models.FileInput import FileInput
+
+
+class AccountInput(BaseModel):
+    name: str
+    key: str
+    secret: str
+    base_url: str = ""
+    stream_url: str = ""
+    strategies: list[FileInput]
@@ -2,7 +2,14 @@ from __future__ import annotations
 
 from pydantic import BaseModel
 
-from data.enums import PositionSide, Strategy, TickerSymbol, TimeInForce
+from data.enums import (
+    ExecutorBackend,
+    OrderTransport,
+    PositionSide,
+    Strategy,
+    TickerSymbol,
+    TimeInForce,
+)
 
 
 class FileInput(BaseModel):
@@ -22,4 +29,20 @@ class FileInput(BaseModel):
     market_making: bool = False
     mm_sell_quantity: float = 0.0
     mm_buy_quantity: float = 0.0
+    buy_volume_scale: float = 0.0
+    sell_volume_scale: float = 0.0
     leverage: int = 1
+    reconcile: bool = True
+    reconcile_price_tolerance: float = 0.0
+    reconcile_quantity_tolerance: float = 0.0
+    executor_backend: ExecutorBackend = ExecutorBackend.THREAD
+    executor_workers: int = 40
+    order_transport: OrderTransport = OrderTransport.REST
+    event_driven: bool = True
+    trigger_ticks: int = 10
+    debounce_seconds: float = 0.25
+    record: bool = False
+    record_directory: str = "recordings"
+    display_frame_rate: float = 4.0
+    metrics_port: int = 0
+    metrics_summary_seconds: float = 0.0
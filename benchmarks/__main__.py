@@ -0,0 +1,46 @@
+import os
+
+import typer
+
+from benchmarks.suite import (
+    DEFAULT_BASELINE,
+    compare_results,
+    format_comparison,
+    format_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+
+
+def main(
+    names: list[str] = typer.Argument(None),
+    repeat: int = 5,
+    scale: float = 1.0,
+    save: str = "",
+    baseline: str = DEFAULT_BASELINE,
+    current: str = "",
+    compare: bool = True,
+    threshold: float = 0.25,
+) -> None:
+    if current:
+        results = load_results(current)
+    else:
+        results = run_benchmarks(names=names, repeat=repeat, scale=scale)
+        print(format_results(results))
+    if save:
+        save_results(results, save)
+    if not compare or (save and os.path.abspath(save) == os.path.abspath(baseline)):
+        return
+    try:
+        rows = compare_results(results, load_results(baseline), threshold=threshold)
+    except FileNotFoundError:
+        print(f"no baseline at {baseline}, run with --save {baseline} to create one")
+        return
+    print(format_comparison(rows))
+    if any(row["status"] == "slower" for row in rows):
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    typer.run(function=main)
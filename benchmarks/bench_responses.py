@@ -0,0 +1,143 @@
+import timeit
+import tracemalloc
+
+from network.responses.responses import (
+    AccountInfoResponse,
+    CompactAccountInfoResponse,
+    CompactPositionInformationResponse,
+    PositionInformationResponse,
+)
+
+ASSET = {
+    "walletBalance": "1000.00000000",
+    "unrealizedProfit": "0.00000000",
+    "marginBalance": "1000.00000000",
+    "maintMargin": "0.00000000",
+    "initialMargin": "0.00000000",
+    "positionInitialMargin": "0.00000000",
+    "openOrderInitialMargin": "0.00000000",
+    "crossWalletBalance": "1000.00000000",
+    "crossUnPnl": "0.00000000",
+    "availableBalance": "1000.00000000",
+    "maxWithdrawAmount": "1000.00000000",
+    "marginAvailable": True,
+    "updateTime": 1700000000000,
+}
+POSITION = {
+    "initialMargin": "0",
+    "maintMargin": "0",
+    "unrealizedProfit": "0.00000000",
+    "positionInitialMargin": "0",
+    "openOrderInitialMargin": "0",
+    "leverage": "20",
+    "isolated": False,
+    "entryPrice": "0.0",
+    "maxNotional": "250000",
+    "bidNotional": "0",
+    "askNotional": "0",
+    "positionSide": "BOTH",
+    "positionAmt": "0",
+    "updateTime": 0,
+}
+POSITION_RISK = {
+    "symbol": "BTCUSDT",
+    "positionAmt": "0.500",
+    "entryPrice": "30000.0",
+    "breakEvenPrice": "30012.0",
+    "markPrice": "30100.00000000",
+    "unRealizedProfit": "50.00000000",
+    "liquidationPrice": "0",
+    "leverage": "20",
+    "maxNotionalValue": "250000",
+    "marginType": "cross",
+    "isolatedMargin": "0.00000000",
+    "isAutoAddMargin": "false",
+    "positionSide": "BOTH",
+    "notional": "15050.00000000",
+    "isolatedWallet": "0",
+    "updateTime": 1700000000000,
+}
+
+
+def create_account(positions: int) -> dict:
+    return {
+        "feeTier": 0,
+        "canTrade": True,
+        "canDeposit": True,
+        "canWithdraw": True,
+        "updateTime": 0,
+        "multiAssetsMargin": False,
+        "tradeGroupId": -1,
+        "totalInitialMargin": "0.00000000",
+        "totalMaintMargin": "0.00000000",
+        "totalWalletBalance": "1000.00000000",
+        "totalUnrealizedProfit": "0.00000000",
+        "totalMarginBalance": "1000.00000000",
+        "totalPositionInitialMargin": "0.00000000",
+        "totalOpenOrderInitialMargin": "0.00000000",
+        "totalCrossWalletBalance": "1000.00000000",
+        "totalCrossUnPnl": "0.00000000",
+        "availableBalance": "1000.00000000",
+        "maxWithdrawAmount": "1000.00000000",
+        "assets": [{**ASSET, "asset": f"ASSET{i}"} for i in range(10)],
+        "positions": [
+            {**POSITION, "symbol": f"SYM{i}USDT"} for i in range(positions)
+        ],
+    }
+
+
+def pydantic_account(raw: dict) -> float:
+    return AccountInfoResponse(**raw).availableBalance
+
+
+def compact_account(raw: dict) -> float:
+    return CompactAccountInfoResponse(raw).availableBalance
+
+
+def projected_account(raw: dict) -> float:
+    return CompactAccountInfoResponse(raw, ["availableBalance"]).availableBalance
+
+
+def pydantic_position(raw: dict) -> float:
+    position = PositionInformationResponse(**raw)
+    return position.positionAmt * position.entryPrice
+
+
+def compact_position(raw: dict) -> float:
+    position = CompactPositionInformationResponse(raw)
+    return position.positionAmt * position.entryPrice
+
+
+def measure(function, number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e6
+
+
+def allocated(function) -> int:
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def run(number: int = 2000, positions: int = 300) -> dict[str, float]:
+    account = create_account(positions)
+    results = {}
+    for name, function in [
+        ("account_pydantic", pydantic_account),
+        ("account_compact", compact_account),
+        ("account_projected", projected_account),
+    ]:
+        results[f"{name}_us"] = measure(lambda: function(account), number)
+        results[f"{name}_bytes"] = allocated(lambda: function(account))
+    for name, function in [
+        ("position_pydantic", pydantic_position),
+        ("position_compact", compact_position),
+    ]:
+        results[f"{name}_us"] = measure(lambda: function(POSITION_RISK), number)
+    return results
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name:28} {value:10.2f}")
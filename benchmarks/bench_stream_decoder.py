@@ -0,0 +1,130 @@
+import json
+import timeit
+
+from data.enums import Side
+from data.order_book import OrderBookSide
+from network.stream_decoder import StreamDecoder
+
+ACK_MESSAGE = '{"result":null,"id":3}'
+
+DEPTH_MESSAGE = json.dumps(
+    {
+        "stream": "btcusdt@depth@100ms",
+        "data": {
+            "e": "depthUpdate",
+            "E": 1700000000000,
+            "T": 1700000000000,
+            "s": "BTCUSDT",
+            "U": 1000,
+            "u": 1010,
+            "pu": 999,
+            "b": [[f"{30000.0 - i / 10:.1f}", "1.234"] for i in range(40)],
+            "a": [[f"{30000.1 + i / 10:.1f}", "0.567"] for i in range(40)],
+        },
+    },
+    separators=(",", ":"),
+)
+ACCOUNT_MESSAGE = json.dumps(
+    {
+        "stream": "listenkey",
+        "data": {
+            "e": "ACCOUNT_UPDATE",
+            "E": 1700000000000,
+            "T": 1700000000000,
+            "a": {
+                "m": "ORDER",
+                "B": [{"a": "USDT", "wb": "1000.5", "cw": "1000.5", "bc": "0"}],
+                "P": [
+                    {
+                        "s": "BTCUSDT",
+                        "pa": "0.5",
+                        "ep": "30000.0",
+                        "bep": "30010.0",
+                        "cr": "12.5",
+                        "up": "1.0",
+                        "mt": "cross",
+                        "iw": "0",
+                        "ps": "LONG",
+                    }
+                ],
+            },
+        },
+    },
+    separators=(",", ":"),
+)
+
+
+def json_depth(book: OrderBookSide, message: str) -> None:
+    data = json.loads(message)
+    if "data" in message:
+        for price, quantity in data["data"]["b"]:
+            book.update(float(price), float(quantity))
+        for price, quantity in data["data"]["a"]:
+            book.update(float(price), float(quantity))
+
+
+def decoder_depth(book: OrderBookSide, decoder: StreamDecoder, message: str) -> None:
+    _, data = decoder.decode(message)
+    for price, quantity in data.bids:
+        book.update(price, quantity)
+    for price, quantity in data.asks:
+        book.update(price, quantity)
+
+
+def json_account(message: str) -> float:
+    data = json.loads(message)["data"]
+    total = 0.0
+    for position in data["a"]["P"]:
+        total += float(position["pa"]) + float(position["ep"])
+        total += float(position["bep"]) + float(position["up"]) + float(position["cr"])
+    total += float(data["a"]["P"][0]["ep"]) + float(data["a"]["P"][0]["bep"])
+    total += float(data["a"]["P"][0]["cr"]) + float(data["a"]["P"][0]["up"])
+    total += float(data["a"]["P"][0]["pa"]) + float(data["a"]["B"][0]["wb"])
+    return total
+
+
+def decoder_account(decoder: StreamDecoder, message: str) -> float:
+    _, data = decoder.decode(message)
+    total = 0.0
+    for position in data.positions:
+        total += position.position_amount + position.entry_price
+        total += (
+            position.break_even_price
+            + position.unrealized_profit
+            + position.accumulated_realized
+        )
+    position = data.positions[0]
+    total += position.entry_price + position.break_even_price
+    total += position.accumulated_realized + position.unrealized_profit
+    total += position.position_amount + data.balances[0].wallet_balance
+    return total
+
+
+def json_skip(message: str) -> None:
+    json.loads(message)
+
+
+def measure(function, number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e6
+
+
+def run(number: int = 20000) -> dict[str, float]:
+    decoder = StreamDecoder()
+    book = OrderBookSide(Side.BUY)
+    return {
+        "depth_json_us": measure(lambda: json_depth(book, DEPTH_MESSAGE), number),
+        "depth_decoder_us": measure(
+            lambda: decoder_depth(book, decoder, DEPTH_MESSAGE), number
+        ),
+        "account_json_us": measure(lambda: json_account(ACCOUNT_MESSAGE), number),
+        "account_decoder_us": measure(
+            lambda: decoder_account(decoder, ACCOUNT_MESSAGE), number
+        ),
+        "ack_json_us": measure(lambda: json_skip(ACK_MESSAGE), number),
+        "ack_decoder_us": measure(lambda: decoder.decode(ACK_MESSAGE), number),
+    }
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name:24} {value:8.2f}")
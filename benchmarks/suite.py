@@ -0,0 +1,398 @@
+import json
+import os
+import platform
+import statistics
+import timeit
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import numpy as np
+from binance.um_futures import UMFutures
+
+from backtest.matching import MatchingEngine
+from backtest.repository import SimulatedTradeRepo
+from base.models.FileInput import FileInput
+from benchmarks.bench_responses import (
+    POSITION_RISK,
+    compact_account,
+    compact_position,
+    create_account,
+    pydantic_account,
+    pydantic_position,
+)
+from benchmarks.bench_stream_decoder import ACCOUNT_MESSAGE
+from data.enums import AmountSpacing, PositionSide, Side, TickerSymbol, TimeInForce
+from display.display import generate_table
+from display.provider import (
+    ACCOUNT_INFO,
+    LAST_PRICE,
+    MARK_PRICE,
+    POSITION,
+    DisplayDataProvider,
+)
+from network.network import BinanceNetworkClient
+from network.order_encoder import BatchOrderEncoder
+from network.stream_decoder import StreamDecoder
+from repository.repository import stringify_orders
+from strategy.executor import ExecutorBackend, OrderExecutor
+from strategy.fixed_range import FixedRangeStrategy
+from utils.listutils import batched_lists
+from utils.mathutils import get_scaled_quantities
+from utils.orderutils import (
+    create_multiple_orders,
+    create_order_array,
+    get_buy_orders_quantities_and_prices,
+    get_sell_orders_quantities_and_prices,
+)
+
+SEED = 0
+MARK = 30000.0
+BASELINE_DIRECTORY = os.path.join(os.path.dirname(__file__), "baselines")
+DEFAULT_BASELINE = os.path.join(BASELINE_DIRECTORY, "default.json")
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    number: int = 100
+
+
+def buy_ladder() -> list[tuple[float, float]]:
+    return get_buy_orders_quantities_and_prices(
+        orders_num=100,
+        high_price=MARK * 0.9994,
+        low_price=MARK * 0.98,
+        available_balance=10000.0,
+        leverage=3,
+        mark_price=MARK,
+        max_notional_value=1_000_000.0,
+        notional=0.0,
+        side=PositionSide.LONG,
+        precision=3,
+        order_quantity_min=0.002,
+        order_quantity_max=1000.0,
+        amount_spacing=AmountSpacing.GEOMETRIC,
+        tick_size=0.1,
+        step_size=0.001,
+    )
+
+
+def sell_ladder() -> list[tuple[float, float]]:
+    return get_sell_orders_quantities_and_prices(
+        orders_num=100,
+        high_price=MARK * 1.02,
+        low_price=MARK * 1.0006,
+        amount=0.5,
+        order_quantity_min=0.002,
+        amount_spacing=AmountSpacing.GEOMETRIC,
+        tick_size=0.1,
+        step_size=0.001,
+    )
+
+
+def create_orders() -> list[dict[str, Any]]:
+    return create_multiple_orders(
+        symbol=TickerSymbol.BTCUSDT,
+        side=Side.BUY,
+        quantities_and_prices=buy_ladder(),
+        position_side=PositionSide.LONG,
+        time_in_force=TimeInForce.GTX,
+    ) + create_multiple_orders(
+        symbol=TickerSymbol.BTCUSDT,
+        side=Side.SELL,
+        quantities_and_prices=sell_ladder(),
+        position_side=PositionSide.LONG,
+        time_in_force=TimeInForce.GTX,
+    )
+
+
+def create_depth(levels: int = 20) -> tuple[list, list]:
+    rng = np.random.default_rng(SEED)
+    quantities = np.round(rng.uniform(0.001, 5.0, 2 * levels), 3).tolist()
+    bids = [
+        [f"{MARK - 0.1 * i:.1f}", f"{quantities[i]:.3f}"] for i in range(levels)
+    ]
+    asks = [
+        [f"{MARK + 0.1 * (i + 1):.1f}", f"{quantities[levels + i]:.3f}"]
+        for i in range(levels)
+    ]
+    return bids, asks
+
+
+def create_simulated_repo() -> SimulatedTradeRepo:
+    engine = MatchingEngine(tick_size=0.1)
+    engine.set_market(time=1_700_000_000_000, price=MARK, is_buyer_maker=True)
+    repo = SimulatedTradeRepo(
+        engine=engine,
+        initial_balance=10000.0,
+        leverage=3,
+        position_side=PositionSide.LONG,
+    )
+    repo.on_fill((0, 0, 1, MARK, 0.5, 0.0, False))
+    return repo
+
+
+def create_file_input(reconcile: bool) -> FileInput:
+    template = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), "my_trading_template.json"
+    )
+    with open(file=template, mode="r", encoding="utf-8") as f:
+        return FileInput(
+            **{**json.load(f), "reconcile": reconcile, "market_making": False}
+        )
+
+
+def setup_buy_ladder() -> Callable[[], Any]:
+    return buy_ladder
+
+
+def setup_sell_ladder() -> Callable[[], Any]:
+    return sell_ladder
+
+
+def setup_scaled_quantities() -> Callable[[], Any]:
+    return lambda: get_scaled_quantities(
+        total_amount=25.0,
+        volume_scale=1.001,
+        num=5000,
+        step_size=0.001,
+        min_quantity=0.002,
+    )
+
+
+def setup_create_multiple_orders() -> Callable[[], Any]:
+    return create_orders
+
+
+def setup_batched_lists() -> Callable[[], Any]:
+    orders = create_orders()
+    return lambda: batched_lists(orders, 5)
+
+
+def create_signing_client() -> UMFutures:
+    client = UMFutures(key="benchmark", secret="benchmark")
+    client.send_request = lambda method, path, payload=None, special=False: (
+        client._prepare_params(payload or {}, special)
+    )
+    return client
+
+
+def setup_new_batch_order() -> Callable[[], Any]:
+    batches = batched_lists(create_orders(), 5)
+    network_client = object.__new__(BinanceNetworkClient)
+    network_client.client = create_signing_client()
+    encoder = BatchOrderEncoder()
+    return lambda: [
+        network_client.send_signed_query(
+            "POST", "/fapi/v1/batchOrders", encoder.encode_query(batch)
+        )
+        for batch in batches
+    ]
+
+
+def setup_new_batch_order_stringify() -> Callable[[], Any]:
+    batches = batched_lists(create_orders(), 5)
+    client = create_signing_client()
+    return lambda: [
+        client.new_batch_order(batchOrders=stringify_orders(batch))
+        for batch in batches
+    ]
+
+
+def setup_encode_order_array() -> Callable[[], Any]:
+    ladder = buy_ladder()
+    orders = create_order_array(
+        np.array([price for price, _ in ladder]),
+        np.array([quantity for _, quantity in ladder]),
+    )
+    encoder = BatchOrderEncoder()
+    return lambda: encoder.encode_array(
+        symbol=TickerSymbol.BTCUSDT,
+        side=Side.BUY,
+        orders=orders,
+        position_side=PositionSide.LONG,
+        time_in_force=TimeInForce.GTX,
+    )
+
+
+def setup_account_pydantic() -> Callable[[], Any]:
+    account = create_account(300)
+    return lambda: pydantic_account(account)
+
+
+def setup_account_compact() -> Callable[[], Any]:
+    account = create_account(300)
+    return lambda: compact_account(account)
+
+
+def setup_position_pydantic() -> Callable[[], Any]:
+    return lambda: pydantic_position(POSITION_RISK)
+
+
+def setup_position_compact() -> Callable[[], Any]:
+    return lambda: compact_position(POSITION_RISK)
+
+
+def setup_display_provider() -> None:
+    repo = create_simulated_repo()
+    provider = DisplayDataProvider(repo=repo)
+    provider.set_symbol(TickerSymbol.BTCUSDT)
+    provider.set(MARK_PRICE, MARK)
+    provider.set(LAST_PRICE, MARK)
+    provider.set(POSITION, repo.get_position_risk(TickerSymbol.BTCUSDT))
+    provider.set(ACCOUNT_INFO, repo.get_account_info())
+
+
+def setup_generate_table_account() -> Callable[[], Any]:
+    setup_display_provider()
+    _, data = StreamDecoder().decode(ACCOUNT_MESSAGE)
+    return lambda: generate_table(data)
+
+
+def setup_generate_table_depth() -> Callable[[], Any]:
+    setup_display_provider()
+    bids, asks = create_depth()
+    data = {"e": "depthUpdate", "b": bids, "a": asks}
+    return lambda: generate_table(data)
+
+
+def setup_fixed_range(reconcile: bool) -> Callable[[], Any]:
+    file_input = create_file_input(reconcile)
+    repo = create_simulated_repo()
+    strategy = FixedRangeStrategy(
+        file_input=file_input,
+        repo=repo,
+        executor=OrderExecutor(backend=ExecutorBackend.THREAD, max_workers=1),
+    )
+
+    def cycle() -> None:
+        if not reconcile:
+            repo.cancel_all_orders(file_input.symbol)
+        strategy.run_loop()
+
+    return cycle
+
+
+BENCHMARKS = [
+    Benchmark("buy_orders_quantities_and_prices", setup_buy_ladder, 500),
+    Benchmark("sell_orders_quantities_and_prices", setup_sell_ladder, 500),
+    Benchmark("scaled_quantities", setup_scaled_quantities, 500),
+    Benchmark("create_multiple_orders", setup_create_multiple_orders, 200),
+    Benchmark("batched_lists", setup_batched_lists, 2000),
+    Benchmark("new_batch_order_serialize", setup_new_batch_order, 50),
+    Benchmark("new_batch_order_stringify", setup_new_batch_order_stringify, 50),
+    Benchmark("encode_order_array", setup_encode_order_array, 500),
+    Benchmark("account_pydantic", setup_account_pydantic, 50),
+    Benchmark("account_compact", setup_account_compact, 50),
+    Benchmark("position_pydantic", setup_position_pydantic, 2000),
+    Benchmark("position_compact", setup_position_compact, 2000),
+    Benchmark("generate_table_account", setup_generate_table_account, 200),
+    Benchmark("generate_table_depth", setup_generate_table_depth, 200),
+    Benchmark("fixed_range_cycle", lambda: setup_fixed_range(False), 20),
+    Benchmark("fixed_range_reconcile", lambda: setup_fixed_range(True), 20),
+]
+
+
+def get_benchmarks(names: list[str] | None = None) -> list[Benchmark]:
+    if not names:
+        return list(BENCHMARKS)
+    unknown = set(names) - {benchmark.name for benchmark in BENCHMARKS}
+    if unknown:
+        raise ValueError(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+    return [benchmark for benchmark in BENCHMARKS if benchmark.name in names]
+
+
+def measure(function: Callable[[], Any], number: int, repeat: int) -> dict[str, Any]:
+    function()
+    timings = [
+        seconds / number * 1e6
+        for seconds in timeit.repeat(function, number=number, repeat=repeat)
+    ]
+    return {
+        "min_us": min(timings),
+        "median_us": statistics.median(timings),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run_benchmarks(
+    names: list[str] | None = None, repeat: int = 5, scale: float = 1.0
+) -> dict[str, Any]:
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least one, got {repeat}")
+    results = {}
+    for benchmark in get_benchmarks(names):
+        number = max(1, int(benchmark.number * scale))
+        results[benchmark.name] = measure(benchmark.setup(), number, repeat)
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "seed": SEED,
+        "results": results,
+    }
+
+
+def save_results(results: dict[str, Any], file_name: str) -> None:
+    directory = os.path.dirname(file_name)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(file=file_name, mode="w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_results(file_name: str) -> dict[str, Any]:
+    with open(file=file_name, mode="r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_results(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.1
+) -> list[dict[str, Any]]:
+    rows = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            rows.append({"name": name, "current_us": result["min_us"], "status": "new"})
+            continue
+        ratio = result["min_us"] / base["min_us"] if base["min_us"] else 1.0
+        if ratio > 1.0 + threshold:
+            status = "slower"
+        elif ratio < 1.0 / (1.0 + threshold):
+            status = "faster"
+        else:
+            status = "same"
+        rows.append(
+            {
+                "name": name,
+                "baseline_us": base["min_us"],
+                "current_us": result["min_us"],
+                "ratio": ratio,
+                "status": status,
+            }
+        )
+    return rows
+
+
+def format_results(results: dict[str, Any]) -> str:
+    return "\n".join(
+        f"{name:36} {result['min_us']:12.2f} {result['median_us']:12.2f}"
+        for name, result in results["results"].items()
+    )
+
+
+def format_comparison(rows: list[dict[str, Any]]) -> str:
+    lines = []
+    for row in rows:
+        if row["status"] == "new":
+            lines.append(f"{row['name']:36} {'':>12} {row['current_us']:12.2f} new")
+            continue
+        lines.append(
+            f"{row['name']:36} {row['baseline_us']:12.2f} {row['current_us']:12.2f}"
+            f" {row['ratio']:6.2f}x {row['status']}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,278 @@
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+from base.helpers import Singleton
+from data.enums import OrderStatus, TickerSymbol
+from network.responses.responses import (
+    CompactAccountInfoResponse,
+    CompactPositionInformationResponse,
+)
+from network.stream_decoder import AccountUpdate, decode_account_update
+from repository.repository import TradeRepo
+
+OPEN_ORDER_STATUSES = [OrderStatus.NEW.value, OrderStatus.PARTIALLY_FILLED.value]
+
+
+class AccountState(metaclass=Singleton):
+    def __init__(
+        self,
+        repo: TradeRepo | None = None,
+        reconcile_seconds: float = 60.0,
+        account_refresh_seconds: float = 1.0,
+    ) -> None:
+        self.repo = repo if repo is not None else TradeRepo()
+        self.reconcile_seconds = reconcile_seconds
+        self.account_refresh_seconds = account_refresh_seconds
+        self.symbols: dict[str, TickerSymbol] = {}
+        self.account_info: CompactAccountInfoResponse | None = None
+        self.positions: dict[str, CompactPositionInformationResponse] = {}
+        self.mark_prices: dict[str, float] = {}
+        self.last_prices: dict[str, float] = {}
+        self.open_orders: dict[str, dict[int, dict[str, Any]]] = {}
+        self.order_updates: dict[str, dict[int, tuple[int, float]]] = {}
+        self.accumulated_realized: dict[str, float] = {}
+        self.updated_at = 0.0
+        self.reconciled_at = 0.0
+        self.listeners: list[Callable[[str, str], None]] = []
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._refresh = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def track(self, symbol: TickerSymbol) -> None:
+        with self._lock:
+            self.symbols[symbol.name] = symbol
+        self.reconcile_symbol(symbol)
+
+    def add_listener(self, listener: Callable[[str, str], None]) -> None:
+        self.listeners.append(listener)
+
+    def start(self) -> "AccountState":
+        if self._thread is None:
+            self._stop.clear()
+            self._refresh.clear()
+            self._thread = threading.Thread(
+                target=self._reconcile_loop, name="account-state", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._refresh.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _reconcile_loop(self) -> None:
+        deadline = time.monotonic() + self.reconcile_seconds
+        while not self._stop.is_set():
+            refresh = self._refresh.wait(max(deadline - time.monotonic(), 0.0))
+            if self._stop.is_set():
+                return
+            try:
+                if refresh:
+                    self._refresh.clear()
+                    self.refresh_account_info()
+                    self._stop.wait(self.account_refresh_seconds)
+                else:
+                    self.reconcile()
+                    deadline = time.monotonic() + self.reconcile_seconds
+            except Exception as e:
+                logging.error(e)
+
+    def request_account_refresh(self) -> None:
+        self._refresh.set()
+
+    def refresh_account_info(self) -> None:
+        account_info = self.repo.get_account_info()
+        with self._lock:
+            self.account_info = account_info
+            self.updated_at = time.time()
+
+    def reconcile(self) -> None:
+        account_info = self.repo.get_account_info()
+        with self._lock:
+            self.account_info = account_info
+            symbols = list(self.symbols.values())
+        for symbol in symbols:
+            self.reconcile_symbol(symbol, with_account=False)
+
+    def reconcile_symbol(self, symbol: TickerSymbol, with_account: bool = True) -> None:
+        position = self.repo.get_position_risk(symbol=symbol)
+        mark_price = self.repo.get_mark_price(symbol=symbol).markPrice
+        last_price = self.repo.get_ticker_price(symbol=symbol)
+        requested_at = time.monotonic()
+        open_orders = self.repo.get_open_orders(symbol=symbol)
+        account_info = self.repo.get_account_info() if with_account else None
+        with self._lock:
+            self.positions[symbol.name] = position
+            self.mark_prices[symbol.name] = mark_price
+            self.last_prices[symbol.name] = last_price
+            self.merge_open_orders(symbol.name, open_orders, requested_at)
+            if account_info is not None:
+                self.account_info = account_info
+            self.reconciled_at = self.updated_at = time.time()
+
+    def merge_open_orders(
+        self, symbol: str, open_orders: list[dict[str, Any]], requested_at: float
+    ) -> None:
+        current = self.open_orders.get(symbol, {})
+        updates = self.order_updates.setdefault(symbol, {})
+        merged = {}
+        for order in open_orders:
+            update = updates.get(order["orderId"])
+            if update is None or update[0] < order.get("updateTime", 0):
+                merged[order["orderId"]] = order
+            elif order["orderId"] in current:
+                merged[order["orderId"]] = current[order["orderId"]]
+        for order_id, order in current.items():
+            update = updates.get(order_id)
+            if order_id not in merged and update and update[1] >= requested_at:
+                merged[order_id] = order
+        self.open_orders[symbol] = merged
+        for order_id, update in list(updates.items()):
+            if update[1] < requested_at:
+                del updates[order_id]
+
+    def on_event(self, event: dict[str, Any] | AccountUpdate) -> None:
+        if isinstance(event, AccountUpdate):
+            event_type = "ACCOUNT_UPDATE"
+            symbols = self._on_account_update(event)
+        elif not isinstance(event, dict):
+            return
+        elif (event_type := event.get("e")) == "ACCOUNT_UPDATE":
+            symbols = self._on_account_update(decode_account_update(event))
+        elif event_type == "ORDER_TRADE_UPDATE":
+            symbols = self._on_order_trade_update(event["o"])
+        elif event_type == "ACCOUNT_CONFIG_UPDATE" and "ac" in event:
+            symbols = self._on_account_config_update(event["ac"])
+        elif event_type == "markPriceUpdate":
+            symbols = self._on_mark_price(event["s"], float(event["p"]))
+        elif event_type in ["aggTrade", "trade"]:
+            symbols = self._on_last_price(event["s"], float(event["p"]))
+        else:
+            return
+        for symbol in symbols:
+            for listener in self.listeners:
+                listener(event_type, symbol)
+
+    def _on_account_update(self, event: AccountUpdate) -> list[str]:
+        with self._lock:
+            if self.account_info is not None:
+                for balance in event.balances:
+                    if balance.asset == "USDT":
+                        self.account_info.totalWalletBalance = balance.wallet_balance
+                        self.account_info.totalCrossWalletBalance = str(
+                            balance.cross_wallet_balance
+                        )
+            symbols = []
+            for item in event.positions:
+                position = self.positions.get(item.symbol)
+                if position is None or item.position_side != position.positionSide:
+                    continue
+                position.positionAmt = item.position_amount
+                position.entryPrice = item.entry_price
+                position.breakEvenPrice = item.break_even_price
+                position.unRealizedProfit = item.unrealized_profit
+                position.notional = position.positionAmt * position.markPrice
+                self.accumulated_realized[item.symbol] = item.accumulated_realized
+                symbols.append(item.symbol)
+            self.updated_at = time.time()
+        self.request_account_refresh()
+        return symbols
+
+    def _on_order_trade_update(self, data: dict[str, Any]) -> list[str]:
+        symbol = data["s"]
+        update_time = data.get("T", 0)
+        with self._lock:
+            orders = self.open_orders.setdefault(symbol, {})
+            self.order_updates.setdefault(symbol, {})[data["i"]] = (
+                update_time,
+                time.monotonic(),
+            )
+            if data["X"] in OPEN_ORDER_STATUSES:
+                orders[data["i"]] = {
+                    "orderId": data["i"],
+                    "symbol": symbol,
+                    "clientOrderId": data["c"],
+                    "side": data["S"],
+                    "positionSide": data["ps"],
+                    "type": data["o"],
+                    "timeInForce": data["f"],
+                    "price": data["p"],
+                    "origQty": data["q"],
+                    "executedQty": data["z"],
+                    "status": data["X"],
+                    "priceMatch": data.get("pm", "NONE"),
+                    "updateTime": update_time,
+                }
+            else:
+                orders.pop(data["i"], None)
+            if data.get("x") == "TRADE":
+                self.last_prices[symbol] = float(data["L"])
+            self.updated_at = time.time()
+        return [symbol]
+
+    def _on_account_config_update(self, data: dict[str, Any]) -> list[str]:
+        with self._lock:
+            position = self.positions.get(data["s"])
+            if position is None:
+                return []
+            position.leverage = int(data["l"])
+            self.updated_at = time.time()
+        return [data["s"]]
+
+    def _on_mark_price(self, symbol: str, mark_price: float) -> list[str]:
+        with self._lock:
+            self.mark_prices[symbol] = mark_price
+            position = self.positions.get(symbol)
+            if position is not None:
+                position.markPrice = mark_price
+                position.notional = position.positionAmt * mark_price
+                position.unRealizedProfit = position.positionAmt * (
+                    mark_price - position.entryPrice
+                )
+            self.updated_at = time.time()
+        return [symbol]
+
+    def _on_last_price(self, symbol: str, last_price: float) -> list[str]:
+        with self._lock:
+            self.last_prices[symbol] = last_price
+        return [symbol]
+
+    def set_leverage(self, symbol: TickerSymbol, leverage: int) -> None:
+        with self._lock:
+            position = self.positions.get(symbol.name)
+            if position is not None:
+                position.leverage = leverage
+
+    def get_position(self, symbol: TickerSymbol) -> CompactPositionInformationResponse:
+        with self._lock:
+            return self.positions[symbol.name].model_copy()
+
+    def get_account_info(self) -> CompactAccountInfoResponse:
+        with self._lock:
+            return self.account_info.model_copy()
+
+    def get_mark_price(self, symbol: TickerSymbol) -> float:
+        with self._lock:
+            return self.mark_prices[symbol.name]
+
+    def get_last_price(self, symbol: TickerSymbol) -> float:
+        with self._lock:
+            return self.last_prices[symbol.name]
+
+    def get_open_orders(self, symbol: TickerSymbol) -> list[dict[str, Any]]:
+        with self._lock:
+            return list(self.open_orders.get(symbol.name, {}).values())
+
+    def get_accumulated_realized(self, symbol: TickerSymbol) -> float:
+        with self._lock:
+            return self.accumulated_realized.get(symbol.name, 0.0)
+
+    def is_ready(self, symbol: TickerSymbol) -> bool:
+        with self._lock:
+            return self.account_info is not None and symbol.name in self.positions
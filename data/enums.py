@@ -1,4 +1,4 @@
-from enum import auto, Enum, EnumType, StrEnum
+from enum import auto, Enum, EnumType, IntEnum, StrEnum
 
 from base.helpers import AutoName
 
@@ -50,6 +50,15 @@ class PriceMatchQueue(PriceMatch):
 class TickerSymbol(AutoName):
     BTCUSDT = auto()
 
+    @classmethod
+    def _missing_(cls, value):
+        if not isinstance(value, str) or not value.isalnum() or not value.isupper():
+            return None
+        member = object.__new__(cls)
+        member._name_ = value
+        member._value_ = value
+        return cls._value2member_map_.setdefault(value, member)
+
 
 # noinspection PyUnusedName,PyUnusedClass
 class Side(AutoName):
@@ -155,13 +164,51 @@ class STPMODE(AutoName):
 # noinspection PyUnusedName,PyUnusedClass
 class RateLimiters(AutoName):
     REQUEST_WEIGHT = auto()
+    ORDERS = auto()
 
 
 # noinspection PyUnusedName,PyUnusedClass
 class RateLimitIntervals(AutoName):
+    SECOND = auto()
     MINUTE = auto()
 
 
+# noinspection PyUnusedName,PyUnusedClass
+class RequestPriority(IntEnum):
+    CANCEL = 0
+    ORDER = 1
+    ACCOUNT = 2
+    DISPLAY = 3
+
+
+# noinspection PyUnusedName,PyUnusedClass
+class ExecutorBackend(AutoName):
+    THREAD = auto()
+    PROCESS = auto()
+    ASYNCIO = auto()
+
+
+# noinspection PyUnusedName,PyUnusedClass
+class OrderTransport(AutoName):
+    REST = auto()
+    WEBSOCKET = auto()
+
+
+# noinspection PyUnusedName,PyUnusedClass
+class TriggerReason(AutoName):
+    STARTUP = auto()
+    PRICE_MOVE = auto()
+    FILL = auto()
+    POSITION = auto()
+    STALENESS = auto()
+
+
+# noinspection PyUnusedName,PyUnusedClass
+class RecordKind(IntEnum):
+    STREAM = 0
+    REST = 1
+
+
 # noinspection PyUnusedName,PyUnusedClass
 class AmountSpacing(Enum):
     LINEAR = auto()
@@ -0,0 +1,172 @@
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from base.helpers import Singleton
+from data.enums import TickerSymbol
+from model import RateLimit
+from repository.repository import TradeRepo
+from utils.mathutils import get_increment_scale, round_to_increment
+
+
+@dataclass(slots=True)
+class SymbolFilters:
+    symbol: str
+    tick_size: float = 0.1
+    step_size: float = 0.001
+    min_price: float = 0.0
+    max_price: float = 0.0
+    min_qty: float = 0.001
+    max_qty: float = 1000.0
+    market_min_qty: float = 0.001
+    market_max_qty: float = 1000.0
+    min_notional: float = 0.0
+    price_precision: int = 1
+    quantity_precision: int = 3
+
+    def __post_init__(self) -> None:
+        get_increment_scale(self.tick_size)
+        get_increment_scale(self.step_size)
+
+    def round_price(self, prices, mode: str = "nearest"):
+        return round_to_increment(prices, self.tick_size, mode)
+
+    def round_quantity(self, quantities, mode: str = "nearest"):
+        return round_to_increment(quantities, self.step_size, mode)
+
+    def get_min_quantity(self, price: float) -> float:
+        if self.min_notional <= 0.0 or price <= 0.0:
+            return self.min_qty
+        return max(
+            self.min_qty, self.round_quantity(self.min_notional / price, "ceil")
+        )
+
+
+def get_symbol_filters(symbol: dict[str, Any]) -> SymbolFilters:
+    filters = {f["filterType"]: f for f in symbol.get("filters", [])}
+    price_filter = filters.get("PRICE_FILTER", {})
+    lot_size = filters.get("LOT_SIZE", {})
+    market_lot_size = filters.get("MARKET_LOT_SIZE", lot_size)
+    min_notional = filters.get("MIN_NOTIONAL", {})
+    return SymbolFilters(
+        symbol=symbol["symbol"],
+        tick_size=float(price_filter.get("tickSize", 0.1)),
+        step_size=float(lot_size.get("stepSize", 0.001)),
+        min_price=float(price_filter.get("minPrice", 0.0)),
+        max_price=float(price_filter.get("maxPrice", 0.0)),
+        min_qty=float(lot_size.get("minQty", 0.001)),
+        max_qty=float(lot_size.get("maxQty", 1000.0)),
+        market_min_qty=float(market_lot_size.get("minQty", 0.001)),
+        market_max_qty=float(market_lot_size.get("maxQty", 1000.0)),
+        min_notional=float(min_notional.get("notional", 0.0)),
+        price_precision=symbol.get("pricePrecision", 1),
+        quantity_precision=symbol.get("quantityPrecision", 3),
+    )
+
+
+class ExchangeInfoCache(metaclass=Singleton):
+    def __init__(
+        self,
+        repo: TradeRepo | None = None,
+        path: str = "exchange_info.json",
+        ttl_seconds: float = 3600.0,
+    ) -> None:
+        self.repo = repo if repo is not None else TradeRepo()
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.exchange_info: dict[str, Any] | None = None
+        self.filters: dict[str, SymbolFilters] = {}
+        self.rate_limits: list[RateLimit] = []
+        self.updated_at = 0.0
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def load(self) -> "ExchangeInfoCache":
+        cached = self.read_file()
+        if cached is not None and time.time() - cached["updated"] < self.ttl_seconds:
+            self.set_exchange_info(cached["exchangeInfo"], cached["updated"])
+        else:
+            try:
+                self.refresh()
+            except Exception as e:
+                if cached is None:
+                    raise e
+                logging.error(e)
+                self.set_exchange_info(cached["exchangeInfo"], cached["updated"])
+        return self
+
+    def refresh(self) -> None:
+        exchange_info = self.repo.get_exchange_info()
+        updated = time.time()
+        self.set_exchange_info(exchange_info, updated)
+        self.write_file(exchange_info, updated)
+
+    def read_file(self) -> dict[str, Any] | None:
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, mode="r", encoding="utf-8") as f:
+                return json.load(f)
+        except ValueError as e:
+            logging.error(e)
+            return None
+
+    def write_file(self, exchange_info: dict[str, Any], updated: float) -> None:
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, mode="w", encoding="utf-8") as f:
+            json.dump({"updated": updated, "exchangeInfo": exchange_info}, f)
+        os.replace(temp_path, self.path)
+
+    def set_exchange_info(self, exchange_info: dict[str, Any], updated: float) -> None:
+        filters = {
+            symbol["symbol"]: get_symbol_filters(symbol)
+            for symbol in exchange_info["symbols"]
+        }
+        rate_limits = [RateLimit(**i) for i in exchange_info.get("rateLimits", [])]
+        with self._lock:
+            self.exchange_info = exchange_info
+            self.filters = filters
+            self.rate_limits = rate_limits
+            self.updated_at = updated
+
+    def start(self) -> "ExchangeInfoCache":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._refresh_loop, name="exchange-info", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.wait(
+            max(
+                self.updated_at + self.ttl_seconds - time.time(),
+                min(self.ttl_seconds, 60.0),
+            )
+        ):
+            try:
+                self.refresh()
+            except Exception as e:
+                logging.error(e)
+
+    def get_filters(self, symbol: TickerSymbol | str) -> SymbolFilters:
+        name = symbol if isinstance(symbol, str) else symbol.name
+        with self._lock:
+            filters = self.filters.get(name)
+        return filters if filters is not None else SymbolFilters(symbol=name)
+
+    def get_rate_limits(self) -> list[RateLimit]:
+        with self._lock:
+            return list(self.rate_limits)
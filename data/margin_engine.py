@@ -0,0 +1,100 @@
+import numpy as np
+
+from data.enums import PositionSide
+from model import NotionalAndLeverageBracket
+
+GRID_MARGIN_DTYPE = np.dtype(
+    [
+        ("position_amount", np.float64),
+        ("entry_price", np.float64),
+        ("notional", np.float64),
+        ("initial_margin", np.float64),
+        ("maintenance_margin", np.float64),
+        ("liquidation_price", np.float64),
+        ("within_max_notional", np.bool_),
+    ]
+)
+
+
+class MarginEngine:
+    def __init__(self, brackets: NotionalAndLeverageBracket) -> None:
+        ordered = sorted(brackets.brackets, key=lambda b: b.notionalFloor)
+        if not ordered:
+            raise ValueError(f"{brackets.symbol} has no leverage brackets")
+        self.symbol = brackets.symbol
+        self.caps = np.array([b.notionalCap for b in ordered], dtype=np.float64)
+        self.initial_leverages = np.array(
+            [b.initialLeverage for b in ordered], dtype=np.int64
+        )
+        self.maint_margin_ratios = np.array(
+            [b.maintMarginRatio for b in ordered], dtype=np.float64
+        )
+        self.cums = np.array([b.cum for b in ordered], dtype=np.float64)
+
+    def get_bracket_index(self, notionals) -> np.ndarray:
+        index = np.searchsorted(self.caps, np.abs(notionals), side="left")
+        return np.minimum(index, len(self.caps) - 1)
+
+    def max_notional(self, leverage: int) -> float:
+        allowed = self.caps[self.initial_leverages >= leverage]
+        return float(allowed.max()) if len(allowed) else 0.0
+
+    def max_leverage(self, notional: float) -> int:
+        return int(self.initial_leverages[self.get_bracket_index(notional)])
+
+    def initial_margin(self, notionals, leverage: int) -> np.ndarray:
+        return np.abs(notionals) / leverage
+
+    def maintenance_margin(self, notionals) -> np.ndarray:
+        index = self.get_bracket_index(notionals)
+        return np.abs(notionals) * self.maint_margin_ratios[index] - self.cums[index]
+
+    def liquidation_price(
+        self, wallet_balance, position_amount, entry_price
+    ) -> np.ndarray:
+        position_amount = np.asarray(position_amount, dtype=np.float64)
+        entry_price = np.asarray(entry_price, dtype=np.float64)
+        size = np.abs(position_amount)
+        side = np.sign(position_amount)
+        index = self.get_bracket_index(size * entry_price)
+        denominator = size * self.maint_margin_ratios[index] - side * size
+        with np.errstate(divide="ignore", invalid="ignore"):
+            price = (
+                wallet_balance + self.cums[index] - side * size * entry_price
+            ) / denominator
+        return np.where((size > 0.0) & (price > 0.0), price, 0.0)
+
+    def simulate_fills(
+        self,
+        prices: np.ndarray,
+        quantities: np.ndarray,
+        position_amount: float,
+        entry_price: float,
+        leverage: int,
+        wallet_balance: float,
+        side: PositionSide = PositionSide.LONG,
+    ) -> np.ndarray:
+        sign = 1.0 if side == PositionSide.LONG else -1.0
+        prices = np.asarray(prices, dtype=np.float64)
+        quantities = np.asarray(quantities, dtype=np.float64)
+        order = np.argsort(-sign * prices, kind="stable")
+        amounts = np.empty(len(prices), dtype=np.float64)
+        costs = np.empty(len(prices), dtype=np.float64)
+        amounts[order] = position_amount + sign * np.cumsum(quantities[order])
+        costs[order] = position_amount * entry_price + sign * np.cumsum(
+            prices[order] * quantities[order]
+        )
+        result = np.empty(len(prices), dtype=GRID_MARGIN_DTYPE)
+        result["position_amount"] = amounts
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result["entry_price"] = np.where(amounts != 0.0, costs / amounts, 0.0)
+        result["notional"] = np.abs(amounts) * result["entry_price"]
+        result["initial_margin"] = self.initial_margin(result["notional"], leverage)
+        result["maintenance_margin"] = self.maintenance_margin(result["notional"])
+        result["liquidation_price"] = self.liquidation_price(
+            wallet_balance, amounts, result["entry_price"]
+        )
+        result["within_max_notional"] = result["notional"] <= self.max_notional(
+            leverage
+        )
+        return result
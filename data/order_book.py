@@ -0,0 +1,258 @@
+import logging
+import math
+import threading
+from typing import Any, Callable
+
+from data.enums import Side
+from network.stream_decoder import DepthUpdate, decode_depth_update
+from utils.mathutils import get_increment_scale
+
+
+QUANTITY_SCALE = 10**8
+
+
+class FenwickTree:
+    def __init__(self, bits: int = 32) -> None:
+        self.size = 1 << bits
+        self.tree: dict[int, int] = {}
+
+    def clear(self) -> None:
+        self.tree.clear()
+
+    def add(self, index: int, value: int) -> None:
+        tree = self.tree
+        index += 1
+        while index <= self.size:
+            total = tree.get(index, 0) + value
+            if total:
+                tree[index] = total
+            else:
+                tree.pop(index, None)
+            index += index & -index
+
+    def prefix_sum(self, index: int) -> int:
+        tree = self.tree
+        index = min(index + 1, self.size)
+        total = 0
+        while index > 0:
+            total += tree.get(index, 0)
+            index &= index - 1
+        return total
+
+    def search(self, target: int) -> int:
+        tree = self.tree
+        position = 0
+        step = self.size
+        while step:
+            index = position + step
+            if index <= self.size:
+                value = tree.get(index, 0)
+                if value <= target:
+                    position = index
+                    target -= value
+            step >>= 1
+        return position
+
+
+class OrderBookSide:
+    def __init__(self, side: Side, tick_size: float = 0.1) -> None:
+        self.side = side
+        self.sign = -1.0 if side is Side.BUY else 1.0
+        self.scale, self.units = get_increment_scale(tick_size)
+        self.levels: dict[float, float] = {}
+        self.prices: dict[int, float] = {}
+        self.tree = FenwickTree()
+        self.offset = self.tree.size >> 1
+        self.best_index: int | None = None
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def clear(self) -> None:
+        self.levels.clear()
+        self.prices.clear()
+        self.tree.clear()
+        self.best_index = None
+
+    def get_index(self, price: float) -> int:
+        return round(self.sign * price * self.scale / self.units) + self.offset
+
+    def update(self, price: float, quantity: float) -> None:
+        index = self.get_index(price)
+        previous = self.levels.pop(price, None)
+        if previous is not None:
+            self.tree.add(index, -round(previous * QUANTITY_SCALE))
+            del self.prices[index]
+        if quantity == 0.0:
+            if index == self.best_index:
+                self.best_index = self.tree.search(0) if self.levels else None
+            return
+        self.levels[price] = quantity
+        self.prices[index] = price
+        self.tree.add(index, round(quantity * QUANTITY_SCALE))
+        if self.best_index is None or index < self.best_index:
+            self.best_index = index
+
+    def best(self) -> tuple[float, float] | None:
+        if self.best_index is None:
+            return None
+        price = self.prices[self.best_index]
+        return price, self.levels[price]
+
+    def quantity_at(self, price: float) -> float:
+        return self.levels.get(price, 0.0)
+
+    def cumulative_quantity(self, price: float) -> float:
+        key = self.sign * price * self.scale / self.units
+        index = math.floor(key + 1e-9) + self.offset
+        return self.tree.prefix_sum(index) / QUANTITY_SCALE
+
+    def top(self, levels: int) -> list[tuple[float, float]]:
+        result = []
+        total = 0
+        for _ in range(min(levels, len(self.levels))):
+            price = self.prices[self.tree.search(total)]
+            quantity = self.levels[price]
+            result.append((price, quantity))
+            total += round(quantity * QUANTITY_SCALE)
+        return result
+
+
+class LocalOrderBook:
+    def __init__(
+        self,
+        symbol: str,
+        snapshot_loader: Callable[[], dict[str, Any] | None],
+        background_resync: bool = True,
+        tick_size: float = 0.1,
+    ) -> None:
+        self.symbol = symbol
+        self.snapshot_loader = snapshot_loader
+        self.background_resync = background_resync
+        self.bids = OrderBookSide(Side.BUY, tick_size)
+        self.asks = OrderBookSide(Side.SELL, tick_size)
+        self.last_update_id = 0
+        self.event_time = 0
+        self.synced = False
+        self.snapshot_loaded = False
+        self.resync_count = 0
+        self._buffer: list[DepthUpdate] = []
+        self._lock = threading.RLock()
+        self._resyncing = False
+
+    def on_depth_update(self, event: dict[str, Any] | DepthUpdate) -> None:
+        if not isinstance(event, DepthUpdate):
+            event = decode_depth_update(event)
+        with self._lock:
+            if self.synced:
+                if event.previous_final_update_id == self.last_update_id:
+                    self._apply(event)
+                    return
+                logging.error(
+                    f"{self.symbol} order book gap {event.previous_final_update_id=} {self.last_update_id=}"
+                )
+                self._request_resync(event)
+                return
+            if not self.snapshot_loaded:
+                self._request_resync(event)
+                return
+            if event.final_update_id < self.last_update_id:
+                return
+            if event.first_update_id > self.last_update_id:
+                logging.error(f"{self.symbol} order book snapshot is older than stream")
+                self._request_resync(event)
+                return
+            self.synced = True
+            self._apply(event)
+
+    def resync(self) -> None:
+        snapshot = self.snapshot_loader()
+        with self._lock:
+            if snapshot is None:
+                self._resyncing = False
+                return
+            self.load_snapshot(snapshot)
+            buffered, self._buffer = self._buffer, []
+            self._resyncing = False
+            self.resync_count += 1
+            for event in buffered:
+                self.on_depth_update(event)
+
+    def load_snapshot(self, snapshot: dict[str, Any]) -> None:
+        with self._lock:
+            self.bids.clear()
+            self.asks.clear()
+            for price, quantity in snapshot["bids"]:
+                self.bids.update(float(price), float(quantity))
+            for price, quantity in snapshot["asks"]:
+                self.asks.update(float(price), float(quantity))
+            self.last_update_id = snapshot["lastUpdateId"]
+            self.event_time = snapshot.get("E", 0)
+            self.synced = False
+            self.snapshot_loaded = True
+
+    def _request_resync(self, event: DepthUpdate) -> None:
+        if not self._resyncing:
+            self._buffer = []
+        self.synced = False
+        self.snapshot_loaded = False
+        self._buffer.append(event)
+        self._start_resync()
+
+    def _start_resync(self) -> None:
+        if self._resyncing:
+            return
+        self._resyncing = True
+        if self.background_resync:
+            threading.Thread(
+                target=self._resync_safely, name=f"{self.symbol}-resync", daemon=True
+            ).start()
+        else:
+            self._resync_safely()
+
+    def _resync_safely(self) -> None:
+        try:
+            self.resync()
+        except Exception as e:
+            logging.error(e)
+            with self._lock:
+                self._resyncing = False
+
+    def _apply(self, event: DepthUpdate) -> None:
+        for price, quantity in event.bids:
+            self.bids.update(price, quantity)
+        for price, quantity in event.asks:
+            self.asks.update(price, quantity)
+        self.last_update_id = event.final_update_id
+        self.event_time = event.event_time
+
+    def best_bid(self) -> tuple[float, float] | None:
+        with self._lock:
+            return self.bids.best()
+
+    def best_ask(self) -> tuple[float, float] | None:
+        with self._lock:
+            return self.asks.best()
+
+    def mid_price(self) -> float | None:
+        with self._lock:
+            bid = self.bids.best()
+            ask = self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2.0
+
+    def quantity_at(self, side: Side, price: float) -> float:
+        with self._lock:
+            return self._book_side(side).quantity_at(price)
+
+    def cumulative_quantity(self, side: Side, price: float) -> float:
+        with self._lock:
+            return self._book_side(side).cumulative_quantity(price)
+
+    def top(self, side: Side, levels: int = 10) -> list[tuple[float, float]]:
+        with self._lock:
+            return self._book_side(side).top(levels)
+
+    def _book_side(self, side: Side) -> OrderBookSide:
+        return self.bids if side is Side.BUY else self.asks
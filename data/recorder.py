@@ -0,0 +1,204 @@
+import glob
+import gzip
+import json
+import logging
+import os
+import queue
+import re
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterator
+
+from data.enums import RecordKind
+
+FRAME_HEADER = struct.Struct("<BIqq")
+EVENT_TIME_PATTERN = re.compile(rb'"E":\s*(\d+)')
+FILE_SUFFIX = ".bin.gz"
+
+
+@dataclass(slots=True)
+class Record:
+    kind: RecordKind
+    local_time: int
+    exchange_time: int
+    message: bytes
+
+    def text(self) -> str:
+        return self.message.decode("utf-8")
+
+
+def get_exchange_time(message: bytes) -> int:
+    match = EVENT_TIME_PATTERN.search(message, 0, 512)
+    return int(match.group(1)) if match else 0
+
+
+def encode_record(kind: RecordKind, local_time: int, message: bytes) -> bytes:
+    return (
+        FRAME_HEADER.pack(int(kind), len(message), local_time, get_exchange_time(message))
+        + message
+    )
+
+
+class StreamRecorder:
+    def __init__(
+        self,
+        directory: str = "recordings",
+        prefix: str = "stream",
+        max_file_bytes: int = 256 * 1024 * 1024,
+        max_file_seconds: float = 3600.0,
+        max_queue_size: int = 100_000,
+        compress_level: int = 6,
+        flush_seconds: float = 1.0,
+    ) -> None:
+        self.directory = directory
+        self.prefix = prefix
+        self.max_file_bytes = max_file_bytes
+        self.max_file_seconds = max_file_seconds
+        self.compress_level = compress_level
+        self.flush_seconds = flush_seconds
+        self.dropped = 0
+        self.written = 0
+        self.files: list[str] = []
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._file: gzip.GzipFile | None = None
+        self._file_bytes = 0
+        self._file_opened = 0.0
+        self._sequence = 0
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def start(self) -> "StreamRecorder":
+        if self._thread is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._write_loop, name="stream-recorder", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._close_file()
+
+    def __enter__(self) -> "StreamRecorder":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def record(
+        self, message: str | bytes, kind: RecordKind = RecordKind.STREAM
+    ) -> None:
+        try:
+            self._queue.put_nowait((kind, time.time_ns(), message))
+        except queue.Full:
+            self.dropped += 1
+
+    def _write_loop(self) -> None:
+        while not self._stop.is_set() or not self._queue.empty():
+            try:
+                item = self._queue.get(timeout=self.flush_seconds)
+            except queue.Empty:
+                if self._file is not None:
+                    self._file.flush()
+                continue
+            try:
+                self._write(*item)
+                while True:
+                    self._write(*self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            except Exception as e:
+                logging.error(e)
+
+    def _write(self, kind: RecordKind, local_time: int, message: str | bytes) -> None:
+        if isinstance(message, str):
+            message = message.encode("utf-8")
+        if self._file is None or self._should_roll():
+            self._open_file()
+        frame = encode_record(kind, local_time, message)
+        self._file.write(frame)
+        self._file_bytes += len(frame)
+        self.written += 1
+
+    def _should_roll(self) -> bool:
+        return (
+            self._file_bytes >= self.max_file_bytes
+            or time.monotonic() - self._file_opened >= self.max_file_seconds
+        )
+
+    def _open_file(self) -> None:
+        self._close_file()
+        self._sequence += 1
+        file_name = os.path.join(
+            self.directory,
+            f"{self.prefix}-{time.strftime('%Y%m%d-%H%M%S')}-{self._sequence:05d}{FILE_SUFFIX}",
+        )
+        self._file = gzip.open(
+            file_name, mode="wb", compresslevel=self.compress_level
+        )
+        self._file_bytes = 0
+        self._file_opened = time.monotonic()
+        self.files.append(file_name)
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_records(file_name: str) -> Iterator[Record]:
+    with gzip.open(file_name, mode="rb") as f:
+        while header := f.read(FRAME_HEADER.size):
+            if len(header) < FRAME_HEADER.size:
+                logging.error(f"{file_name} ends with a truncated frame")
+                return
+            kind, length, local_time, exchange_time = FRAME_HEADER.unpack(header)
+            message = f.read(length)
+            if len(message) < length:
+                logging.error(f"{file_name} ends with a truncated frame")
+                return
+            yield Record(RecordKind(kind), local_time, exchange_time, message)
+
+
+def read_jsonl_records(file_name: str) -> Iterator[Record]:
+    with open(file=file_name, mode="rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            data = json.loads(line)
+            if isinstance(data, dict) and "message" in data:
+                message = data["message"]
+                if not isinstance(message, str):
+                    message = json.dumps(message, separators=(",", ":"))
+                message = message.encode("utf-8")
+                kind = RecordKind[data.get("kind", RecordKind.STREAM.name)]
+            else:
+                message = line
+                kind = RecordKind.STREAM
+            exchange_time = get_exchange_time(message)
+            local_time = data.get("local_time", 0) if isinstance(data, dict) else 0
+            yield Record(
+                kind, local_time or exchange_time * 1_000_000, exchange_time, message
+            )
+
+
+def list_recordings(path: str, prefix: str = "stream") -> list[str]:
+    if os.path.isfile(path):
+        return [path]
+    return sorted(glob.glob(os.path.join(path, f"{prefix}-*{FILE_SUFFIX}")))
+
+
+def read_recordings(path: str, prefix: str = "stream") -> Iterator[Record]:
+    for file_name in list_recordings(path, prefix):
+        if file_name.endswith(".jsonl"):
+            yield from read_jsonl_records(file_name)
+        else:
+            yield from read_records(file_name)
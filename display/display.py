@@ -1,4 +1,5 @@
 import logging
+import time
 from uu import Error
 
 from rich.align import Align
@@ -7,9 +8,16 @@ from rich.panel import Panel
 from rich.table import Table
 
 from data.enums import TickerSymbol
+from display.provider import (
+    ACCOUNT_INFO,
+    LAST_PRICE,
+    MARK_PRICE,
+    POSITION,
+    DisplayDataProvider,
+)
 from display.renderables import Footer, Header
-from display.utils import f_money, f_pct
-from repository.repository import TradeRepo
+from display.utils import f_money, f_pct, f_stale
+from network.stream_decoder import AccountUpdate, DepthUpdate, decode_account_update
 from utils.timeutils import get_date_and_time
 
 
@@ -37,52 +45,70 @@ def make_it() -> Layout:
 
 
 layout = make_it()
+display_symbol = TickerSymbol.BTCUSDT
+
+
+def set_display_symbol(symbol: TickerSymbol) -> None:
+    global display_symbol
+    display_symbol = symbol
+    Footer().symbol = symbol
+    DisplayDataProvider().set_symbol(symbol)
 
 
 def generate_table(data) -> None:
     try:
-        if "e" in data:
+        if isinstance(data, AccountUpdate):
+            update_account_tables(data)
+        elif isinstance(data, DepthUpdate):
+            update_book_tables(data.bids, data.asks)
+        elif "e" in data:
             if data["e"] in ["ACCOUNT_UPDATE"]:
-                data["last_account_updated"] = get_date_and_time()
-                display_data_1, display_data_2 = get_display_data(data)
-                layout["left_left"].update(
-                    renderable=Panel(
-                        renderable=create_table_1(display_data=display_data_1),
-                    )
-                )
-                layout["left_right"].update(
-                    renderable=Panel(
-                        renderable=create_table_1(display_data=display_data_2),
-                    )
-                )
-
+                update_account_tables(decode_account_update(data))
             elif data["e"] in ["depthUpdate"]:
-                layout["right_left"].update(
-                    renderable=Align(
-                        Panel(
-                            renderable=create_book_side_table(
-                                data["b"], "green", "ltr"
-                            ),
-                            title="Bids",
-                            expand=False,
-                        ),
-                        align="right",
-                    )
-                )
-                layout["right_right"].update(
-                    renderable=Align(
-                        Panel(
-                            renderable=create_book_side_table(data["a"], "red", "rtl"),
-                            title="Asks",
-                            expand=False,
-                        ),
-                        align="left",
-                    )
-                )
+                update_book_tables(data["b"], data["a"])
     except Error as e:
         logging.error(e)
 
 
+def update_account_tables(data: AccountUpdate) -> None:
+    display_data_1, display_data_2 = get_display_data(
+        data, last_account_updated=get_date_and_time()
+    )
+    layout["left_left"].update(
+        renderable=Panel(
+            renderable=create_table_1(display_data=display_data_1),
+        )
+    )
+    layout["left_right"].update(
+        renderable=Panel(
+            renderable=create_table_1(display_data=display_data_2),
+        )
+    )
+
+
+def update_book_tables(bids, asks) -> None:
+    layout["right_left"].update(
+        renderable=Align(
+            Panel(
+                renderable=create_book_side_table(bids, "green", "ltr"),
+                title="Bids",
+                expand=False,
+            ),
+            align="right",
+        )
+    )
+    layout["right_right"].update(
+        renderable=Align(
+            Panel(
+                renderable=create_book_side_table(asks, "red", "rtl"),
+                title="Asks",
+                expand=False,
+            ),
+            align="left",
+        )
+    )
+
+
 def create_table_1(display_data) -> Table:
     table = Table(expand=True)
     table.add_column("ID")
@@ -91,43 +117,69 @@ def create_table_1(display_data) -> Table:
     return table
 
 
-def get_display_data(data) -> tuple[dict[str, str], dict[str, str]]:
-    repo = TradeRepo()
-    mark_price = repo.get_mark_price(TickerSymbol.BTCUSDT).markPrice
-    last_price = float(repo.get_ticker_price(TickerSymbol.BTCUSDT))
-    position_risk = repo.get_position_risk(TickerSymbol.BTCUSDT)
-    account_info = repo.get_account_info()
-    entry_price = float(data["a"]["P"][0]["ep"] if data else position_risk.entryPrice)
-    break_even_price = float(data["a"]["P"][0]["bep"] if data else 0.0)
-    accumulated_realized = float(data["a"]["P"][0]["cr"] if data else 0.0)
-    unrealized = float(
-        data["a"]["P"][0]["up"] if data else account_info.totalCrossUnPnl
+def get_display_data(
+    data: AccountUpdate | None, last_account_updated: str | None = None
+) -> tuple[dict[str, str], dict[str, str]]:
+    provider = DisplayDataProvider()
+    mark_price = provider.get(MARK_PRICE)
+    last_price = provider.get(LAST_PRICE)
+    position_risk = provider.get(POSITION)
+    account_info = provider.get(ACCOUNT_INFO)
+    if None in (
+        mark_price.value,
+        last_price.value,
+        position_risk.value,
+        account_info.value,
+    ):
+        return {"status": "[yellow]waiting for data"}, {}
+    now = time.time()
+    mark_stale = f_stale(mark_price.age(now), provider.stale_seconds)
+    last_stale = f_stale(last_price.age(now), provider.stale_seconds)
+    position_stale = f_stale(position_risk.age(now), provider.stale_seconds)
+    account_stale = f_stale(account_info.age(now), provider.stale_seconds)
+    mark_price = mark_price.value
+    last_price = last_price.value
+    position_risk = position_risk.value
+    account_info = account_info.value
+    symbol = provider.symbol
+    positions = data.positions if data else []
+    position = next((p for p in positions if p.symbol == symbol.name), None)
+    balance = data.balances[0] if data and data.balances else None
+    entry_price = position.entry_price if position else position_risk.entryPrice
+    break_even_price = position.break_even_price if position else 0.0
+    accumulated_realized = position.accumulated_realized if position else 0.0
+    unrealized = (
+        position.unrealized_profit if position else account_info.totalCrossUnPnl
     )
-    position_amount = float(
-        data["a"]["P"][0]["pa"] if data else position_risk.positionAmt
+    position_amount = (
+        position.position_amount if position else position_risk.positionAmt
     )
-    wallet_balance = float(
-        data["a"]["B"][0]["wb"] if data else account_info.totalWalletBalance
+    wallet_balance = (
+        balance.wallet_balance if balance else account_info.totalWalletBalance
     )
     liquidation_price = position_risk.liquidationPrice
     balance_minus_unrealized = wallet_balance - unrealized
     balance_plus_unrealized = wallet_balance + unrealized
     price_change_mark = mark_price - entry_price
     pnl_mark = price_change_mark * position_amount
-    pnl_pct_mark = float(float(price_change_mark / entry_price) * 100.0)
+    pnl_pct_mark = (
+        float(float(price_change_mark / entry_price) * 100.0) if entry_price else 0.0
+    )
     price_change_last = last_price - entry_price
     pnl_last = price_change_last * position_amount
-    pnl_pct_last = float(float(price_change_last / last_price) * 100.0)
+    pnl_pct_last = (
+        float(float(price_change_last / last_price) * 100.0) if last_price else 0.0
+    )
     display_data_1 = {
-        "mark_price": f_money(mark_price),
-        "last_price": f_money(last_price),
+        "mark_price": f_money(mark_price) + mark_stale,
+        "last_price": f_money(last_price) + last_stale,
         "entry_price": f_money(entry_price),
         "break_even_price": f_money(break_even_price),
         "accumulated_realized": f_money(accumulated_realized),
         "unrealized": f_money(unrealized),
-        "position_amount": f"{position_amount}",
-        "liquidation_price": f_money(liquidation_price),
-        "wallet_balance": f_money(wallet_balance, "yellow"),
+        "position_amount": f"{position_amount}" + position_stale,
+        "liquidation_price": f_money(liquidation_price) + position_stale,
+        "wallet_balance": f_money(wallet_balance, "yellow") + account_stale,
         "balance_minus_unrealized-realized": f_money(balance_minus_unrealized),
     }
 
@@ -138,8 +190,8 @@ def get_display_data(data) -> tuple[dict[str, str], dict[str, str]]:
         "profit_loss_percentage": f_pct(pnl_pct_mark),
         "profit_loss_percentage_last": f_pct(pnl_pct_last),
     }
-    if "last_account_updated" in data:
-        display_data_2["last_account_updated"] = data["last_account_updated"]
+    if last_account_updated is not None:
+        display_data_2["last_account_updated"] = last_account_updated
     return (
         display_data_1,
         display_data_2,
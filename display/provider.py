@@ -0,0 +1,161 @@
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from base.helpers import Singleton
+from data.account_state import AccountState
+from data.enums import RequestPriority, TickerSymbol
+from network.stream_decoder import AccountUpdate
+from repository.repository import TradeRepo
+
+MARK_PRICE = "mark_price"
+LAST_PRICE = "last_price"
+POSITION = "position"
+ACCOUNT_INFO = "account_info"
+OPEN_ORDERS = "open_orders"
+HEADROOM = "headroom"
+FIELDS = (MARK_PRICE, LAST_PRICE, POSITION, ACCOUNT_INFO, OPEN_ORDERS, HEADROOM)
+
+
+@dataclass(slots=True)
+class DisplayField:
+    value: Any = None
+    updated_at: float = 0.0
+
+    def age(self, now: float | None = None) -> float:
+        if self.updated_at == 0.0:
+            return math.inf
+        return (now if now is not None else time.time()) - self.updated_at
+
+
+class DisplayDataProvider(metaclass=Singleton):
+    def __init__(
+        self,
+        repo: TradeRepo | None = None,
+        account_state: AccountState | None = None,
+        symbol: TickerSymbol = TickerSymbol.BTCUSDT,
+        poll_seconds: float = 5.0,
+        stale_seconds: float = 15.0,
+    ) -> None:
+        self.repo = repo if repo is not None else TradeRepo()
+        self.account_state = account_state
+        self.symbol = symbol
+        self.poll_seconds = poll_seconds
+        self.stale_seconds = stale_seconds
+        self.fields = {name: DisplayField() for name in FIELDS}
+        self.failures: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def set_symbol(self, symbol: TickerSymbol) -> None:
+        with self._lock:
+            if symbol is self.symbol:
+                return
+            self.symbol = symbol
+            self.fields = {name: DisplayField() for name in FIELDS}
+
+    def set(self, name: str, value: Any, updated_at: float | None = None) -> None:
+        with self._lock:
+            self.fields[name] = DisplayField(
+                value=value,
+                updated_at=updated_at if updated_at is not None else time.time(),
+            )
+
+    def set_failures(self, symbol: str, failures: int) -> None:
+        with self._lock:
+            self.failures = {**self.failures, symbol: failures}
+
+    def get_failing(self) -> dict[str, int]:
+        with self._lock:
+            return {symbol: n for symbol, n in self.failures.items() if n}
+
+    def get(self, name: str) -> DisplayField:
+        with self._lock:
+            field = self.fields[name]
+            return DisplayField(value=field.value, updated_at=field.updated_at)
+
+    def value(self, name: str, default: Any = None) -> Any:
+        value = self.get(name).value
+        return value if value is not None else default
+
+    def is_stale(self, name: str, now: float | None = None) -> bool:
+        return self.get(name).age(now) > self.stale_seconds
+
+    def on_event(self, data) -> None:
+        if isinstance(data, AccountUpdate):
+            self.update_from_state()
+            return
+        if not isinstance(data, dict):
+            return
+        event_type = data.get("e")
+        if event_type == "markPriceUpdate" and data["s"] == self.symbol.name:
+            self.set(MARK_PRICE, float(data["p"]))
+        elif event_type in ["aggTrade", "trade"] and data["s"] == self.symbol.name:
+            self.set(LAST_PRICE, float(data["p"]))
+        elif event_type in ["ACCOUNT_UPDATE", "ORDER_TRADE_UPDATE"]:
+            self.update_from_state()
+
+    def update_from_state(self) -> bool:
+        state = self.account_state
+        symbol = self.symbol
+        if state is None or not state.is_ready(symbol):
+            return False
+        updated_at = state.updated_at
+        self.set(POSITION, state.get_position(symbol), updated_at)
+        self.set(ACCOUNT_INFO, state.get_account_info(), updated_at)
+        self.set(OPEN_ORDERS, state.get_open_orders(symbol), updated_at)
+        if self.get(MARK_PRICE).updated_at < updated_at:
+            self.set(MARK_PRICE, state.get_mark_price(symbol), updated_at)
+        if self.get(LAST_PRICE).updated_at == 0.0:
+            self.set(LAST_PRICE, state.get_last_price(symbol), updated_at)
+        return True
+
+    def update_from_repo(self) -> None:
+        symbol = self.symbol
+        getters: dict[str, Callable[[], Any]] = {
+            MARK_PRICE: lambda: self.repo.get_mark_price(symbol).markPrice,
+            LAST_PRICE: lambda: float(self.repo.get_ticker_price(symbol)),
+            POSITION: lambda: self.repo.get_position_risk(symbol),
+            ACCOUNT_INFO: lambda: self.repo.get_account_info(),
+            OPEN_ORDERS: lambda: self.repo.get_open_orders(symbol),
+        }
+        with self.repo.rate_limiter.priority(RequestPriority.DISPLAY):
+            for name, getter in getters.items():
+                try:
+                    self.set(name, getter())
+                except Exception as e:
+                    logging.error(e)
+
+    def poll(self) -> None:
+        headroom = self.repo.get_rate_limit_headroom()
+        self.set(HEADROOM, min(headroom.values(), default=1.0))
+        if not self.update_from_state():
+            self.update_from_repo()
+
+    def start(self) -> "DisplayDataProvider":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._poll_loop, name="display-data", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _poll_loop(self) -> None:
+        while True:
+            try:
+                self.poll()
+            except Exception as e:
+                logging.error(e)
+            if self._stop.wait(self.poll_seconds):
+                return
@@ -5,8 +5,15 @@ from rich.table import Table
 
 from base.helpers import Singleton
 from data.enums import TickerSymbol
-from display.utils import f_money
-from repository.repository import TradeRepo
+from display.provider import (
+    HEADROOM,
+    LAST_PRICE,
+    MARK_PRICE,
+    OPEN_ORDERS,
+    POSITION,
+    DisplayDataProvider,
+)
+from display.utils import f_failing, f_money, f_pct, f_stale
 from utils.timeutils import get_date_and_time
 
 
@@ -39,17 +46,26 @@ class Right:
 
 
 class Footer(metaclass=Singleton):
+    def __init__(self, symbol: TickerSymbol = TickerSymbol.BTCUSDT) -> None:
+        self.symbol = symbol
+
     def __rich__(self) -> Panel:
-        repo = TradeRepo()
-        orders = repo.get_open_orders(TickerSymbol.BTCUSDT)
+        provider = DisplayDataProvider()
+        orders = provider.value(OPEN_ORDERS, [])
+        position_risk = provider.get(POSITION)
+        mark_price = provider.value(MARK_PRICE, 0.0)
+        last_price = provider.value(LAST_PRICE, 0.0)
+        headroom = provider.value(HEADROOM, 1.0)
+        failing = f_failing(provider.get_failing())
+        if position_risk.value is None:
+            return Panel(f"[yellow]waiting for data[/yellow]{failing}", title="Footer")
+        stale = f_stale(position_risk.age(), provider.stale_seconds)
+        position_risk = position_risk.value
         open_buy_orders_num = sum(order["side"] == "BUY" for order in orders)
         open_sell_orders_num = sum(order["side"] == "SELL" for order in orders)
-        position_risk = repo.get_position_risk(TickerSymbol.BTCUSDT)
-        mark_price = repo.get_mark_price(TickerSymbol.BTCUSDT).markPrice
-        last_price = float(repo.get_ticker_price(TickerSymbol.BTCUSDT))
         pnl_mark = (mark_price - position_risk.entryPrice) * position_risk.positionAmt
         pnl_last = (last_price - position_risk.entryPrice) * position_risk.positionAmt
         return Panel(
-            f"OBO={open_buy_orders_num}, OSO={open_sell_orders_num}, LVRG={position_risk.leverage}, PnLMrk={f_money(pnl_mark)}, PnLLst={f_money(pnl_last)}, Ps. Amt.={position_risk.positionAmt}, Ent. Price={f_money(position_risk.entryPrice)}, Mrk Price={f_money(mark_price)}, Lst Price={f_money(last_price)}, Last Update={get_date_and_time()}",
+            f"OBO={open_buy_orders_num}, OSO={open_sell_orders_num}, LVRG={position_risk.leverage}, PnLMrk={f_money(pnl_mark)}, PnLLst={f_money(pnl_last)}, Ps. Amt.={position_risk.positionAmt}, Ent. Price={f_money(position_risk.entryPrice)}, Mrk Price={f_money(mark_price)}, Lst Price={f_money(last_price)}, API Hdrm={f_pct(headroom * 100.0)}, Last Update={get_date_and_time()}{stale}{failing}",
             title="Footer",
         )
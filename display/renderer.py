@@ -0,0 +1,104 @@
+import logging
+import threading
+import time
+from typing import Any
+
+from rich.layout import Layout
+from rich.live import Live
+
+from display.display import update_account_tables, update_book_tables
+from display.provider import DisplayDataProvider
+from network.stream_decoder import AccountUpdate, DepthUpdate, decode_account_update
+
+ACCOUNT_PANEL = "account"
+BOOK_PANEL = "book"
+
+
+class DisplayRenderer:
+    def __init__(
+        self,
+        layout: Layout,
+        frame_rate: float = 4.0,
+        idle_refresh_seconds: float = 1.0,
+        live: Live | None = None,
+        provider: DisplayDataProvider | None = None,
+    ) -> None:
+        if frame_rate <= 0.0:
+            raise ValueError(f"frame_rate must be positive, got {frame_rate}")
+        self.layout = layout
+        self.frame_seconds = 1.0 / frame_rate
+        self.idle_refresh_seconds = idle_refresh_seconds
+        self.live = live
+        self.provider = provider
+        self.frames = 0
+        self.renders = {ACCOUNT_PANEL: 0, BOOK_PANEL: 0}
+        self.dropped = 0
+        self._pending: dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_refresh = 0.0
+
+    def on_event(self, data) -> None:
+        if self.provider is not None:
+            self.provider.on_event(data)
+        if isinstance(data, DepthUpdate):
+            panel, value = BOOK_PANEL, (data.bids, data.asks)
+        elif isinstance(data, AccountUpdate):
+            panel, value = ACCOUNT_PANEL, data
+        elif isinstance(data, dict) and data.get("e") == "depthUpdate":
+            panel, value = BOOK_PANEL, (data["b"], data["a"])
+        elif isinstance(data, dict) and data.get("e") == "ACCOUNT_UPDATE":
+            panel, value = ACCOUNT_PANEL, data
+        else:
+            return
+        with self._lock:
+            if panel in self._pending:
+                self.dropped += 1
+            self._pending[panel] = value
+
+    def render_once(self) -> bool:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if ACCOUNT_PANEL in pending:
+            data = pending[ACCOUNT_PANEL]
+            if isinstance(data, dict):
+                data = decode_account_update(data)
+            update_account_tables(data)
+            self.renders[ACCOUNT_PANEL] += 1
+        if BOOK_PANEL in pending:
+            bids, asks = pending[BOOK_PANEL]
+            update_book_tables(bids, asks)
+            self.renders[BOOK_PANEL] += 1
+        return bool(pending)
+
+    def refresh(self, changed: bool) -> None:
+        now = time.monotonic()
+        if self.live is None:
+            return
+        if changed or now - self._last_refresh >= self.idle_refresh_seconds:
+            self._last_refresh = now
+            self.live.refresh()
+            self.frames += 1
+
+    def start(self) -> "DisplayRenderer":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._render_loop, name="display-renderer", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _render_loop(self) -> None:
+        while not self._stop.wait(self.frame_seconds):
+            try:
+                self.refresh(self.render_once())
+            except Exception as e:
+                logging.error(e)
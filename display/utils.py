@@ -21,3 +21,18 @@ def f_pct(percentage: float) -> str:
         return f"[red]{formatted_percentage}[/red]"
     else:
         return formatted_percentage
+
+
+def f_stale(age: float, stale_seconds: float) -> str:
+    if age <= stale_seconds:
+        return ""
+    if age == float("inf"):
+        return " [yellow](n/a)[/yellow]"
+    return f" [yellow]({age:.0f}s)[/yellow]"
+
+
+def f_failing(failing: dict[str, int]) -> str:
+    if not failing:
+        return ""
+    symbols = ", ".join(f"{symbol} x{n}" for symbol, n in sorted(failing.items()))
+    return f" [red](failing: {symbols})[/red]"
@@ -1,21 +1,52 @@
 import contextlib
+import itertools
 import json
 import logging
+import threading
 import time
+from functools import partial
+from typing import Any
 
 import typer
 from binance.error import ClientError
 from binance.lib.utils import config_logging
 from rich.live import Live
 
-from data.enums import Strategy, TickerSymbol
-from display.display import generate_table, layout
+from base.consts import Settings
+from base.models.FileInput import FileInput
+from data.account_state import AccountState
+from data.enums import (
+    ExecutorBackend,
+    OrderTransport,
+    RecordKind,
+    Strategy,
+    TickerSymbol,
+)
+from data.exchange_info import ExchangeInfoCache
+from data.margin_engine import MarginEngine
+from data.order_book import LocalOrderBook
+from data.recorder import StreamRecorder
+from display.display import layout, set_display_symbol
+from display.provider import DisplayDataProvider
+from display.renderer import DisplayRenderer
+from network.stream_decoder import StreamDecoder
+from network.ws_order_client import WebsocketOrderClient
+from repository.async_repository import AsyncTradeRepo
 from repository.repository import TradeRepo
+from repository.ws_repository import WebsocketTradeRepo
 from strategy.all_price_match_queue import AllPriceMatchQueueStrategy
+from strategy.executor import OrderExecutor
 from strategy.fixed_range import FixedRangeStrategy
-from utils.fileutils import get_inputs_from_file
+from strategy.scheduler import StrategyScheduler
+from strategy.TradeStrategy import TradeStrategy
+from utils.fileutils import get_all_inputs_from_file
+from utils.metrics import RATE_LIMIT_HEADROOM, TICK_TO_ORDER, Metrics, MetricsServer
 
 FORMAT = "%(message)s"
+DEPTH_PATH = "/fapi/v1/depth"
+EXCHANGE_INFO_PATH = "/fapi/v1/exchangeInfo"
+STRATEGY_FAILURES = "strategy.failures"
+RETRY_SECONDS = 1.0
 
 # logging.basicConfig(
 #     level=logging.INFO,
@@ -24,56 +55,298 @@ FORMAT = "%(message)s"
 #     handlers=[RichHandler(markup=True)],
 # )
 config_logging(logging, logging.ERROR)
+logging.getLogger("metrics").setLevel(logging.INFO)
+
+
+order_books: dict[str, LocalOrderBook] = {}
+schedulers: dict[str, StrategyScheduler] = {}
+recorders: list[StreamRecorder] = []
+stream_decoder = StreamDecoder()
+renderer: DisplayRenderer | None = None
+symbol_failures: dict[str, int] = {}
+
+
+def record_rest(path: str, params: dict, response: Any) -> None:
+    for recorder in recorders:
+        recorder.record(
+            json.dumps({"path": path, "params": params, "response": response}),
+            kind=RecordKind.REST,
+        )
+
+
+def load_depth_snapshot(repo: TradeRepo, symbol: TickerSymbol) -> dict:
+    snapshot = repo.get_depth(symbol=symbol, limit=1000)
+    record_rest(DEPTH_PATH, {"symbol": symbol.name, "limit": 1000}, snapshot)
+    return snapshot
 
 
 def on_message(_, message) -> None:
-    data = json.loads(message)
-    if "data" in message:
-        generate_table(data=data["data"])
-        # live.update(renderable=, refresh=True)
+    received_ns = time.perf_counter_ns()
+    for recorder in recorders:
+        recorder.record(message)
+    stream, data = stream_decoder.decode(message)
+    if data is None:
+        return
+    if stream.endswith("@depth@100ms"):
+        order_book = order_books.get(data.symbol)
+        if order_book is not None:
+            order_book.on_depth_update(data)
+        return
+    AccountState().on_event(data)
+    for scheduler in schedulers.values():
+        scheduler.on_event(data, received_ns)
+    if renderer is not None:
+        renderer.on_event(data)
 
 
-def main() -> None:
-    live = Live(renderable=layout, refresh_per_second=1, screen=True)
-    live.start()
-    repo = TradeRepo()
-    file_input = get_inputs_from_file()
-    listen_key = repo.get_listen_key().listenKey
-    ws_client = repo.get_websocket_client(message_handler=on_message, is_combined=True)
-    ws_client.user_data(listen_key=listen_key, id=1)
-    ws_client.partial_book_depth(symbol=TickerSymbol.BTCUSDT.name, id=2, level=10, speed=100)
-    try:
-        max_leverage = file_input.leverage
-        while True:
-            repo.cancel_all_orders(TickerSymbol.BTCUSDT)
-            current_leverage = repo.get_position_risk(symbol=file_input.symbol).leverage
+def record_tick_to_order(
+    symbol: TickerSymbol,
+    scheduler: StrategyScheduler,
+    strategy: TradeStrategy | None,
+) -> None:
+    if strategy is None or strategy.acked_ns is None or scheduler.trigger_ns is None:
+        return
+    Metrics().record(
+        f"{TICK_TO_ORDER}.{symbol.name}", strategy.acked_ns - scheduler.trigger_ns
+    )
+
+
+def set_symbol_failures(symbol: TickerSymbol, failures: int) -> None:
+    symbol_failures[symbol.name] = failures
+    DisplayDataProvider().set_failures(symbol.name, failures)
+
+
+def run_symbol(
+    file_input: FileInput,
+    repo: TradeRepo,
+    order_repo: TradeRepo | WebsocketTradeRepo,
+    executor: OrderExecutor,
+    account_state: AccountState,
+    exchange_info: ExchangeInfoCache,
+    margin_engine: MarginEngine | None,
+    stop_event: threading.Event,
+) -> None:
+    symbol = file_input.symbol
+    scheduler = schedulers[symbol.name]
+    max_leverage = file_input.leverage
+    failures = 0
+    set_symbol_failures(symbol, failures)
+    while not stop_event.is_set():
+        try:
+            strategy_1 = strategy_2 = None
+            if (
+                not file_input.reconcile
+                or file_input.strategy is not Strategy.FIXED_RANGE
+            ):
+                repo.cancel_all_orders(symbol)
+            position = account_state.get_position(symbol)
+            current_leverage = position.leverage
+            if margin_engine is not None:
+                max_leverage = min(
+                    file_input.leverage, margin_engine.max_leverage(position.notional)
+                )
             try:
                 if max_leverage > current_leverage:
-                    repo.change_initial_leverage(file_input.symbol, current_leverage + 1)
+                    repo.change_initial_leverage(symbol, current_leverage + 1)
+                    account_state.set_leverage(symbol, current_leverage + 1)
                 elif max_leverage < current_leverage:
-                    repo.change_initial_leverage(file_input.symbol, current_leverage - 1)
+                    repo.change_initial_leverage(symbol, current_leverage - 1)
+                    account_state.set_leverage(symbol, current_leverage - 1)
             except ClientError as e:
                 logging.error(e)
             if file_input.strategy is Strategy.FIXED_RANGE:
-                strategy_1 = FixedRangeStrategy(file_input=file_input)
+                strategy_1 = FixedRangeStrategy(
+                    file_input=file_input,
+                    repo=order_repo,
+                    executor=executor,
+                    order_book=order_books.get(symbol.name),
+                    account_state=account_state,
+                    exchange_info=exchange_info,
+                    margin_engine=margin_engine,
+                )
                 strategy_1.run_loop()
+                scheduler.set_grid_center(strategy_1.center_price)
             elif file_input.strategy is Strategy.PRICE_MATCH_QUEUE:
-                strategy_2 = AllPriceMatchQueueStrategy(file_input=file_input)
+                strategy_2 = AllPriceMatchQueueStrategy(
+                    file_input=file_input,
+                    repo=order_repo,
+                    executor=executor,
+                    order_book=order_books.get(symbol.name),
+                    account_state=account_state,
+                    exchange_info=exchange_info,
+                    margin_engine=margin_engine,
+                )
                 strategy_2.run_loop()
-            if file_input.once:
-                break
-            with contextlib.suppress(ClientError):
-                repo.keep_alive(listen_key=listen_key)
-                ws_client.ping()
-            time.sleep(file_input.delay_seconds)
+                scheduler.set_grid_center(strategy_2.center_price)
+            record_tick_to_order(symbol, scheduler, strategy_1 or strategy_2)
+            failures = 0
+        except Exception as e:
+            failures += 1
+            logging.error(msg=f"{symbol.name}: {e}")
+        set_symbol_failures(symbol, failures)
+        if file_input.once:
+            break
+        if failures:
+            stop_event.wait(
+                min(RETRY_SECONDS * 2 ** (failures - 1), file_input.delay_seconds)
+            )
+        elif file_input.event_driven:
+            scheduler.wait()
+        else:
+            stop_event.wait(file_input.delay_seconds)
+
+
+def run(file_inputs: list[FileInput], display: bool = True) -> None:
+    global renderer
+    repo = TradeRepo()
+    settings = file_inputs[0]
+    account_state = AccountState(repo=repo)
+    Metrics().register_gauge(RATE_LIMIT_HEADROOM, repo.rate_limiter.headroom)
+    Metrics().register_gauge(STRATEGY_FAILURES, lambda: dict(symbol_failures))
+    display_data = DisplayDataProvider(
+        repo=repo, account_state=account_state, symbol=settings.symbol
+    )
+    set_display_symbol(settings.symbol)
+    live = Live(renderable=layout, auto_refresh=False, screen=True)
+    if display:
+        display_data.start()
+        live.start()
+        renderer = DisplayRenderer(
+            layout=layout,
+            frame_rate=settings.display_frame_rate,
+            live=live,
+            provider=display_data,
+        ).start()
+    exchange_info = ExchangeInfoCache(repo=repo)
+    with contextlib.suppress(ClientError):
+        exchange_info.load().start()
+        repo.rate_limiter.seed(exchange_info.get_rate_limits())
+    margin_engines: dict[str, MarginEngine | None] = {}
+    for file_input in file_inputs:
+        margin_engines[file_input.symbol.name] = None
+        with contextlib.suppress(ClientError):
+            margin_engines[file_input.symbol.name] = MarginEngine(
+                repo.get_leverage_brackets(file_input.symbol)
+            )
+    executor = OrderExecutor(
+        backend=settings.executor_backend,
+        max_workers=settings.executor_workers,
+        async_repo_factory=partial(
+            AsyncTradeRepo, rate_limiter=repo.rate_limiter, encoder=repo.encoder
+        )
+        if settings.executor_backend is ExecutorBackend.ASYNCIO
+        else None,
+        rate_limiter=repo.rate_limiter,
+    ).start()
+    ws_order_client = None
+    if any(f.order_transport is OrderTransport.WEBSOCKET for f in file_inputs):
+        ws_order_client = WebsocketOrderClient(
+            key=Settings().KEY, secret=Settings().SECRET, url=Settings().WS_API_URL
+        ).start()
+    metrics_server = MetricsServer(
+        port=settings.metrics_port or None,
+        summary_seconds=settings.metrics_summary_seconds,
+    ).start()
+    if settings.record:
+        recorders.append(StreamRecorder(directory=settings.record_directory).start())
+        if exchange_info.exchange_info is not None:
+            record_rest(EXCHANGE_INFO_PATH, {}, exchange_info.exchange_info)
+    for file_input in file_inputs:
+        filters = exchange_info.get_filters(file_input.symbol)
+        repo.encoder.set_increments(
+            file_input.symbol, filters.tick_size, filters.step_size
+        )
+        schedulers[file_input.symbol.name] = StrategyScheduler(
+            symbol=file_input.symbol.name,
+            tick_size=filters.tick_size,
+            trigger_ticks=file_input.trigger_ticks,
+            debounce_seconds=file_input.debounce_seconds,
+            max_staleness_seconds=file_input.delay_seconds,
+        )
+        account_state.track(file_input.symbol)
+    account_state.start()
+    listen_key = repo.get_listen_key().listenKey
+    ws_client = repo.get_websocket_client(message_handler=on_message, is_combined=True)
+    ws_client.user_data(listen_key=listen_key, id=1)
+    ws_client.partial_book_depth(
+        symbol=settings.symbol.name, id=2, level=10, speed=100
+    )
+    stream_ids = itertools.count(3)
+    for file_input in file_inputs:
+        symbol = file_input.symbol
+        order_books[symbol.name] = LocalOrderBook(
+            symbol=symbol.name,
+            snapshot_loader=partial(load_depth_snapshot, repo, symbol),
+            tick_size=exchange_info.get_filters(symbol).tick_size,
+        )
+        ws_client.diff_book_depth(symbol=symbol.name, id=next(stream_ids), speed=100)
+        ws_client.mark_price(symbol=symbol.name, id=next(stream_ids), speed=1)
+        ws_client.agg_trade(symbol=symbol.name, id=next(stream_ids))
+    stop_event = threading.Event()
+    threads = [
+        threading.Thread(
+            target=run_symbol,
+            args=(
+                file_input,
+                repo,
+                WebsocketTradeRepo(repo=repo, client=ws_order_client)
+                if file_input.order_transport is OrderTransport.WEBSOCKET
+                else repo,
+                executor,
+                account_state,
+                exchange_info,
+                margin_engines[file_input.symbol.name],
+                stop_event,
+            ),
+            name=f"{file_input.symbol.name}-strategy",
+            daemon=True,
+        )
+        for file_input in file_inputs
+    ]
+    for thread in threads:
+        thread.start()
+    keep_alive_seconds = min(file_input.delay_seconds for file_input in file_inputs)
+    try:
+        last_keep_alive = time.monotonic()
+        while alive := [thread for thread in threads if thread.is_alive()]:
+            alive[0].join(timeout=keep_alive_seconds)
+            if time.monotonic() - last_keep_alive >= keep_alive_seconds:
+                last_keep_alive = time.monotonic()
+                with contextlib.suppress(ClientError):
+                    repo.keep_alive(listen_key=listen_key)
+                    ws_client.ping()
     except Exception as e:
         logging.error(msg=e)
     finally:
-        live.stop()
+        if renderer is not None:
+            renderer.stop()
+            renderer = None
+        if display:
+            live.stop()
+        display_data.stop()
+        stop_event.set()
+        for scheduler in schedulers.values():
+            scheduler.stop()
+        for thread in threads:
+            thread.join()
+        executor.shutdown()
+        if ws_order_client is not None:
+            ws_order_client.stop()
+        account_state.stop()
+        exchange_info.stop()
+        metrics_server.stop()
+        Metrics().remove_gauge(RATE_LIMIT_HEADROOM)
+        Metrics().remove_gauge(STRATEGY_FAILURES)
         ws_client.stop()
+        for recorder in recorders:
+            recorder.stop()
         repo.close_listen_key(listen_key=listen_key)
         typer.Exit()
 
 
+def main() -> None:
+    run(get_all_inputs_from_file())
+
+
 if __name__ == "__main__":
     typer.run(function=main)
@@ -0,0 +1,46 @@
+import asyncio
+
+import typer
+
+from mock_exchange.exchange import MockExchange, MockExchangeConfig
+
+
+def main(
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    symbol: str = "BTCUSDT",
+    price: float = 30000.0,
+    latency_seconds: float = 0.0,
+    jitter_seconds: float = 0.0,
+    error_rate: float = 0.0,
+    key: str = "mock-key",
+    secret: str = "mock-secret",
+) -> None:
+    exchange = MockExchange(
+        config=MockExchangeConfig(
+            key=key,
+            secret=secret,
+            prices={symbol: price},
+            latency_seconds=latency_seconds,
+            jitter_seconds=jitter_seconds,
+            error_rate=error_rate,
+        ),
+        host=host,
+        port=port,
+    )
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(exchange.open())
+    print(
+        f"BASE_URL={exchange.base_url} STREAM_URL={exchange.stream_url}"
+        f" WS_API_URL={exchange.ws_api_url}"
+    )
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        loop.run_until_complete(exchange.close())
+
+
+if __name__ == "__main__":
+    typer.run(function=main)
@@ -0,0 +1,815 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+from urllib.parse import parse_qsl
+
+import numpy as np
+from aiohttp import WSMsgType, web
+
+from backtest.matching import MatchingEngine
+from backtest.repository import SimulatedTradeRepo
+from data.enums import PositionSide, Side, TickerSymbol
+from network.network import get_depth_weight
+
+Handler = Callable[[web.Request, dict[str, str]], Awaitable[Any]]
+INVALID_SIGNATURE = {"code": -1022, "msg": "Signature for this request is not valid."}
+INVALID_API_KEY = {
+    "code": -2015,
+    "msg": "Invalid API-key, IP, or permissions for action.",
+}
+TOO_MANY_REQUESTS = {
+    "code": -1003,
+    "msg": "Too many requests; current limit is exceeded.",
+}
+TOO_MANY_ORDERS = {
+    "code": -1015,
+    "msg": "Too many new orders; current limit is exceeded.",
+}
+INTERNAL_ERROR = {
+    "code": -1001,
+    "msg": "Internal error; unable to process your request. Please try again.",
+}
+ORDER_NOT_FOUND = {"code": -2013, "msg": "Order does not exist."}
+INVALID_LISTEN_KEY = {"code": -1125, "msg": "This listenKey does not exist."}
+UNKNOWN_METHOD = {
+    "code": -1100,
+    "msg": "Illegal characters found in parameter 'method'.",
+}
+
+
+@dataclass
+class MockExchangeConfig:
+    key: str = "mock-key"
+    secret: str = "mock-secret"
+    prices: dict[str, float] = field(default_factory=lambda: {"BTCUSDT": 30000.0})
+    tick_size: float = 0.1
+    initial_balance: float = 1000.0
+    leverage: int = 1
+    latency_seconds: float = 0.0
+    jitter_seconds: float = 0.0
+    error_rate: float = 0.0
+    weight_limit: int = 2400
+    order_limit_10s: int = 300
+    order_limit_1m: int = 1200
+    market_seconds: float = 0.1
+    volatility_ticks: int = 5
+    depth_levels: int = 20
+    level_quantity: float = 1.0
+    check_signature: bool = True
+    seed: int = 0
+
+
+class MockSymbol:
+    def __init__(self, symbol: str, price: float, config: MockExchangeConfig) -> None:
+        self.symbol = symbol
+        self.engine = MatchingEngine(tick_size=config.tick_size)
+        self.engine.set_market(time.time() * 1000, price, is_buyer_maker=True)
+        self.repo = SimulatedTradeRepo(
+            engine=self.engine, initial_balance=0.0, leverage=config.leverage
+        )
+        self.update_id = 1
+        self.book: dict[str, dict[float, float]] = {"b": {}, "a": {}}
+        self.orders: dict[int, dict[str, Any]] = {}
+
+    def get_levels(self, levels: int, quantity: float) -> dict[str, dict[float, float]]:
+        tick = self.engine.tick_size
+        return {
+            "b": {
+                round(self.engine.best_bid - i * tick, 8): quantity
+                for i in range(levels)
+            },
+            "a": {
+                round(self.engine.best_ask + i * tick, 8): quantity
+                for i in range(levels)
+            },
+        }
+
+    def get_margin(self) -> float:
+        engine = self.engine
+        orders = sum(
+            o.price * o.remaining
+            for o in engine.orders.values()
+            if o.side == Side.BUY.value
+        )
+        position = abs(self.repo.position_amount) * engine.last_price
+        return (position + orders) / self.repo.leverage
+
+
+class MockExchange:
+    def __init__(
+        self,
+        config: MockExchangeConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.config = config if config is not None else MockExchangeConfig()
+        self.host = host
+        self.port = port
+        self.symbols = {
+            symbol: MockSymbol(symbol, price, self.config)
+            for symbol, price in self.config.prices.items()
+        }
+        for mock_symbol in self.symbols.values():
+            mock_symbol.engine.on_fill = self._fill_handler(mock_symbol)
+        self.random = random.Random(self.config.seed)
+        self.listen_keys: set[str] = set()
+        self.sockets: dict[web.WebSocketResponse, tuple[bool, set[str]]] = {}
+        self.api_sockets: set[web.WebSocketResponse] = set()
+        self.api_methods: dict[str, Callable[[dict[str, str]], dict[str, Any]]] = {
+            "order.place": self.place_order,
+            "order.modify": self.modify_order,
+            "order.cancel": self.cancel_order,
+        }
+        self.windows: dict[str, tuple[int, int]] = {}
+        self.requests = 0
+        self.orders = 0
+        self.errors = 0
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._runner: web.AppRunner | None = None
+        self._market_task: asyncio.Task | None = None
+        self._pending_events: list[tuple[str, dict[str, Any]]] = []
+        self._thread: threading.Thread | None = None
+        self._started = threading.Event()
+        self.app = self.create_app()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def stream_url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    @property
+    def ws_api_url(self) -> str:
+        return f"ws://{self.host}:{self.port}/ws-fapi/v1"
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        routes = [
+            ("POST", "/fapi/v1/order", self.new_order, 0, True),
+            ("POST", "/fapi/v1/batchOrders", self.new_batch_orders, 5, True),
+            ("PUT", "/fapi/v1/batchOrders", self.modify_batch_orders, 5, True),
+            ("DELETE", "/fapi/v1/batchOrders", self.cancel_batch_orders, 1, True),
+            ("DELETE", "/fapi/v1/allOpenOrders", self.cancel_all_orders, 1, True),
+            ("GET", "/fapi/v1/openOrders", self.get_open_orders, 1, True),
+            ("GET", "/fapi/v1/openOrder", self.get_open_order, 1, True),
+            ("GET", "/fapi/v2/positionRisk", self.get_position_risk, 5, True),
+            ("GET", "/fapi/v3/positionRisk", self.get_position_risk, 5, True),
+            ("GET", "/fapi/v2/account", self.get_account, 5, True),
+            ("GET", "/fapi/v3/account", self.get_account, 5, True),
+            ("GET", "/fapi/v2/balance", self.get_balance, 5, True),
+            ("GET", "/fapi/v3/balance", self.get_balance, 5, True),
+            ("POST", "/fapi/v1/leverage", self.change_leverage, 1, True),
+            ("GET", "/fapi/v1/premiumIndex", self.get_mark_price, 1, False),
+            ("GET", "/fapi/v1/ticker/price", self.get_ticker_price, 1, False),
+            ("GET", "/fapi/v1/depth", self.get_depth, None, False),
+            ("GET", "/fapi/v1/time", self.get_time, 1, False),
+            ("POST", "/fapi/v1/listenKey", self.new_listen_key, 1, False),
+            ("PUT", "/fapi/v1/listenKey", self.renew_listen_key, 1, False),
+            ("DELETE", "/fapi/v1/listenKey", self.close_listen_key, 1, False),
+        ]
+        for method, path, handler, weight, signed in routes:
+            app.router.add_route(
+                method, path, self.endpoint(handler, weight=weight, signed=signed)
+            )
+        app.router.add_get("/stream", self.stream_handler)
+        app.router.add_get("/ws", self.stream_handler)
+        app.router.add_get("/ws-fapi/v1", self.ws_api_handler)
+        return app
+
+    def endpoint(
+        self, handler: Handler, weight: int | None, signed: bool
+    ) -> Callable:
+        async def wrapper(request: web.Request) -> web.Response:
+            self.requests += 1
+            await self.delay()
+            raw_query = request.raw_path.partition("?")[2]
+            params = dict(parse_qsl(raw_query, keep_blank_values=True))
+            if request.headers.get("X-MBX-APIKEY") != self.config.key and (
+                signed or request.path.endswith("listenKey")
+            ):
+                return self.error_response(401, INVALID_API_KEY)
+            if signed and self.config.check_signature:
+                if not self.check_signature(raw_query):
+                    return self.error_response(400, INVALID_SIGNATURE)
+            if self.config.error_rate and self.random.random() < self.config.error_rate:
+                return self.error_response(503, INTERNAL_ERROR)
+            orders = get_order_count(request, params)
+            if weight is None:
+                weight_used = get_depth_weight(int(params.get("limit", 500)))
+            else:
+                weight_used = weight
+            headers, error = self.consume(weight_used, orders)
+            if error is not None:
+                return self.error_response(429, error, headers)
+            response = await handler(request, params)
+            self.flush_events()
+            return web.json_response(response, headers=headers)
+
+        return wrapper
+
+    async def delay(self) -> None:
+        delay = self.config.latency_seconds
+        if self.config.jitter_seconds:
+            delay += self.random.uniform(0.0, self.config.jitter_seconds)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def error_response(
+        self, status: int, error: dict[str, Any], headers: dict[str, str] | None = None
+    ) -> web.Response:
+        self.errors += 1
+        return web.json_response(error, status=status, headers=headers)
+
+    def check_signature(self, raw_query: str) -> bool:
+        query, _, signature = raw_query.rpartition("&signature=")
+        expected = hmac.new(
+            self.config.secret.encode("utf-8"), query.encode("utf-8"), hashlib.sha256
+        ).hexdigest()
+        return hmac.compare_digest(expected, signature)
+
+    def consume(
+        self, weight: int, orders: int
+    ) -> tuple[dict[str, str], dict[str, Any] | None]:
+        now = time.time()
+        limits = [("WEIGHT-1M", 60, weight, self.config.weight_limit)]
+        if orders:
+            limits += [
+                ("ORDER-COUNT-10S", 10, orders, self.config.order_limit_10s),
+                ("ORDER-COUNT-1M", 60, orders, self.config.order_limit_1m),
+            ]
+        headers = {}
+        error = None
+        for name, seconds, amount, limit in limits:
+            window = int(now // seconds)
+            current, used = self.windows.get(name, (window, 0))
+            used = used + amount if current == window else amount
+            self.windows[name] = (window, used)
+            header = "USED-WEIGHT-1M" if name == "WEIGHT-1M" else name
+            headers[f"X-MBX-{header}"] = str(used)
+            if used > limit and error is None:
+                error = TOO_MANY_REQUESTS if name == "WEIGHT-1M" else TOO_MANY_ORDERS
+                headers["Retry-After"] = str(int(seconds - now % seconds) + 1)
+        if orders and error is None:
+            self.orders += orders
+        return headers, error
+
+    def get_symbol(self, params: dict[str, str]) -> MockSymbol:
+        symbol = params.get("symbol", next(iter(self.symbols)))
+        if symbol not in self.symbols:
+            raise web.HTTPBadRequest(
+                text=json.dumps({"code": -1121, "msg": "Invalid symbol."}),
+                content_type="application/json",
+            )
+        return self.symbols[symbol]
+
+    def submit(self, mock_symbol: MockSymbol, order: dict[str, Any]) -> dict[str, Any]:
+        response = mock_symbol.engine.submit(order)
+        if response.get("status") == "NEW":
+            mock_symbol.orders[response["orderId"]] = response
+            self.emit_order(mock_symbol, response, "NEW")
+        elif response.get("status") == "FILLED":
+            self.emit_order(
+                mock_symbol,
+                response,
+                "TRADE",
+                last_price=float(response["avgPrice"]),
+                last_quantity=float(response["executedQty"]),
+            )
+        return response
+
+    async def new_order(self, request: web.Request, params: dict[str, str]) -> Any:
+        return self.submit(self.get_symbol(params), params)
+
+    async def new_batch_orders(self, request: web.Request, params: dict[str, str]):
+        return [
+            self.submit(self.get_symbol(order), order)
+            for order in json.loads(params["batchOrders"])
+        ]
+
+    async def modify_batch_orders(self, request: web.Request, params: dict[str, str]):
+        responses = []
+        for order in json.loads(params["batchOrders"]):
+            mock_symbol = self.get_symbol(order)
+            response = mock_symbol.engine.modify(order)
+            if "orderId" in response and response["status"] == "NEW":
+                self.emit_order(mock_symbol, response, "AMENDMENT")
+            responses.append(response)
+        return responses
+
+    async def cancel_batch_orders(self, request: web.Request, params: dict[str, str]):
+        mock_symbol = self.get_symbol(params)
+        responses = []
+        for order_id in json.loads(params["orderIdList"]):
+            response = mock_symbol.engine.cancel(order_id)
+            if "orderId" in response:
+                self.emit_order(mock_symbol, response, "CANCELED")
+            responses.append(response)
+        return responses
+
+    async def cancel_all_orders(self, request: web.Request, params: dict[str, str]):
+        mock_symbol = self.get_symbol(params)
+        for order_id in list(mock_symbol.engine.orders):
+            response = mock_symbol.engine.cancel(order_id)
+            self.emit_order(mock_symbol, response, "CANCELED")
+        return {"code": 200, "msg": "The operation of cancel all open order is done."}
+
+    async def get_open_orders(self, request: web.Request, params: dict[str, str]):
+        return self.get_symbol(params).engine.open_orders()
+
+    async def get_open_order(self, request: web.Request, params: dict[str, str]):
+        order = self.get_symbol(params).engine.orders.get(int(params["orderId"]))
+        if order is None:
+            raise web.HTTPBadRequest(
+                text=json.dumps(ORDER_NOT_FOUND), content_type="application/json"
+            )
+        return order.to_response()
+
+    async def get_position_risk(self, request: web.Request, params: dict[str, str]):
+        if "symbol" in params:
+            symbols = [self.get_symbol(params)]
+        else:
+            symbols = list(self.symbols.values())
+        return [
+            s.repo.get_position_risk(TickerSymbol(s.symbol)).model_dump()
+            for s in symbols
+        ]
+
+    def get_wallet_balance(self) -> tuple[float, float, float]:
+        wallet = self.config.initial_balance + sum(
+            s.repo.wallet_balance for s in self.symbols.values()
+        )
+        unrealized = sum(s.repo.unrealized_pnl for s in self.symbols.values())
+        margin = sum(s.get_margin() for s in self.symbols.values())
+        return wallet, unrealized, max(wallet + unrealized - margin, 0.0)
+
+    async def get_account(self, request: web.Request, params: dict[str, str]):
+        wallet, unrealized, available = self.get_wallet_balance()
+        now = int(time.time() * 1000)
+        asset = {
+            "asset": "USDT",
+            "walletBalance": str(wallet),
+            "unrealizedProfit": str(unrealized),
+            "marginBalance": str(wallet + unrealized),
+            "maintMargin": "0",
+            "initialMargin": str(wallet + unrealized - available),
+            "positionInitialMargin": "0",
+            "openOrderInitialMargin": "0",
+            "crossWalletBalance": str(wallet),
+            "crossUnPnl": str(unrealized),
+            "availableBalance": str(available),
+            "maxWithdrawAmount": str(available),
+            "marginAvailable": True,
+            "updateTime": now,
+        }
+        return {
+            "feeTier": 0,
+            "canTrade": True,
+            "canDeposit": True,
+            "canWithdraw": True,
+            "updateTime": now,
+            "multiAssetsMargin": False,
+            "tradeGroupId": -1,
+            "totalInitialMargin": asset["initialMargin"],
+            "totalMaintMargin": "0",
+            "totalWalletBalance": str(wallet),
+            "totalUnrealizedProfit": str(unrealized),
+            "totalMarginBalance": asset["marginBalance"],
+            "totalPositionInitialMargin": "0",
+            "totalOpenOrderInitialMargin": "0",
+            "totalCrossWalletBalance": str(wallet),
+            "totalCrossUnPnl": str(unrealized),
+            "availableBalance": str(available),
+            "maxWithdrawAmount": str(available),
+            "assets": [asset],
+            "positions": [],
+        }
+
+    async def get_balance(self, request: web.Request, params: dict[str, str]):
+        account = await self.get_account(request, params)
+        return [{**account["assets"][0], "balance": account["totalWalletBalance"]}]
+
+    async def change_leverage(self, request: web.Request, params: dict[str, str]):
+        mock_symbol = self.get_symbol(params)
+        leverage = int(params["leverage"])
+        mock_symbol.repo.leverage = leverage
+        return {
+            "leverage": leverage,
+            "maxNotionalValue": str(mock_symbol.repo.max_notional_value),
+            "symbol": mock_symbol.symbol,
+        }
+
+    async def get_mark_price(self, request: web.Request, params: dict[str, str]):
+        engine = self.get_symbol(params).engine
+        return {
+            "symbol": params.get("symbol", next(iter(self.symbols))),
+            "markPrice": str(engine.last_price),
+            "indexPrice": str(engine.last_price),
+            "estimatedSettlePrice": str(engine.last_price),
+            "lastFundingRate": "0.0001",
+            "interestRate": "0.0001",
+            "nextFundingTime": 0,
+            "time": int(time.time() * 1000),
+        }
+
+    async def get_ticker_price(self, request: web.Request, params: dict[str, str]):
+        mock_symbol = self.get_symbol(params)
+        return {
+            "symbol": mock_symbol.symbol,
+            "price": str(mock_symbol.engine.last_price),
+            "time": int(time.time() * 1000),
+        }
+
+    async def get_depth(self, request: web.Request, params: dict[str, str]):
+        mock_symbol = self.get_symbol(params)
+        levels = mock_symbol.get_levels(
+            min(int(params.get("limit", 500)), self.config.depth_levels),
+            self.config.level_quantity,
+        )
+        now = int(time.time() * 1000)
+        return {
+            "lastUpdateId": mock_symbol.update_id + 1,
+            "E": now,
+            "T": now,
+            "bids": [[str(p), str(q)] for p, q in levels["b"].items()],
+            "asks": [[str(p), str(q)] for p, q in levels["a"].items()],
+        }
+
+    async def get_time(self, request: web.Request, params: dict[str, str]):
+        return {"serverTime": int(time.time() * 1000)}
+
+    async def new_listen_key(self, request: web.Request, params: dict[str, str]):
+        listen_key = uuid.uuid4().hex
+        self.listen_keys.add(listen_key)
+        return {"listenKey": listen_key}
+
+    async def renew_listen_key(self, request: web.Request, params: dict[str, str]):
+        if params.get("listenKey") not in self.listen_keys:
+            raise web.HTTPBadRequest(
+                text=json.dumps(INVALID_LISTEN_KEY), content_type="application/json"
+            )
+        return {}
+
+    async def close_listen_key(self, request: web.Request, params: dict[str, str]):
+        self.listen_keys.discard(params.get("listenKey", ""))
+        return {}
+
+    async def stream_handler(self, request: web.Request) -> web.WebSocketResponse:
+        socket = web.WebSocketResponse(heartbeat=30.0)
+        await socket.prepare(request)
+        combined = request.path == "/stream"
+        streams = set(request.query.get("streams", "").split("/")) - {""}
+        self.sockets[socket] = (combined, streams)
+        try:
+            async for message in socket:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                command = json.loads(message.data)
+                names = command.get("params", [])
+                if command.get("method") == "SUBSCRIBE":
+                    streams.update(names)
+                elif command.get("method") == "UNSUBSCRIBE":
+                    streams.difference_update(names)
+                await socket.send_json({"result": None, "id": command.get("id")})
+        finally:
+            self.sockets.pop(socket, None)
+        return socket
+
+    async def ws_api_handler(self, request: web.Request) -> web.WebSocketResponse:
+        socket = web.WebSocketResponse(heartbeat=30.0)
+        await socket.prepare(request)
+        self.api_sockets.add(socket)
+        try:
+            async for message in socket:
+                if message.type == WSMsgType.TEXT:
+                    asyncio.ensure_future(
+                        self.handle_api_request(socket, json.loads(message.data))
+                    )
+        finally:
+            self.api_sockets.discard(socket)
+        return socket
+
+    async def handle_api_request(
+        self, socket: web.WebSocketResponse, command: dict[str, Any]
+    ) -> None:
+        self.requests += 1
+        await self.delay()
+        status, response = self.call_api(
+            command.get("method", ""),
+            {key: str(value) for key, value in command.get("params", {}).items()},
+        )
+        if status != 200:
+            self.errors += 1
+        payload = {"id": command.get("id"), "status": status}
+        payload["result" if status == 200 else "error"] = response
+        self.flush_events()
+        if not socket.closed:
+            await socket.send_str(json.dumps(payload))
+
+    def call_api(self, method: str, params: dict[str, str]) -> tuple[int, Any]:
+        handler = self.api_methods.get(method)
+        if handler is None:
+            return 400, UNKNOWN_METHOD
+        if params.get("apiKey") != self.config.key:
+            return 401, INVALID_API_KEY
+        if self.config.check_signature:
+            signature = params.pop("signature", "")
+            query = "&".join(f"{key}={value}" for key, value in sorted(params.items()))
+            if not self.check_signature(f"{query}&signature={signature}"):
+                return 400, INVALID_SIGNATURE
+        if self.config.error_rate and self.random.random() < self.config.error_rate:
+            return 503, INTERNAL_ERROR
+        _, error = self.consume(1, int(method == "order.place"))
+        if error is not None:
+            return 429, error
+        try:
+            response = handler(params)
+        except web.HTTPException as e:
+            return e.status, json.loads(e.text)
+        return (400, response) if "code" in response else (200, response)
+
+    def place_order(self, params: dict[str, str]) -> dict[str, Any]:
+        return self.submit(self.get_symbol(params), params)
+
+    def modify_order(self, params: dict[str, str]) -> dict[str, Any]:
+        mock_symbol = self.get_symbol(params)
+        response = mock_symbol.engine.modify(params)
+        if "orderId" in response and response["status"] == "NEW":
+            self.emit_order(mock_symbol, response, "AMENDMENT")
+        return response
+
+    def cancel_order(self, params: dict[str, str]) -> dict[str, Any]:
+        mock_symbol = self.get_symbol(params)
+        response = mock_symbol.engine.cancel(int(params.get("orderId", 0)))
+        if "orderId" in response:
+            self.emit_order(mock_symbol, response, "CANCELED")
+        return response
+
+    async def close_api_sockets(self) -> None:
+        for socket in list(self.api_sockets):
+            await socket.close()
+
+    def _fill_handler(self, mock_symbol: MockSymbol) -> Callable[[tuple], None]:
+        def on_fill(fill: tuple) -> None:
+            mock_symbol.repo.on_fill(fill)
+            order_id = int(fill[1])
+            order = mock_symbol.orders.get(order_id)
+            if order is not None:
+                simulated = mock_symbol.engine.orders.get(order_id)
+                if simulated is None:
+                    mock_symbol.orders.pop(order_id)
+                    executed = float(order["executedQty"]) + fill[4]
+                    order = {**order, "status": "FILLED", "executedQty": str(executed)}
+                else:
+                    order = mock_symbol.orders[order_id] = simulated.to_response()
+                self.emit_order(
+                    mock_symbol,
+                    order,
+                    "TRADE",
+                    last_price=fill[3],
+                    last_quantity=fill[4],
+                )
+            self.emit_account(mock_symbol)
+
+        return on_fill
+
+    def emit_order(
+        self,
+        mock_symbol: MockSymbol,
+        order: dict[str, Any],
+        execution: str,
+        last_price: float = 0.0,
+        last_quantity: float = 0.0,
+    ) -> None:
+        if execution == "CANCELED":
+            mock_symbol.orders.pop(order["orderId"], None)
+        now = int(time.time() * 1000)
+        self._pending_events.append(
+            (
+                "",
+                {
+                    "e": "ORDER_TRADE_UPDATE",
+                    "E": now,
+                    "T": now,
+                    "o": {
+                        "s": mock_symbol.symbol,
+                        "c": order["clientOrderId"],
+                        "S": order["side"],
+                        "o": order["type"],
+                        "f": order["timeInForce"],
+                        "q": order["origQty"],
+                        "p": order["price"],
+                        "ap": order["avgPrice"],
+                        "x": execution,
+                        "X": order["status"],
+                        "i": order["orderId"],
+                        "l": str(last_quantity),
+                        "z": order["executedQty"],
+                        "L": str(last_price),
+                        "T": now,
+                        "ps": order["positionSide"],
+                    },
+                },
+            )
+        )
+
+    def emit_account(self, mock_symbol: MockSymbol) -> None:
+        wallet, unrealized, _ = self.get_wallet_balance()
+        repo = mock_symbol.repo
+        now = int(time.time() * 1000)
+        self._pending_events.append(
+            (
+                "",
+                {
+                    "e": "ACCOUNT_UPDATE",
+                    "E": now,
+                    "T": now,
+                    "a": {
+                        "m": "ORDER",
+                        "B": [
+                            {
+                                "a": "USDT",
+                                "wb": str(wallet),
+                                "cw": str(wallet),
+                                "bc": "0",
+                            }
+                        ],
+                        "P": [
+                            {
+                                "s": mock_symbol.symbol,
+                                "pa": str(repo.position_amount),
+                                "ep": str(repo.entry_price),
+                                "bep": str(repo.entry_price),
+                                "cr": str(repo.realized_pnl),
+                                "up": str(repo.unrealized_pnl),
+                                "mt": "cross",
+                                "iw": "0",
+                                "ps": PositionSide.BOTH.value,
+                            }
+                        ],
+                    },
+                },
+            )
+        )
+
+    def flush_events(self) -> None:
+        events, self._pending_events = self._pending_events, []
+        for stream, data in events:
+            if stream:
+                self.publish(stream, data)
+            else:
+                for listen_key in self.listen_keys:
+                    self.publish(listen_key, data)
+
+    def publish(self, stream: str, data: dict[str, Any]) -> None:
+        for socket, (combined, streams) in list(self.sockets.items()):
+            if stream not in streams or socket.closed:
+                continue
+            payload = {"stream": stream, "data": data} if combined else data
+            asyncio.ensure_future(socket.send_str(json.dumps(payload)))
+
+    def step_market(self) -> None:
+        now = int(time.time() * 1000)
+        for mock_symbol in self.symbols.values():
+            engine = mock_symbol.engine
+            ticks = self.random.randint(
+                -self.config.volatility_ticks, self.config.volatility_ticks
+            )
+            price = max(engine.last_price + ticks * engine.tick_size, engine.tick_size)
+            price = round(price, 8)
+            engine.match_trades(
+                times=np.array([now], dtype=np.int64),
+                prices=np.array([price]),
+                is_buyer_maker=np.array([ticks < 0]),
+                quantities=np.array([self.config.level_quantity]),
+            )
+            self.publish_market(mock_symbol, now)
+        self.flush_events()
+
+    def publish_market(self, mock_symbol: MockSymbol, now: int) -> None:
+        symbol = mock_symbol.symbol
+        name = symbol.lower()
+        price = str(mock_symbol.engine.last_price)
+        levels = mock_symbol.get_levels(
+            self.config.depth_levels, self.config.level_quantity
+        )
+        changes = {
+            side: {
+                **{p: 0.0 for p in mock_symbol.book[side] if p not in levels[side]},
+                **levels[side],
+            }
+            for side in ["b", "a"]
+        }
+        previous_update_id = mock_symbol.update_id
+        mock_symbol.update_id += 2
+        mock_symbol.book = levels
+        depth = {
+            "e": "depthUpdate",
+            "E": now,
+            "T": now,
+            "s": symbol,
+            "U": previous_update_id + 1,
+            "u": mock_symbol.update_id,
+            "pu": previous_update_id,
+        }
+        self.publish(
+            f"{name}@depth@100ms",
+            {
+                **depth,
+                "b": [[str(p), str(q)] for p, q in changes["b"].items()],
+                "a": [[str(p), str(q)] for p, q in changes["a"].items()],
+            },
+        )
+        self.publish(
+            f"{name}@depth10@100ms",
+            {
+                **depth,
+                "b": [[str(p), str(q)] for p, q in list(levels["b"].items())[:10]],
+                "a": [[str(p), str(q)] for p, q in list(levels["a"].items())[:10]],
+            },
+        )
+        self.publish(
+            f"{name}@markPrice@1s",
+            {"e": "markPriceUpdate", "E": now, "s": symbol, "p": price, "i": price},
+        )
+        self.publish(
+            f"{name}@aggTrade",
+            {
+                "e": "aggTrade",
+                "E": now,
+                "s": symbol,
+                "a": mock_symbol.update_id,
+                "p": price,
+                "q": str(self.config.level_quantity),
+                "T": now,
+                "m": True,
+            },
+        )
+
+    async def _run_market(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.market_seconds)
+            self.step_market()
+
+    async def open(self) -> "MockExchange":
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        if self.config.market_seconds > 0.0:
+            self._market_task = asyncio.create_task(self._run_market())
+        return self
+
+    async def close(self) -> None:
+        if self._market_task is not None:
+            self._market_task.cancel()
+            self._market_task = None
+        for socket in list(self.sockets):
+            await socket.close()
+        await self.close_api_sockets()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def start(self) -> "MockExchange":
+        self._thread = threading.Thread(
+            target=self._serve, name="mock-exchange", daemon=True
+        )
+        self._thread.start()
+        self._started.wait()
+        return self
+
+    def stop(self) -> None:
+        if self.loop is not None and self._thread is not None:
+            asyncio.run_coroutine_threadsafe(self.close(), self.loop).result()
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self._thread = None
+
+    def _serve(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_until_complete(self.open())
+        self._started.set()
+        self.loop.run_forever()
+        self.loop.close()
+
+
+def get_order_count(request: web.Request, params: dict[str, str]) -> int:
+    if request.method != "POST":
+        return 0
+    if request.path.endswith("/order"):
+        return 1
+    if request.path.endswith("/batchOrders"):
+        return len(json.loads(params.get("batchOrders", "[]")))
+    return 0
+
@@ -0,0 +1,413 @@
+import json
+import logging
+import time
+from typing import Any
+
+import aiohttp
+from binance.error import ClientError, ServerError
+from binance.lib.authentication import hmac_hashing
+from binance.lib.utils import cleanNoneValue, encoded_string, get_timestamp
+from yarl import URL
+
+from data.enums import RequestPriority
+from model import ChangeInitialLeverage
+from network.network import get_depth_weight
+from network.rate_limiter import RateLimiter
+from network.responses.responses import (
+    CancelAllOrdersResponse,
+    CompactAccountInfoResponse,
+    CompactMarkPriceResponse,
+    CompactPositionInformationResponse,
+    ListenKeyResponse,
+)
+from utils.metrics import Metrics
+
+
+class AsyncBinanceNetworkClient:
+    def __init__(
+        self,
+        key: str,
+        secret: str,
+        base_url: str,
+        pool_size: int = 200,
+        keepalive_timeout: float = 60.0,
+        timeout: float = 10.0,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        self.key = key
+        self.secret = secret
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.session: aiohttp.ClientSession | None = None
+
+    async def open(self) -> "AsyncBinanceNetworkClient":
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.pool_size,
+                keepalive_timeout=self.keepalive_timeout,
+                enable_cleanup_closed=True,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={
+                    "Content-Type": "application/json;charset=utf-8",
+                    "X-MBX-APIKEY": self.key,
+                },
+            )
+        return self
+
+    async def close(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self) -> "AsyncBinanceNetworkClient":
+        return await self.open()
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def send_request(
+        self, http_method: str, url_path: str, query_string: str = ""
+    ) -> Any:
+        await self.open()
+        url = self.base_url + url_path
+        if query_string:
+            url = f"{url}?{query_string}"
+        started = time.perf_counter_ns()
+        async with self.session.request(http_method, URL(url, encoded=True)) as r:
+            text = await r.text()
+            Metrics().record(
+                f"http {http_method} {url_path}",
+                time.perf_counter_ns() - started,
+                size=len(text),
+                error=r.status >= 400,
+            )
+            self.rate_limiter.update_from_headers(r.status, r.headers)
+            self.handle_exception(r.status, text, r.headers)
+            try:
+                return json.loads(text)
+            except ValueError:
+                return text
+
+    async def query(self, url_path: str, payload: dict | None = None) -> Any:
+        return await self.send_request(
+            "GET", url_path, encoded_string(cleanNoneValue(payload or {}))
+        )
+
+    async def sign_request(
+        self,
+        http_method: str,
+        url_path: str,
+        payload: dict | None = None,
+        special: bool = False,
+    ) -> Any:
+        return await self.send_signed_query(
+            http_method,
+            url_path,
+            encoded_string(cleanNoneValue(payload or {}), special),
+        )
+
+    async def send_signed_query(
+        self, http_method: str, url_path: str, query_string: str
+    ) -> Any:
+        query_string = f"{query_string}&timestamp={get_timestamp()}"
+        signature = hmac_hashing(self.secret, query_string)
+        return await self.send_request(
+            http_method, url_path, f"{query_string}&signature={signature}"
+        )
+
+    @staticmethod
+    def handle_exception(status_code: int, text: str, headers) -> None:
+        if status_code < 400:
+            return
+        if 400 <= status_code < 500:
+            try:
+                err = json.loads(text)
+            except ValueError:
+                raise ClientError(status_code, None, text, headers)
+            raise ClientError(status_code, err["code"], err["msg"], headers)
+        raise ServerError(status_code, text)
+
+    async def cancel_all_orders_request(self, symbol) -> CancelAllOrdersResponse:
+        await self.rate_limiter.acquire_async(
+            weight=1, priority=RequestPriority.CANCEL
+        )
+        try:
+            response = await self.sign_request(
+                "DELETE", "/fapi/v1/allOpenOrders", {"symbol": symbol}
+            )
+            logging.info(response)
+            return CancelAllOrdersResponse(**response)
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    async def new_price_match_order_request(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        position_side: str,
+        order_type: str,
+        time_in_force: str,
+        price_match: str,
+    ) -> Any | dict[Any, Any]:
+        await self.rate_limiter.acquire_async(
+            weight=0, orders=1, priority=RequestPriority.ORDER
+        )
+        try:
+            response = await self.sign_request(
+                "POST",
+                "/fapi/v1/order",
+                {
+                    "symbol": symbol,
+                    "side": side,
+                    "positionSide": position_side,
+                    "type": order_type,
+                    "quantity": quantity,
+                    "timeInForce": time_in_force,
+                    "priceMatch": price_match,
+                },
+            )
+            logging.info(response)
+            return response
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    async def new_order_request(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        position_side: str,
+        price: float,
+        order_type: str,
+        time_in_force: str,
+    ) -> Any | dict[Any, Any]:
+        await self.rate_limiter.acquire_async(
+            weight=0, orders=1, priority=RequestPriority.ORDER
+        )
+        try:
+            response = await self.sign_request(
+                "POST",
+                "/fapi/v1/order",
+                {
+                    "symbol": symbol,
+                    "side": side,
+                    "positionSide": position_side,
+                    "type": order_type,
+                    "quantity": str(quantity),
+                    "timeInForce": time_in_force,
+                    "price": price,
+                },
+            )
+            logging.info(response)
+            return response
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    async def new_batch_order_request(
+        self, params: str, orders: int
+    ) -> Any | dict[Any, Any]:
+        await self.rate_limiter.acquire_async(
+            weight=5, orders=orders, priority=RequestPriority.ORDER
+        )
+        try:
+            response = await self.send_signed_query(
+                "POST", "/fapi/v1/batchOrders", params
+            )
+            logging.info(response)
+            return response
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    async def modify_batch_order_request(
+        self, params: str, orders: int
+    ) -> Any | dict[Any, Any]:
+        await self.rate_limiter.acquire_async(
+            weight=5, orders=orders, priority=RequestPriority.ORDER
+        )
+        try:
+            response = await self.send_signed_query(
+                "PUT", "/fapi/v1/batchOrders", params
+            )
+            logging.info(response)
+            return response
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    async def cancel_batch_order_request(
+        self, symbol: str, order_ids: list[int]
+    ) -> Any | dict[Any, Any]:
+        await self.rate_limiter.acquire_async(
+            weight=1, priority=RequestPriority.CANCEL
+        )
+        try:
+            response = await self.sign_request(
+                "DELETE",
+                "/fapi/v1/batchOrders",
+                {
+                    "symbol": symbol,
+                    "orderIdList": json.dumps(order_ids).replace(" ", ""),
+                },
+            )
+            logging.info(response)
+            return response
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    async def get_position_risk_request(
+        self, symbol: str
+    ) -> list[CompactPositionInformationResponse]:
+        await self.rate_limiter.acquire_async(weight=5)
+        try:
+            response = await self.sign_request(
+                "GET", "/fapi/v2/positionRisk", {"symbol": symbol}
+            )
+            logging.info(response)
+            return [CompactPositionInformationResponse(i) for i in response]
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    async def get_account_info_request(
+        self, fields: list[str] | None = None
+    ) -> CompactAccountInfoResponse:
+        await self.rate_limiter.acquire_async(weight=5)
+        try:
+            response = await self.sign_request("GET", "/fapi/v2/account")
+            logging.info(response)
+            return CompactAccountInfoResponse(response, fields)
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    async def get_mark_price_request(self, symbol: str) -> CompactMarkPriceResponse:
+        await self.rate_limiter.acquire_async(weight=1)
+        try:
+            response = await self.query("/fapi/v1/premiumIndex", {"symbol": symbol})
+            logging.info(response)
+            return CompactMarkPriceResponse(response)
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    async def get_ticker_price_request(self, symbol: str) -> Any | dict[Any, Any]:
+        await self.rate_limiter.acquire_async(weight=1)
+        try:
+            response = await self.query("/fapi/v1/ticker/price", {"symbol": symbol})
+            logging.info(response)
+            return response
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    async def get_listen_key_request(
+        self,
+    ) -> ListenKeyResponse:
+        await self.rate_limiter.acquire_async(weight=1)
+        try:
+            response = await self.send_request("POST", "/fapi/v1/listenKey")
+            logging.info(response)
+            return ListenKeyResponse(**response)
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    async def close_listen_key_request(self, listen_key: str) -> Any | dict[Any, Any]:
+        await self.rate_limiter.acquire_async(weight=1)
+        try:
+            response = await self.send_request(
+                "DELETE",
+                "/fapi/v1/listenKey",
+                encoded_string({"listenKey": listen_key}),
+            )
+            logging.info(response)
+            return response
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    async def get_open_orders_request(self, symbol: str) -> Any | dict[Any, Any]:
+        await self.rate_limiter.acquire_async(weight=1)
+        try:
+            response = await self.sign_request(
+                "GET", "/fapi/v1/openOrders", {"symbol": symbol}
+            )
+            logging.info(response)
+            return response
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    async def keep_alive_request(self, listen_key: str):
+        await self.rate_limiter.acquire_async(weight=1)
+        try:
+            response = await self.send_request(
+                "PUT", "/fapi/v1/listenKey", encoded_string({"listenKey": listen_key})
+            )
+            logging.info(response)
+            return response
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    async def get_time_request(self) -> Any | dict[Any, Any]:
+        await self.rate_limiter.acquire_async(weight=1)
+        try:
+            response = await self.query("/fapi/v1/time")
+            logging.info(response)
+            return response
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    async def get_orders_request(self, symbol):
+        return await self.get_open_orders_request(symbol=symbol)
+
+    async def get_balance_request(self):
+        await self.rate_limiter.acquire_async(weight=5)
+        try:
+            response = await self.sign_request("GET", "/fapi/v2/balance")
+            logging.info(response)
+            return response
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    async def get_depth_request(self, symbol: str, limit: int = 5):
+        await self.rate_limiter.acquire_async(weight=get_depth_weight(limit))
+        try:
+            response = await self.query(
+                "/fapi/v1/depth", {"symbol": symbol, "limit": limit}
+            )
+            logging.info(response)
+            return response
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    async def change_initial_leverage_request(
+        self, symbol: str, leverage: int
+    ) -> ChangeInitialLeverage:
+        await self.rate_limiter.acquire_async(weight=1)
+        try:
+            response = await self.sign_request(
+                "POST", "/fapi/v1/leverage", {"symbol": symbol, "leverage": leverage}
+            )
+            logging.info(response)
+            return ChangeInitialLeverage(**response)
+        except ClientError as e:
+            logging.error(e)
+            raise e
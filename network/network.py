@@ -2,24 +2,46 @@ import logging
 from typing import Any
 
 from binance.error import ClientError
+from binance.lib.utils import get_timestamp
 from binance.um_futures import UMFutures
 
 from base.helpers import Singleton
-from model import ChangeInitialLeverage
+from data.enums import RequestPriority
+from model import ChangeInitialLeverage, NotionalAndLeverageBracket
+from network.rate_limiter import RateLimiter
 from network.responses.responses import (
-    AccountInfoResponse,
     CancelAllOrdersResponse,
+    CompactAccountInfoResponse,
+    CompactMarkPriceResponse,
+    CompactPositionInformationResponse,
     ListenKeyResponse,
-    MarkPriceResponse,
-    PositionInformationResponse,
 )
+from utils.metrics import timed
+
+
+def get_depth_weight(limit: int) -> int:
+    if limit <= 50:
+        return 2
+    if limit <= 100:
+        return 5
+    return 10 if limit <= 500 else 20
 
 
 class BinanceNetworkClient(metaclass=Singleton):
-    def __init__(self, client: UMFutures):
+    def __init__(self, client: UMFutures, rate_limiter: RateLimiter | None = None):
         self.client = client
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+
+    def send_signed_query(self, http_method: str, url_path: str, query: str) -> Any:
+        query = f"{query}&timestamp={get_timestamp()}"
+        signature = self.client._get_sign(query)
+        return self.client.send_request(
+            http_method, f"{url_path}?{query}&signature={signature}"
+        )
 
+    @timed("rest.cancel_all_orders")
     def cancel_all_orders_request(self, symbol) -> CancelAllOrdersResponse:
+        self.rate_limiter.acquire(weight=1, priority=RequestPriority.CANCEL)
         try:
             response = self.client.cancel_open_orders(symbol=symbol)
             logging.info(response)
@@ -28,6 +50,7 @@ class BinanceNetworkClient(metaclass=Singleton):
             logging.error(e)
             raise e
 
+    @timed("rest.new_price_match_order")
     def new_price_match_order_request(
         self,
         symbol: str,
@@ -38,6 +61,7 @@ class BinanceNetworkClient(metaclass=Singleton):
         time_in_force: str,
         price_match: str,
     ) -> Any | dict[Any, Any]:
+        self.rate_limiter.acquire(weight=0, orders=1, priority=RequestPriority.ORDER)
         try:
             response = self.client.new_order(
                 symbol=symbol,
@@ -54,6 +78,7 @@ class BinanceNetworkClient(metaclass=Singleton):
             logging.error(e)
             raise e
 
+    @timed("rest.new_order")
     def new_order_request(
         self,
         symbol: str,
@@ -64,6 +89,7 @@ class BinanceNetworkClient(metaclass=Singleton):
         order_type: str,
         time_in_force: str,
     ) -> Any | dict[Any, Any]:
+        self.rate_limiter.acquire(weight=0, orders=1, priority=RequestPriority.ORDER)
         try:
             response = self.client.new_order(
                 symbol=symbol,
@@ -80,48 +106,90 @@ class BinanceNetworkClient(metaclass=Singleton):
             logging.error(e)
             raise e
 
-    def new_batch_order_request(self, params) -> Any | dict[Any, Any]:
+    @timed("rest.new_batch_order")
+    def new_batch_order_request(self, params: str, orders: int) -> Any | dict[Any, Any]:
+        self.rate_limiter.acquire(
+            weight=5, orders=orders, priority=RequestPriority.ORDER
+        )
+        try:
+            response = self.send_signed_query("POST", "/fapi/v1/batchOrders", params)
+            logging.info(response)
+            return response
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    @timed("rest.modify_batch_order")
+    def modify_batch_order_request(
+        self, params: str, orders: int
+    ) -> Any | dict[Any, Any]:
+        self.rate_limiter.acquire(
+            weight=5, orders=orders, priority=RequestPriority.ORDER
+        )
         try:
-            response = self.client.new_batch_order(batchOrders=params)
+            response = self.send_signed_query("PUT", "/fapi/v1/batchOrders", params)
             logging.info(response)
             return response
         except ClientError as e:
             logging.error(e)
             raise e
 
+    @timed("rest.cancel_batch_order")
+    def cancel_batch_order_request(
+        self, symbol: str, order_ids: list[int]
+    ) -> Any | dict[Any, Any]:
+        self.rate_limiter.acquire(weight=1, priority=RequestPriority.CANCEL)
+        try:
+            response = self.client.cancel_batch_order(
+                symbol=symbol, orderIdList=order_ids, origClientOrderIdList=None
+            )
+            logging.info(response)
+            return response
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    @timed("rest.get_position_risk")
     def get_position_risk_request(
         self, symbol: str
-    ) -> list[PositionInformationResponse]:
+    ) -> list[CompactPositionInformationResponse]:
+        self.rate_limiter.acquire(weight=5)
         try:
             response = self.client.get_position_risk(symbol=symbol)
             logging.info(response)
-            return [PositionInformationResponse(**i) for i in response]
+            return [CompactPositionInformationResponse(i) for i in response]
         except ClientError as e:
             logging.error(e)
             raise e
 
+    @timed("rest.get_account_info")
     def get_account_info_request(
-        self,
-    ) -> AccountInfoResponse:
+        self, fields: list[str] | None = None
+    ) -> CompactAccountInfoResponse:
+        self.rate_limiter.acquire(weight=5)
         try:
             # noinspection PyCallingNonCallable
             response = self.client.account()
             logging.info(response)
-            return AccountInfoResponse(**response)
+            return CompactAccountInfoResponse(response, fields)
         except ClientError as e:
             logging.error(e)
             raise e
 
-    def get_mark_price_request(self, symbol: str) -> MarkPriceResponse:
+    @timed("rest.get_mark_price")
+    def get_mark_price_request(self, symbol: str) -> CompactMarkPriceResponse:
+        self.rate_limiter.acquire(weight=1)
         try:
             response = self.client.mark_price(symbol=symbol)
             logging.info(response)
-            return MarkPriceResponse(**response)
+            return CompactMarkPriceResponse(response)
         except ClientError as e:
             logging.error(e)
             raise e
 
+    @timed("rest.get_ticker_price")
     def get_ticker_price_request(self, symbol: str) -> Any | dict[Any, Any]:
+        self.rate_limiter.acquire(weight=1)
         try:
             response = self.client.ticker_price(symbol=symbol)
             logging.info(response)
@@ -130,9 +198,11 @@ class BinanceNetworkClient(metaclass=Singleton):
             logging.error(e)
             raise e
 
+    @timed("rest.get_listen_key")
     def get_listen_key_request(
         self,
     ) -> ListenKeyResponse:
+        self.rate_limiter.acquire(weight=1)
         try:
             response = self.client.new_listen_key()
             logging.info(response)
@@ -141,7 +211,9 @@ class BinanceNetworkClient(metaclass=Singleton):
             logging.error(e)
             raise e
 
+    @timed("rest.close_listen_key")
     def close_listen_key_request(self, listen_key: str) -> Any | dict[Any, Any]:
+        self.rate_limiter.acquire(weight=1)
         try:
             response = self.client.close_listen_key(listenKey=listen_key)
             logging.info(response)
@@ -150,7 +222,9 @@ class BinanceNetworkClient(metaclass=Singleton):
             logging.error(e)
             raise e
 
+    @timed("rest.get_open_orders")
     def get_open_orders_request(self, symbol: str) -> Any | dict[Any, Any]:
+        self.rate_limiter.acquire(weight=1)
         try:
             response = self.client.get_open_orders(symbol=symbol)
             logging.info(response)
@@ -159,7 +233,9 @@ class BinanceNetworkClient(metaclass=Singleton):
             logging.error(e)
             raise e
 
+    @timed("rest.keep_alive")
     def keep_alive_request(self, listen_key: str):
+        self.rate_limiter.acquire(weight=1)
         try:
             response = self.client.renew_listen_key(listenKey=listen_key)
             logging.info(response)
@@ -168,7 +244,9 @@ class BinanceNetworkClient(metaclass=Singleton):
             logging.error(e)
             raise e
 
+    @timed("rest.get_time")
     def get_time_request(self) -> Any | dict[Any, Any]:
+        self.rate_limiter.acquire(weight=1)
         try:
             response = self.client.time()
             logging.info(response)
@@ -177,7 +255,9 @@ class BinanceNetworkClient(metaclass=Singleton):
             logging.error(e)
             raise e
 
+    @timed("rest.get_orders")
     def get_orders_request(self, symbol):
+        self.rate_limiter.acquire(weight=1)
         try:
             response = self.client.get_orders(symbol=symbol)
             logging.info(response)
@@ -186,7 +266,9 @@ class BinanceNetworkClient(metaclass=Singleton):
             logging.error(e)
             raise e
 
+    @timed("rest.get_balance")
     def get_balance_request(self):
+        self.rate_limiter.acquire(weight=5)
         try:
             response = self.client.balance()
             logging.info(response)
@@ -195,7 +277,9 @@ class BinanceNetworkClient(metaclass=Singleton):
             logging.error(e)
             raise e
 
+    @timed("rest.get_depth")
     def get_depth_request(self, symbol: str, limit: int = 5):
+        self.rate_limiter.acquire(weight=get_depth_weight(limit))
         try:
             response = self.client.depth(symbol=symbol, **{"limit": limit})
             logging.info(response)
@@ -204,9 +288,11 @@ class BinanceNetworkClient(metaclass=Singleton):
             logging.error(e)
             raise e
 
+    @timed("rest.change_initial_leverage")
     def change_initial_leverage_request(
         self, symbol: str, leverage: int
     ) -> ChangeInitialLeverage:
+        self.rate_limiter.acquire(weight=1)
         try:
             response = self.client.change_leverage(symbol=symbol, leverage=leverage)
             logging.info(response)
@@ -214,3 +300,29 @@ class BinanceNetworkClient(metaclass=Singleton):
         except ClientError as e:
             logging.error(e)
             raise e
+
+    @timed("rest.get_exchange_info")
+    def get_exchange_info_request(self) -> dict[str, Any]:
+        self.rate_limiter.acquire(weight=1)
+        try:
+            response = self.client.exchange_info()
+            logging.info(response)
+            return response
+        except ClientError as e:
+            logging.error(e)
+            raise e
+
+    @timed("rest.get_leverage_brackets")
+    def get_leverage_brackets_request(
+        self, symbol: str
+    ) -> list[NotionalAndLeverageBracket]:
+        self.rate_limiter.acquire(weight=1)
+        try:
+            response = self.client.leverage_brackets(symbol=symbol)
+            logging.info(response)
+            if isinstance(response, dict):
+                response = [response]
+            return [NotionalAndLeverageBracket(**i) for i in response]
+        except ClientError as e:
+            logging.error(e)
+            raise e
@@ -0,0 +1,158 @@
+import json
+from enum import Enum
+from typing import Any
+from urllib.parse import quote_plus
+
+import numpy as np
+
+from data.enums import OrderType, PositionSide, Side, TickerSymbol, TimeInForce
+from network.requests import NewOrderRequest
+from utils.mathutils import get_increment_scale
+
+ORDER_FIELDS = frozenset(NewOrderRequest.model_fields) | {
+    "orderId",
+    "origClientOrderId",
+}
+JSON_TOKENS = ("[", ",", "]", "{", "}")
+QUOTED_TOKENS = tuple(quote_plus(token) for token in JSON_TOKENS)
+PRICE_FIELDS = ("price", "stopPrice", "activationPrice")
+MAX_DECIMALS = 8
+
+
+def get_decimals(increment: float) -> int:
+    return len(str(get_increment_scale(increment)[0])) - 1
+
+
+def format_value(value: Any, decimals: int = MAX_DECIMALS) -> str:
+    if isinstance(value, Enum):
+        return str(value.value)
+    if isinstance(value, float):
+        return np.format_float_positional(value, precision=decimals, trim="0")
+    return str(value)
+
+
+class BatchOrderEncoder:
+    def __init__(self, max_cache_size: int = 65536) -> None:
+        self.max_cache_size = max_cache_size
+        self.decimals: dict[str, dict[str, int]] = {}
+        self._fragments: dict[tuple[str, type, Any, int], tuple[str, str]] = {}
+        self._formatted: dict[tuple[str, str], tuple[str, str]] = {}
+
+    def set_increments(
+        self, symbol: TickerSymbol | str, tick_size: float, step_size: float
+    ) -> None:
+        price_decimals = get_decimals(tick_size)
+        self.decimals[getattr(symbol, "value", symbol)] = {
+            **{key: price_decimals for key in PRICE_FIELDS},
+            "quantity": get_decimals(step_size),
+        }
+
+    def get_key_decimals(self, symbol: Any) -> dict[str, int]:
+        return self.decimals.get(getattr(symbol, "value", symbol), {})
+
+    def get_fragments(
+        self, key: str, value: Any, decimals: int = MAX_DECIMALS
+    ) -> tuple[str, str]:
+        cache_key = (key, value.__class__, value, decimals)
+        fragments = self._fragments.get(cache_key)
+        if fragments is None:
+            if key not in ORDER_FIELDS:
+                raise ValueError(f"unknown order field {key}")
+            text = format_value(value, decimals)
+            fragments = self._formatted.get((key, text))
+            if fragments is None:
+                fragment = f"{json.dumps(key)}:{json.dumps(text)}"
+                fragments = (fragment, quote_plus(fragment))
+            if len(self._fragments) >= self.max_cache_size:
+                self._fragments.clear()
+                self._formatted.clear()
+            self._fragments[cache_key] = fragments
+            self._formatted[(key, text)] = fragments
+        return fragments
+
+    def format_orders(self, orders: list[dict[str, Any]]) -> list[dict[str, str]]:
+        formatted = []
+        for order in orders:
+            decimals = self.get_key_decimals(order.get("symbol"))
+            formatted.append(
+                {
+                    key: format_value(value, decimals.get(key, MAX_DECIMALS))
+                    for key, value in order.items()
+                }
+            )
+        return formatted
+
+    def encode_order(self, order: dict[str, Any], index: int, comma: str) -> str:
+        get_fragments = self.get_fragments
+        decimals = self.get_key_decimals(order.get("symbol"))
+        return comma.join(
+            [
+                get_fragments(key, value, decimals.get(key, MAX_DECIMALS))[index]
+                for key, value in order.items()
+            ]
+        )
+
+    def encode(self, orders: list[dict[str, Any]], quoted: bool = False) -> str:
+        encode_order = self.encode_order
+        index = int(quoted)
+        open_list, comma, close_list, open_order, close_order = (
+            QUOTED_TOKENS if quoted else JSON_TOKENS
+        )
+        return (
+            open_list
+            + comma.join(
+                [
+                    open_order + encode_order(order, index, comma) + close_order
+                    for order in orders
+                ]
+            )
+            + close_list
+        )
+
+    def encode_query(self, orders: list[dict[str, Any]]) -> str:
+        return "batchOrders=" + self.encode(orders, quoted=True)
+
+    def encode_array(
+        self,
+        symbol: TickerSymbol,
+        side: Side,
+        orders: np.ndarray,
+        position_side: PositionSide,
+        order_type: OrderType = OrderType.LIMIT,
+        time_in_force: TimeInForce = TimeInForce.GTC,
+        quoted: bool = False,
+    ) -> str:
+        get_fragments = self.get_fragments
+        index = int(quoted)
+        open_list, comma, close_list, open_order, close_order = (
+            QUOTED_TOKENS if quoted else JSON_TOKENS
+        )
+        decimals = self.get_key_decimals(symbol)
+        price_decimals = decimals.get("price", MAX_DECIMALS)
+        quantity_decimals = decimals.get("quantity", MAX_DECIMALS)
+        prefix = open_order + comma.join(
+            [
+                get_fragments("symbol", symbol)[index],
+                get_fragments("side", side)[index],
+                get_fragments("type", order_type)[index],
+                get_fragments("timeInForce", time_in_force)[index],
+                get_fragments("positionSide", position_side)[index],
+            ]
+        )
+        return (
+            open_list
+            + comma.join(
+                [
+                    prefix
+                    + comma
+                    + get_fragments("quantity", quantity, quantity_decimals)[index]
+                    + comma
+                    + get_fragments("price", price, price_decimals)[index]
+                    + close_order
+                    for price, quantity in zip(
+                        orders["price"].tolist(), orders["quantity"].tolist()
+                    )
+                ]
+            )
+            + close_list
+        )
@@ -0,0 +1,228 @@
+import asyncio
+import contextlib
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, Iterator
+
+from data.enums import RateLimiters, RequestPriority
+from model import RateLimit
+
+INTERVAL_LETTERS = {"SECOND": "S", "MINUTE": "M", "HOUR": "H", "DAY": "D"}
+INTERVAL_SECONDS = {"S": 1.0, "M": 60.0, "H": 3600.0, "D": 86400.0}
+HEADER_PREFIXES = {
+    "x-mbx-used-weight-": RateLimiters.REQUEST_WEIGHT.value,
+    "x-mbx-order-count-": RateLimiters.ORDERS.value,
+}
+DEFAULT_RATE_LIMITS = [
+    RateLimit(
+        rateLimitType=RateLimiters.REQUEST_WEIGHT.value,
+        interval="MINUTE",
+        intervalNum=1,
+        limit=2400,
+    ),
+    RateLimit(
+        rateLimitType=RateLimiters.ORDERS.value,
+        interval="MINUTE",
+        intervalNum=1,
+        limit=1200,
+    ),
+    RateLimit(
+        rateLimitType=RateLimiters.ORDERS.value,
+        interval="SECOND",
+        intervalNum=10,
+        limit=300,
+    ),
+]
+
+
+def get_bucket_key(rate_limit_type: str, interval: str, interval_num: int) -> str:
+    return f"{rate_limit_type}-{interval_num}{INTERVAL_LETTERS[interval]}"
+
+
+class TokenBucket:
+    def __init__(
+        self, limit: int, interval_seconds: float, clock: Callable[[], float]
+    ) -> None:
+        self.limit = limit
+        self.interval_seconds = interval_seconds
+        self.clock = clock
+        self.tokens = float(limit)
+        self.updated = clock()
+
+    @property
+    def rate(self) -> float:
+        return self.limit / self.interval_seconds
+
+    def refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(
+            float(self.limit), self.tokens + (now - self.updated) * self.rate
+        )
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        self.refill()
+        if amount <= self.tokens:
+            return 0.0
+        return (min(amount, self.limit) - self.tokens) / self.rate
+
+    def consume(self, amount: float) -> None:
+        self.tokens -= amount
+
+    def refund(self, amount: float) -> None:
+        self.refill()
+        self.tokens = min(float(self.limit), self.tokens + amount)
+
+    def set_used(self, used: float) -> None:
+        self.refill()
+        self.tokens = min(self.tokens, float(self.limit) - used)
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        rate_limits: list[RateLimit] | None = None,
+        safety_margin: float = 0.9,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.safety_margin = safety_margin
+        self.clock = clock
+        self.buckets: dict[str, TokenBucket] = {}
+        self.blocked_until = 0.0
+        self._condition = threading.Condition()
+        self._waiters: list[tuple[int, int]] = []
+        self._counter = itertools.count()
+        self._local = threading.local()
+        self.seed(rate_limits or DEFAULT_RATE_LIMITS)
+
+    def seed(self, rate_limits: list[RateLimit]) -> None:
+        with self._condition:
+            for rate_limit in rate_limits:
+                key = get_bucket_key(
+                    rate_limit.rateLimitType, rate_limit.interval, rate_limit.intervalNum
+                )
+                interval_seconds = (
+                    INTERVAL_SECONDS[INTERVAL_LETTERS[rate_limit.interval]]
+                    * rate_limit.intervalNum
+                )
+                self.buckets[key] = TokenBucket(
+                    limit=int(rate_limit.limit * self.safety_margin),
+                    interval_seconds=interval_seconds,
+                    clock=self.clock,
+                )
+            self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def priority(self, priority: RequestPriority) -> Iterator[None]:
+        previous = getattr(self._local, "priority", None)
+        self._local.priority = priority
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    @contextlib.contextmanager
+    def prepaid(self) -> Iterator[None]:
+        previous = getattr(self._local, "prepaid", False)
+        self._local.prepaid = True
+        try:
+            yield
+        finally:
+            self._local.prepaid = previous
+
+    def acquire(
+        self,
+        weight: int = 1,
+        orders: int = 0,
+        priority: RequestPriority = RequestPriority.ACCOUNT,
+        timeout: float | None = None,
+    ) -> bool:
+        override = getattr(self._local, "priority", None)
+        priority = priority if override is None else override
+        if getattr(self._local, "prepaid", False):
+            weight = orders = 0
+        ticket = (int(priority), next(self._counter))
+        deadline = None if timeout is None else self.clock() + timeout
+        with self._condition:
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    wait = self._wait_time(weight, orders)
+                    if self._waiters[0] == ticket and wait == 0.0:
+                        self._consume(weight, orders)
+                        return True
+                    if deadline is not None:
+                        remaining = deadline - self.clock()
+                        if remaining <= 0.0:
+                            return False
+                        wait = min(wait, remaining) if wait else remaining
+                    self._condition.wait(timeout=wait or None)
+            finally:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+    async def acquire_async(
+        self,
+        weight: int = 1,
+        orders: int = 0,
+        priority: RequestPriority = RequestPriority.ACCOUNT,
+    ) -> bool:
+        if self.acquire(weight=weight, orders=orders, priority=priority, timeout=0.0):
+            return True
+        return await asyncio.to_thread(
+            self.acquire, weight=weight, orders=orders, priority=priority
+        )
+
+    def _wait_time(self, weight: int, orders: int) -> float:
+        wait = max(self.blocked_until - self.clock(), 0.0)
+        for key, bucket in self.buckets.items():
+            amount = orders if key.startswith(RateLimiters.ORDERS.value) else weight
+            if amount:
+                wait = max(wait, bucket.wait_time(amount))
+        return wait
+
+    def _consume(self, weight: int, orders: int) -> None:
+        for key, bucket in self.buckets.items():
+            amount = orders if key.startswith(RateLimiters.ORDERS.value) else weight
+            bucket.consume(amount)
+
+    def refund(self, weight: int = 0, orders: int = 0) -> None:
+        with self._condition:
+            for key, bucket in self.buckets.items():
+                amount = orders if key.startswith(RateLimiters.ORDERS.value) else weight
+                if amount:
+                    bucket.refund(amount)
+            self._condition.notify_all()
+
+    def update_from_headers(self, status_code: int, headers) -> None:
+        with self._condition:
+            for header, value in headers.items():
+                header = header.lower()
+                for prefix, rate_limit_type in HEADER_PREFIXES.items():
+                    if header.startswith(prefix):
+                        bucket = self.buckets.get(
+                            f"{rate_limit_type}-{header[len(prefix):].upper()}"
+                        )
+                        if bucket is not None:
+                            bucket.set_used(float(value))
+            if status_code in [418, 429]:
+                retry_after = float(headers.get("Retry-After", 60))
+                self.blocked_until = max(self.blocked_until, self.clock() + retry_after)
+                logging.error(f"Rate limited with {status_code}, backing off {retry_after}s")
+            self._condition.notify_all()
+
+    def on_response(self, response, *args, **kwargs):
+        self.update_from_headers(response.status_code, response.headers)
+        return response
+
+    def headroom(self) -> dict[str, float]:
+        with self._condition:
+            result = {}
+            for key, bucket in self.buckets.items():
+                bucket.refill()
+                result[key] = max(bucket.tokens, 0.0) / bucket.limit
+            return result
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, Callable, Iterable, List
 
 from pydantic import BaseModel
 
@@ -98,3 +98,76 @@ class AccountInfoResponse(BaseModel):
     maxWithdrawAmount: str
     assets: List[Asset]
     positions: List[Position]
+
+
+def to_bool(value: Any) -> bool:
+    return value if isinstance(value, bool) else str(value).lower() == "true"
+
+
+def get_converters(model: type[BaseModel]) -> dict[str, Callable[[Any], Any]]:
+    converters = {float: float, int: int, bool: to_bool}
+    return {
+        name: converters[field.annotation]
+        for name, field in model.model_fields.items()
+        if field.annotation in converters
+    }
+
+
+class CompactResponse:
+    converters: dict[str, Callable[[Any], Any]] = {}
+
+    def __init__(
+        self, raw: dict[str, Any], fields: Iterable[str] | None = None
+    ) -> None:
+        if fields is not None:
+            raw = {name: raw[name] for name in fields}
+        self._raw = raw
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_raw":
+            raise AttributeError(name)
+        try:
+            value = self._raw[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        converter = self.converters.get(name)
+        if converter is not None:
+            value = converter(value)
+        self.__dict__[name] = value
+        return value
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.model_dump()})"
+
+    def model_copy(self) -> "CompactResponse":
+        copy = object.__new__(type(self))
+        copy.__dict__.update(self.__dict__)
+        return copy
+
+    def model_dump(self) -> dict[str, Any]:
+        names = {**self._raw, **self.__dict__}
+        return {name: getattr(self, name) for name in names if name != "_raw"}
+
+
+class CompactAsset(CompactResponse):
+    converters = get_converters(Asset)
+
+
+class CompactPosition(CompactResponse):
+    converters = get_converters(Position)
+
+
+class CompactMarkPriceResponse(CompactResponse):
+    converters = get_converters(MarkPriceResponse)
+
+
+class CompactPositionInformationResponse(CompactResponse):
+    converters = get_converters(PositionInformationResponse)
+
+
+class CompactAccountInfoResponse(CompactResponse):
+    converters = {
+        **get_converters(AccountInfoResponse),
+        "assets": lambda items: [CompactAsset(i) for i in items],
+        "positions": lambda items: [CompactPosition(i) for i in items],
+    }
@@ -0,0 +1,137 @@
+import json
+from dataclasses import dataclass
+from typing import Any, Callable
+
+STREAM_PREFIX = '{"stream":"'
+DATA_KEY = '"data":'
+DEPTH_STREAM_SUFFIXES = ["@depth@100ms", "@depth10@100ms", "@depth@250ms", "@depth@500ms"]
+
+
+@dataclass(slots=True)
+class DepthUpdate:
+    symbol: str
+    event_time: int
+    transaction_time: int
+    first_update_id: int
+    final_update_id: int
+    previous_final_update_id: int
+    bids: list[list[float]]
+    asks: list[list[float]]
+
+
+@dataclass(slots=True)
+class BalanceUpdate:
+    asset: str
+    wallet_balance: float
+    cross_wallet_balance: float
+    balance_change: float
+
+
+@dataclass(slots=True)
+class PositionUpdate:
+    symbol: str
+    position_amount: float
+    entry_price: float
+    break_even_price: float
+    accumulated_realized: float
+    unrealized_profit: float
+    margin_type: str
+    isolated_wallet: float
+    position_side: str
+
+
+@dataclass(slots=True)
+class AccountUpdate:
+    event_time: int
+    transaction_time: int
+    reason: str
+    balances: list[BalanceUpdate]
+    positions: list[PositionUpdate]
+
+
+def decode_depth_update(data: dict[str, Any]) -> DepthUpdate:
+    return DepthUpdate(
+        data["s"],
+        data["E"],
+        data.get("T", 0),
+        data["U"],
+        data["u"],
+        data.get("pu", 0),
+        [[float(p), float(q)] for p, q in data["b"]],
+        [[float(p), float(q)] for p, q in data["a"]],
+    )
+
+
+def decode_account_update(data: dict[str, Any]) -> AccountUpdate:
+    account = data["a"]
+    return AccountUpdate(
+        data.get("E", 0),
+        data.get("T", 0),
+        account.get("m", ""),
+        [
+            BalanceUpdate(
+                b["a"], float(b["wb"]), float(b["cw"]), float(b.get("bc", 0.0))
+            )
+            for b in account.get("B", [])
+        ],
+        [
+            PositionUpdate(
+                p["s"],
+                float(p["pa"]),
+                float(p["ep"]),
+                float(p.get("bep", 0.0)),
+                float(p["cr"]),
+                float(p["up"]),
+                p.get("mt", ""),
+                float(p.get("iw", 0.0)),
+                p["ps"],
+            )
+            for p in account.get("P", [])
+        ],
+    )
+
+
+def decode_user_data(data: dict[str, Any]) -> Any:
+    if data.get("e") == "ACCOUNT_UPDATE":
+        return decode_account_update(data)
+    return data
+
+
+def get_stream_name(message: str) -> str:
+    if not message.startswith(STREAM_PREFIX):
+        return ""
+    return message[len(STREAM_PREFIX) : message.index('"', len(STREAM_PREFIX))]
+
+
+class StreamDecoder:
+    def __init__(self, loads: Callable[[str], Any] = json.loads) -> None:
+        self.loads = loads
+        self.decoders: dict[str, Callable[[dict[str, Any]], Any]] = {}
+        self.default_decoder: Callable[[dict[str, Any]], Any] = decode_user_data
+        for stream_suffix in DEPTH_STREAM_SUFFIXES:
+            self.register(stream_suffix, decode_depth_update)
+
+    def register(
+        self, stream_suffix: str, decoder: Callable[[dict[str, Any]], Any]
+    ) -> None:
+        self.decoders[stream_suffix] = decoder
+
+    def get_decoder(self, stream: str) -> Callable[[dict[str, Any]], Any]:
+        at = stream.find("@")
+        if at < 0:
+            return self.default_decoder
+        return self.decoders.get(stream[at:], self.default_decoder)
+
+    def decode(self, message: str) -> tuple[str, Any]:
+        stream = get_stream_name(message)
+        if not stream:
+            if '"stream"' not in message:
+                return "", None
+            frame = self.loads(message)
+            stream = frame.get("stream", "")
+            return stream, self.get_decoder(stream)(frame["data"])
+        data_index = message.find(DATA_KEY, len(STREAM_PREFIX) + len(stream))
+        if data_index < 0:
+            return stream, None
+        payload = message[data_index + len(DATA_KEY) : message.rindex("}")]
+        return stream, self.get_decoder(stream)(self.loads(payload))
@@ -0,0 +1,182 @@
+import asyncio
+import itertools
+import json
+import logging
+import threading
+import time
+from typing import Any
+
+import aiohttp
+from binance.lib.authentication import hmac_hashing
+from binance.lib.utils import get_timestamp
+
+from utils.metrics import Metrics
+
+WS_API_URL = "wss://ws-fapi.binance.com/ws-fapi/v1"
+DISCONNECTED = {
+    "code": -1001,
+    "msg": "Internal error; unable to process your request. Please try again.",
+}
+TIMEOUT = {
+    "code": -1007,
+    "msg": "Timeout waiting for response from backend server. Send status unknown;"
+    " execution status unknown.",
+}
+
+
+def sign_params(secret: str, params: dict[str, str]) -> str:
+    query = "&".join(f"{key}={value}" for key, value in sorted(params.items()))
+    return hmac_hashing(secret, query)
+
+
+class WebsocketOrderClient:
+    def __init__(
+        self,
+        key: str,
+        secret: str,
+        url: str = WS_API_URL,
+        timeout_seconds: float = 5.0,
+        reconnect_seconds: float = 1.0,
+        max_reconnect_seconds: float = 30.0,
+        heartbeat_seconds: float = 30.0,
+    ) -> None:
+        self.key = key
+        self.secret = secret
+        self.url = url or WS_API_URL
+        self.timeout_seconds = timeout_seconds
+        self.reconnect_seconds = reconnect_seconds
+        self.max_reconnect_seconds = max_reconnect_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.reconnects = 0
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.socket: aiohttp.ClientWebSocketResponse | None = None
+        self._ids = itertools.count(1)
+        self._pending: dict[str, asyncio.Future] = {}
+        self._connected = threading.Event()
+        self._closing: asyncio.Event | None = None
+        self._thread: threading.Thread | None = None
+        self._started = threading.Event()
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    def wait_connected(self, timeout: float | None = None) -> bool:
+        return self._connected.wait(timeout)
+
+    def start(self) -> "WebsocketOrderClient":
+        if self._thread is None:
+            self._started.clear()
+            self._thread = threading.Thread(
+                target=self._serve, name="ws-order-client", daemon=True
+            )
+            self._thread.start()
+            self._started.wait()
+        return self
+
+    def stop(self) -> None:
+        if self.loop is not None and self._thread is not None:
+            asyncio.run_coroutine_threadsafe(self.close(), self.loop).result()
+            self._thread.join()
+            self._thread = None
+
+    def _serve(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self._closing = asyncio.Event()
+        self._started.set()
+        try:
+            self.loop.run_until_complete(self._run())
+        finally:
+            self.loop.close()
+            self.loop = None
+
+    async def _run(self) -> None:
+        delay = self.reconnect_seconds
+        async with aiohttp.ClientSession() as session:
+            while not self._closing.is_set():
+                try:
+                    async with session.ws_connect(
+                        self.url, heartbeat=self.heartbeat_seconds
+                    ) as socket:
+                        self.socket = socket
+                        self._connected.set()
+                        delay = self.reconnect_seconds
+                        async for message in socket:
+                            if message.type == aiohttp.WSMsgType.TEXT:
+                                self.on_message(message.data)
+                except (aiohttp.ClientError, OSError, asyncio.TimeoutError) as e:
+                    logging.error(f"order websocket: {e}")
+                finally:
+                    self._connected.clear()
+                    self.socket = None
+                    self.fail_pending()
+                if self._closing.is_set():
+                    return
+                self.reconnects += 1
+                try:
+                    await asyncio.wait_for(self._closing.wait(), delay)
+                except asyncio.TimeoutError:
+                    delay = min(delay * 2, self.max_reconnect_seconds)
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self.socket is not None:
+            await self.socket.close()
+
+    def on_message(self, data: str) -> None:
+        message = json.loads(data)
+        future = self._pending.pop(message.get("id"), None)
+        if future is not None and not future.done():
+            future.set_result(message)
+
+    def fail_pending(self) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("order websocket disconnected"))
+
+    async def send(self, method: str, params: dict[str, str]) -> dict[str, Any]:
+        socket = self.socket
+        if socket is None or socket.closed:
+            return dict(DISCONNECTED)
+        request_id = str(next(self._ids))
+        params = {**params, "apiKey": self.key, "timestamp": get_timestamp()}
+        params["signature"] = sign_params(self.secret, params)
+        future = self.loop.create_future()
+        self._pending[request_id] = future
+        started = time.perf_counter_ns()
+        try:
+            await socket.send_str(
+                json.dumps({"id": request_id, "method": method, "params": params})
+            )
+        except (ConnectionError, RuntimeError) as e:
+            self._pending.pop(request_id, None)
+            logging.error(f"order websocket: {e}")
+            return dict(DISCONNECTED)
+        try:
+            message = await asyncio.wait_for(future, self.timeout_seconds)
+        except (asyncio.TimeoutError, ConnectionError):
+            self._pending.pop(request_id, None)
+            message = {"error": dict(TIMEOUT)}
+        Metrics().record(
+            f"ws.{method}", time.perf_counter_ns() - started, error="error" in message
+        )
+        return message["error"] if "error" in message else message["result"]
+
+    async def send_many(
+        self, method: str, params_list: list[dict[str, str]]
+    ) -> list[dict[str, Any]]:
+        return list(
+            await asyncio.gather(*(self.send(method, params) for params in params_list))
+        )
+
+    def request_many(
+        self, method: str, params_list: list[dict[str, str]]
+    ) -> list[dict[str, Any]]:
+        loop = self.loop
+        if loop is None or not self.connected:
+            raise ConnectionError("order websocket is not connected")
+        return asyncio.run_coroutine_threadsafe(
+            self.send_many(method, params_list), loop
+        ).result()
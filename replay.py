@@ -0,0 +1,261 @@
+import cProfile
+import json
+import logging
+import time
+from collections import deque
+from typing import Any, Iterable
+
+import numpy as np
+import typer
+from rich.live import Live
+
+import main as live_main
+from backtest.engine import STRATEGIES
+from backtest.matching import MatchingEngine
+from backtest.repository import SimulatedTradeRepo
+from base.helpers import replace_singleton
+from base.models.FileInput import FileInput
+from data.account_state import AccountState
+from data.enums import ExecutorBackend, RecordKind, Strategy
+from data.exchange_info import ExchangeInfoCache, SymbolFilters
+from data.order_book import LocalOrderBook
+from data.recorder import Record, read_recordings
+from display.display import layout
+from display.renderer import DisplayRenderer
+from network.stream_decoder import get_stream_name
+from strategy.executor import OrderExecutor
+from strategy.scheduler import StrategyScheduler
+from utils.fileutils import get_inputs_from_file
+from utils.timeutils import VirtualClock
+
+
+class Replayer:
+    def __init__(
+        self,
+        file_input: FileInput,
+        records: Iterable[Record],
+        speed: float = 0.0,
+        run_strategy: bool = True,
+        initial_balance: float = 1000.0,
+        use_exchange_time: bool = False,
+        exchange_info: ExchangeInfoCache | None = None,
+        renderer: DisplayRenderer | None = None,
+    ) -> None:
+        self.file_input = file_input
+        self.exchange_info = exchange_info
+        self.renderer = renderer
+        self.next_frame = 0.0
+        self.use_exchange_time = use_exchange_time
+        self.records = records
+        self.run_strategy = run_strategy
+        self.symbol = file_input.symbol.name
+        self.clock = VirtualClock(speed=speed)
+        self.filters = (
+            exchange_info.get_filters(file_input.symbol)
+            if exchange_info is not None
+            else SymbolFilters(symbol=self.symbol)
+        )
+        self.matching = MatchingEngine(tick_size=self.filters.tick_size)
+        self.repo = SimulatedTradeRepo(
+            engine=self.matching,
+            initial_balance=initial_balance,
+            leverage=file_input.leverage,
+            position_side=file_input.position_side,
+        )
+        self.scheduler = StrategyScheduler(
+            symbol=self.symbol,
+            tick_size=self.filters.tick_size,
+            trigger_ticks=file_input.trigger_ticks,
+            debounce_seconds=file_input.debounce_seconds,
+            max_staleness_seconds=file_input.delay_seconds,
+            clock=self.clock.time,
+        )
+        self.order_book = LocalOrderBook(
+            symbol=self.symbol,
+            snapshot_loader=self.next_snapshot,
+            background_resync=False,
+            tick_size=self.filters.tick_size,
+        )
+        self.executor = OrderExecutor(backend=ExecutorBackend.THREAD, max_workers=1)
+        self.account_state: AccountState | None = None
+        self.snapshots: deque[dict[str, Any]] = deque()
+        self.trades: list[tuple[int, float, bool]] = []
+        self.messages = 0
+        self.cycles = 0
+
+    def next_snapshot(self) -> dict[str, Any] | None:
+        return self.snapshots.popleft() if self.snapshots else None
+
+    def on_rest(self, record: Record) -> None:
+        data = json.loads(record.message)
+        if data.get("path") != live_main.DEPTH_PATH:
+            return
+        if data["params"]["symbol"] != self.symbol or self.order_book.synced:
+            return
+        self.snapshots.append(data["response"])
+        self.order_book.resync()
+
+    def on_stream(self, record: Record) -> None:
+        self.messages += 1
+        message = record.text()
+        live_main.on_message(None, message)
+        if get_stream_name(message).endswith("@aggTrade"):
+            data = json.loads(message)["data"]
+            if data["s"] == self.symbol:
+                self.trades.append(
+                    (data["T"], float(data["p"]), data["m"], float(data["q"]))
+                )
+
+    def render(self, force: bool = False) -> None:
+        if self.renderer is None:
+            return
+        now = self.clock.time()
+        if force or now >= self.next_frame:
+            self.next_frame = now + self.renderer.frame_seconds
+            self.renderer.refresh(self.renderer.render_once())
+
+    def match_trades(self) -> None:
+        if not self.trades:
+            return
+        times, prices, is_buyer_maker, quantities = zip(*self.trades)
+        self.trades = []
+        self.matching.match_trades(
+            np.array(times, dtype=np.int64),
+            np.array(prices, dtype=np.float64),
+            np.array(is_buyer_maker, dtype=np.bool_),
+            np.array(quantities, dtype=np.float64),
+        )
+
+    def run_cycle(self) -> None:
+        self.match_trades()
+        if self.matching.last_price <= 0.0:
+            return
+        if (
+            not self.file_input.reconcile
+            or self.file_input.strategy is not Strategy.FIXED_RANGE
+        ):
+            self.repo.cancel_all_orders(self.file_input.symbol)
+        strategy = STRATEGIES[self.file_input.strategy](
+            file_input=self.file_input,
+            repo=self.repo,
+            executor=self.executor,
+            order_book=self.order_book,
+            exchange_info=self.exchange_info,
+        )
+        strategy.run_loop()
+        self.scheduler.set_grid_center(strategy.center_price)
+        self.cycles += 1
+
+    def run(self) -> dict[str, Any]:
+        live_main.order_books[self.symbol] = self.order_book
+        live_main.schedulers[self.symbol] = self.scheduler
+        live_main.renderer = self.renderer
+        started = time.perf_counter()
+        try:
+            with replace_singleton(AccountState, repo=self.repo) as account_state:
+                self.account_state = account_state
+                account_state.track(self.file_input.symbol)
+                for record in self.records:
+                    timestamp = (
+                        record.exchange_time * 1_000_000
+                        if self.use_exchange_time
+                        else record.local_time
+                    )
+                    if timestamp:
+                        self.clock.advance_to(timestamp)
+                    if record.kind is RecordKind.REST:
+                        self.on_rest(record)
+                        continue
+                    self.on_stream(record)
+                    self.render()
+                    if self.run_strategy and self.scheduler.poll():
+                        self.run_cycle()
+                self.match_trades()
+                self.render(force=True)
+        finally:
+            self.executor.shutdown()
+            live_main.order_books.pop(self.symbol, None)
+            live_main.schedulers.pop(self.symbol, None)
+            live_main.renderer = None
+        return {
+            "messages": self.messages,
+            "cycles": self.cycles,
+            "fills": len(self.matching.fills),
+            "position": self.repo.position_amount,
+            "pnl": self.repo.equity - self.repo.initial_balance,
+            "fees": self.repo.fees,
+            "replay_seconds": self.clock.elapsed(),
+            "seconds": time.perf_counter() - started,
+        }
+
+
+def find_exchange_info(path: str) -> dict[str, Any] | None:
+    for record in read_recordings(path):
+        if record.kind is not RecordKind.REST:
+            return None
+        data = json.loads(record.message)
+        if data.get("path") == live_main.EXCHANGE_INFO_PATH:
+            return data["response"]
+    return None
+
+
+def load_exchange_info(
+    path: str, exchange_info_file: str = "exchange_info.json"
+) -> ExchangeInfoCache:
+    exchange_info = ExchangeInfoCache(path=exchange_info_file)
+    recorded = find_exchange_info(path)
+    if recorded is not None:
+        exchange_info.set_exchange_info(recorded, 0.0)
+    elif (cached := exchange_info.read_file()) is not None:
+        exchange_info.set_exchange_info(cached["exchangeInfo"], cached["updated"])
+    else:
+        logging.error(f"no exchange info in {path} or {exchange_info_file}")
+    return exchange_info
+
+
+def main(
+    path: str,
+    config_file: str = "my_trading.json",
+    speed: float = 0.0,
+    run_strategy: bool = True,
+    display: bool = False,
+    initial_balance: float = 1000.0,
+    use_exchange_time: bool = False,
+    profile_file: str = "",
+    exchange_info_file: str = "exchange_info.json",
+) -> None:
+    file_input = get_inputs_from_file(file_name=config_file)
+    live = Live(renderable=layout, auto_refresh=False, screen=True)
+    replayer = Replayer(
+        file_input=file_input,
+        records=read_recordings(path),
+        speed=speed,
+        run_strategy=run_strategy,
+        initial_balance=initial_balance,
+        use_exchange_time=use_exchange_time,
+        exchange_info=load_exchange_info(path, exchange_info_file),
+        renderer=DisplayRenderer(
+            layout=layout, frame_rate=file_input.display_frame_rate, live=live
+        )
+        if display
+        else None,
+    )
+    if display:
+        live.start()
+    profiler = cProfile.Profile() if profile_file else None
+    try:
+        if profiler is not None:
+            profiler.enable()
+        summary = replayer.run()
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_file)
+        if display:
+            live.stop()
+    logging.info(summary)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    typer.run(function=main)
@@ -0,0 +1,170 @@
+import asyncio
+from typing import Any
+
+from base.consts import Settings
+from data.enums import (
+    OrderType,
+    PositionSide,
+    PriceMatch,
+    PriceMatchNone,
+    Side,
+    TickerSymbol,
+    TimeInForce,
+)
+from model import ChangeInitialLeverage
+from network.async_network import AsyncBinanceNetworkClient
+from network.order_encoder import BatchOrderEncoder
+from network.rate_limiter import RateLimiter
+from network.responses.responses import (
+    CancelAllOrdersResponse,
+    CompactAccountInfoResponse,
+    CompactMarkPriceResponse,
+    CompactPositionInformationResponse,
+    ListenKeyResponse,
+)
+
+
+class AsyncTradeRepo:
+    def __init__(
+        self,
+        client: AsyncBinanceNetworkClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+        encoder: BatchOrderEncoder | None = None,
+    ):
+        self.client = client or AsyncBinanceNetworkClient(
+            key=Settings().KEY,
+            secret=Settings().SECRET,
+            base_url=Settings().BASE_URL,
+            rate_limiter=rate_limiter,
+        )
+        self.encoder = encoder or BatchOrderEncoder()
+
+    async def __aenter__(self) -> "AsyncTradeRepo":
+        await self.client.open()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self.client.close()
+
+    async def get_account_info(
+        self, fields: list[str] | None = None
+    ) -> CompactAccountInfoResponse:
+        return await self.client.get_account_info_request(fields=fields)
+
+    async def get_cross_wallet_balance(
+        self,
+    ) -> float:
+        return (await self.client.get_balance_request())[0]["crossWalletBalance"]
+
+    async def get_mark_price(self, symbol: TickerSymbol) -> CompactMarkPriceResponse:
+        return await self.client.get_mark_price_request(symbol=symbol.name)
+
+    async def get_ticker_price(self, symbol: TickerSymbol) -> float:
+        response = await self.client.get_ticker_price_request(symbol=symbol.name)
+        return float(response["price"])
+
+    async def get_snapshot(
+        self, symbol: TickerSymbol
+    ) -> tuple[
+        CompactMarkPriceResponse,
+        CompactPositionInformationResponse,
+        CompactAccountInfoResponse,
+    ]:
+        mark_price, position_risk, account_info = await asyncio.gather(
+            self.get_mark_price(symbol=symbol),
+            self.get_position_risk(symbol=symbol),
+            self.get_account_info(),
+        )
+        return mark_price, position_risk, account_info
+
+    async def new_order(
+        self,
+        symbol: TickerSymbol,
+        side: Side,
+        quantity: float,
+        position_side: PositionSide,
+        price: float = -1.0,
+        order_type: OrderType = OrderType.LIMIT,
+        time_in_force: TimeInForce = TimeInForce.GTC,
+        price_match: PriceMatch = PriceMatchNone.NONE,
+    ) -> Any | dict[Any, Any]:
+        if price_match is PriceMatchNone.NONE:
+            return await self.client.new_order_request(
+                symbol=symbol.name,
+                side=side.name,
+                quantity=quantity,
+                position_side=position_side.name,
+                price=price,
+                order_type=order_type.name,
+                time_in_force=time_in_force.name,
+            )
+        return await self.client.new_price_match_order_request(
+            symbol=symbol.name,
+            side=side.name,
+            quantity=quantity,
+            position_side=position_side.name,
+            order_type=order_type.name,
+            time_in_force=time_in_force.name,
+            price_match=price_match.name,
+        )
+
+    async def new_batch_order(self, orders: list) -> Any | dict[Any, Any]:
+        return await self.client.new_batch_order_request(
+            params=self.encoder.encode_query(orders), orders=len(orders)
+        )
+
+    async def new_batch_orders(self, batched_orders: list[list]) -> list[Any]:
+        return await asyncio.gather(
+            *(self.new_batch_order(orders=orders) for orders in batched_orders),
+            return_exceptions=True,
+        )
+
+    async def modify_batch_order(self, orders: list) -> Any | dict[Any, Any]:
+        return await self.client.modify_batch_order_request(
+            params=self.encoder.encode_query(orders), orders=len(orders)
+        )
+
+    async def cancel_batch_order(
+        self, symbol: TickerSymbol, order_ids: list[int]
+    ) -> Any | dict[Any, Any]:
+        return await self.client.cancel_batch_order_request(
+            symbol=symbol.name, order_ids=order_ids
+        )
+
+    async def cancel_all_orders(self, symbol: TickerSymbol) -> CancelAllOrdersResponse:
+        return await self.client.cancel_all_orders_request(symbol=symbol.name)
+
+    async def get_listen_key(
+        self,
+    ) -> ListenKeyResponse:
+        return await self.client.get_listen_key_request()
+
+    async def close_listen_key(self, listen_key: str) -> Any | dict[Any, Any]:
+        return await self.client.close_listen_key_request(listen_key=listen_key)
+
+    async def get_open_orders(self, symbol: TickerSymbol) -> Any | dict[Any, Any]:
+        return await self.client.get_orders_request(symbol=symbol.name)
+
+    async def keep_alive(self, listen_key: str):
+        return await self.client.keep_alive_request(listen_key=listen_key)
+
+    async def get_time(
+        self,
+    ) -> int:
+        return (await self.client.get_time_request())["serverTime"]
+
+    async def get_depth(self, symbol: TickerSymbol, limit: int = 5):
+        return await self.client.get_depth_request(symbol=symbol.name, limit=limit)
+
+    async def get_position_risk(
+        self, symbol: TickerSymbol
+    ) -> CompactPositionInformationResponse:
+        return (await self.client.get_position_risk_request(symbol=symbol.name))[0]
+
+    async def change_initial_leverage(
+        self, symbol: TickerSymbol, leverage: int
+    ) -> ChangeInitialLeverage:
+        return await self.client.change_initial_leverage_request(symbol.name, leverage)
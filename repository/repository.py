@@ -1,4 +1,3 @@
-from enum import Enum
 from typing import Any
 
 from binance.um_futures import UMFutures
@@ -16,15 +15,28 @@ from data.enums import (
     TickerSymbol,
     TimeInForce,
 )
-from model import ChangeInitialLeverage
+from model import ChangeInitialLeverage, NotionalAndLeverageBracket, RateLimit
 from network.network import BinanceNetworkClient
+from network.order_encoder import BatchOrderEncoder, format_value
+from network.rate_limiter import RateLimiter
 from network.responses.responses import (
-    AccountInfoResponse,
     CancelAllOrdersResponse,
+    CompactAccountInfoResponse,
+    CompactMarkPriceResponse,
+    CompactPositionInformationResponse,
     ListenKeyResponse,
-    MarkPriceResponse,
-    PositionInformationResponse,
 )
+from utils.metrics import record_response
+
+
+def stringify_orders(orders: list) -> list[dict[str, str]]:
+    new_orders = []
+    for order in orders:
+        new_dict = {}
+        for key in order:
+            new_dict[key] = format_value(order[key])
+        new_orders.append(new_dict)
+    return new_orders
 
 
 class TradeRepo(metaclass=Singleton):
@@ -34,19 +46,37 @@ class TradeRepo(metaclass=Singleton):
         )
         adapter = HTTPAdapter(pool_connections=200, pool_maxsize=200)
         um_client.session.mount("https://", adapter)
-        self.client = BinanceNetworkClient(client=um_client)
+        self.rate_limiter = RateLimiter()
+        um_client.session.hooks["response"].append(self.rate_limiter.on_response)
+        um_client.session.hooks["response"].append(record_response)
+        self.client = BinanceNetworkClient(
+            client=um_client, rate_limiter=self.rate_limiter
+        )
+        self.encoder = BatchOrderEncoder()
+
+    def get_exchange_info(self) -> dict[str, Any]:
+        return self.client.get_exchange_info_request()
+
+    def get_rate_limits(self) -> list[RateLimit]:
+        return [RateLimit(**i) for i in self.get_exchange_info()["rateLimits"]]
+
+    def seed_rate_limits(self) -> None:
+        self.rate_limiter.seed(self.get_rate_limits())
+
+    def get_rate_limit_headroom(self) -> dict[str, float]:
+        return self.rate_limiter.headroom()
 
     def get_account_info(
-        self,
-    ) -> AccountInfoResponse:
-        return self.client.get_account_info_request()
+        self, fields: list[str] | None = None
+    ) -> CompactAccountInfoResponse:
+        return self.client.get_account_info_request(fields=fields)
 
     def get_cross_wallet_balance(
         self,
     ) -> float:
         return self.client.get_balance_request()[0]["crossWalletBalance"]
 
-    def get_mark_price(self, symbol: TickerSymbol) -> MarkPriceResponse:
+    def get_mark_price(self, symbol: TickerSymbol) -> CompactMarkPriceResponse:
         return self.client.get_mark_price_request(symbol=symbol.name)
 
     def get_ticker_price(self, symbol: TickerSymbol) -> float:
@@ -86,17 +116,21 @@ class TradeRepo(metaclass=Singleton):
         )
 
     def new_batch_order(self, orders: list) -> Any | dict[Any, Any]:
-        new_orders = []
-        for order in orders:
-            new_dict = {}
-            for key in order:
-                key_value = order[key]
-                if isinstance(key_value, Enum):
-                    new_dict[key] = key_value.value
-                else:
-                    new_dict[key] = str(key_value)
-            new_orders.append(new_dict)
-        return self.client.new_batch_order_request(params=new_orders)
+        return self.client.new_batch_order_request(
+            params=self.encoder.encode_query(orders), orders=len(orders)
+        )
+
+    def modify_batch_order(self, orders: list) -> Any | dict[Any, Any]:
+        return self.client.modify_batch_order_request(
+            params=self.encoder.encode_query(orders), orders=len(orders)
+        )
+
+    def cancel_batch_order(
+        self, symbol: TickerSymbol, order_ids: list[int]
+    ) -> Any | dict[Any, Any]:
+        return self.client.cancel_batch_order_request(
+            symbol=symbol.name, order_ids=order_ids
+        )
 
     def cancel_all_orders(self, symbol: TickerSymbol) -> CancelAllOrdersResponse:
         return self.client.cancel_all_orders_request(symbol=symbol.name)
@@ -144,10 +178,17 @@ class TradeRepo(metaclass=Singleton):
     def get_depth(self, symbol: TickerSymbol, limit: int = 5):
         return self.client.get_depth_request(symbol=symbol.name, limit=limit)
 
-    def get_position_risk(self, symbol: TickerSymbol) -> PositionInformationResponse:
+    def get_position_risk(
+        self, symbol: TickerSymbol
+    ) -> CompactPositionInformationResponse:
         return self.client.get_position_risk_request(symbol=symbol.name)[0]
 
     def change_initial_leverage(
         self, symbol: TickerSymbol, leverage: int
     ) -> ChangeInitialLeverage:
         return self.client.change_initial_leverage_request(symbol.name, leverage)
+
+    def get_leverage_brackets(
+        self, symbol: TickerSymbol
+    ) -> NotionalAndLeverageBracket:
+        return self.client.get_leverage_brackets_request(symbol=symbol.name)[0]
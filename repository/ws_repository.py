@@ -0,0 +1,115 @@
+import logging
+from typing import Any
+
+from data.enums import (
+    OrderType,
+    PositionSide,
+    PriceMatch,
+    PriceMatchNone,
+    RequestPriority,
+    Side,
+    TickerSymbol,
+    TimeInForce,
+)
+from network.ws_order_client import DISCONNECTED, WebsocketOrderClient
+from repository.repository import TradeRepo
+
+
+class WebsocketTradeRepo:
+    def __init__(self, repo: TradeRepo, client: WebsocketOrderClient) -> None:
+        self.repo = repo
+        self.client = client
+        self.fallbacks = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.repo, name)
+
+    def send(
+        self, method: str, orders: list[dict[str, str]], fallback
+    ) -> list[dict[str, Any]]:
+        acquired = self.client.connected
+        if acquired:
+            self.repo.rate_limiter.acquire(
+                weight=0, orders=len(orders), priority=RequestPriority.ORDER
+            )
+            try:
+                responses = self.client.request_many(method, orders)
+            except ConnectionError as e:
+                logging.error(e)
+                responses = [DISCONNECTED] * len(orders)
+        else:
+            responses = [DISCONNECTED] * len(orders)
+        retry = [i for i, r in enumerate(responses) if r.get("code") == -1001]
+        if retry:
+            self.fallbacks += 1
+            if acquired:
+                self.repo.rate_limiter.refund(orders=len(retry))
+            for i, response in zip(retry, fallback([orders[i] for i in retry])):
+                responses[i] = response
+        logging.info(responses)
+        return responses
+
+    def new_order(
+        self,
+        symbol: TickerSymbol,
+        side: Side,
+        quantity: float,
+        position_side: PositionSide,
+        price: float = -1.0,
+        order_type: OrderType = OrderType.LIMIT,
+        time_in_force: TimeInForce = TimeInForce.GTC,
+        price_match: PriceMatch = PriceMatchNone.NONE,
+    ) -> Any | dict[Any, Any]:
+        order = {
+            "symbol": symbol,
+            "side": side,
+            "positionSide": position_side,
+            "type": order_type,
+            "quantity": quantity,
+            "timeInForce": time_in_force,
+        }
+        if price_match is PriceMatchNone.NONE:
+            order["price"] = price
+        else:
+            order["priceMatch"] = price_match
+        return self.send(
+            "order.place",
+            self.repo.encoder.format_orders([order]),
+            lambda _: [
+                self.repo.new_order(
+                    symbol=symbol,
+                    side=side,
+                    quantity=quantity,
+                    position_side=position_side,
+                    price=price,
+                    order_type=order_type,
+                    time_in_force=time_in_force,
+                    price_match=price_match,
+                )
+            ],
+        )[0]
+
+    def new_batch_order(self, orders: list) -> Any | dict[Any, Any]:
+        return self.send(
+            "order.place",
+            self.repo.encoder.format_orders(orders),
+            self.repo.new_batch_order,
+        )
+
+    def modify_batch_order(self, orders: list) -> Any | dict[Any, Any]:
+        return self.send(
+            "order.modify",
+            self.repo.encoder.format_orders(orders),
+            self.repo.modify_batch_order,
+        )
+
+    def cancel_batch_order(
+        self, symbol: TickerSymbol, order_ids: list[int]
+    ) -> Any | dict[Any, Any]:
+        return self.send(
+            "order.cancel",
+            [{"symbol": symbol.name, "orderId": str(i)} for i in order_ids],
+            lambda orders: self.repo.cancel_batch_order(
+                symbol=symbol, order_ids=[int(order["orderId"]) for order in orders]
+            ),
+        )
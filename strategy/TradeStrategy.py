@@ -1,8 +1,25 @@
-import concurrent.futures
+import time
 from typing import Any
 
 from base.models.FileInput import FileInput
+from data.account_state import AccountState
+from data.exchange_info import ExchangeInfoCache, SymbolFilters
+from data.margin_engine import MarginEngine
+from data.order_book import LocalOrderBook
+from network.responses.responses import (
+    AccountInfoResponse,
+    PositionInformationResponse,
+)
 from repository.repository import TradeRepo
+from strategy.executor import (
+    BatchResult,
+    OrderExecutor,
+    default_executor,
+    submit_order,
+)
+from utils.listutils import batched_lists
+from utils.metrics import timed
+from utils.reconcileutils import ReconcilePlan, reconcile_orders
 
 
 class TradeStrategy:
@@ -10,33 +27,100 @@ class TradeStrategy:
         self,
         file_input: FileInput,
         repo: TradeRepo = TradeRepo(),
+        executor: OrderExecutor | None = None,
+        order_book: LocalOrderBook | None = None,
+        account_state: AccountState | None = None,
+        exchange_info: ExchangeInfoCache | None = None,
+        margin_engine: MarginEngine | None = None,
     ) -> None:
         self.file_input = file_input
         self.repo = repo
+        self.executor = executor if executor is not None else default_executor()
+        self.order_book = order_book
+        self.account_state = account_state
+        self.exchange_info = exchange_info
+        self.margin_engine = margin_engine
+        self.center_price: float | None = None
+        self.acked_ns: int | None = None
 
-    def work(self, order) -> Any | dict[Any, Any]:
-        if isinstance(order, list):
-            return self.repo.new_batch_order(orders=order)
-        if "priceMatch" in order:
-            return self.repo.new_order(
-                symbol=order["symbol"],
-                side=order["side"],
-                quantity=order["quantity"],
-                position_side=order["positionSide"],
-                price_match=order["priceMatch"],
+    def has_account_state(self) -> bool:
+        return self.account_state is not None and self.account_state.is_ready(
+            self.file_input.symbol
+        )
+
+    def get_filters(self) -> SymbolFilters:
+        if self.exchange_info is None:
+            return SymbolFilters(symbol=self.file_input.symbol.name)
+        return self.exchange_info.get_filters(self.file_input.symbol)
+
+    def get_max_notional(self, position_risk: PositionInformationResponse) -> float:
+        if self.margin_engine is None:
+            return position_risk.maxNotionalValue
+        return self.margin_engine.max_notional(position_risk.leverage)
+
+    def get_last_price(self) -> float:
+        if self.order_book is not None and self.order_book.synced:
+            mid_price = self.order_book.mid_price()
+            if mid_price is not None:
+                return mid_price
+        if self.has_account_state():
+            return self.account_state.get_last_price(self.file_input.symbol)
+        return self.repo.get_ticker_price(self.file_input.symbol)
+
+    @timed("strategy.snapshot")
+    def get_snapshot(
+        self,
+    ) -> tuple[float, PositionInformationResponse, AccountInfoResponse]:
+        symbol = self.file_input.symbol
+        if self.has_account_state():
+            return (
+                self.account_state.get_mark_price(symbol),
+                self.account_state.get_position(symbol),
+                self.account_state.get_account_info(),
             )
-        else:
-            return self.repo.new_order(
-                symbol=order["symbol"],
-                side=order["side"],
-                quantity=order["quantity"],
-                position_side=order["positionSide"],
-                price=order["price"],
+        if self.executor.uses_async_repo(self.repo):
+            mark_price, position_risk, account_info = self.executor.run_async(
+                lambda repo: repo.get_snapshot(symbol=symbol)
             )
+        else:
+            mark_price = self.repo.get_mark_price(symbol=symbol)
+            position_risk = self.repo.get_position_risk(symbol=symbol)
+            account_info = self.repo.get_account_info()
+        return mark_price.markPrice, position_risk, account_info
+
+    def work(self, order) -> Any | dict[Any, Any]:
+        return submit_order(self.repo, order)
 
-    def execute_orders(self, batched_orders) -> None:
-        with concurrent.futures.ProcessPoolExecutor(max_workers=61) as executor:
-            executor.map(self.work, batched_orders, chunksize=5)
+    @timed("strategy.submit")
+    def execute_orders(self, batched_orders) -> list[BatchResult]:
+        results = self.executor.submit(batched_orders, repo=self.repo)
+        self.acked_ns = time.perf_counter_ns()
+        return results
+
+    @timed("strategy.reconcile")
+    def reconcile(self, target_orders: list[dict[str, Any]]) -> ReconcilePlan:
+        if self.has_account_state():
+            open_orders = self.account_state.get_open_orders(self.file_input.symbol)
+        else:
+            open_orders = self.repo.get_open_orders(symbol=self.file_input.symbol)
+        plan = reconcile_orders(
+            target_orders=target_orders,
+            open_orders=open_orders,
+            price_tolerance=self.file_input.reconcile_price_tolerance,
+            quantity_tolerance=self.file_input.reconcile_quantity_tolerance,
+            step_size=self.get_filters().step_size,
+        )
+        for order_ids in batched_lists(plan.cancels, 10):
+            self.repo.cancel_batch_order(
+                symbol=self.file_input.symbol, order_ids=order_ids
+            )
+        for amends in batched_lists(plan.amends, 5):
+            self.repo.modify_batch_order(orders=amends)
+        if plan.cancels or plan.amends:
+            self.acked_ns = time.perf_counter_ns()
+        if plan.new_orders:
+            self.execute_orders(batched_lists(plan.new_orders, 5))
+        return plan
 
     def run_loop(self) -> None:
         pass
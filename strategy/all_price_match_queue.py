@@ -1,7 +1,10 @@
+import time
+
 from base.models.FileInput import FileInput
 from data.enums import Side
 from strategy.TradeStrategy import TradeStrategy
 from utils.mathutils import get_max_buy_amount
+from utils.metrics import Metrics
 from utils.orderutils import create_all_queue_price_match_orders
 
 
@@ -10,28 +13,32 @@ class AllPriceMatchQueueStrategy(TradeStrategy):
         super().__init__(file_input=file_input)
 
     def run_loop(self):
-        mark_price = self.repo.get_mark_price(symbol=self.file_input.symbol).markPrice
-        position_risk = self.repo.get_position_risk(symbol=self.file_input.symbol)
-        account_info = self.repo.get_account_info()
+        mark_price, position_risk, account_info = self.get_snapshot()
+        started = time.perf_counter_ns()
+        self.center_price = mark_price
         buy_amount = get_max_buy_amount(
             leverage=position_risk.leverage,
             available_balance=account_info.availableBalance,
             mark_price=mark_price,
         )
-        buy_order_amount = round(buy_amount / float(self.file_input.buy_orders_num), 4)
-        sell_order_amount = round(
-            position_risk.positionAmt / float(self.file_input.sell_orders_num), 4
+        filters = self.get_filters()
+        buy_order_amount = filters.round_quantity(
+            buy_amount / float(self.file_input.buy_orders_num), "floor"
+        )
+        sell_order_amount = filters.round_quantity(
+            position_risk.positionAmt / float(self.file_input.sell_orders_num), "floor"
         )
         buy_orders = create_all_queue_price_match_orders(
             symbol=self.file_input.symbol,
             side=Side.BUY,
             position_side=self.file_input.position_side,
-            quantity=min(buy_order_amount, 1000.0),
+            quantity=min(buy_order_amount, filters.max_qty),
         )
         sell_orders = create_all_queue_price_match_orders(
             symbol=self.file_input.symbol,
             side=Side.SELL,
             position_side=self.file_input.position_side,
-            quantity=min(sell_order_amount, 1000.0),
+            quantity=min(sell_order_amount, filters.max_qty),
         )
+        Metrics().record("strategy.grid_build", time.perf_counter_ns() - started)
         self.execute_orders(buy_orders + sell_orders)
@@ -0,0 +1,278 @@
+import asyncio
+import concurrent.futures
+import logging
+import multiprocessing
+import threading
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Callable
+
+from data.enums import ExecutorBackend, RequestPriority
+from network.rate_limiter import RateLimiter
+from repository.repository import TradeRepo
+
+
+@dataclass
+class BatchResult:
+    index: int
+    orders: Any
+    response: Any = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.order_errors
+
+    @property
+    def order_errors(self) -> list[dict[str, Any]]:
+        if not isinstance(self.response, list):
+            return []
+        return [r for r in self.response if isinstance(r, dict) and "code" in r]
+
+
+def submit_order(repo: TradeRepo, order) -> Any | dict[Any, Any]:
+    if isinstance(order, list):
+        return repo.new_batch_order(orders=order)
+    if "priceMatch" in order:
+        return repo.new_order(
+            symbol=order["symbol"],
+            side=order["side"],
+            quantity=order["quantity"],
+            position_side=order["positionSide"],
+            price_match=order["priceMatch"],
+        )
+    return repo.new_order(
+        symbol=order["symbol"],
+        side=order["side"],
+        quantity=order["quantity"],
+        position_side=order["positionSide"],
+        price=order["price"],
+    )
+
+
+def submit_batch(repo: TradeRepo, index: int, order) -> BatchResult:
+    try:
+        response = submit_order(repo, order)
+        return BatchResult(index=index, orders=order, response=response)
+    except Exception as e:
+        return BatchResult(index=index, orders=order, error=e)
+
+
+async def submit_order_async(repo, order) -> Any | dict[Any, Any]:
+    if isinstance(order, list):
+        return await repo.new_batch_order(orders=order)
+    if "priceMatch" in order:
+        return await repo.new_order(
+            symbol=order["symbol"],
+            side=order["side"],
+            quantity=order["quantity"],
+            position_side=order["positionSide"],
+            price_match=order["priceMatch"],
+        )
+    return await repo.new_order(
+        symbol=order["symbol"],
+        side=order["side"],
+        quantity=order["quantity"],
+        position_side=order["positionSide"],
+        price=order["price"],
+    )
+
+
+async def submit_batch_async(repo, index: int, order) -> BatchResult:
+    try:
+        response = await submit_order_async(repo, order)
+        return BatchResult(index=index, orders=order, response=response)
+    except Exception as e:
+        return BatchResult(index=index, orders=order, error=e)
+
+
+def get_order_cost(order) -> tuple[int, int]:
+    if isinstance(order, list):
+        return 5, len(order)
+    return 0, 1
+
+
+process_repo: TradeRepo | None = None
+
+
+def init_process_worker(repo_factory: Callable[[], TradeRepo] = TradeRepo) -> None:
+    global process_repo
+    process_repo = repo_factory()
+    try:
+        process_repo.get_time()
+    except Exception as e:
+        logging.error(e)
+
+
+def submit_batch_in_process_worker(index: int, order) -> BatchResult:
+    with process_repo.rate_limiter.prepaid():
+        return submit_batch(process_repo, index, order)
+
+
+class OrderExecutor:
+    def __init__(
+        self,
+        backend: ExecutorBackend = ExecutorBackend.THREAD,
+        max_workers: int = 40,
+        repo_factory: Callable[[], TradeRepo] = TradeRepo,
+        async_repo_factory: Callable[[], Any] | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        self.backend = backend
+        self.max_workers = max_workers
+        self.repo_factory = repo_factory
+        self.async_repo_factory = async_repo_factory
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self._async_repo = None
+        self._pool: concurrent.futures.Executor | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._repo_lock = threading.Lock()
+
+    def start(self) -> "OrderExecutor":
+        with self._lock:
+            if self.backend is ExecutorBackend.PROCESS and self._pool is None:
+                self._pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=init_process_worker,
+                    initargs=(self.repo_factory,),
+                )
+            elif self.backend is ExecutorBackend.THREAD and self._pool is None:
+                self._pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="order-executor"
+                )
+            elif self.backend is ExecutorBackend.ASYNCIO and self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="order-executor", daemon=True
+                )
+                self._loop_thread.start()
+        return self
+
+    def submit(
+        self, batched_orders, repo: TradeRepo | None = None
+    ) -> list[BatchResult]:
+        if (
+            self.backend is ExecutorBackend.PROCESS
+            and repo is not None
+            and type(repo) is not TradeRepo
+        ):
+            raise ValueError("the PROCESS backend only submits through TradeRepo")
+        self.start()
+        batched_orders = list(batched_orders)
+        if self.backend is ExecutorBackend.PROCESS:
+            rate_limiter = repo.rate_limiter if repo is not None else self.rate_limiter
+            futures = []
+            for index, order in enumerate(batched_orders):
+                weight, orders = get_order_cost(order)
+                rate_limiter.acquire(
+                    weight=weight, orders=orders, priority=RequestPriority.ORDER
+                )
+                futures.append(
+                    self._pool.submit(submit_batch_in_process_worker, index, order)
+                )
+            results = self._collect(batched_orders, futures)
+        elif self.backend is ExecutorBackend.ASYNCIO:
+            repo = repo if repo is not None else self.repo_factory()
+            results = asyncio.run_coroutine_threadsafe(
+                self._submit_async(batched_orders, repo), self._loop
+            ).result()
+        else:
+            repo = repo if repo is not None else self.repo_factory()
+            futures = [
+                self._pool.submit(submit_batch, repo, index, order)
+                for index, order in enumerate(batched_orders)
+            ]
+            results = self._collect(batched_orders, futures)
+        for result in results:
+            if result.error is not None:
+                logging.error(result.error)
+            for order_error in result.order_errors:
+                logging.error(order_error)
+        return results
+
+    @property
+    def has_async_repo(self) -> bool:
+        return (
+            self.backend is ExecutorBackend.ASYNCIO
+            and self.async_repo_factory is not None
+        )
+
+    def uses_async_repo(self, repo: TradeRepo | None) -> bool:
+        return self.has_async_repo and (repo is None or type(repo) is TradeRepo)
+
+    def get_async_repo(self):
+        with self._repo_lock:
+            if self._async_repo is None and self.has_async_repo:
+                self._async_repo = self.async_repo_factory()
+            return self._async_repo
+
+    def run_async(self, coroutine_function: Callable[[Any], Any]) -> Any:
+        if not self.has_async_repo:
+            raise ValueError("run_async needs the ASYNCIO backend and an async repo")
+        self.start()
+
+        async def run() -> Any:
+            return await coroutine_function(self.get_async_repo())
+
+        return asyncio.run_coroutine_threadsafe(run(), self._loop).result()
+
+    async def _submit_async(
+        self, batched_orders: list, repo: TradeRepo
+    ) -> list[BatchResult]:
+        semaphore = asyncio.Semaphore(self.max_workers)
+        async_repo = self.get_async_repo() if self.uses_async_repo(repo) else None
+
+        async def run(index: int, order) -> BatchResult:
+            async with semaphore:
+                if async_repo is not None:
+                    return await submit_batch_async(async_repo, index, order)
+                return await asyncio.to_thread(submit_batch, repo, index, order)
+
+        return list(
+            await asyncio.gather(
+                *(run(index, order) for index, order in enumerate(batched_orders))
+            )
+        )
+
+    @staticmethod
+    def _collect(
+        batched_orders: list, futures: list[concurrent.futures.Future]
+    ) -> list[BatchResult]:
+        results = []
+        for index, (order, future) in enumerate(zip(batched_orders, futures)):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(BatchResult(index=index, orders=order, error=e))
+        return results
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+            if self._loop is not None:
+                if self._async_repo is not None:
+                    asyncio.run_coroutine_threadsafe(
+                        self._async_repo.close(), self._loop
+                    ).result()
+                    self._async_repo = None
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop_thread.join()
+                self._loop.close()
+                self._loop = None
+                self._loop_thread = None
+
+    def __enter__(self) -> "OrderExecutor":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+
+
+@cache
+def default_executor() -> OrderExecutor:
+    return OrderExecutor()
@@ -1,12 +1,15 @@
+import time
+
 from base.models.FileInput import FileInput
 from data.enums import AmountSpacing, PositionSide, Side
 from strategy.TradeStrategy import TradeStrategy
 from utils.listutils import batched_lists
 from utils.mathutils import get_grid_maxs_and_mins
+from utils.metrics import Metrics
 from utils.orderutils import (
-    create_multiple_orders,
-    get_buy_orders_quantities_and_prices,
-    get_sell_orders_quantities_and_prices,
+    create_orders_from_array,
+    get_buy_orders_array,
+    get_sell_orders_array,
 )
 
 
@@ -15,17 +18,18 @@ class FixedRangeStrategy(TradeStrategy):
         super().__init__(file_input=file_input)
 
     def run_loop(self) -> None:
-        mark_price = self.repo.get_mark_price(symbol=self.file_input.symbol).markPrice
-        position_risk = self.repo.get_position_risk(symbol=self.file_input.symbol)
-        account_info = self.repo.get_account_info()
+        mark_price, position_risk, account_info = self.get_snapshot()
+        started = time.perf_counter_ns()
         entry_price = position_risk.entryPrice
         position_amount = position_risk.positionAmt
         entry_price = mark_price if self.file_input.use_mark_price else entry_price
         center_price = entry_price if entry_price > 0.0 else mark_price
         max_mm_position = 400.0
         if position_amount >= max_mm_position and self.file_input.market_making:
-            last_price = self.repo.get_ticker_price(self.file_input.symbol)
+            last_price = self.get_last_price()
             center_price = min(position_risk.entryPrice, mark_price, last_price)
+        self.center_price = center_price
+        filters = self.get_filters()
         (
             price_sell_max,
             price_sell_min,
@@ -40,46 +44,56 @@ class FixedRangeStrategy(TradeStrategy):
         )
         buy_orders = []
         if position_amount < max_mm_position or not self.file_input.market_making:
-            buy_orders_quantities_and_prices = get_buy_orders_quantities_and_prices(
+            buy_orders_array = get_buy_orders_array(
                 orders_num=self.file_input.buy_orders_num,
                 high_price=price_buy_max,
                 low_price=price_buy_min,
                 available_balance=account_info.availableBalance,
                 leverage=position_risk.leverage,
                 mark_price=mark_price,
-                max_notional_value=position_risk.maxNotionalValue,
+                max_notional_value=self.get_max_notional(position_risk),
                 notional=position_risk.notional,
                 side=PositionSide.LONG,
-                precision=3,
-                order_quantity_min=0.001,
-                order_quantity_max=1000.0,
+                precision=filters.quantity_precision,
+                order_quantity_min=filters.get_min_quantity(price_buy_min),
+                order_quantity_max=filters.max_qty,
                 amount_spacing=AmountSpacing.GEOMETRIC,
                 market_making=self.file_input.market_making,
                 mm_buy_quantity=self.file_input.mm_buy_quantity,
+                tick_size=filters.tick_size,
+                step_size=filters.step_size,
+                volume_scale=self.file_input.buy_volume_scale,
             )
-            buy_orders = create_multiple_orders(
+            buy_orders = create_orders_from_array(
                 symbol=self.file_input.symbol,
                 side=Side.BUY,
-                quantities_and_prices=buy_orders_quantities_and_prices,
+                orders=buy_orders_array,
                 position_side=self.file_input.position_side,
                 time_in_force=self.file_input.time_in_force,
             )
-        sell_orders_quantities_and_prices = get_sell_orders_quantities_and_prices(
+        sell_orders_array = get_sell_orders_array(
             orders_num=200 - len(buy_orders) if isinstance(buy_orders, list) else 0,
             high_price=price_sell_max,
             low_price=price_sell_min,
             amount=position_amount,
-            order_quantity_min=0.001,
+            order_quantity_min=filters.get_min_quantity(price_sell_min),
             amount_spacing=AmountSpacing.GEOMETRIC,
             market_making=self.file_input.market_making,
             mm_sell_quantity=self.file_input.mm_sell_quantity,
+            tick_size=filters.tick_size,
+            step_size=filters.step_size,
+            volume_scale=self.file_input.sell_volume_scale,
         )
-        sell_orders = create_multiple_orders(
+        sell_orders = create_orders_from_array(
             symbol=self.file_input.symbol,
             side=Side.SELL,
-            quantities_and_prices=sell_orders_quantities_and_prices,
+            orders=sell_orders_array,
             position_side=self.file_input.position_side,
             time_in_force=self.file_input.time_in_force,
         )
-        batched_orders = batched_lists(buy_orders + sell_orders, 5)
-        self.execute_orders(batched_orders)
+        Metrics().record("strategy.grid_build", time.perf_counter_ns() - started)
+        if self.file_input.reconcile:
+            self.reconcile(buy_orders + sell_orders)
+        else:
+            batched_orders = batched_lists(buy_orders + sell_orders, 5)
+            self.execute_orders(batched_orders)
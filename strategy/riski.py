@@ -1,9 +1,40 @@
+import numpy as np
+
+from data.enums import PositionSide
+from data.margin_engine import MarginEngine
 from repository.repository import TradeRepo
 
 
 def get_margin_ratio():
     repo = TradeRepo()
-    account_info = repo.get_account_info()
+    account_info = repo.get_account_info(
+        fields=["totalMaintMargin", "totalWalletBalance"]
+    )
     maintenance_margin = account_info.totalMaintMargin
     total_wallet_balance = account_info.totalWalletBalance
-    return maintenance_margin / total_wallet_balance
\ No newline at end of file
+    return maintenance_margin / total_wallet_balance
+
+
+def get_grid_margin_ratios(
+    margin_engine: MarginEngine,
+    wallet_balance: float,
+    position_amount: float,
+    entry_price: float,
+    leverage: int,
+    prices: np.ndarray,
+    quantities: np.ndarray,
+    side: PositionSide = PositionSide.LONG,
+) -> np.ndarray:
+    fills = margin_engine.simulate_fills(
+        prices=prices,
+        quantities=quantities,
+        position_amount=position_amount,
+        entry_price=entry_price,
+        leverage=leverage,
+        wallet_balance=wallet_balance,
+        side=side,
+    )
+    margin_balance = wallet_balance + fills["position_amount"] * (
+        np.asarray(prices) - fills["entry_price"]
+    )
+    return fills["maintenance_margin"] / margin_balance
@@ -0,0 +1,129 @@
+import threading
+import time
+from typing import Any, Callable
+
+from data.enums import TriggerReason
+from network.stream_decoder import AccountUpdate
+
+
+class StrategyScheduler:
+    def __init__(
+        self,
+        symbol: str,
+        tick_size: float = 0.1,
+        trigger_ticks: int = 10,
+        debounce_seconds: float = 0.25,
+        max_staleness_seconds: float = 20.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if tick_size <= 0.0:
+            raise ValueError("tick_size must be positive")
+        if trigger_ticks < 1:
+            raise ValueError("trigger_ticks must be at least 1")
+        if debounce_seconds < 0.0 or max_staleness_seconds <= 0.0:
+            raise ValueError("scheduler intervals must be positive")
+        self.symbol = symbol
+        self.tick_size = tick_size
+        self.trigger_ticks = trigger_ticks
+        self.debounce_seconds = debounce_seconds
+        self.max_staleness_seconds = max_staleness_seconds
+        self.clock = clock
+        self.grid_center: float | None = None
+        self.last_price: float | None = None
+        self.last_run = clock()
+        self.run_count = 0
+        self.pending: set[TriggerReason] = set()
+        self.trigger_ns: int | None = None
+        self._first_trigger: float | None = None
+        self._first_trigger_ns: int | None = None
+        self._stopped = False
+        self._condition = threading.Condition()
+
+    def set_grid_center(self, price: float | None) -> None:
+        with self._condition:
+            self.grid_center = price
+            self.pending.discard(TriggerReason.PRICE_MOVE)
+            if not self.pending:
+                self._first_trigger = None
+                self._first_trigger_ns = None
+
+    def trigger(self, reason: TriggerReason, received_ns: int | None = None) -> None:
+        with self._condition:
+            if not self.pending:
+                self._first_trigger = self.clock()
+                self._first_trigger_ns = (
+                    received_ns if received_ns is not None else time.perf_counter_ns()
+                )
+            self.pending.add(reason)
+            self._condition.notify_all()
+
+    def on_price(self, price: float, received_ns: int | None = None) -> None:
+        with self._condition:
+            self.last_price = price
+            center = self.grid_center
+        if center is None:
+            return
+        if abs(price - center) >= self.trigger_ticks * self.tick_size - 1e-9:
+            self.trigger(TriggerReason.PRICE_MOVE, received_ns)
+
+    def on_event(
+        self, event: dict[str, Any] | AccountUpdate, received_ns: int | None = None
+    ) -> None:
+        if isinstance(event, AccountUpdate):
+            if any(p.symbol == self.symbol for p in event.positions):
+                self.trigger(TriggerReason.POSITION, received_ns)
+            return
+        if not isinstance(event, dict):
+            return
+        event_type = event.get("e")
+        if event_type == "ORDER_TRADE_UPDATE":
+            if event["o"]["s"] == self.symbol and event["o"].get("x") == "TRADE":
+                self.trigger(TriggerReason.FILL, received_ns)
+        elif event_type == "ACCOUNT_UPDATE":
+            if any(p["s"] == self.symbol for p in event["a"].get("P", [])):
+                self.trigger(TriggerReason.POSITION, received_ns)
+        elif event_type in ["markPriceUpdate", "aggTrade", "trade"]:
+            if event["s"] == self.symbol:
+                self.on_price(float(event["p"]), received_ns)
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+    def wait(self) -> set[TriggerReason]:
+        with self._condition:
+            while not self._stopped:
+                now = self.clock()
+                if self.pending:
+                    remaining = self._first_trigger + self.debounce_seconds - now
+                else:
+                    remaining = self.last_run + self.max_staleness_seconds - now
+                    if remaining <= 0.0:
+                        self.pending.add(TriggerReason.STALENESS)
+                        break
+                if remaining <= 0.0:
+                    break
+                self._condition.wait(timeout=remaining)
+            return self._take()
+
+    def poll(self) -> set[TriggerReason]:
+        with self._condition:
+            now = self.clock()
+            if self.pending:
+                if now < self._first_trigger + self.debounce_seconds:
+                    return set()
+            elif now - self.last_run >= self.max_staleness_seconds:
+                self.pending.add(TriggerReason.STALENESS)
+            else:
+                return set()
+            return self._take()
+
+    def _take(self) -> set[TriggerReason]:
+        reasons, self.pending = self.pending, set()
+        self.trigger_ns = self._first_trigger_ns
+        self._first_trigger = None
+        self._first_trigger_ns = None
+        self.last_run = self.clock()
+        self.run_count += 1
+        return reasons
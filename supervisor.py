@@ -0,0 +1,259 @@
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import typer
+
+from base.models.AccountInput import AccountInput
+from base.models.FileInput import FileInput
+from data.account_state import AccountState
+from repository.repository import TradeRepo
+from utils.fileutils import get_accounts_from_file
+
+
+@dataclass
+class WorkerSpec:
+    name: str
+    account: AccountInput
+    strategies: list[FileInput]
+    core: int | None = None
+
+    @property
+    def once(self) -> bool:
+        return all(file_input.once for file_input in self.strategies)
+
+
+def get_available_cores() -> list[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def shard_accounts(
+    accounts: list[AccountInput], cores: list[int] | None = None
+) -> list[WorkerSpec]:
+    cores = cores if cores is not None else get_available_cores()
+    return [
+        WorkerSpec(
+            name=account.name,
+            account=account,
+            strategies=account.strategies,
+            core=cores[index % len(cores)] if cores else None,
+        )
+        for index, account in enumerate(accounts)
+    ]
+
+
+def get_worker_status(spec: WorkerSpec) -> dict[str, Any]:
+    state = AccountState()
+    symbols = {}
+    for file_input in spec.strategies:
+        if not state.is_ready(file_input.symbol):
+            continue
+        position = state.get_position(file_input.symbol)
+        symbols[file_input.symbol.name] = {
+            "position_amount": position.positionAmt,
+            "entry_price": position.entryPrice,
+            "mark_price": state.get_mark_price(file_input.symbol),
+            "unrealized_profit": position.unRealizedProfit,
+            "leverage": position.leverage,
+            "open_orders": len(state.get_open_orders(file_input.symbol)),
+        }
+    account_info = state.account_info
+    headroom = TradeRepo().get_rate_limit_headroom()
+    return {
+        "worker": spec.name,
+        "account": spec.account.name,
+        "pid": os.getpid(),
+        "time": time.time(),
+        "wallet_balance": account_info.totalWalletBalance if account_info else 0.0,
+        "headroom": min(headroom.values()) if headroom else 1.0,
+        "symbols": symbols,
+    }
+
+
+def report_status(
+    spec: WorkerSpec, status_queue, report_seconds: float, stop: threading.Event
+) -> None:
+    while not stop.wait(report_seconds):
+        try:
+            status_queue.put(get_worker_status(spec))
+        except Exception as e:
+            logging.error(e)
+
+
+def exit_worker(*args) -> None:
+    sys.exit(0)
+
+
+def run_worker(spec: WorkerSpec, status_queue, report_seconds: float) -> None:
+    signal.signal(signal.SIGTERM, exit_worker)
+    if spec.core is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {spec.core})
+    os.environ["KEY"] = spec.account.key
+    os.environ["SECRET"] = spec.account.secret
+    if spec.account.base_url:
+        os.environ["BASE_URL"] = spec.account.base_url
+    if spec.account.stream_url:
+        os.environ["STREAM_URL"] = spec.account.stream_url
+    import main as live_main
+
+    stop = threading.Event()
+    threading.Thread(
+        target=report_status,
+        args=(spec, status_queue, report_seconds, stop),
+        name="status-reporter",
+        daemon=True,
+    ).start()
+    try:
+        live_main.run(spec.strategies, display=False)
+    finally:
+        stop.set()
+
+
+class Supervisor:
+    def __init__(
+        self,
+        specs: list[WorkerSpec],
+        report_seconds: float = 5.0,
+        restart_seconds: float = 1.0,
+        max_restart_seconds: float = 60.0,
+        target: Callable[[WorkerSpec, Any, float], None] = run_worker,
+        context=None,
+    ) -> None:
+        self.specs = {spec.name: spec for spec in specs}
+        self.report_seconds = report_seconds
+        self.restart_seconds = restart_seconds
+        self.max_restart_seconds = max_restart_seconds
+        self.target = target
+        self.context = context or multiprocessing.get_context("spawn")
+        self.status_queue = self.context.Queue()
+        self.processes: dict[str, multiprocessing.process.BaseProcess] = {}
+        self.restarts: dict[str, int] = {name: 0 for name in self.specs}
+        self.restart_at: dict[str, float] = {}
+        self.finished: set[str] = set()
+        self.states: dict[str, dict[str, Any]] = {}
+
+    def start(self) -> "Supervisor":
+        for spec in self.specs.values():
+            self.start_worker(spec)
+        return self
+
+    def start_worker(self, spec: WorkerSpec) -> None:
+        process = self.context.Process(
+            target=self.target,
+            args=(spec, self.status_queue, self.report_seconds),
+            name=spec.name,
+            daemon=False,
+        )
+        process.start()
+        self.processes[spec.name] = process
+        self.restart_at.pop(spec.name, None)
+
+    def poll(self) -> bool:
+        self.drain()
+        now = time.monotonic()
+        for name, spec in self.specs.items():
+            if name in self.finished:
+                continue
+            if name in self.restart_at:
+                if now >= self.restart_at[name]:
+                    self.restarts[name] += 1
+                    logging.error(f"restarting worker {name}")
+                    self.start_worker(spec)
+                continue
+            process = self.processes[name]
+            if process.is_alive():
+                continue
+            process.join()
+            if process.exitcode == 0 and spec.once:
+                self.finished.add(name)
+                continue
+            logging.error(f"worker {name} exited with {process.exitcode}")
+            self.restart_at[name] = now + min(
+                self.restart_seconds * 2 ** self.restarts[name],
+                self.max_restart_seconds,
+            )
+        return len(self.finished) < len(self.specs)
+
+    def drain(self) -> None:
+        while True:
+            try:
+                status = self.status_queue.get_nowait()
+            except queue.Empty:
+                return
+            self.states[status["worker"]] = status
+
+    def aggregate(self) -> dict[str, Any]:
+        accounts: dict[str, dict[str, Any]] = {}
+        for status in self.states.values():
+            account = accounts.setdefault(
+                status["account"],
+                {"wallet_balance": 0.0, "unrealized_profit": 0.0, "symbols": {}},
+            )
+            account["wallet_balance"] = status["wallet_balance"]
+            account["symbols"].update(status["symbols"])
+            account["unrealized_profit"] = sum(
+                s["unrealized_profit"] for s in account["symbols"].values()
+            )
+        return {
+            "workers": len(self.specs),
+            "alive": sum(p.is_alive() for p in self.processes.values()),
+            "restarts": sum(self.restarts.values()),
+            "min_headroom": min(
+                (s["headroom"] for s in self.states.values()), default=1.0
+            ),
+            "wallet_balance": sum(a["wallet_balance"] for a in accounts.values()),
+            "unrealized_profit": sum(
+                a["unrealized_profit"] for a in accounts.values()
+            ),
+            "accounts": accounts,
+        }
+
+    def run(self, poll_seconds: float = 1.0, on_status=None) -> None:
+        last_status = time.monotonic()
+        while self.poll():
+            time.sleep(poll_seconds)
+            if on_status is not None and (
+                time.monotonic() - last_status >= self.report_seconds
+            ):
+                last_status = time.monotonic()
+                on_status(self.aggregate())
+
+    def stop(self, timeout: float = 10.0) -> None:
+        for process in self.processes.values():
+            if process.is_alive():
+                process.terminate()
+        for process in self.processes.values():
+            process.join(timeout=timeout)
+        self.drain()
+
+
+def main(
+    accounts_file: str = "accounts.json",
+    report_seconds: float = 5.0,
+    pin_cores: bool = True,
+) -> None:
+    specs = shard_accounts(
+        get_accounts_from_file(file_name=accounts_file),
+        cores=None if pin_cores else [],
+    )
+    supervisor = Supervisor(specs=specs, report_seconds=report_seconds).start()
+    try:
+        supervisor.run(on_status=lambda status: print(json.dumps(status)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        supervisor.stop()
+
+
+if __name__ == "__main__":
+    typer.run(function=main)
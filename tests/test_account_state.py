@@ -0,0 +1,196 @@
+import time
+
+import pytest
+
+from base.helpers import Singleton
+from data.account_state import AccountState
+from data.enums import TickerSymbol
+from network.responses.responses import (
+    AccountInfoResponse,
+    MarkPriceResponse,
+    PositionInformationResponse,
+)
+
+
+class FakeRepo:
+    def __init__(self) -> None:
+        self.calls = []
+        self.on_open_orders = None
+
+    def get_account_info(self):
+        self.calls.append("account")
+        return AccountInfoResponse.model_construct(
+            totalWalletBalance=1000.0,
+            totalCrossWalletBalance="1000.0",
+            availableBalance=1000.0 - self.calls.count("account"),
+        )
+
+    def get_position_risk(self, symbol):
+        self.calls.append("position")
+        return PositionInformationResponse.model_construct(
+            symbol=symbol.name,
+            positionAmt=0.0,
+            entryPrice=0.0,
+            breakEvenPrice=0.0,
+            markPrice=100.0,
+            unRealizedProfit=0.0,
+            leverage=10,
+            positionSide="BOTH",
+            notional=0.0,
+        )
+
+    def get_mark_price(self, symbol):
+        self.calls.append("mark")
+        return MarkPriceResponse.model_construct(markPrice=100.0)
+
+    def get_ticker_price(self, symbol):
+        self.calls.append("ticker")
+        return 100.5
+
+    def get_open_orders(self, symbol):
+        self.calls.append("orders")
+        if self.on_open_orders is not None:
+            self.on_open_orders()
+        return [{"orderId": 1, "symbol": symbol.name, "status": "NEW"}]
+
+
+@pytest.fixture
+def state():
+    Singleton._instances.pop(AccountState, None)
+    repo = FakeRepo()
+    account_state = AccountState(repo=repo)
+    account_state.track(TickerSymbol.BTCUSDT)
+    yield account_state
+    Singleton._instances.pop(AccountState, None)
+
+
+def order_event(order_id: int, status: str, execution: str = "NEW"):
+    return {
+        "e": "ORDER_TRADE_UPDATE",
+        "o": {
+            "s": "BTCUSDT",
+            "c": "client",
+            "S": "BUY",
+            "o": "LIMIT",
+            "f": "GTC",
+            "q": "0.010",
+            "p": "99.0",
+            "x": execution,
+            "X": status,
+            "i": order_id,
+            "L": "99.0",
+            "z": "0",
+            "T": 1,
+            "ps": "BOTH",
+        },
+    }
+
+
+def test_account_state_is_seeded_once_from_rest(state):
+    assert state.is_ready(TickerSymbol.BTCUSDT)
+    assert state.get_mark_price(TickerSymbol.BTCUSDT) == 100.0
+    assert state.get_last_price(TickerSymbol.BTCUSDT) == 100.5
+    assert state.get_position(TickerSymbol.BTCUSDT).leverage == 10
+    calls = list(state.repo.calls)
+    state.get_account_info()
+    state.get_open_orders(TickerSymbol.BTCUSDT)
+    assert state.repo.calls == calls
+
+
+def account_update():
+    return {
+        "e": "ACCOUNT_UPDATE",
+        "a": {
+            "m": "ORDER",
+            "B": [{"a": "USDT", "wb": "990.5", "cw": "990.5", "bc": "0"}],
+            "P": [
+                {
+                    "s": "BTCUSDT",
+                    "pa": "0.5",
+                    "ep": "98.0",
+                    "bep": "98.1",
+                    "cr": "-1.5",
+                    "up": "1.0",
+                    "mt": "cross",
+                    "iw": "0",
+                    "ps": "BOTH",
+                }
+            ],
+        },
+    }
+
+
+def test_account_update_changes_position_and_balance(state):
+    listened = []
+    state.add_listener(lambda event_type, symbol: listened.append((event_type, symbol)))
+    state.on_event(account_update())
+    position = state.get_position(TickerSymbol.BTCUSDT)
+    assert position.positionAmt == 0.5
+    assert position.entryPrice == 98.0
+    assert position.notional == 50.0
+    assert state.get_account_info().totalWalletBalance == 990.5
+    assert state.get_accumulated_realized(TickerSymbol.BTCUSDT) == -1.5
+    assert listened == [("ACCOUNT_UPDATE", "BTCUSDT")]
+
+
+@pytest.mark.parametrize(
+    "events, expected_output",
+    [
+        ([order_event(2, "NEW")], [1, 2]),
+        ([order_event(2, "NEW"), order_event(2, "PARTIALLY_FILLED", "TRADE")], [1, 2]),
+        ([order_event(2, "NEW"), order_event(2, "FILLED", "TRADE")], [1]),
+        ([order_event(1, "CANCELED", "CANCELED")], []),
+        ([order_event(1, "EXPIRED", "EXPIRED")], []),
+    ],
+    ids=["new", "partially_filled", "filled", "canceled", "expired"],
+)
+def test_order_trade_update_tracks_open_orders(state, events, expected_output):
+    for event in events:
+        state.on_event(event)
+    orders = state.get_open_orders(TickerSymbol.BTCUSDT)
+    assert [o["orderId"] for o in orders] == expected_output
+
+
+@pytest.mark.parametrize(
+    "before, during, expected_output",
+    [
+        ([], [order_event(1, "FILLED", "TRADE")], []),
+        ([], [order_event(2, "NEW")], [1, 2]),
+        ([order_event(2, "NEW")], [], [1]),
+    ],
+    ids=["filled_during_request", "placed_during_request", "stale_local_order"],
+)
+def test_reconcile_merges_stream_updates(state, before, during, expected_output):
+    for event in before:
+        state.on_event(event)
+    state.repo.on_open_orders = lambda: [state.on_event(event) for event in during]
+    state.reconcile_symbol(TickerSymbol.BTCUSDT)
+    orders = state.get_open_orders(TickerSymbol.BTCUSDT)
+    assert [o["orderId"] for o in orders] == expected_output
+
+
+def test_mark_price_and_trade_events_update_prices(state):
+    state.on_event({"e": "ACCOUNT_CONFIG_UPDATE", "ac": {"s": "BTCUSDT", "l": 20}})
+    state.on_event({"e": "markPriceUpdate", "s": "BTCUSDT", "p": "101.0"})
+    state.on_event({"e": "aggTrade", "s": "BTCUSDT", "p": "101.2"})
+    assert state.get_mark_price(TickerSymbol.BTCUSDT) == 101.0
+    assert state.get_last_price(TickerSymbol.BTCUSDT) == 101.2
+    assert state.get_position(TickerSymbol.BTCUSDT).markPrice == 101.0
+    assert state.get_position(TickerSymbol.BTCUSDT).leverage == 20
+
+
+def test_account_update_refreshes_available_balance(state):
+    state.reconcile_seconds = 60.0
+    state.account_refresh_seconds = 0.0
+    available = state.get_account_info().availableBalance
+    state.start()
+    try:
+        state.on_event(account_update())
+        for _ in range(100):
+            if state.get_account_info().availableBalance != available:
+                break
+            time.sleep(0.01)
+    finally:
+        state.stop()
+    assert state.get_account_info().availableBalance == available - 1
+    assert state.repo.calls.count("position") == 1
@@ -0,0 +1,158 @@
+import asyncio
+import hashlib
+import hmac
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from binance.error import ClientError
+
+from data.enums import PositionSide, Side, TickerSymbol
+from network.async_network import AsyncBinanceNetworkClient
+from repository.async_repository import AsyncTradeRepo
+from utils.listutils import batched_lists
+from utils.orderutils import create_order
+
+SECRET = "secret"
+
+POSITION = {
+    "symbol": "BTCUSDT",
+    "positionAmt": "0.5",
+    "entryPrice": "30000.0",
+    "breakEvenPrice": "30010.0",
+    "markPrice": "30100.0",
+    "unRealizedProfit": "50.0",
+    "liquidationPrice": "0",
+    "leverage": "3",
+    "maxNotionalValue": "1000000",
+    "marginType": "cross",
+    "isolatedMargin": "0.0",
+    "isAutoAddMargin": "false",
+    "positionSide": "LONG",
+    "notional": "15050.0",
+    "isolatedWallet": "0",
+    "updateTime": 0,
+}
+
+ACCOUNT = {
+    "feeTier": 0,
+    "canTrade": True,
+    "canDeposit": True,
+    "canWithdraw": True,
+    "updateTime": 0,
+    "multiAssetsMargin": False,
+    "tradeGroupId": -1,
+    "totalInitialMargin": "0",
+    "totalMaintMargin": "10.0",
+    "totalWalletBalance": "1000.0",
+    "totalUnrealizedProfit": "0",
+    "totalMarginBalance": "0",
+    "totalPositionInitialMargin": "0",
+    "totalOpenOrderInitialMargin": "0",
+    "totalCrossWalletBalance": "0",
+    "totalCrossUnPnl": "50.0",
+    "availableBalance": "900.0",
+    "maxWithdrawAmount": "0",
+    "assets": [],
+    "positions": [],
+}
+
+MARK_PRICE = {
+    "symbol": "BTCUSDT",
+    "markPrice": "30100.0",
+    "indexPrice": "30090.0",
+    "estimatedSettlePrice": "30080.0",
+    "lastFundingRate": "0.0001",
+    "nextFundingTime": 0,
+    "interestRate": "0.0001",
+    "time": 0,
+}
+
+
+def is_signed(request: web.Request) -> bool:
+    query_string = request.raw_path.partition("?")[2]
+    payload, _, signature = query_string.rpartition("&signature=")
+    expected = hmac.new(SECRET.encode(), payload.encode(), hashlib.sha256).hexdigest()
+    return signature == expected and request.headers.get("X-MBX-APIKEY") == "key"
+
+
+def create_app(peers: set, batches: list) -> web.Application:
+    async def signed(request: web.Request, body) -> web.Response:
+        peers.add(request.transport.get_extra_info("peername"))
+        if not is_signed(request):
+            return web.json_response({"code": -1022, "msg": "Signature"}, status=400)
+        return web.json_response(body)
+
+    async def position_risk(request):
+        return await signed(request, [POSITION])
+
+    async def account(request):
+        return await signed(request, ACCOUNT)
+
+    async def batch_orders(request):
+        orders = json.loads(request.query["batchOrders"])
+        batches.append(orders)
+        return await signed(request, [{"orderId": i} for i, _ in enumerate(orders)])
+
+    async def mark_price(request):
+        return web.json_response(MARK_PRICE)
+
+    app = web.Application()
+    app.router.add_get("/fapi/v2/positionRisk", position_risk)
+    app.router.add_get("/fapi/v2/account", account)
+    app.router.add_post("/fapi/v1/batchOrders", batch_orders)
+    app.router.add_get("/fapi/v1/premiumIndex", mark_price)
+    return app
+
+
+async def run_repo(secret: str):
+    peers: set = set()
+    batches: list = []
+    server = TestServer(create_app(peers, batches))
+    await server.start_server()
+    try:
+        client = AsyncBinanceNetworkClient(
+            key="key", secret=secret, base_url=str(server.make_url("")), pool_size=4
+        )
+        async with AsyncTradeRepo(client=client) as repo:
+            mark_price, position_risk, account_info = await repo.get_snapshot(
+                TickerSymbol.BTCUSDT
+            )
+            orders = [
+                create_order(
+                    symbol=TickerSymbol.BTCUSDT,
+                    side=Side.BUY,
+                    quantity=0.001,
+                    position_side=PositionSide.LONG,
+                    price=29000.0 + i,
+                )
+                for i in range(20)
+            ]
+            responses = await repo.new_batch_orders(batched_lists(orders, 5))
+        return mark_price, position_risk, account_info, responses, batches, peers
+    finally:
+        await server.close()
+
+
+def test_async_repo_snapshot_and_batches():
+    mark_price, position_risk, account_info, responses, batches, peers = asyncio.run(
+        run_repo(SECRET)
+    )
+    assert mark_price.markPrice == 30100.0
+    assert position_risk.leverage == 3
+    assert account_info.availableBalance == 900.0
+    assert len(responses) == 4
+    assert all(len(r) == 5 for r in responses)
+    assert sorted(float(o["price"]) for b in batches for o in b)[0] == 29000.0
+    assert batches[0][0]["side"] == "BUY"
+
+
+def test_async_repo_reuses_connections():
+    *_, peers = asyncio.run(run_repo(SECRET))
+    assert len(peers) <= 4
+
+
+def test_async_repo_raises_client_error():
+    with pytest.raises(ClientError):
+        asyncio.run(run_repo("wrong"))
@@ -0,0 +1,183 @@
+import json
+
+import numpy as np
+import pytest
+
+from backtest.engine import TRADE_DTYPE, BacktestEngine, load_agg_trades_csv
+from backtest.matching import MatchingEngine
+from backtest.repository import SimulatedTradeRepo
+from base.models.FileInput import FileInput
+from data.enums import (
+    PositionSide,
+    PriceMatchOpponent,
+    PriceMatchQueue,
+    Side,
+    TickerSymbol,
+    TimeInForce,
+)
+from strategy.fixed_range import FixedRangeStrategy
+from utils.orderutils import create_order
+
+
+def create_engine(**kwargs) -> MatchingEngine:
+    engine = MatchingEngine(tick_size=0.1, **kwargs)
+    engine.set_market(time=0, price=100.0, is_buyer_maker=True)
+    return engine
+
+
+def limit_order(side: Side, price: float, time_in_force=TimeInForce.GTC, quantity=1.0):
+    return create_order(
+        symbol=TickerSymbol.BTCUSDT,
+        side=side,
+        quantity=quantity,
+        position_side=PositionSide.BOTH,
+        price=price,
+        time_in_force=time_in_force,
+    )
+
+
+@pytest.mark.parametrize(
+    "order, expected_status, expected_fills",
+    [
+        (limit_order(Side.BUY, 99.0), "NEW", 0),
+        (limit_order(Side.BUY, 101.0), "FILLED", 1),
+        (limit_order(Side.SELL, 99.0), "FILLED", 1),
+        (limit_order(Side.BUY, 99.0, TimeInForce.GTX), "NEW", 0),
+        (limit_order(Side.BUY, 100.1, TimeInForce.GTX), None, 0),
+        (limit_order(Side.SELL, 100.0, TimeInForce.GTX), None, 0),
+    ],
+    ids=["resting", "taker_buy", "taker_sell", "gtx_resting", "gtx_buy", "gtx_sell"],
+)
+def test_matching_engine_submit(order, expected_status, expected_fills):
+    engine = create_engine()
+    response = engine.submit(order)
+    if expected_status is None:
+        assert response["code"] == -5022
+    else:
+        assert response["status"] == expected_status
+    assert len(engine.fills) == expected_fills
+
+
+@pytest.mark.parametrize(
+    "side, price_match, expected_output",
+    [
+        (Side.BUY, PriceMatchQueue.QUEUE, 100.0),
+        (Side.BUY, PriceMatchQueue.QUEUE_5, 99.6),
+        (Side.SELL, PriceMatchQueue.QUEUE, 100.1),
+        (Side.SELL, PriceMatchQueue.QUEUE_10, 101.0),
+        (Side.BUY, PriceMatchOpponent.OPPONENT, 100.1),
+        (Side.SELL, PriceMatchOpponent.OPPONENT_20, 98.1),
+    ],
+    ids=[
+        "queue_buy",
+        "queue_5_buy",
+        "queue_sell",
+        "queue_10_sell",
+        "opponent",
+        "opponent_20",
+    ],
+)
+def test_matching_engine_price_match(side, price_match, expected_output):
+    engine = create_engine()
+    price = engine.resolve_price(side.value, 0.0, price_match.value)
+    assert price == pytest.approx(expected_output)
+
+
+def test_matching_engine_fills_trade_through_in_time_order():
+    engine = create_engine()
+    engine.submit(limit_order(Side.BUY, 99.5))
+    engine.submit(limit_order(Side.BUY, 99.0))
+    engine.submit(limit_order(Side.SELL, 100.5))
+    times = np.array([1, 2, 3, 4, 5], dtype=np.int64)
+    prices = np.array([99.5, 99.4, 100.6, 99.0, 98.9])
+    fills = engine.match_trades(times, prices, np.zeros(5, dtype=np.bool_))
+    assert fills == 3
+    assert engine.get_fills()["time"].tolist() == [2, 3, 5]
+    assert engine.get_fills()["price"].tolist() == [99.5, 100.5, 99.0]
+    assert engine.last_price == 98.9
+    assert engine.orders == {}
+
+
+def test_matching_engine_limits_fills_to_trade_quantity():
+    engine = create_engine()
+    first = engine.submit(limit_order(Side.BUY, 99.0, quantity=1.0))
+    better = engine.submit(limit_order(Side.BUY, 99.5, quantity=0.5))
+    sell = engine.submit(limit_order(Side.SELL, 100.5, quantity=1.0))
+    fills = engine.match_trades(
+        np.array([1, 2, 3], dtype=np.int64),
+        np.array([98.9, 98.9, 100.6]),
+        np.array([True, True, False]),
+        np.array([0.8, 0.3, 0.25]),
+    )
+    assert fills == 4
+    assert engine.get_fills()[["time", "order_id", "quantity"]].tolist() == [
+        (1, better["orderId"], 0.5),
+        (1, first["orderId"], pytest.approx(0.3)),
+        (2, first["orderId"], 0.3),
+        (3, sell["orderId"], 0.25),
+    ]
+    resting = {o["orderId"]: o for o in engine.open_orders()}
+    assert resting[first["orderId"]]["status"] == "PARTIALLY_FILLED"
+    assert float(resting[first["orderId"]]["executedQty"]) == pytest.approx(0.6)
+    assert float(resting[sell["orderId"]]["executedQty"]) == 0.25
+    assert better["orderId"] not in resting
+
+
+@pytest.mark.parametrize(
+    "fill_on_touch, expected_output", [(False, 0), (True, 1)], ids=["through", "touch"]
+)
+def test_matching_engine_fill_on_touch(fill_on_touch, expected_output):
+    engine = create_engine(fill_on_touch=fill_on_touch)
+    engine.submit(limit_order(Side.BUY, 99.5))
+    fills = engine.match_trades(
+        np.array([1], dtype=np.int64), np.array([99.5]), np.array([True])
+    )
+    assert fills == expected_output
+
+
+def test_simulated_repo_accounts_realized_pnl_and_fees():
+    engine = create_engine(maker_fee=0.001)
+    repo = SimulatedTradeRepo(engine=engine, initial_balance=1000.0, leverage=2)
+    repo.new_batch_order([limit_order(Side.BUY, 99.0), limit_order(Side.SELL, 101.0)])
+    assert repo.get_account_info().availableBalance == pytest.approx(1000.0 - 49.5)
+    engine.match_trades(
+        np.array([1, 2], dtype=np.int64), np.array([98.0, 102.0]), np.array([True, False])
+    )
+    assert repo.position_amount == 0.0
+    assert repo.realized_pnl == pytest.approx(2.0)
+    assert repo.fees == pytest.approx(0.2)
+    assert repo.wallet_balance == pytest.approx(1001.8)
+    assert repo.get_position_risk(TickerSymbol.BTCUSDT).positionAmt == 0.0
+
+
+def test_load_agg_trades_csv(tmp_path):
+    file_name = tmp_path / "trades.csv"
+    file_name.write_text(
+        "agg_trade_id,price,quantity,first_trade_id,last_trade_id,transact_time,is_buyer_maker\n"
+        "1,30000.1,0.010,1,1,1700000000000,true\n"
+        "2,30000.0,0.020,2,3,1700000000100,false\n"
+    )
+    trades = load_agg_trades_csv(str(file_name))
+    assert trades["price"].tolist() == [30000.1, 30000.0]
+    assert trades["time"].tolist() == [1700000000000, 1700000000100]
+    assert trades["is_buyer_maker"].tolist() == [True, False]
+
+
+def test_backtest_engine_runs_fixed_range_strategy():
+    with open(file="my_trading_template.json", mode="r", encoding="utf-8") as f:
+        file_input = FileInput(**json.load(f))
+    rng = np.random.default_rng(0)
+    trades = np.empty(20000, dtype=TRADE_DTYPE)
+    trades["time"] = 1_700_000_000_000 + np.arange(len(trades)) * 100
+    trades["price"] = np.round(30000.0 + np.cumsum(rng.normal(0.0, 2.0, len(trades))), 1)
+    trades["quantity"] = 0.01
+    trades["is_buyer_maker"] = rng.random(len(trades)) < 0.5
+    report = BacktestEngine(
+        file_input=file_input, strategy_class=FixedRangeStrategy, trades=trades
+    ).run()
+    summary = report.summary()
+    assert summary["cycles"] == 100
+    assert summary["fills"] > 0
+    assert summary["fees"] > 0.0
+    assert report.snapshots["equity"][-1] == pytest.approx(1000.0 + report.pnl)
+    assert report.snapshots["fills"][-1] == len(report.fills)
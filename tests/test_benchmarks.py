@@ -0,0 +1,63 @@
+import pytest
+
+from benchmarks.suite import (
+    BENCHMARKS,
+    compare_results,
+    get_benchmarks,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+
+
+def results(**timings) -> dict:
+    return {
+        "results": {
+            name: {"min_us": value, "median_us": value, "number": 1, "repeat": 1}
+            for name, value in timings.items()
+        }
+    }
+
+
+@pytest.mark.parametrize(
+    "current, expected_output",
+    [
+        (100.0, "same"),
+        (109.0, "same"),
+        (125.0, "slower"),
+        (80.0, "faster"),
+    ],
+    ids=["same", "within_threshold", "slower", "faster"],
+)
+def test_compare_results(current, expected_output):
+    rows = compare_results(results(a=current), results(a=100.0), threshold=0.1)
+    assert [row["status"] for row in rows] == [expected_output]
+    assert rows[0]["ratio"] == pytest.approx(current / 100.0)
+
+
+def test_compare_results_marks_new_benchmarks():
+    rows = compare_results(results(a=1.0, b=2.0), results(a=1.0))
+    assert [row["status"] for row in rows] == ["same", "new"]
+
+
+def test_get_benchmarks_rejects_unknown_names():
+    with pytest.raises(ValueError):
+        get_benchmarks(["missing"])
+
+
+def test_benchmark_names_are_unique():
+    names = [benchmark.name for benchmark in BENCHMARKS]
+    assert len(names) == len(set(names))
+
+
+@pytest.mark.parametrize(
+    "name", [benchmark.name for benchmark in BENCHMARKS], ids=lambda name: name
+)
+def test_run_benchmarks(name, tmp_path):
+    output = run_benchmarks(names=[name], repeat=1, scale=0.0)
+    assert list(output["results"]) == [name]
+    assert output["results"][name]["number"] == 1
+    assert output["results"][name]["min_us"] > 0.0
+    file_name = str(tmp_path / "results.json")
+    save_results(output, file_name)
+    assert load_results(file_name) == output
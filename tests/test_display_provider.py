@@ -0,0 +1,142 @@
+import contextlib
+import math
+
+import pytest
+from rich.console import Console
+
+from base.helpers import Singleton
+from data.account_state import AccountState
+from data.enums import TickerSymbol
+from display.display import get_display_data
+from display.provider import (
+    LAST_PRICE,
+    MARK_PRICE,
+    POSITION,
+    DisplayDataProvider,
+    DisplayField,
+)
+from display.renderables import Footer
+from tests.test_account_state import FakeRepo
+
+
+class FakeRateLimiter:
+    def priority(self, priority):
+        return contextlib.nullcontext()
+
+
+class DisplayRepo(FakeRepo):
+    def __init__(self) -> None:
+        super().__init__()
+        self.rate_limiter = FakeRateLimiter()
+
+    def get_rate_limit_headroom(self):
+        return {"REQUEST_WEIGHT": 0.75}
+
+    def get_account_info(self):
+        account_info = super().get_account_info()
+        account_info.totalCrossUnPnl = 0.0
+        return account_info
+
+    def get_open_orders(self, symbol):
+        return [{**order, "side": "BUY"} for order in super().get_open_orders(symbol)]
+
+    def get_position_risk(self, symbol):
+        position = super().get_position_risk(symbol)
+        position.liquidationPrice = 0.0
+        return position
+
+
+class OfflineRepo(DisplayRepo):
+    def __getattribute__(self, name):
+        if name.startswith("get_") and name != "get_rate_limit_headroom":
+            raise AssertionError(f"{name} called while rendering")
+        return super().__getattribute__(name)
+
+
+@pytest.fixture(autouse=True)
+def reset_singletons():
+    for cls in [DisplayDataProvider, AccountState, Footer]:
+        Singleton._instances.pop(cls, None)
+    yield
+    for cls in [DisplayDataProvider, AccountState, Footer]:
+        Singleton._instances.pop(cls, None)
+
+
+def render(renderable) -> str:
+    console = Console(width=400, record=True)
+    console.print(renderable)
+    return console.export_text()
+
+
+def test_provider_polls_rest_until_state_is_ready():
+    repo = DisplayRepo()
+    provider = DisplayDataProvider(repo=repo, account_state=AccountState(repo=repo))
+    provider.poll()
+    assert provider.value(MARK_PRICE) == 100.0
+    assert provider.value(LAST_PRICE) == 100.5
+    assert repo.calls == ["mark", "ticker", "position", "account", "orders"]
+    provider.account_state.track(TickerSymbol.BTCUSDT)
+    repo.calls.clear()
+    provider.poll()
+    assert repo.calls == []
+    assert provider.value(POSITION).leverage == 10
+
+
+def test_provider_follows_streams():
+    provider = DisplayDataProvider(repo=DisplayRepo())
+    provider.on_event({"e": "markPriceUpdate", "s": "BTCUSDT", "p": "101.5"})
+    provider.on_event({"e": "aggTrade", "s": "BTCUSDT", "p": "101.7"})
+    provider.on_event({"e": "markPriceUpdate", "s": "ETHUSDT", "p": "5.0"})
+    assert provider.value(MARK_PRICE) == 101.5
+    assert provider.value(LAST_PRICE) == 101.7
+
+
+def test_set_symbol_clears_fields():
+    provider = DisplayDataProvider(repo=DisplayRepo())
+    provider.set(MARK_PRICE, 1.0)
+    provider.set_symbol(TickerSymbol("ETHUSDT"))
+    assert provider.value(MARK_PRICE) is None
+    assert provider.is_stale(MARK_PRICE)
+
+
+@pytest.mark.parametrize(
+    "updated_at, now, expected",
+    [(0.0, 100.0, math.inf), (90.0, 100.0, 10.0)],
+    ids=["never", "updated"],
+)
+def test_field_age(updated_at, now, expected):
+    assert DisplayField(value=1.0, updated_at=updated_at).age(now) == expected
+
+
+def test_rendering_never_touches_network():
+    repo = DisplayRepo()
+    provider = DisplayDataProvider(repo=repo, account_state=AccountState(repo=repo))
+    provider.account_state.track(TickerSymbol.BTCUSDT)
+    provider.poll()
+    provider.repo = OfflineRepo()
+    provider.set(LAST_PRICE, 100.5, updated_at=1.0)
+    display_data_1, display_data_2 = get_display_data(None)
+    assert "100.00" in display_data_1["mark_price"]
+    assert "(n/a)" not in display_data_1["last_price"]
+    assert "s)" in display_data_1["last_price"]
+    assert "pnl_mark" in display_data_2
+    footer = render(Footer())
+    assert "OBO=1, OSO=0, LVRG=10" in footer
+    assert "API Hdrm=75.00%" in footer
+
+
+def test_rendering_waits_for_data():
+    DisplayDataProvider(repo=OfflineRepo())
+    display_data_1, display_data_2 = get_display_data(None)
+    assert display_data_2 == {}
+    assert "waiting for data" in render(Footer())
+
+
+def test_footer_reports_failing_symbols():
+    provider = DisplayDataProvider(repo=OfflineRepo())
+    provider.set_failures("ETHUSDT", 3)
+    provider.set_failures("BTCUSDT", 0)
+    assert provider.get_failing() == {"ETHUSDT": 3}
+    assert "failing: ETHUSDT x3" in render(Footer())
+    provider.set_failures("ETHUSDT", 0)
+    assert "failing" not in render(Footer())
@@ -1,5 +1,7 @@
+import pytest
+
 from utils.enumutils import get_enum_member_from_name
-from data.enums import ALL_ENUMS, PriceMatchOpponent
+from data.enums import ALL_ENUMS, PriceMatchOpponent, TickerSymbol
 from utils.enumutils import get_enum_type_from_member_name
 
 
@@ -15,3 +17,16 @@ def test_get_enum_member_from_name():
         get_enum_member_from_name("PriceMatchOpponent.OPPONENT", ALL_ENUMS)
         == PriceMatchOpponent.OPPONENT
     )
+
+
+def test_ticker_symbol_is_data_driven():
+    symbol = TickerSymbol("ETHUSDT")
+    assert symbol.name == symbol.value == "ETHUSDT"
+    assert symbol is TickerSymbol("ETHUSDT")
+    assert TickerSymbol("BTCUSDT") is TickerSymbol.BTCUSDT
+
+
+@pytest.mark.parametrize("value", ["ethusdt", "ETH-USDT", 1])
+def test_ticker_symbol_rejects_invalid_values(value):
+    with pytest.raises(ValueError):
+        TickerSymbol(value)
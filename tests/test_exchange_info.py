@@ -0,0 +1,128 @@
+import json
+
+import pytest
+
+from base.helpers import Singleton
+from data.exchange_info import ExchangeInfoCache, SymbolFilters, get_symbol_filters
+
+SYMBOL = {
+    "symbol": "ETHUSDT",
+    "pricePrecision": 2,
+    "quantityPrecision": 3,
+    "filters": [
+        {
+            "filterType": "PRICE_FILTER",
+            "minPrice": "39.86",
+            "maxPrice": "306177",
+            "tickSize": "0.01",
+        },
+        {
+            "filterType": "LOT_SIZE",
+            "minQty": "0.001",
+            "maxQty": "10000",
+            "stepSize": "0.001",
+        },
+        {
+            "filterType": "MARKET_LOT_SIZE",
+            "minQty": "0.001",
+            "maxQty": "2000",
+            "stepSize": "0.001",
+        },
+        {"filterType": "MIN_NOTIONAL", "notional": "20"},
+    ],
+}
+EXCHANGE_INFO = {
+    "rateLimits": [
+        {
+            "rateLimitType": "REQUEST_WEIGHT",
+            "interval": "MINUTE",
+            "intervalNum": 1,
+            "limit": 2400,
+        }
+    ],
+    "symbols": [SYMBOL],
+}
+
+
+class FakeRepo:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.calls = 0
+
+    def get_exchange_info(self):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("exchange info unavailable")
+        return EXCHANGE_INFO
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    Singleton._instances.pop(ExchangeInfoCache, None)
+    yield
+    Singleton._instances.pop(ExchangeInfoCache, None)
+
+
+def test_get_symbol_filters():
+    filters = get_symbol_filters(SYMBOL)
+    assert filters.tick_size == 0.01
+    assert filters.step_size == 0.001
+    assert (filters.min_qty, filters.max_qty) == (0.001, 10000.0)
+    assert filters.market_max_qty == 2000.0
+    assert filters.min_notional == 20.0
+    assert filters.round_price(2000.123) == 2000.12
+    assert filters.get_min_quantity(2000.0) == 0.01
+
+
+@pytest.mark.parametrize(
+    "price, expected", [(0.0, 0.001), (3000.0, 0.007), (30000.0, 0.001)]
+)
+def test_min_quantity_covers_min_notional(price, expected):
+    filters = SymbolFilters(symbol="ETHUSDT", min_notional=20.0)
+    assert filters.get_min_quantity(price) == expected
+
+
+def test_cache_persists_and_reuses_file(tmp_path):
+    path = str(tmp_path / "exchange_info.json")
+    repo = FakeRepo()
+    cache = ExchangeInfoCache(repo=repo, path=path).load()
+    assert repo.calls == 1
+    assert cache.get_filters("ETHUSDT").tick_size == 0.01
+    assert cache.get_rate_limits()[0].limit == 2400
+    Singleton._instances.pop(ExchangeInfoCache, None)
+    other_repo = FakeRepo()
+    cache = ExchangeInfoCache(repo=other_repo, path=path).load()
+    assert other_repo.calls == 0
+    assert cache.get_filters("ETHUSDT").min_notional == 20.0
+
+
+def test_cache_refreshes_stale_file(tmp_path):
+    path = tmp_path / "exchange_info.json"
+    path.write_text(json.dumps({"updated": 0.0, "exchangeInfo": {"symbols": []}}))
+    repo = FakeRepo()
+    cache = ExchangeInfoCache(repo=repo, path=str(path)).load()
+    assert repo.calls == 1
+    assert "ETHUSDT" in cache.filters
+    assert json.loads(path.read_text())["updated"] > 0.0
+
+
+def test_cache_falls_back_to_stale_file(tmp_path):
+    path = tmp_path / "exchange_info.json"
+    path.write_text(json.dumps({"updated": 0.0, "exchangeInfo": EXCHANGE_INFO}))
+    cache = ExchangeInfoCache(repo=FakeRepo(fail=True), path=str(path)).load()
+    assert cache.get_filters("ETHUSDT").tick_size == 0.01
+
+
+def test_cache_without_file_raises(tmp_path):
+    cache = ExchangeInfoCache(
+        repo=FakeRepo(fail=True), path=str(tmp_path / "exchange_info.json")
+    )
+    with pytest.raises(ConnectionError):
+        cache.load()
+
+
+def test_unknown_symbol_uses_defaults(tmp_path):
+    cache = ExchangeInfoCache(repo=FakeRepo(), path=str(tmp_path / "info.json"))
+    filters = cache.load().get_filters("BTCUSDT")
+    assert (filters.tick_size, filters.step_size) == (0.1, 0.001)
+    assert (filters.min_qty, filters.max_qty) == (0.001, 1000.0)
@@ -0,0 +1,143 @@
+import asyncio
+import json
+
+import aiohttp
+import pytest
+from binance.error import ClientError, ServerError
+from binance.um_futures import UMFutures
+
+from data.order_book import LocalOrderBook
+from mock_exchange.exchange import MockExchange, MockExchangeConfig
+from network.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def exchange(request):
+    config = getattr(request, "param", {})
+    exchange = MockExchange(
+        config=MockExchangeConfig(market_seconds=0.0, seed=1, **config)
+    ).start()
+    yield exchange
+    exchange.stop()
+
+
+def create_client(exchange: MockExchange, secret: str = "mock-secret") -> UMFutures:
+    return UMFutures(key="mock-key", secret=secret, base_url=exchange.base_url)
+
+
+def step_market(exchange: MockExchange) -> None:
+    async def step() -> None:
+        exchange.step_market()
+        await asyncio.sleep(0.05)
+
+    asyncio.run_coroutine_threadsafe(step(), exchange.loop).result()
+
+
+def buy_order(price: float, quantity: str = "0.010") -> dict[str, str]:
+    return {
+        "symbol": "BTCUSDT",
+        "side": "BUY",
+        "type": "LIMIT",
+        "quantity": quantity,
+        "price": str(price),
+        "timeInForce": "GTC",
+        "positionSide": "BOTH",
+    }
+
+
+def test_signed_order_round_trip(exchange):
+    client = create_client(exchange)
+    responses = client.new_batch_order(
+        batchOrders=[buy_order(29000.0), buy_order(29100.0)]
+    )
+    assert [r["status"] for r in responses] == ["NEW", "NEW"]
+    open_orders = client.get_orders(symbol="BTCUSDT")
+    assert sorted(float(o["price"]) for o in open_orders) == [29000.0, 29100.0]
+    canceled = client.cancel_batch_order(
+        symbol="BTCUSDT",
+        orderIdList=[responses[0]["orderId"]],
+        origClientOrderIdList=None,
+    )
+    assert canceled[0]["status"] == "CANCELED"
+    remaining = client.get_open_orders(
+        symbol="BTCUSDT", orderId=responses[1]["orderId"]
+    )
+    assert remaining["price"] == "29100.0"
+    position = client.get_position_risk(symbol="BTCUSDT")[0]
+    assert position["positionAmt"] == 0.0
+    assert float(client.account()["totalWalletBalance"]) == 1000.0
+
+
+def test_crossing_order_fills_and_updates_position(exchange):
+    client = create_client(exchange)
+    response = client.new_order(**buy_order(31000.0))
+    assert response["status"] == "FILLED"
+    position = client.get_position_risk(symbol="BTCUSDT")[0]
+    assert position["positionAmt"] == 0.01
+    assert float(client.account()["totalWalletBalance"]) < 1000.0
+
+
+def test_invalid_signature_is_rejected(exchange):
+    with pytest.raises(ClientError) as error:
+        create_client(exchange, secret="wrong").account()
+    assert error.value.error_code == -1022
+
+
+@pytest.mark.parametrize("exchange", [{"weight_limit": 10}], indirect=True)
+def test_rate_limit_headers_and_rejection(exchange):
+    client = create_client(exchange)
+    limiter = RateLimiter()
+    client.session.hooks["response"].append(limiter.on_response)
+    client.account()
+    assert limiter.buckets["REQUEST_WEIGHT-1M"].tokens < 2400.0
+    client.account()
+    with pytest.raises(ClientError) as error:
+        client.account()
+    assert error.value.status_code == 429
+    assert limiter.blocked_until > 0.0
+
+
+@pytest.mark.parametrize("exchange", [{"error_rate": 1.0}], indirect=True)
+def test_injected_errors(exchange):
+    with pytest.raises(ServerError):
+        create_client(exchange).account()
+    assert exchange.errors == 1
+
+
+def test_streams_publish_market_and_user_events(exchange):
+    client = create_client(exchange)
+    listen_key = client.new_listen_key()["listenKey"]
+    book = LocalOrderBook(
+        symbol="BTCUSDT",
+        snapshot_loader=lambda: client.depth(symbol="BTCUSDT", limit=1000),
+    )
+
+    async def listen() -> list[dict]:
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(f"{exchange.stream_url}/stream") as socket:
+                await socket.send_json(
+                    {
+                        "method": "SUBSCRIBE",
+                        "params": [listen_key, "btcusdt@depth@100ms"],
+                        "id": 1,
+                    }
+                )
+                assert (await socket.receive_json())["id"] == 1
+                await asyncio.to_thread(book.resync)
+                await asyncio.to_thread(client.new_order, **buy_order(29000.0))
+                await asyncio.to_thread(step_market, exchange)
+                await asyncio.to_thread(step_market, exchange)
+                frames = []
+                while len(frames) < 3:
+                    frames.append(json.loads((await socket.receive()).data))
+                return frames
+
+    frames = asyncio.run(listen())
+    assert frames[0]["stream"] == listen_key
+    assert frames[0]["data"]["o"]["X"] == "NEW"
+    for frame in frames[1:]:
+        assert frame["stream"] == "btcusdt@depth@100ms"
+        book.on_depth_update(frame["data"])
+    assert book.synced
+    best_bid = exchange.symbols["BTCUSDT"].engine.best_bid
+    assert book.bids.best()[0] == pytest.approx(best_bid)
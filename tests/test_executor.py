@@ -0,0 +1,149 @@
+import os
+import threading
+import time
+
+import pytest
+
+from data.enums import ExecutorBackend
+from network.rate_limiter import RateLimiter
+from strategy.executor import OrderExecutor
+
+
+class FakeRepo:
+    def __init__(self):
+        self.batches = []
+
+    def new_batch_order(self, orders):
+        if orders == ["bad"]:
+            raise RuntimeError("rejected")
+        self.batches.append(orders)
+        return [{"orderId": i} for i, _ in enumerate(orders)]
+
+
+class ProcessRepo(FakeRepo):
+    rate_limiter = RateLimiter(clock=lambda: 0.0)
+
+    def get_time(self):
+        return 0
+
+    def new_batch_order(self, orders):
+        self.rate_limiter.acquire(weight=5, orders=len(orders))
+        headroom = self.rate_limiter.headroom()["ORDERS-10S"]
+        return [
+            {"orderId": o, "pid": os.getpid(), "headroom": headroom} for o in orders
+        ]
+
+
+@pytest.mark.parametrize(
+    "backend", [ExecutorBackend.THREAD, ExecutorBackend.ASYNCIO], ids=["thread", "asyncio"]
+)
+def test_executor_returns_results_in_order(backend):
+    repo = FakeRepo()
+    with OrderExecutor(backend=backend, max_workers=4) as executor:
+        results = executor.submit([["a", "b"], ["bad"], ["c"]], repo=repo)
+        again = executor.submit([["d"]], repo=repo)
+    assert [r.index for r in results] == [0, 1, 2]
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[1].error, RuntimeError)
+    assert results[0].response == [{"orderId": 0}, {"orderId": 1}]
+    assert again[0].ok
+    assert len(repo.batches) == 3
+
+
+def test_executor_reports_per_order_errors():
+    class RejectingRepo(FakeRepo):
+        def new_batch_order(self, orders):
+            return [{"code": -2019, "msg": "Margin is insufficient."}]
+
+    with OrderExecutor(max_workers=1) as executor:
+        results = executor.submit([["a"]], repo=RejectingRepo())
+    assert not results[0].ok
+    assert results[0].order_errors == [{"code": -2019, "msg": "Margin is insufficient."}]
+
+
+def test_executor_uses_async_repo():
+    class FakeAsyncRepo:
+        closed = False
+
+        async def new_batch_order(self, orders):
+            return [{"orderId": o} for o in orders]
+
+        async def get_time(self):
+            return 1
+
+        async def close(self):
+            FakeAsyncRepo.closed = True
+
+    executor = OrderExecutor(
+        backend=ExecutorBackend.ASYNCIO, async_repo_factory=FakeAsyncRepo
+    )
+    with executor:
+        results = executor.submit([[1, 2], [3]])
+        server_time = executor.run_async(lambda repo: repo.get_time())
+    assert [r.response for r in results] == [[{"orderId": 1}, {"orderId": 2}], [{"orderId": 3}]]
+    assert server_time == 1
+    assert FakeAsyncRepo.closed
+
+
+def test_asyncio_executor_keeps_custom_repo():
+    class FakeAsyncRepo:
+        async def new_batch_order(self, orders):
+            raise AssertionError("custom repo bypassed")
+
+        async def close(self):
+            pass
+
+    repo = FakeRepo()
+    executor = OrderExecutor(
+        backend=ExecutorBackend.ASYNCIO, async_repo_factory=FakeAsyncRepo
+    )
+    with executor:
+        results = executor.submit([["a"], ["b"]], repo=repo)
+        assert executor.uses_async_repo(None)
+        assert not executor.uses_async_repo(repo)
+    assert [r.ok for r in results] == [True, True]
+    assert repo.batches == [["a"], ["b"]]
+
+
+def test_async_repo_is_created_once():
+    created = []
+
+    class FakeAsyncRepo:
+        def __init__(self):
+            created.append(self)
+            time.sleep(0.01)
+
+    executor = OrderExecutor(
+        backend=ExecutorBackend.ASYNCIO, async_repo_factory=FakeAsyncRepo
+    )
+    threads = [threading.Thread(target=executor.get_async_repo) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(created) == 1
+
+
+def test_process_executor_builds_repo_in_worker_and_shares_order_budget():
+    rate_limiter = RateLimiter(clock=lambda: 0.0)
+    with OrderExecutor(
+        backend=ExecutorBackend.PROCESS,
+        max_workers=1,
+        repo_factory=ProcessRepo,
+        rate_limiter=rate_limiter,
+    ) as executor:
+        results = executor.submit([[1, 2], [3]])
+    assert [[r["orderId"] for r in result.response] for result in results] == [
+        [1, 2],
+        [3],
+    ]
+    assert results[0].response[0]["pid"] != os.getpid()
+    assert all(r["headroom"] == 1.0 for result in results for r in result.response)
+    bucket = rate_limiter.buckets["ORDERS-10S"]
+    assert bucket.limit - bucket.tokens == 3
+    assert ProcessRepo.rate_limiter.headroom()["ORDERS-10S"] == 1.0
+
+
+def test_process_executor_rejects_custom_repo():
+    with pytest.raises(ValueError):
+        OrderExecutor(backend=ExecutorBackend.PROCESS).submit([["a"]], repo=FakeRepo())
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from data.enums import TickerSymbol
+from utils.fileutils import get_all_inputs_from_file, get_inputs_from_file
+
+CONFIG = {
+    "once": True,
+    "use_mark_price": True,
+    "delay_seconds": 20.0,
+    "symbol": "BTCUSDT",
+    "strategy": "FIXED_RANGE",
+    "position_side": "LONG",
+}
+
+
+def write_config(tmp_path, data) -> str:
+    path = tmp_path / "my_trading.json"
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (CONFIG, ["BTCUSDT"]),
+        ([CONFIG, {**CONFIG, "symbol": "ETHUSDT"}], ["BTCUSDT", "ETHUSDT"]),
+        (
+            {"strategies": [{**CONFIG, "symbol": "SOLUSDT"}, CONFIG]},
+            ["SOLUSDT", "BTCUSDT"],
+        ),
+    ],
+    ids=["single", "list", "strategies"],
+)
+def test_get_all_inputs_from_file(tmp_path, data, expected):
+    file_inputs = get_all_inputs_from_file(file_name=write_config(tmp_path, data))
+    assert [i.symbol.name for i in file_inputs] == expected
+    assert get_inputs_from_file(
+        file_name=write_config(tmp_path, data)
+    ).symbol is TickerSymbol(expected[0])
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [],
+        [CONFIG, CONFIG],
+        [CONFIG, {**CONFIG, "symbol": "ETHUSDT", "executor_backend": "ASYNCIO"}],
+        [CONFIG, {**CONFIG, "symbol": "ETHUSDT", "metrics_port": 9000}],
+        {
+            "metrics_port": 9000,
+            "strategies": [CONFIG, {**CONFIG, "symbol": "ETHUSDT", "metrics_port": 1}],
+        },
+        {
+            **CONFIG,
+            "order_transport": "WEBSOCKET",
+            "executor_backend": "ASYNCIO",
+        },
+        {
+            "executor_backend": "PROCESS",
+            "strategies": [{**CONFIG, "order_transport": "WEBSOCKET"}],
+        },
+    ],
+    ids=[
+        "empty",
+        "duplicate_symbol",
+        "mixed_backends",
+        "mixed_metrics_port",
+        "overridden_shared_field",
+        "websocket_asyncio",
+        "websocket_process",
+    ],
+)
+def test_get_all_inputs_from_file_rejects(tmp_path, data):
+    with pytest.raises(ValueError):
+        get_all_inputs_from_file(file_name=write_config(tmp_path, data))
+
+
+def test_get_all_inputs_from_file_applies_shared_fields(tmp_path):
+    data = {
+        "executor_backend": "ASYNCIO",
+        "metrics_port": 9000,
+        "strategies": [CONFIG, {**CONFIG, "symbol": "ETHUSDT"}],
+    }
+    file_inputs = get_all_inputs_from_file(file_name=write_config(tmp_path, data))
+    assert [i.executor_backend.name for i in file_inputs] == ["ASYNCIO", "ASYNCIO"]
+    assert [i.metrics_port for i in file_inputs] == [9000, 9000]
+
+
+def test_get_all_inputs_from_file_accepts_websocket_threads(tmp_path):
+    data = {**CONFIG, "order_transport": "WEBSOCKET", "executor_backend": "THREAD"}
+    file_inputs = get_all_inputs_from_file(file_name=write_config(tmp_path, data))
+    assert file_inputs[0].order_transport.name == "WEBSOCKET"
@@ -1,4 +1,4 @@
-from base.helpers import Singleton
+from base.helpers import Singleton, replace_singleton
 
 
 class TestClass(metaclass=Singleton):
@@ -18,3 +18,11 @@ def test_singleton_variable():
 
     instance1.x = 1
     assert instance1.x == instance2.x
+
+
+def test_replace_singleton_restores_previous_instance():
+    previous = TestClass()
+    with replace_singleton(TestClass) as replacement:
+        assert replacement is not previous
+        assert TestClass() is replacement
+    assert TestClass() is previous
@@ -0,0 +1,68 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import main as live_main
+from base.helpers import Singleton
+from base.models.FileInput import FileInput
+from display.provider import DisplayDataProvider
+from strategy.scheduler import StrategyScheduler
+from tests.test_display_provider import OfflineRepo
+
+
+class FakeAccountState:
+    def get_position(self, symbol):
+        return SimpleNamespace(leverage=1, notional=0.0)
+
+
+@pytest.fixture(autouse=True)
+def reset_main():
+    Singleton._instances.pop(DisplayDataProvider, None)
+    DisplayDataProvider(repo=OfflineRepo())
+    yield
+    Singleton._instances.pop(DisplayDataProvider, None)
+    live_main.schedulers.clear()
+    live_main.symbol_failures.clear()
+
+
+def test_run_symbol_survives_strategy_errors(monkeypatch):
+    stop_event = threading.Event()
+    runs = []
+
+    class FlakyStrategy:
+        def __init__(self, **kwargs) -> None:
+            self.center_price = 100.0
+            self.acked_ns = None
+
+        def run_loop(self) -> None:
+            runs.append(dict(live_main.symbol_failures))
+            if len(runs) <= 2:
+                raise ConnectionError("read timed out")
+            stop_event.set()
+
+    monkeypatch.setattr(live_main, "FixedRangeStrategy", FlakyStrategy)
+    monkeypatch.setattr(live_main, "RETRY_SECONDS", 0.001)
+    file_input = FileInput(
+        once=False,
+        use_mark_price=True,
+        delay_seconds=0.01,
+        symbol="BTCUSDT",
+        strategy="FIXED_RANGE",
+        position_side="LONG",
+        event_driven=False,
+    )
+    live_main.schedulers["BTCUSDT"] = StrategyScheduler(symbol="BTCUSDT")
+    live_main.run_symbol(
+        file_input,
+        None,
+        None,
+        None,
+        FakeAccountState(),
+        None,
+        None,
+        stop_event,
+    )
+    assert runs == [{"BTCUSDT": 0}, {"BTCUSDT": 1}, {"BTCUSDT": 2}]
+    assert live_main.symbol_failures == {"BTCUSDT": 0}
+    assert DisplayDataProvider().get_failing() == {}
@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+from data.enums import PositionSide
+from data.margin_engine import MarginEngine
+from model import NotionalAndLeverageBracket
+from strategy.riski import get_grid_margin_ratios
+
+BRACKETS = NotionalAndLeverageBracket(
+    symbol="BTCUSDT",
+    notionalCoef=1.0,
+    brackets=[
+        {
+            "bracket": 2,
+            "initialLeverage": 100,
+            "notionalCap": 600000,
+            "notionalFloor": 50000,
+            "maintMarginRatio": 0.005,
+            "cum": 50,
+        },
+        {
+            "bracket": 1,
+            "initialLeverage": 125,
+            "notionalCap": 50000,
+            "notionalFloor": 0,
+            "maintMarginRatio": 0.004,
+            "cum": 0,
+        },
+        {
+            "bracket": 3,
+            "initialLeverage": 50,
+            "notionalCap": 3000000,
+            "notionalFloor": 600000,
+            "maintMarginRatio": 0.01,
+            "cum": 3050,
+        },
+    ],
+)
+
+
+@pytest.mark.parametrize(
+    "leverage, expected",
+    [(20, 3000000.0), (50, 3000000.0), (100, 600000.0), (125, 50000.0), (126, 0.0)],
+)
+def test_max_notional(leverage, expected):
+    assert MarginEngine(BRACKETS).max_notional(leverage) == expected
+
+
+@pytest.mark.parametrize(
+    "notional, expected", [(1000.0, 125), (100000.0, 100), (-700000.0, 50)]
+)
+def test_max_leverage(notional, expected):
+    assert MarginEngine(BRACKETS).max_leverage(notional) == expected
+
+
+def test_maintenance_margin():
+    margins = MarginEngine(BRACKETS).maintenance_margin(
+        np.array([10000.0, 100000.0, 1000000.0])
+    )
+    np.testing.assert_allclose(margins, [40.0, 450.0, 6950.0])
+
+
+@pytest.mark.parametrize(
+    "position_amount, expected",
+    [(1.0, 29000.0 / 0.996), (-1.0, 31000.0 / 1.004), (0.0, 0.0)],
+    ids=["long", "short", "flat"],
+)
+def test_liquidation_price(position_amount, expected):
+    price = MarginEngine(BRACKETS).liquidation_price(1000.0, position_amount, 30000.0)
+    assert price == pytest.approx(expected)
+
+
+def test_simulate_fills_in_fill_order():
+    fills = MarginEngine(BRACKETS).simulate_fills(
+        prices=np.array([29000.0, 29900.0, 29500.0]),
+        quantities=np.array([0.1, 0.1, 0.1]),
+        position_amount=0.0,
+        entry_price=0.0,
+        leverage=10,
+        wallet_balance=1000.0,
+    )
+    np.testing.assert_allclose(fills["position_amount"], [0.3, 0.1, 0.2])
+    np.testing.assert_allclose(fills["entry_price"], [88400.0 / 3, 29900.0, 29700.0])
+    np.testing.assert_allclose(fills["initial_margin"], fills["notional"] / 10)
+    assert fills["within_max_notional"].all()
+    assert (np.diff(fills["liquidation_price"][[1, 2, 0]]) > 0.0).all()
+
+
+def test_simulate_short_fills_reduce_position():
+    fills = MarginEngine(BRACKETS).simulate_fills(
+        prices=np.array([31000.0, 30500.0]),
+        quantities=np.array([0.5, 0.5]),
+        position_amount=1.0,
+        entry_price=30000.0,
+        leverage=10,
+        wallet_balance=1000.0,
+        side=PositionSide.SHORT,
+    )
+    np.testing.assert_allclose(fills["position_amount"], [0.0, 0.5])
+    assert fills["liquidation_price"][0] == 0.0
+
+
+def test_grid_margin_ratios():
+    ratios = get_grid_margin_ratios(
+        margin_engine=MarginEngine(BRACKETS),
+        wallet_balance=1000.0,
+        position_amount=0.0,
+        entry_price=0.0,
+        leverage=10,
+        prices=np.array([30000.0]),
+        quantities=np.array([1.0]),
+    )
+    np.testing.assert_allclose(ratios, [120.0 / 1000.0])
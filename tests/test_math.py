@@ -1,7 +1,13 @@
+import numpy as np
 import pytest
 
 from data.enums import PositionSide
-from utils.mathutils import cost_to_open_position
+from utils.mathutils import (
+    cost_to_open_position,
+    get_scale_weights,
+    get_scaled_quantities,
+    round_to_increment,
+)
 
 
 @pytest.mark.parametrize(
@@ -31,3 +37,117 @@ def test_cost_to_open_position_long(
     )
     # Assert
     assert result == expected_output
+
+
+@pytest.mark.parametrize(
+    "value, increment, mode, expected",
+    [
+        (30000.06, 0.1, "nearest", 30000.1),
+        (30000.06, 0.1, "floor", 30000.0),
+        (0.0014, 0.001, "ceil", 0.002),
+        (0.003, 0.001, "ceil", 0.003),
+        (1.26, 0.5, "nearest", 1.5),
+        (12345.0, 10.0, "floor", 12340.0),
+    ],
+    ids=["nearest", "floor", "ceil", "ceil_exact", "half_tick", "integer_tick"],
+)
+def test_round_to_increment(value, increment, mode, expected):
+    assert round_to_increment(value, increment, mode) == expected
+
+
+def test_round_to_increment_matches_round():
+    values = np.random.default_rng(0).uniform(1.0, 100000.0, 10000)
+    assert (round_to_increment(values, 0.1) == np.round(values, 1)).all()
+    assert (round_to_increment(values, 0.001) == np.round(values, 3)).all()
+
+
+@pytest.mark.parametrize(
+    "volume_scale, num",
+    [(1.0, 5), (1.1, 20), (0.9, 20), (1.5, 5000)],
+    ids=["flat", "growing", "shrinking", "many_levels"],
+)
+def test_get_scale_weights(volume_scale, num):
+    weights = get_scale_weights(volume_scale, num)
+    assert weights.sum() == pytest.approx(1.0)
+    assert np.all(np.isfinite(weights))
+    tail = weights[-min(num, 20) :]
+    np.testing.assert_allclose(
+        tail / tail[0], volume_scale ** np.arange(len(tail)), rtol=1e-9
+    )
+
+
+@pytest.mark.parametrize(
+    "volume_scale, num", [(0.0, 5), (1.1, 0)], ids=["zero_scale", "no_levels"]
+)
+def test_get_scale_weights_errors(volume_scale, num):
+    with pytest.raises(ValueError):
+        get_scale_weights(volume_scale, num)
+
+
+@pytest.mark.parametrize(
+    "total_amount, volume_scale, num, min_quantity, expected_output",
+    [
+        (1.0, 1.0, 4, 0.0, [0.25, 0.25, 0.25, 0.25]),
+        (1.0, 1.0, 3, 0.0, [0.334, 0.333, 0.333]),
+        (1.0, 2.0, 4, 0.0, [0.067, 0.134, 0.267, 0.532]),
+        (0.01, 2.0, 4, 0.002, [0.002, 0.002, 0.003, 0.003]),
+        (0.005, 1.0, 4, 0.002, [0.003, 0.002]),
+        (0.001, 1.0, 4, 0.002, []),
+    ],
+    ids=["flat", "remainder", "doubling", "min_quantity", "fewer_levels", "empty"],
+)
+def test_get_scaled_quantities(
+    total_amount, volume_scale, num, min_quantity, expected_output
+):
+    result = get_scaled_quantities(
+        total_amount=total_amount,
+        volume_scale=volume_scale,
+        num=num,
+        step_size=0.001,
+        min_quantity=min_quantity,
+    )
+    assert result.tolist() == expected_output
+
+
+@pytest.mark.parametrize(
+    "total_amount, max_quantity, expected_output",
+    [
+        (1.0, 0.3, [0.134, 0.266, 0.3, 0.3]),
+        (1.0, 0.25, [0.25, 0.25, 0.25, 0.25]),
+        (2.0, 0.25, [0.25, 0.25, 0.25, 0.25]),
+        (1.0, 0.6, [0.067, 0.134, 0.267, 0.532]),
+    ],
+    ids=["capped_top", "exact_fit", "excess_dropped", "cap_not_reached"],
+)
+def test_get_scaled_quantities_max_quantity(
+    total_amount, max_quantity, expected_output
+):
+    result = get_scaled_quantities(
+        total_amount=total_amount,
+        volume_scale=2.0,
+        num=4,
+        step_size=0.001,
+        max_quantity=max_quantity,
+    )
+    assert result.tolist() == expected_output
+
+
+def test_get_scaled_quantities_per_level_max_quantity():
+    result = get_scaled_quantities(
+        total_amount=1.0,
+        volume_scale=2.0,
+        num=4,
+        step_size=0.001,
+        max_quantity=np.array([0.6, 0.6, 0.6, 0.4]),
+    )
+    assert result.tolist() == [0.086, 0.172, 0.342, 0.4]
+
+
+def test_get_scaled_quantities_respects_step_and_total():
+    result = get_scaled_quantities(
+        total_amount=123.4567, volume_scale=1.003, num=2000, step_size=0.01
+    )
+    assert len(result) == 2000
+    assert round(result.sum(), 2) == 123.45
+    assert np.all(result >= 0.01)
+    np.testing.assert_allclose(result, round_to_increment(result, 0.01))
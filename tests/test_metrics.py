@@ -0,0 +1,92 @@
+import json
+import urllib.request
+
+import pytest
+
+from base.helpers import Singleton
+from network.rate_limiter import RateLimiter
+from utils.metrics import (
+    RATE_LIMIT_HEADROOM,
+    LatencyHistogram,
+    Metrics,
+    MetricsServer,
+    get_bucket_index,
+    get_bucket_upper_bound,
+    timed,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    Singleton._instances.pop(Metrics, None)
+    yield
+    Singleton._instances.pop(Metrics, None)
+
+
+@pytest.mark.parametrize(
+    "value", [0, 1, 127, 128, 129, 255, 256, 1_000, 123_456, 10**9, 2**43]
+)
+def test_bucket_bounds_contain_value(value):
+    index = get_bucket_index(value)
+    assert get_bucket_upper_bound(index) >= value
+    assert index == 0 or get_bucket_upper_bound(index - 1) < value
+    assert get_bucket_upper_bound(index) <= value * 1.016 + 1
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for value in range(1, 10_001):
+        histogram.record(value * 1000)
+    assert (histogram.count, histogram.min, histogram.max) == (10_000, 1000, 10**7)
+    for percentile in [50.0, 90.0, 99.0]:
+        expected = percentile * 100_000
+        assert histogram.percentile(percentile) == pytest.approx(expected, rel=0.016)
+    assert histogram.percentile(100.0) == 10**7
+    other = LatencyHistogram()
+    other.record(10**8)
+    histogram.merge(other)
+    assert (histogram.count, histogram.max) == (10_001, 10**8)
+
+
+def test_timed_records_calls_and_errors():
+    @timed("rest.test")
+    def request(fail: bool) -> int:
+        if fail:
+            raise ConnectionError("down")
+        return 1
+
+    assert request(False) == 1
+    with pytest.raises(ConnectionError):
+        request(True)
+    summary = Metrics().summary()["metrics"]["rest.test"]
+    assert (summary["count"], summary["errors"]) == (2, 1)
+    assert summary["p50_us"] <= summary["p99.9_us"] <= summary["max_us"]
+
+
+def test_metrics_server_serves_summary():
+    Metrics().record("http GET /fapi/v1/depth", 2_000_000, size=512)
+    server = MetricsServer(port=0).start()
+    try:
+        host, port = server.address
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+            summary = json.loads(response.read())
+    finally:
+        server.stop()
+    depth = summary["metrics"]["http GET /fapi/v1/depth"]
+    assert (depth["count"], depth["bytes"]) == (1, 512)
+    assert depth["p50_us"] == pytest.approx(2000.0, rel=0.016)
+
+
+def test_metrics_summary_reports_rate_limit_headroom():
+    rate_limiter = RateLimiter(clock=lambda: 0.0)
+    Metrics().register_gauge(RATE_LIMIT_HEADROOM, rate_limiter.headroom)
+    rate_limiter.acquire(weight=0, orders=30)
+    gauges = Metrics().summary()["gauges"]
+    assert gauges == {
+        f"{RATE_LIMIT_HEADROOM}.{key}": value
+        for key, value in rate_limiter.headroom().items()
+    }
+    assert gauges[f"{RATE_LIMIT_HEADROOM}.ORDERS-10S"] < 1.0
+    assert gauges[f"{RATE_LIMIT_HEADROOM}.REQUEST_WEIGHT-1M"] == 1.0
+    Metrics().remove_gauge(RATE_LIMIT_HEADROOM)
+    assert Metrics().summary()["gauges"] == {}
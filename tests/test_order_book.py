@@ -0,0 +1,111 @@
+import pytest
+
+from data.enums import Side
+from data.order_book import LocalOrderBook
+
+SNAPSHOT = {
+    "lastUpdateId": 100,
+    "E": 1,
+    "T": 1,
+    "bids": [["99.0", "1.0"], ["98.0", "2.0"], ["97.0", "3.0"]],
+    "asks": [["101.0", "1.5"], ["102.0", "2.5"]],
+}
+
+
+def event(first: int, last: int, previous: int, bids=(), asks=()):
+    return {
+        "e": "depthUpdate",
+        "E": last,
+        "T": last,
+        "s": "BTCUSDT",
+        "U": first,
+        "u": last,
+        "pu": previous,
+        "b": [list(b) for b in bids],
+        "a": [list(a) for a in asks],
+    }
+
+
+def create_book(snapshots: list):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return snapshots[min(len(calls), len(snapshots)) - 1]
+
+    book = LocalOrderBook("BTCUSDT", snapshot_loader=loader, background_resync=False)
+    return book, calls
+
+
+def test_order_book_syncs_from_snapshot_and_stream():
+    book, calls = create_book([SNAPSHOT])
+    book.on_depth_update(event(90, 99, 89, bids=[("96.0", "1.0")]))
+    book.on_depth_update(event(99, 105, 99, bids=[("99.5", "0.5")], asks=[("101.0", "0")]))
+    book.on_depth_update(event(106, 110, 105, asks=[("100.5", "4.0")]))
+    assert calls == [1]
+    assert book.synced
+    assert book.last_update_id == 110
+    assert book.best_bid() == (99.5, 0.5)
+    assert book.best_ask() == (100.5, 4.0)
+    assert book.mid_price() == 100.0
+    assert book.quantity_at(Side.BUY, 96.0) == 0.0
+    assert book.top(Side.SELL, 2) == [(100.5, 4.0), (102.0, 2.5)]
+
+
+@pytest.mark.parametrize(
+    "side, price, expected_output",
+    [
+        (Side.BUY, 99.0, 1.0),
+        (Side.BUY, 98.0, 3.0),
+        (Side.BUY, 97.5, 3.0),
+        (Side.BUY, 100.0, 0.0),
+        (Side.SELL, 101.0, 1.5),
+        (Side.SELL, 105.0, 4.0),
+    ],
+)
+def test_order_book_cumulative_quantity(side, price, expected_output):
+    book, _ = create_book([SNAPSHOT])
+    book.load_snapshot(SNAPSHOT)
+    assert book.cumulative_quantity(side, price) == expected_output
+
+
+def test_order_book_resyncs_on_gap():
+    resynced = dict(SNAPSHOT, lastUpdateId=200, bids=[["90.0", "1.0"]])
+    book, calls = create_book([SNAPSHOT, resynced])
+    book.on_depth_update(event(99, 105, 99))
+    book.on_depth_update(event(120, 130, 110))
+    assert calls == [1, 1]
+    assert not book.synced
+    book.on_depth_update(event(195, 205, 130, bids=[("91.0", "1.0")]))
+    assert book.synced
+    assert book.best_bid() == (91.0, 1.0)
+    assert book.resync_count == 2
+
+
+def test_order_book_side_tracks_cumulative_quantity_across_updates():
+    book, _ = create_book([SNAPSHOT])
+    book.load_snapshot(SNAPSHOT)
+    book.bids.update(98.0, 0.0)
+    book.bids.update(98.5, 0.1)
+    book.bids.update(99.0, 0.2)
+    assert book.cumulative_quantity(Side.BUY, 98.5) == 0.3
+    assert book.cumulative_quantity(Side.BUY, 90.0) == 3.3
+    assert book.top(Side.BUY, 5) == [(99.0, 0.2), (98.5, 0.1), (97.0, 3.0)]
+    for price, _ in book.top(Side.BUY, 5):
+        book.bids.update(price, 0.0)
+    assert book.best_bid() is None
+    assert book.cumulative_quantity(Side.BUY, 90.0) == 0.0
+    assert book.bids.tree.tree == {}
+
+
+@pytest.mark.parametrize(
+    "tick_size, prices",
+    [(0.1, [30000.1, 30000.2, 29999.9]), (0.0001, [0.1234, 0.1235, 0.1233])],
+    ids=["btc", "small_tick"],
+)
+def test_order_book_side_orders_levels_by_tick(tick_size, prices):
+    book = LocalOrderBook("BTCUSDT", snapshot_loader=lambda: None, tick_size=tick_size)
+    for price in prices:
+        book.asks.update(price, 1.0)
+    assert [price for price, _ in book.top(Side.SELL, 3)] == sorted(prices)
+    assert book.cumulative_quantity(Side.SELL, sorted(prices)[1]) == 2.0
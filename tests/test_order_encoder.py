@@ -0,0 +1,195 @@
+import json
+
+import numpy as np
+import pytest
+from binance.lib.utils import encoded_string
+from binance.um_futures import UMFutures
+
+from base.helpers import Singleton
+from data.enums import (
+    OrderType,
+    PositionSide,
+    PriceMatchQueue,
+    Side,
+    TickerSymbol,
+    TimeInForce,
+)
+from mock_exchange.exchange import MockExchange, MockExchangeConfig
+from network.network import BinanceNetworkClient
+from network.order_encoder import BatchOrderEncoder
+from network.rate_limiter import RateLimiter
+from repository.repository import stringify_orders
+from utils.orderutils import create_order, create_order_array, create_orders_from_array
+
+
+def limit_order(price: float, quantity: float = 0.001, **kwargs) -> dict:
+    return create_order(
+        symbol=TickerSymbol.BTCUSDT,
+        side=Side.BUY,
+        quantity=quantity,
+        position_side=PositionSide.LONG,
+        price=price,
+        time_in_force=TimeInForce.GTX,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize(
+    "orders",
+    [
+        [limit_order(29000.0), limit_order(29000.1, 0.123)],
+        [limit_order(0.0, price_match=PriceMatchQueue.QUEUE_5)],
+        [
+            {
+                "orderId": 12345,
+                "symbol": TickerSymbol.BTCUSDT,
+                "side": Side.SELL,
+                "quantity": 0.5,
+                "price": 31000.5,
+            }
+        ],
+        [limit_order(1e-05), limit_order(123456789.0, 1)],
+        [],
+    ],
+    ids=["limit", "price_match", "amend", "number_formats", "empty"],
+)
+def test_encode_matches_stringify_orders(orders):
+    payload = BatchOrderEncoder().encode(orders)
+    assert json.loads(payload) == stringify_orders(orders)
+    assert " " not in payload
+
+
+def test_encode_query_matches_connector_encoding():
+    orders = [limit_order(29000.0), limit_order(0.0, price_match=PriceMatchQueue.QUEUE)]
+    expected_output = encoded_string(
+        {"batchOrders": json.dumps(stringify_orders(orders), separators=(",", ":"))},
+        True,
+    )
+    assert BatchOrderEncoder().encode_query(orders) == expected_output
+
+
+def test_encode_array_matches_create_orders_from_array():
+    rng = np.random.default_rng(0)
+    orders = create_order_array(
+        np.round(29000.0 + rng.uniform(0.0, 100.0, 50), 1),
+        np.round(rng.uniform(0.001, 1.0, 50), 3),
+    )
+    encoder = BatchOrderEncoder()
+    payload = encoder.encode_array(
+        symbol=TickerSymbol.BTCUSDT,
+        side=Side.SELL,
+        orders=orders,
+        position_side=PositionSide.SHORT,
+        order_type=OrderType.LIMIT,
+        time_in_force=TimeInForce.GTC,
+    )
+    expected_output = create_orders_from_array(
+        symbol=TickerSymbol.BTCUSDT,
+        side=Side.SELL,
+        orders=orders,
+        position_side=PositionSide.SHORT,
+    )
+    assert json.loads(payload) == stringify_orders(expected_output)
+
+
+@pytest.mark.parametrize(
+    "value, expected_output",
+    [
+        (1e-05, "0.00001"),
+        (2.5e-07, "0.00000025"),
+        (30000.100000000002, "30000.1"),
+        (0.009000000000000001, "0.009"),
+        (1e16, "10000000000000000.0"),
+    ],
+    ids=["tiny", "tinier", "price_noise", "quantity_noise", "large"],
+)
+def test_encode_formats_floats_positionally(value, expected_output):
+    orders = [{"price": value, "quantity": value}]
+    assert json.loads(BatchOrderEncoder().encode(orders)) == [
+        {"price": expected_output, "quantity": expected_output}
+    ]
+
+
+def test_encode_uses_symbol_increments():
+    encoder = BatchOrderEncoder()
+    encoder.set_increments(TickerSymbol.BTCUSDT, tick_size=0.1, step_size=0.001)
+    orders = [
+        limit_order(30000.100000000002, 0.0090000001),
+        limit_order(30000.14, 0.0094),
+    ]
+    expected_output = [{"price": "30000.1", "quantity": "0.009"}] * 2
+    assert [
+        {"price": order["price"], "quantity": order["quantity"]}
+        for order in json.loads(encoder.encode(orders))
+    ] == expected_output
+    assert [
+        {"price": order["price"], "quantity": order["quantity"]}
+        for order in encoder.format_orders(orders)
+    ] == expected_output
+    payload = encoder.encode_array(
+        symbol=TickerSymbol.BTCUSDT,
+        side=Side.BUY,
+        orders=create_order_array(
+            np.array([30000.100000000002]), np.array([0.0090000001])
+        ),
+        position_side=PositionSide.LONG,
+        order_type=OrderType.LIMIT,
+        time_in_force=TimeInForce.GTC,
+    )
+    assert json.loads(payload)[0]["price"] == "30000.1"
+    assert json.loads(payload)[0]["quantity"] == "0.009"
+
+
+def test_encode_rejects_unknown_fields():
+    with pytest.raises(ValueError):
+        BatchOrderEncoder().encode([{**limit_order(29000.0), "leverage": 3}])
+
+
+def test_encode_cache_is_bounded():
+    encoder = BatchOrderEncoder(max_cache_size=10)
+    orders = [limit_order(29000.0 + i / 10) for i in range(20)]
+    assert json.loads(encoder.encode(orders)) == stringify_orders(orders)
+    assert len(encoder._fragments) <= 10
+
+
+def test_encode_distinguishes_value_types():
+    encoder = BatchOrderEncoder()
+    assert json.loads(encoder.encode([{"quantity": 1}, {"quantity": 1.0}])) == [
+        {"quantity": "1"},
+        {"quantity": "1.0"},
+    ]
+
+
+def test_encoded_batch_is_signed_and_accepted():
+    exchange = MockExchange(
+        config=MockExchangeConfig(market_seconds=0.0, seed=1)
+    ).start()
+    Singleton._instances.pop(BinanceNetworkClient, None)
+    try:
+        client = BinanceNetworkClient(
+            client=UMFutures(
+                key="mock-key", secret="mock-secret", base_url=exchange.base_url
+            ),
+            rate_limiter=RateLimiter(),
+        )
+        orders = [limit_order(29000.0), limit_order(29000.1, 0.123)]
+        responses = client.new_batch_order_request(
+            params=BatchOrderEncoder().encode_query(orders), orders=len(orders)
+        )
+        assert [r["status"] for r in responses] == ["NEW", "NEW"]
+        amends = [
+            {
+                "orderId": responses[0]["orderId"],
+                "symbol": TickerSymbol.BTCUSDT,
+                "side": Side.BUY,
+                "quantity": 0.002,
+                "price": 28900.0,
+            }
+        ]
+        amended = client.modify_batch_order_request(
+            params=BatchOrderEncoder().encode_query(amends), orders=1
+        )
+        assert float(amended[0]["price"]) == 28900.0
+    finally:
+        Singleton._instances.pop(BinanceNetworkClient, None)
+        exchange.stop()
@@ -0,0 +1,229 @@
+import numpy as np
+import pytest
+
+from data.enums import AmountSpacing, PositionSide, Side, TickerSymbol, TimeInForce
+from utils.orderutils import (
+    ORDER_DTYPE,
+    create_multiple_orders,
+    create_orders_from_array,
+    get_buy_orders_array,
+    get_buy_orders_quantities_and_prices,
+    get_prices_list,
+    get_sell_orders_array,
+    max_open_quantities,
+    max_open_quantity,
+)
+
+BUY_PARAMS = {
+    "orders_num": 50,
+    "high_price": 29900.0,
+    "low_price": 24000.0,
+    "available_balance": 1500.0,
+    "leverage": 3,
+    "mark_price": 30000.0,
+    "max_notional_value": 1000000.0,
+    "notional": 500.0,
+    "side": PositionSide.LONG,
+    "precision": 3,
+    "order_quantity_min": 0.001,
+    "order_quantity_max": 1000.0,
+}
+
+
+def scalar_buy_orders(params: dict) -> list[tuple[float, float]]:
+    prices = get_prices_list(
+        params["orders_num"],
+        params["high_price"],
+        params["low_price"],
+        params.get("amount_spacing", AmountSpacing.LINEAR),
+    )
+    result = []
+    for price in prices:
+        order_price = round(price, 1)
+        quantity = max_open_quantity(
+            leverage=params["leverage"],
+            available_balance=params["available_balance"] / params["orders_num"],
+            order_price=order_price,
+            mark_price=params["mark_price"],
+            max_notional_value=params["max_notional_value"],
+            notional=params["notional"],
+            side=params["side"],
+            precision=params["precision"],
+        )
+        if params.get("market_making"):
+            quantity = min(params["mm_buy_quantity"], quantity)
+        quantity = min(quantity, params["order_quantity_max"])
+        quantity = max(quantity, params["order_quantity_min"])
+        result.append((order_price, round(quantity, params["precision"])))
+    return result
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        {"amount_spacing": AmountSpacing.GEOMETRIC},
+        {"market_making": True, "mm_buy_quantity": 0.002},
+        {"available_balance": 0.0},
+        {"order_quantity_max": 0.005},
+        {"side": PositionSide.SHORT, "high_price": 35000.0, "low_price": 30100.0},
+        {"max_notional_value": 600.0},
+    ],
+    ids=[
+        "linear",
+        "geometric",
+        "market_making",
+        "no_balance",
+        "quantity_max",
+        "short",
+        "notional_cap",
+    ],
+)
+def test_buy_orders_array_matches_scalar(overrides):
+    params = {**BUY_PARAMS, **overrides}
+    orders = get_buy_orders_array(**params)
+    assert orders.dtype == ORDER_DTYPE
+    assert get_buy_orders_quantities_and_prices(**params) == scalar_buy_orders(params)
+
+
+def test_buy_orders_array_empty():
+    orders = get_buy_orders_array(**{**BUY_PARAMS, "orders_num": 0})
+    assert orders.dtype == ORDER_DTYPE
+    assert len(orders) == 0
+
+
+@pytest.mark.parametrize(
+    "orders_num, amount, market_making, mm_sell_quantity, expected_output",
+    [
+        (4, 0.04, False, 0.0, [0.01] * 4),
+        (4, 0.04, True, 0.02, [0.02] * 2),
+        (4, 0.0005, False, 0.0, []),
+        (0, 1.0, False, 0.0, []),
+    ],
+    ids=["even", "market_making", "below_minimum", "no_orders"],
+)
+def test_sell_orders_array(
+    orders_num, amount, market_making, mm_sell_quantity, expected_output
+):
+    orders = get_sell_orders_array(
+        orders_num=orders_num,
+        high_price=31000.0,
+        low_price=30100.0,
+        amount=amount,
+        order_quantity_min=0.001,
+        market_making=market_making,
+        mm_sell_quantity=mm_sell_quantity,
+    )
+    assert orders["quantity"].tolist() == expected_output
+    if len(orders):
+        assert orders["price"][0] == 30100.0
+        assert orders["price"][-1] == 31000.0
+        assert np.all(np.diff(orders["price"]) > 0)
+
+
+@pytest.mark.parametrize(
+    "volume_scale", [1.0, 1.05, 0.95], ids=["flat", "growing", "shrinking"]
+)
+def test_sell_orders_array_volume_scale(volume_scale):
+    orders = get_sell_orders_array(
+        orders_num=50,
+        high_price=31000.0,
+        low_price=30100.0,
+        amount=1.5,
+        order_quantity_min=0.002,
+        volume_scale=volume_scale,
+    )
+    quantities = orders["quantity"]
+    assert len(orders) == 50
+    assert round(quantities.sum(), 3) == 1.5
+    assert quantities.min() >= 0.002
+    assert orders["price"][0] == 30100.0
+    assert orders["price"][-1] == 31000.0
+    if volume_scale > 1.0:
+        assert quantities[-1] > quantities[0]
+    elif volume_scale < 1.0:
+        assert quantities[-1] < quantities[0]
+
+
+def test_buy_orders_array_volume_scale():
+    flat = get_buy_orders_array(**BUY_PARAMS)
+    orders = get_buy_orders_array(**{**BUY_PARAMS, "volume_scale": 1.05})
+    np.testing.assert_array_equal(orders["price"], flat["price"])
+    assert round(orders["quantity"].sum(), 3) == round(flat["quantity"].sum(), 3)
+    assert orders["quantity"][0] > orders["quantity"][-1]
+    assert orders["quantity"].min() >= BUY_PARAMS["order_quantity_min"]
+
+
+def test_create_orders_from_array_matches_create_multiple_orders():
+    orders = get_buy_orders_array(**BUY_PARAMS)
+    quantities_and_prices = get_buy_orders_quantities_and_prices(**BUY_PARAMS)
+    expected_output = create_multiple_orders(
+        symbol=TickerSymbol.BTCUSDT,
+        side=Side.BUY,
+        quantities_and_prices=quantities_and_prices,
+        position_side=PositionSide.LONG,
+        time_in_force=TimeInForce.GTX,
+    )
+    assert (
+        create_orders_from_array(
+            symbol=TickerSymbol.BTCUSDT,
+            side=Side.BUY,
+            orders=orders,
+            position_side=PositionSide.LONG,
+            time_in_force=TimeInForce.GTX,
+        )
+        == expected_output
+    )
+
+
+@pytest.mark.parametrize(
+    "mm_buy_quantity, order_quantity_max",
+    [(0.005, 1000.0), (1.0, 0.004), (0.002, 0.004)],
+    ids=["mm_cap", "max_cap", "all_capped"],
+)
+def test_buy_orders_array_volume_scale_respects_caps(
+    mm_buy_quantity, order_quantity_max
+):
+    params = {
+        **BUY_PARAMS,
+        "volume_scale": 1.05,
+        "market_making": True,
+        "mm_buy_quantity": mm_buy_quantity,
+        "order_quantity_max": order_quantity_max,
+    }
+    orders = get_buy_orders_array(**params)
+    cap = min(mm_buy_quantity, order_quantity_max)
+    budget = get_buy_orders_array(**{**BUY_PARAMS, "volume_scale": 1.05})
+    assert len(orders) == BUY_PARAMS["orders_num"]
+    assert orders["quantity"].max() <= cap
+    assert orders["quantity"][0] >= orders["quantity"][-1]
+    assert round(orders["quantity"].sum(), 3) == round(
+        min(budget["quantity"].sum(), cap * len(orders)), 3
+    )
+
+
+def test_buy_orders_array_volume_scale_respects_level_limits():
+    params = {
+        **BUY_PARAMS,
+        "orders_num": 5,
+        "high_price": 29900.0,
+        "low_price": 29000.0,
+        "max_notional_value": 2000.0,
+        "volume_scale": 2.0,
+    }
+    orders = get_buy_orders_array(**params)
+    level_limits = max_open_quantities(
+        leverage=params["leverage"],
+        available_balance=params["available_balance"],
+        order_prices=orders["price"],
+        mark_price=params["mark_price"],
+        max_notional_value=params["max_notional_value"],
+        notional=params["notional"],
+        side=params["side"],
+        precision=params["precision"],
+    )
+    unscaled = get_buy_orders_array(**{**params, "volume_scale": 0.0})
+    assert np.all(orders["quantity"] <= level_limits)
+    assert orders["quantity"][0] == level_limits[0]
+    assert orders["quantity"][0] > orders["quantity"][-1]
+    assert round(orders["quantity"].sum(), 3) == round(unscaled["quantity"].sum(), 3)
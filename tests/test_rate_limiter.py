@@ -0,0 +1,91 @@
+import threading
+import time
+
+from data.enums import RequestPriority
+from model import RateLimit
+from network.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def create_limiter(clock, limit=100, interval="MINUTE"):
+    return RateLimiter(
+        rate_limits=[
+            RateLimit(interval=interval, intervalNum=1, limit=limit, rateLimitType="REQUEST_WEIGHT"),
+            RateLimit(interval="SECOND", intervalNum=10, limit=10, rateLimitType="ORDERS"),
+        ],
+        safety_margin=1.0,
+        clock=clock,
+    )
+
+
+def test_rate_limiter_consumes_and_refills():
+    clock = FakeClock()
+    limiter = create_limiter(clock)
+    assert limiter.acquire(weight=60, timeout=0.0)
+    assert not limiter.acquire(weight=60, timeout=0.0)
+    assert limiter.headroom()["REQUEST_WEIGHT-1M"] == 0.4
+    clock.now = 30.0
+    assert limiter.acquire(weight=60, timeout=0.0)
+
+
+def test_rate_limiter_counts_orders():
+    clock = FakeClock()
+    limiter = create_limiter(clock)
+    assert limiter.acquire(weight=5, orders=10, timeout=0.0)
+    assert not limiter.acquire(weight=5, orders=1, timeout=0.0)
+    assert limiter.acquire(weight=5, timeout=0.0)
+
+
+def test_rate_limiter_corrects_from_headers():
+    clock = FakeClock()
+    limiter = create_limiter(clock)
+    limiter.update_from_headers(200, {"X-MBX-USED-WEIGHT-1M": "90", "X-MBX-ORDER-COUNT-10S": "4"})
+    headroom = limiter.headroom()
+    assert headroom["REQUEST_WEIGHT-1M"] == 0.1
+    assert headroom["ORDERS-10S"] == 0.6
+
+
+def test_rate_limiter_backs_off_on_429():
+    clock = FakeClock()
+    limiter = create_limiter(clock)
+    limiter.update_from_headers(429, {"Retry-After": "5"})
+    assert not limiter.acquire(weight=1, timeout=0.0)
+    clock.now = 5.0
+    assert limiter.acquire(weight=1, timeout=0.0)
+
+
+def test_rate_limiter_prepaid_only_waits_for_backoff():
+    clock = FakeClock()
+    limiter = create_limiter(clock)
+    with limiter.prepaid():
+        assert limiter.acquire(weight=100, orders=10, timeout=0.0)
+        assert limiter.acquire(weight=100, orders=10, timeout=0.0)
+    assert limiter.headroom() == {"REQUEST_WEIGHT-1M": 1.0, "ORDERS-10S": 1.0}
+    limiter.update_from_headers(429, {"Retry-After": "5"})
+    with limiter.prepaid():
+        assert not limiter.acquire(weight=1, timeout=0.0)
+
+
+def test_rate_limiter_serves_higher_priority_first():
+    limiter = create_limiter(time.monotonic, limit=10, interval="SECOND")
+    assert limiter.acquire(weight=10)
+    order = []
+
+    def worker(name, priority):
+        limiter.acquire(weight=5, priority=priority)
+        order.append(name)
+
+    display = threading.Thread(target=worker, args=("display", RequestPriority.DISPLAY))
+    display.start()
+    time.sleep(0.05)
+    with limiter.priority(RequestPriority.CANCEL):
+        worker("cancel", RequestPriority.ACCOUNT)
+    display.join()
+    assert order == ["cancel", "display"]
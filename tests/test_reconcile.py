@@ -0,0 +1,114 @@
+import pytest
+
+from data.enums import PositionSide, Side, TickerSymbol
+from utils.orderutils import create_order
+from utils.reconcileutils import reconcile_orders
+
+
+def target(side: Side, price: float, quantity: float):
+    return create_order(
+        symbol=TickerSymbol.BTCUSDT,
+        side=side,
+        quantity=quantity,
+        position_side=PositionSide.LONG,
+        price=price,
+    )
+
+
+def open_order(order_id: int, side: str, price: str, quantity: str, executed="0"):
+    return {
+        "orderId": order_id,
+        "symbol": "BTCUSDT",
+        "side": side,
+        "positionSide": "LONG",
+        "type": "LIMIT",
+        "price": price,
+        "origQty": quantity,
+        "executedQty": executed,
+        "priceMatch": "NONE",
+    }
+
+
+def test_reconcile_keeps_matching_orders():
+    plan = reconcile_orders(
+        target_orders=[target(Side.BUY, 100.0, 1.0), target(Side.SELL, 110.0, 1.0)],
+        open_orders=[open_order(1, "BUY", "100.0", "1.0"), open_order(2, "SELL", "110.0", "1.0")],
+    )
+    assert plan.is_empty()
+    assert sorted(plan.kept) == [1, 2]
+
+
+def test_reconcile_amends_quantity_change():
+    plan = reconcile_orders(
+        target_orders=[target(Side.BUY, 100.0, 2.0)],
+        open_orders=[open_order(1, "BUY", "100.0", "1.0", executed="0.5")],
+    )
+    assert plan.cancels == []
+    assert plan.new_orders == []
+    assert plan.amends == [
+        {"orderId": 1, "symbol": "BTCUSDT", "side": "BUY", "quantity": 2.5, "price": 100.0}
+    ]
+
+
+def test_reconcile_moves_unmatched_orders_with_amends():
+    plan = reconcile_orders(
+        target_orders=[target(Side.BUY, 99.0, 1.0), target(Side.BUY, 98.0, 1.0)],
+        open_orders=[open_order(1, "BUY", "100.0", "1.0")],
+    )
+    assert plan.cancels == []
+    assert [a["price"] for a in plan.amends] == [98.0]
+    assert [o["price"] for o in plan.new_orders] == [99.0]
+
+
+def test_reconcile_cancels_extra_orders():
+    plan = reconcile_orders(
+        target_orders=[target(Side.SELL, 110.0, 1.0)],
+        open_orders=[
+            open_order(1, "SELL", "110.0", "1.0"),
+            open_order(2, "SELL", "120.0", "1.0"),
+            open_order(3, "BUY", "90.0", "1.0"),
+        ],
+    )
+    assert sorted(plan.cancels) == [2, 3]
+    assert plan.kept == [1]
+
+
+@pytest.mark.parametrize(
+    "price_tolerance, quantity_tolerance, expected_kept",
+    [(0.0, 0.0, []), (0.2, 0.0, []), (0.2, 0.01, [1])],
+    ids=["exact", "price_only", "price_and_quantity"],
+)
+def test_reconcile_tolerance(price_tolerance, quantity_tolerance, expected_kept):
+    plan = reconcile_orders(
+        target_orders=[target(Side.BUY, 100.1, 1.005)],
+        open_orders=[open_order(1, "BUY", "100.0", "1.0")],
+        price_tolerance=price_tolerance,
+        quantity_tolerance=quantity_tolerance,
+    )
+    assert plan.kept == expected_kept
+
+
+def test_reconcile_negative_tolerance():
+    with pytest.raises(ValueError):
+        reconcile_orders(target_orders=[], open_orders=[], price_tolerance=-1.0)
+
+
+@pytest.mark.parametrize(
+    "quantity, executed, step_size, expected_output",
+    [
+        (0.008, "0.001", 0.001, "0.009"),
+        (0.007, "0.002", 0.001, "0.009"),
+        (1.1, "0.2", 0.1, "1.3"),
+        (3.0, "1", 1.0, "4.0"),
+    ],
+    ids=["btc_step", "btc_step_two_fills", "tenth_step", "whole_step"],
+)
+def test_reconcile_rounds_partially_filled_amends(
+    quantity, executed, step_size, expected_output
+):
+    plan = reconcile_orders(
+        target_orders=[target(Side.BUY, 100.0, quantity)],
+        open_orders=[open_order(1, "BUY", "100.0", "0.02", executed=executed)],
+        step_size=step_size,
+    )
+    assert [str(a["quantity"]) for a in plan.amends] == [expected_output]
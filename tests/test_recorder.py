@@ -0,0 +1,61 @@
+import json
+import time
+
+import pytest
+
+from data.enums import RecordKind
+from data.recorder import (
+    StreamRecorder,
+    get_exchange_time,
+    list_recordings,
+    read_recordings,
+)
+
+
+@pytest.mark.parametrize(
+    "message, expected_output",
+    [
+        (b'{"stream":"btcusdt@aggTrade","data":{"e":"aggTrade","E":123,"s":"BTCUSDT"}}', 123),
+        (b'{"e":"ORDER_TRADE_UPDATE","T":5,"E":1700000000000}', 1700000000000),
+        (b'{"result":null,"id":1}', 0),
+    ],
+    ids=["combined_stream", "user_data", "no_event_time"],
+)
+def test_get_exchange_time(message, expected_output):
+    assert get_exchange_time(message) == expected_output
+
+
+def test_recorder_round_trip(tmp_path):
+    messages = [
+        json.dumps({"stream": "btcusdt@aggTrade", "data": {"e": "aggTrade", "E": i}})
+        for i in range(1, 101)
+    ]
+    with StreamRecorder(directory=str(tmp_path)) as recorder:
+        for message in messages:
+            recorder.record(message)
+        recorder.record('{"path":"/fapi/v1/depth"}', kind=RecordKind.REST)
+    records = list(read_recordings(str(tmp_path)))
+    assert [r.text() for r in records] == [*messages, '{"path":"/fapi/v1/depth"}']
+    assert [r.exchange_time for r in records[:-1]] == list(range(1, 101))
+    assert records[-1].kind is RecordKind.REST
+    assert all(r.local_time <= time.time_ns() for r in records)
+    assert recorder.written == 101
+    assert recorder.dropped == 0
+
+
+def test_recorder_rolls_files(tmp_path):
+    with StreamRecorder(directory=str(tmp_path), max_file_bytes=200) as recorder:
+        for i in range(10):
+            recorder.record(json.dumps({"e": "aggTrade", "E": i, "p": "1" * 50}))
+    assert len(list_recordings(str(tmp_path))) > 1
+    assert [r.exchange_time for r in read_recordings(str(tmp_path))] == list(range(10))
+
+
+def test_recorder_drops_when_queue_is_full(tmp_path):
+    recorder = StreamRecorder(directory=str(tmp_path), max_queue_size=2)
+    for i in range(5):
+        recorder.record(json.dumps({"E": i}))
+    assert recorder.dropped == 3
+    recorder.start()
+    recorder.stop()
+    assert recorder.written == 2
@@ -0,0 +1,79 @@
+import pytest
+
+import display.renderer as renderer_module
+from display.display import make_it
+from display.renderer import ACCOUNT_PANEL, BOOK_PANEL, DisplayRenderer
+from network.stream_decoder import AccountUpdate, DepthUpdate
+
+
+class FakeLive:
+    def __init__(self) -> None:
+        self.refreshes = 0
+
+    def refresh(self) -> None:
+        self.refreshes += 1
+
+
+def create_depth(price: float) -> DepthUpdate:
+    return DepthUpdate(
+        symbol="BTCUSDT",
+        event_time=0,
+        transaction_time=0,
+        first_update_id=0,
+        final_update_id=0,
+        previous_final_update_id=0,
+        bids=[[price, 1.0]],
+        asks=[[price + 0.1, 1.0]],
+    )
+
+
+@pytest.fixture
+def rendered(monkeypatch):
+    rendered = []
+    monkeypatch.setattr(
+        renderer_module, "update_book_tables", lambda b, a: rendered.append((b, a))
+    )
+    monkeypatch.setattr(
+        renderer_module, "update_account_tables", lambda d: rendered.append(d)
+    )
+    return rendered
+
+
+def test_renderer_coalesces_depth_updates(rendered):
+    renderer = DisplayRenderer(layout=make_it())
+    for i in range(10):
+        renderer.on_event(create_depth(100.0 + i))
+    assert rendered == []
+    assert renderer.render_once()
+    assert rendered == [([[109.0, 1.0]], [[109.1, 1.0]])]
+    assert renderer.renders == {ACCOUNT_PANEL: 0, BOOK_PANEL: 1}
+    assert renderer.dropped == 9
+    assert not renderer.render_once()
+
+
+def test_renderer_only_renders_changed_panels(rendered):
+    renderer = DisplayRenderer(layout=make_it())
+    update = AccountUpdate(
+        event_time=0, transaction_time=0, reason="ORDER", balances=[], positions=[]
+    )
+    renderer.on_event(update)
+    renderer.on_event({"e": "ORDER_TRADE_UPDATE"})
+    assert renderer.render_once()
+    assert rendered == [update]
+    assert renderer.renders == {ACCOUNT_PANEL: 1, BOOK_PANEL: 0}
+
+
+def test_renderer_refreshes_live_on_change_or_idle(rendered):
+    live = FakeLive()
+    renderer = DisplayRenderer(layout=make_it(), idle_refresh_seconds=60.0, live=live)
+    renderer.refresh(changed=False)
+    assert live.refreshes == 1
+    renderer.refresh(changed=False)
+    assert live.refreshes == 1
+    renderer.refresh(changed=True)
+    assert live.refreshes == 2
+
+
+def test_renderer_rejects_non_positive_frame_rate():
+    with pytest.raises(ValueError):
+        DisplayRenderer(layout=make_it(), frame_rate=0.0)
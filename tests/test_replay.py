@@ -0,0 +1,263 @@
+import json
+
+import pytest
+
+from base.helpers import Singleton
+from base.models.FileInput import FileInput
+from data.account_state import AccountState
+from data.exchange_info import ExchangeInfoCache
+from data.recorder import StreamRecorder, read_recordings
+from display.display import layout
+from display.renderer import BOOK_PANEL, DisplayRenderer
+from replay import Replayer, load_exchange_info
+from tests.test_account_state import FakeRepo
+from utils.timeutils import VirtualClock
+
+START = 1_700_000_000_000
+
+
+def stream(name: str, data: dict) -> str:
+    return json.dumps({"stream": name, "data": data}, separators=(",", ":"))
+
+
+def create_messages() -> list[tuple[str, str]]:
+    messages = [
+        (
+            "STREAM",
+            stream(
+                "btcusdt@depth@100ms",
+                {
+                    "e": "depthUpdate",
+                    "E": START,
+                    "s": "BTCUSDT",
+                    "U": 95,
+                    "u": 101,
+                    "pu": 94,
+                    "b": [["29999.9", "1.0"]],
+                    "a": [["30000.1", "1.0"]],
+                },
+            ),
+        ),
+        (
+            "REST",
+            json.dumps(
+                {
+                    "path": "/fapi/v1/depth",
+                    "params": {"symbol": "BTCUSDT", "limit": 1000},
+                    "response": {
+                        "lastUpdateId": 100,
+                        "bids": [["29999.9", "2.0"]],
+                        "asks": [["30000.1", "2.0"]],
+                    },
+                }
+            ),
+        ),
+    ]
+    price = 30000.0
+    for i in range(1, 400):
+        price += -10.0 if (i // 20) % 2 == 0 else 10.0
+        time = START + i * 250
+        messages.append(
+            (
+                "STREAM",
+                stream(
+                    "btcusdt@aggTrade",
+                    {
+                        "e": "aggTrade",
+                        "E": time,
+                        "T": time,
+                        "s": "BTCUSDT",
+                        "p": f"{price:.1f}",
+                        "q": "0.010",
+                        "m": i % 2 == 0,
+                    },
+                ),
+            )
+        )
+    return messages
+
+
+@pytest.fixture
+def file_input():
+    with open(file="my_trading_template.json", mode="r", encoding="utf-8") as f:
+        return FileInput(**json.load(f))
+
+
+@pytest.fixture
+def recording(tmp_path):
+    file_name = tmp_path / "capture.jsonl"
+    with open(file=file_name, mode="w", encoding="utf-8") as f:
+        for kind, message in create_messages():
+            f.write(json.dumps({"kind": kind, "message": message}) + "\n")
+    return str(file_name)
+
+
+def replay(file_input, path, **kwargs) -> tuple[dict, Replayer]:
+    Singleton._instances.pop(AccountState, None)
+    replayer = Replayer(
+        file_input=file_input, records=read_recordings(path), **kwargs
+    )
+    summary = replayer.run()
+    Singleton._instances.pop(AccountState, None)
+    summary.pop("seconds")
+    return summary, replayer
+
+
+def test_replay_is_deterministic(file_input, recording):
+    first, replayer = replay(file_input, recording)
+    second, _ = replay(file_input, recording)
+    assert first == second
+    assert first["messages"] == 400
+    assert first["cycles"] > 1
+    assert first["fills"] > 0
+    assert first["replay_seconds"] == pytest.approx(399 * 0.25)
+    assert replayer.order_book.synced
+    assert replayer.order_book.last_update_id == 101
+
+
+def test_replay_uses_its_own_account_state(file_input, recording):
+    expected_output, _ = replay(file_input, recording)
+    live_state = AccountState(repo=FakeRepo())
+    replayer = Replayer(file_input=file_input, records=read_recordings(recording))
+    try:
+        summary = replayer.run()
+        assert AccountState() is live_state
+    finally:
+        Singleton._instances.pop(AccountState, None)
+    summary.pop("seconds")
+    assert summary == expected_output
+    assert replayer.account_state is not live_state
+    assert replayer.account_state.repo is replayer.repo
+    assert live_state.symbols == {}
+
+
+def test_replay_reads_binary_recordings(file_input, recording, tmp_path):
+    directory = tmp_path / "recordings"
+    with StreamRecorder(directory=str(directory)) as recorder:
+        for record in read_recordings(recording):
+            recorder.record(record.message, kind=record.kind)
+    from_jsonl, _ = replay(file_input, recording, use_exchange_time=True)
+    from_binary, _ = replay(file_input, str(directory), use_exchange_time=True)
+    assert from_binary == from_jsonl
+    assert from_binary["cycles"] > 0
+
+
+@pytest.mark.parametrize(
+    "speed, expected_output",
+    [(1.0, [1.0]), (4.0, [0.25]), (0.0, [])],
+    ids=["real_time", "four_times", "as_fast_as_possible"],
+)
+def test_virtual_clock_speed(speed, expected_output):
+    slept = []
+    wall = [100.0]
+
+    def sleep(seconds):
+        slept.append(seconds)
+        wall[0] += seconds
+
+    clock = VirtualClock(speed=speed, sleep=sleep, wall=lambda: wall[0])
+    clock.advance_to(1_000_000_000)
+    clock.advance_to(2_000_000_000)
+    clock.advance_to(2_000_000_000)
+    assert slept == expected_output
+    assert clock.elapsed() == 1.0
+
+
+EXCHANGE_INFO = {
+    "rateLimits": [],
+    "symbols": [
+        {
+            "symbol": "BTCUSDT",
+            "filters": [
+                {"filterType": "PRICE_FILTER", "tickSize": "0.5"},
+                {"filterType": "LOT_SIZE", "stepSize": "0.001", "minQty": "0.001"},
+            ],
+        }
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "recorded, cached, expected_output",
+    [(True, False, 0.5), (False, True, 0.5), (False, False, 0.1)],
+    ids=["recording", "cache_file", "defaults"],
+)
+def test_replay_uses_exchange_info_filters(
+    file_input, tmp_path, recorded, cached, expected_output
+):
+    messages = create_messages()
+    if recorded:
+        messages.insert(
+            0,
+            (
+                "REST",
+                json.dumps(
+                    {
+                        "path": "/fapi/v1/exchangeInfo",
+                        "params": {},
+                        "response": EXCHANGE_INFO,
+                    }
+                ),
+            ),
+        )
+    path = tmp_path / "capture.jsonl"
+    with open(file=path, mode="w", encoding="utf-8") as f:
+        for kind, message in messages:
+            f.write(json.dumps({"kind": kind, "message": message}) + "\n")
+    cache_file = tmp_path / "exchange_info.json"
+    if cached:
+        cache_file.write_text(
+            json.dumps({"updated": 0.0, "exchangeInfo": EXCHANGE_INFO})
+        )
+    Singleton._instances.pop(ExchangeInfoCache, None)
+    try:
+        exchange_info = load_exchange_info(str(path), str(cache_file))
+        summary, replayer = replay(file_input, str(path), exchange_info=exchange_info)
+    finally:
+        Singleton._instances.pop(ExchangeInfoCache, None)
+    assert replayer.scheduler.tick_size == expected_output
+    assert replayer.matching.tick_size == expected_output
+    assert summary["messages"] == 400
+
+
+class FakeLive:
+    def __init__(self) -> None:
+        self.refreshes = 0
+
+    def refresh(self) -> None:
+        self.refreshes += 1
+
+
+def test_replay_renders_display(file_input, tmp_path):
+    messages = create_messages()
+    messages.insert(
+        2,
+        (
+            "STREAM",
+            stream(
+                "btcusdt@depth10@100ms",
+                {
+                    "e": "depthUpdate",
+                    "E": START,
+                    "s": "BTCUSDT",
+                    "U": 96,
+                    "u": 102,
+                    "pu": 95,
+                    "b": [["29999.9", "3.0"]],
+                    "a": [["30000.1", "4.0"]],
+                },
+            ),
+        ),
+    )
+    path = tmp_path / "capture.jsonl"
+    with open(file=path, mode="w", encoding="utf-8") as f:
+        for kind, message in messages:
+            f.write(json.dumps({"kind": kind, "message": message}) + "\n")
+    before = layout["right_left"].renderable
+    live = FakeLive()
+    renderer = DisplayRenderer(layout=layout, frame_rate=4.0, live=live)
+    summary, _ = replay(file_input, str(path), renderer=renderer)
+    assert summary["messages"] == 401
+    assert renderer.renders[BOOK_PANEL] == 1
+    assert live.refreshes >= 1
+    assert layout["right_left"].renderable is not before
@@ -0,0 +1,70 @@
+import pytest
+
+from benchmarks.bench_responses import POSITION_RISK, create_account
+from network.responses.responses import (
+    AccountInfoResponse,
+    CompactAccountInfoResponse,
+    CompactPositionInformationResponse,
+    PositionInformationResponse,
+)
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "totalMaintMargin",
+        "totalWalletBalance",
+        "totalCrossWalletBalance",
+        "availableBalance",
+        "canTrade",
+        "tradeGroupId",
+    ],
+)
+def test_compact_account_matches_pydantic(name):
+    raw = create_account(3)
+    assert getattr(CompactAccountInfoResponse(raw), name) == getattr(
+        AccountInfoResponse(**raw), name
+    )
+
+
+@pytest.mark.parametrize("name", list(PositionInformationResponse.model_fields))
+def test_compact_position_matches_pydantic(name):
+    assert getattr(CompactPositionInformationResponse(POSITION_RISK), name) == getattr(
+        PositionInformationResponse(**POSITION_RISK), name
+    )
+
+
+def test_compact_account_nested_lists():
+    account_info = CompactAccountInfoResponse(create_account(3))
+    assert [p.symbol for p in account_info.positions] == [
+        "SYM0USDT",
+        "SYM1USDT",
+        "SYM2USDT",
+    ]
+    assert account_info.positions[0].isolated is False
+    assert account_info.positions is account_info.positions
+    assert account_info.assets[0].availableBalance == "1000.00000000"
+
+
+def test_compact_converts_once_and_accepts_updates():
+    position = CompactPositionInformationResponse(POSITION_RISK)
+    assert position.positionAmt == 0.5
+    position.positionAmt = 1.0
+    copy = position.model_copy()
+    copy.positionAmt = 2.0
+    assert position.positionAmt == 1.0
+    assert copy.positionAmt == 2.0
+    assert copy.model_dump()["entryPrice"] == 30000.0
+
+
+def test_compact_projection():
+    account_info = CompactAccountInfoResponse(
+        create_account(3), ["totalMaintMargin", "totalWalletBalance"]
+    )
+    assert account_info.totalWalletBalance == 1000.0
+    assert account_info.model_dump() == {
+        "totalMaintMargin": 0.0,
+        "totalWalletBalance": 1000.0,
+    }
+    with pytest.raises(AttributeError):
+        account_info.availableBalance
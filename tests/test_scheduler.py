@@ -0,0 +1,123 @@
+import threading
+
+import pytest
+
+from data.enums import TriggerReason
+from strategy.scheduler import StrategyScheduler
+
+
+def create_scheduler(**kwargs):
+    params = {
+        "symbol": "BTCUSDT",
+        "tick_size": 0.1,
+        "trigger_ticks": 10,
+        "debounce_seconds": 0.05,
+        "max_staleness_seconds": 5.0,
+    }
+    params.update(kwargs)
+    return StrategyScheduler(**params)
+
+
+def fill_event(symbol: str = "BTCUSDT", execution: str = "TRADE"):
+    return {"e": "ORDER_TRADE_UPDATE", "o": {"s": symbol, "x": execution}}
+
+
+@pytest.mark.parametrize(
+    "events, expected_output",
+    [
+        ([{"e": "aggTrade", "s": "BTCUSDT", "p": "101.0"}], {TriggerReason.PRICE_MOVE}),
+        ([{"e": "aggTrade", "s": "BTCUSDT", "p": "99.0"}], {TriggerReason.PRICE_MOVE}),
+        ([{"e": "aggTrade", "s": "BTCUSDT", "p": "100.9"}], set()),
+        ([{"e": "aggTrade", "s": "ETHUSDT", "p": "200.0"}], set()),
+        ([fill_event()], {TriggerReason.FILL}),
+        ([fill_event(execution="NEW")], set()),
+        ([fill_event(symbol="ETHUSDT")], set()),
+        (
+            [{"e": "ACCOUNT_UPDATE", "a": {"B": [], "P": [{"s": "BTCUSDT"}]}}],
+            {TriggerReason.POSITION},
+        ),
+        (
+            [
+                fill_event(),
+                {"e": "markPriceUpdate", "s": "BTCUSDT", "p": "102.0"},
+                fill_event(),
+            ],
+            {TriggerReason.FILL, TriggerReason.PRICE_MOVE},
+        ),
+    ],
+    ids=[
+        "price_up",
+        "price_down",
+        "price_inside",
+        "other_symbol_price",
+        "fill",
+        "new_order",
+        "other_symbol_fill",
+        "position",
+        "burst",
+    ],
+)
+def test_scheduler_triggers(events, expected_output):
+    scheduler = create_scheduler()
+    scheduler.set_grid_center(100.0)
+    for event in events:
+        scheduler.on_event(event)
+    assert scheduler.pending == expected_output
+
+
+def test_scheduler_coalesces_burst_into_one_run():
+    scheduler = create_scheduler(debounce_seconds=0.1)
+    scheduler.set_grid_center(100.0)
+
+    def burst():
+        for _ in range(20):
+            scheduler.on_event(fill_event())
+
+    thread = threading.Thread(target=burst)
+    thread.start()
+    reasons = scheduler.wait()
+    thread.join()
+    assert reasons == {TriggerReason.FILL}
+    assert scheduler.run_count == 1
+    assert scheduler.pending == set()
+
+
+def test_scheduler_fires_on_staleness():
+    scheduler = create_scheduler(max_staleness_seconds=0.05)
+    assert scheduler.wait() == {TriggerReason.STALENESS}
+
+
+def test_scheduler_stop_releases_wait():
+    scheduler = create_scheduler(max_staleness_seconds=60.0)
+    threading.Timer(0.05, scheduler.stop).start()
+    assert scheduler.wait() == set()
+
+
+def test_scheduler_new_center_clears_price_move():
+    scheduler = create_scheduler()
+    scheduler.set_grid_center(100.0)
+    scheduler.on_price(102.0)
+    scheduler.set_grid_center(102.0)
+    assert scheduler.pending == set()
+
+
+def test_scheduler_keeps_first_trigger_receive_time():
+    now = [0.0]
+    scheduler = create_scheduler(debounce_seconds=0.0, clock=lambda: now[0])
+    scheduler.trigger(TriggerReason.FILL, received_ns=100)
+    scheduler.trigger(TriggerReason.POSITION, received_ns=200)
+    assert scheduler.poll() == {TriggerReason.FILL, TriggerReason.POSITION}
+    assert scheduler.trigger_ns == 100
+    now[0] = 100.0
+    assert scheduler.poll() == {TriggerReason.STALENESS}
+    assert scheduler.trigger_ns is None
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"tick_size": 0.0}, {"trigger_ticks": 0}, {"max_staleness_seconds": 0.0}],
+    ids=["tick_size", "trigger_ticks", "staleness"],
+)
+def test_scheduler_rejects_bad_config(kwargs):
+    with pytest.raises(ValueError):
+        create_scheduler(**kwargs)
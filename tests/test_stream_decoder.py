@@ -0,0 +1,113 @@
+import json
+
+import pytest
+
+from network.stream_decoder import (
+    AccountUpdate,
+    DepthUpdate,
+    StreamDecoder,
+    get_stream_name,
+)
+
+DEPTH = {
+    "e": "depthUpdate",
+    "E": 2,
+    "T": 2,
+    "s": "BTCUSDT",
+    "U": 10,
+    "u": 12,
+    "pu": 9,
+    "b": [["99.5", "1.25"]],
+    "a": [["100.5", "0"]],
+}
+ACCOUNT = {
+    "e": "ACCOUNT_UPDATE",
+    "E": 3,
+    "T": 3,
+    "a": {
+        "m": "ORDER",
+        "B": [{"a": "USDT", "wb": "1000.5", "cw": "999.5", "bc": "0"}],
+        "P": [
+            {
+                "s": "BTCUSDT",
+                "pa": "-0.5",
+                "ep": "30000",
+                "bep": "30010",
+                "cr": "12.5",
+                "up": "-1.5",
+                "mt": "cross",
+                "iw": "0",
+                "ps": "BOTH",
+            }
+        ],
+    },
+}
+
+
+def frame(stream: str, data: dict, separators=(",", ":")) -> str:
+    return json.dumps({"stream": stream, "data": data}, separators=separators)
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        (frame("btcusdt@depth@100ms", DEPTH), "btcusdt@depth@100ms"),
+        (frame("listenkey", ACCOUNT), "listenkey"),
+        ('{"result":null,"id":1}', ""),
+    ],
+    ids=["depth", "user_data", "ack"],
+)
+def test_get_stream_name(message, expected):
+    assert get_stream_name(message) == expected
+
+
+@pytest.mark.parametrize(
+    "separators", [(",", ":"), (", ", ": ")], ids=["compact", "spaced"]
+)
+def test_decode_depth_update(separators):
+    stream, data = StreamDecoder().decode(
+        frame("btcusdt@depth@100ms", DEPTH, separators)
+    )
+    assert stream == "btcusdt@depth@100ms"
+    assert data == DepthUpdate("BTCUSDT", 2, 2, 10, 12, 9, [[99.5, 1.25]], [[100.5, 0.0]])
+
+
+def test_decode_account_update():
+    _, data = StreamDecoder().decode(frame("listenkey", ACCOUNT))
+    assert isinstance(data, AccountUpdate)
+    assert data.reason == "ORDER"
+    assert data.balances[0].wallet_balance == 1000.5
+    assert data.balances[0].cross_wallet_balance == 999.5
+    position = data.positions[0]
+    assert (position.symbol, position.position_side) == ("BTCUSDT", "BOTH")
+    assert position.position_amount == -0.5
+    assert position.break_even_price == 30010.0
+    assert position.accumulated_realized == 12.5
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"e": "ORDER_TRADE_UPDATE", "o": {"s": "BTCUSDT"}},
+        {"e": "markPriceUpdate", "s": "BTCUSDT", "p": "1"},
+    ],
+    ids=["order_trade_update", "mark_price"],
+)
+def test_decode_passes_other_events_through(data):
+    assert StreamDecoder().decode(frame("btcusdt@markPrice", data)) == (
+        "btcusdt@markPrice",
+        data,
+    )
+
+
+def test_decode_skips_frames_without_stream():
+    assert StreamDecoder().decode('{"result":null,"id":1}') == ("", None)
+
+
+def test_decode_registered_decoder():
+    decoder = StreamDecoder()
+    decoder.register("@markPrice", lambda data: float(data["p"]))
+    assert decoder.decode(frame("btcusdt@markPrice", {"p": "1.5"})) == (
+        "btcusdt@markPrice",
+        1.5,
+    )
@@ -0,0 +1,91 @@
+import os
+import time
+
+from base.models.AccountInput import AccountInput
+from supervisor import Supervisor, WorkerSpec, shard_accounts
+
+STRATEGY = {
+    "once": True,
+    "use_mark_price": True,
+    "delay_seconds": 20.0,
+    "symbol": "BTCUSDT",
+    "strategy": "FIXED_RANGE",
+    "position_side": "LONG",
+}
+
+
+def create_account(name: str, symbols: list[str]):
+    return AccountInput(
+        name=name,
+        key="key",
+        secret="secret",
+        strategies=[{**STRATEGY, "symbol": symbol} for symbol in symbols],
+    )
+
+
+def crash_once_worker(spec, status_queue, report_seconds) -> None:
+    marker = os.path.join(os.environ["SUPERVISOR_TEST_DIR"], spec.name)
+    status_queue.put(
+        {
+            "worker": spec.name,
+            "account": spec.account.name,
+            "wallet_balance": 100.0,
+            "headroom": 0.5,
+            "symbols": {
+                s.symbol.name: {"unrealized_profit": 1.0} for s in spec.strategies
+            },
+        }
+    )
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        os._exit(1)
+
+
+def test_shard_accounts_runs_one_worker_per_account():
+    specs = shard_accounts(
+        [
+            create_account("a", ["BTCUSDT", "ETHUSDT", "SOLUSDT"]),
+            create_account("b", ["BTCUSDT"]),
+            create_account("c", ["ETHUSDT"]),
+        ],
+        cores=[0, 1],
+    )
+    assert [[s.symbol.name for s in spec.strategies] for spec in specs] == [
+        ["BTCUSDT", "ETHUSDT", "SOLUSDT"],
+        ["BTCUSDT"],
+        ["ETHUSDT"],
+    ]
+    assert [spec.name for spec in specs] == ["a", "b", "c"]
+    assert [spec.core for spec in specs] == [0, 1, 0]
+
+
+def test_shard_accounts_without_pinning():
+    specs = shard_accounts([create_account("a", ["BTCUSDT"])], cores=[])
+    assert specs[0].core is None
+
+
+def test_supervisor_restarts_crashed_workers(tmp_path, monkeypatch):
+    monkeypatch.setenv("SUPERVISOR_TEST_DIR", str(tmp_path))
+    specs = [
+        WorkerSpec(name="a-0", account=create_account("a", ["BTCUSDT"]), strategies=[]),
+        WorkerSpec(
+            name="b-0",
+            account=create_account("b", ["ETHUSDT"]),
+            strategies=create_account("b", ["ETHUSDT"]).strategies,
+        ),
+    ]
+    supervisor = Supervisor(
+        specs=specs, restart_seconds=0.01, target=crash_once_worker
+    ).start()
+    deadline = time.monotonic() + 30.0
+    try:
+        while supervisor.poll() and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        supervisor.stop()
+    assert supervisor.finished == {"a-0", "b-0"}
+    assert supervisor.restarts == {"a-0": 1, "b-0": 1}
+    status = supervisor.aggregate()
+    assert status["wallet_balance"] == 200.0
+    assert status["unrealized_profit"] == 1.0
+    assert status["min_headroom"] == 0.5
@@ -0,0 +1,224 @@
+import asyncio
+import time
+
+import pytest
+
+from data.enums import PositionSide, Side, TickerSymbol, TimeInForce
+from mock_exchange.exchange import MockExchange, MockExchangeConfig
+from network.order_encoder import BatchOrderEncoder
+from network.rate_limiter import RateLimiter
+from network.ws_order_client import DISCONNECTED, WebsocketOrderClient, sign_params
+from repository.ws_repository import WebsocketTradeRepo
+from utils.orderutils import create_order
+
+
+def limit_order(price: float, quantity: float = 0.001) -> dict:
+    return create_order(
+        symbol=TickerSymbol.BTCUSDT,
+        side=Side.BUY,
+        quantity=quantity,
+        position_side=PositionSide.LONG,
+        price=price,
+        time_in_force=TimeInForce.GTC,
+    )
+
+
+class FakeRestRepo:
+    def __init__(self) -> None:
+        self.calls = []
+        self.rate_limiter = RateLimiter(clock=lambda: 0.0)
+        self.encoder = BatchOrderEncoder()
+
+    def new_order(self, **kwargs) -> dict:
+        self.rate_limiter.acquire(weight=0, orders=1)
+        self.calls.append(("new_order", kwargs))
+        return {"orderId": -1, "status": "NEW"}
+
+    def new_batch_order(self, orders: list) -> list[dict]:
+        self.rate_limiter.acquire(weight=5, orders=len(orders))
+        self.calls.append(("new_batch_order", orders))
+        return [{"orderId": -1, "status": "NEW"} for _ in orders]
+
+    def modify_batch_order(self, orders: list) -> list[dict]:
+        self.calls.append(("modify_batch_order", orders))
+        return [{"orderId": -1, "status": "NEW"} for _ in orders]
+
+    def cancel_batch_order(self, symbol: TickerSymbol, order_ids: list[int]):
+        self.calls.append(("cancel_batch_order", order_ids))
+        return [{"orderId": i, "status": "CANCELED"} for i in order_ids]
+
+    def get_time(self) -> int:
+        return 0
+
+
+class FakeOrderClient:
+    def __init__(self, responses: list[dict]) -> None:
+        self.connected = True
+        self.responses = responses
+        self.requests = []
+
+    def request_many(self, method: str, params_list: list[dict]) -> list[dict]:
+        self.requests.append((method, params_list))
+        return self.responses[: len(params_list)]
+
+
+@pytest.fixture
+def exchange():
+    exchange = MockExchange(
+        config=MockExchangeConfig(
+            market_seconds=0.0, latency_seconds=0.005, jitter_seconds=0.02, seed=1
+        )
+    ).start()
+    yield exchange
+    exchange.stop()
+
+
+@pytest.fixture
+def client(exchange):
+    client = WebsocketOrderClient(
+        key="mock-key",
+        secret="mock-secret",
+        url=exchange.ws_api_url,
+        reconnect_seconds=0.05,
+    ).start()
+    assert client.wait_connected(5.0)
+    yield client
+    client.stop()
+
+
+def test_sign_params_sorts_keys():
+    assert sign_params("s", {"b": "2", "a": "1"}) == sign_params(
+        "s", {"a": "1", "b": "2"}
+    )
+
+
+def test_pipelined_requests_are_correlated_by_id(client):
+    prices = [29000.0 - i for i in range(20)]
+    orders = [
+        {key: str(getattr(value, "value", value)) for key, value in order.items()}
+        for order in map(limit_order, prices)
+    ]
+    responses = client.request_many("order.place", orders)
+    assert [float(r["price"]) for r in responses] == prices
+    assert all(r["status"] == "NEW" for r in responses)
+
+
+@pytest.mark.parametrize(
+    "method, key, secret, expected_output",
+    [
+        ("order.place", "wrong-key", "mock-secret", -2015),
+        ("order.place", "mock-key", "wrong-secret", -1022),
+        ("order.missing", "mock-key", "mock-secret", -1100),
+    ],
+    ids=["api_key", "signature", "method"],
+)
+def test_request_errors(exchange, method, key, secret, expected_output):
+    client = WebsocketOrderClient(key=key, secret=secret, url=exchange.ws_api_url)
+    client.start()
+    try:
+        assert client.wait_connected(5.0)
+        order = {"symbol": "BTCUSDT", "side": "BUY", "type": "LIMIT"}
+        response = client.request_many(method, [order])[0]
+        assert response["code"] == expected_output
+    finally:
+        client.stop()
+
+
+def test_repo_places_modifies_and_cancels(client):
+    repo = WebsocketTradeRepo(repo=FakeRestRepo(), client=client)
+    placed = repo.new_batch_order(orders=[limit_order(29000.0), limit_order(28990.0)])
+    assert [r["status"] for r in placed] == ["NEW", "NEW"]
+    amend = {
+        "orderId": placed[0]["orderId"],
+        "symbol": TickerSymbol.BTCUSDT,
+        "side": Side.BUY,
+        "quantity": 0.002,
+        "price": 28950.0,
+    }
+    assert float(repo.modify_batch_order(orders=[amend])[0]["price"]) == 28950.0
+    order_ids = [r["orderId"] for r in placed]
+    canceled = repo.cancel_batch_order(TickerSymbol.BTCUSDT, order_ids)
+    assert [r["status"] for r in canceled] == ["CANCELED", "CANCELED"]
+    assert repo.fallbacks == 0
+    assert repo.repo.calls == []
+    assert repo.get_time() == 0
+
+
+def test_repo_falls_back_to_rest_when_disconnected(exchange, client):
+    asyncio.run_coroutine_threadsafe(exchange.close_api_sockets(), exchange.loop)
+    client.stop()
+    repo = WebsocketTradeRepo(repo=FakeRestRepo(), client=client)
+    responses = repo.new_batch_order(orders=[limit_order(29000.0)])
+    assert responses == [{"orderId": -1, "status": "NEW"}]
+    assert repo.fallbacks == 1
+    assert repo.repo.calls[0][0] == "new_batch_order"
+
+
+def test_client_reconnects(exchange, client):
+    asyncio.run_coroutine_threadsafe(
+        exchange.close_api_sockets(), exchange.loop
+    ).result()
+    for _ in range(100):
+        if client.reconnects and client.connected:
+            break
+        time.sleep(0.05)
+    assert client.reconnects >= 1
+    assert client.wait_connected(5.0)
+    order = {"symbol": "BTCUSDT", "orderId": "123"}
+    assert client.request_many("order.cancel", [order])[0]["code"] == -2011
+
+
+def test_repo_formats_single_orders_at_symbol_precision():
+    client = FakeOrderClient([{"orderId": 1, "status": "NEW"}])
+    repo = WebsocketTradeRepo(repo=FakeRestRepo(), client=client)
+    repo.encoder.set_increments(TickerSymbol.BTCUSDT, tick_size=0.1, step_size=1e-05)
+    repo.new_order(
+        symbol=TickerSymbol.BTCUSDT,
+        side=Side.BUY,
+        quantity=0.30000000000000004,
+        position_side=PositionSide.LONG,
+        price=29000.100000000002,
+    )
+    repo.new_order(
+        symbol=TickerSymbol.BTCUSDT,
+        side=Side.BUY,
+        quantity=5e-05,
+        position_side=PositionSide.LONG,
+        price=29000.0,
+    )
+    assert [params[0] for _, params in client.requests] == [
+        {
+            "symbol": "BTCUSDT",
+            "side": "BUY",
+            "positionSide": "LONG",
+            "type": "LIMIT",
+            "quantity": "0.3",
+            "timeInForce": "GTC",
+            "price": "29000.1",
+        },
+        {
+            "symbol": "BTCUSDT",
+            "side": "BUY",
+            "positionSide": "LONG",
+            "type": "LIMIT",
+            "quantity": "0.00005",
+            "timeInForce": "GTC",
+            "price": "29000.0",
+        },
+    ]
+
+
+def test_repo_fallback_spends_order_budget_once():
+    client = FakeOrderClient([{"orderId": 1, "status": "NEW"}, DISCONNECTED])
+    repo = WebsocketTradeRepo(repo=FakeRestRepo(), client=client)
+    limiter = repo.rate_limiter
+    responses = repo.new_batch_order(
+        orders=[limit_order(29000.0), limit_order(28990.0)]
+    )
+    assert responses == [
+        {"orderId": 1, "status": "NEW"},
+        {"orderId": -1, "status": "NEW"},
+    ]
+    bucket = limiter.buckets["ORDERS-10S"]
+    assert bucket.limit - bucket.tokens == 2
+    assert repo.repo.calls[0] == ("new_batch_order", [client.requests[0][1][1]])
@@ -1,11 +1,70 @@
 import json
+from base.models.AccountInput import AccountInput
 from base.models.FileInput import FileInput
+from data.enums import ExecutorBackend, OrderTransport
 
+PROCESS_FIELDS = (
+    "executor_backend",
+    "executor_workers",
+    "display_frame_rate",
+    "metrics_port",
+    "metrics_summary_seconds",
+    "record",
+    "record_directory",
+)
 
-def get_inputs_from_file(
+
+def check_inputs(file_inputs: list[FileInput], name: str) -> list[FileInput]:
+    if not file_inputs:
+        raise ValueError(f"{name} has no strategies")
+    symbols = [i.symbol for i in file_inputs]
+    if len(set(symbols)) != len(symbols):
+        raise ValueError(f"{name} has more than one strategy for a symbol")
+    for field in PROCESS_FIELDS:
+        if len({getattr(i, field) for i in file_inputs}) > 1:
+            raise ValueError(f"{name} strategies must share the same {field}")
+    for i in file_inputs:
+        if (
+            i.order_transport is OrderTransport.WEBSOCKET
+            and i.executor_backend is not ExecutorBackend.THREAD
+        ):
+            raise ValueError(
+                f"{name} uses WEBSOCKET order_transport, which needs the THREAD"
+                f" executor_backend, not {i.executor_backend.name}"
+            )
+    return file_inputs
+
+
+def get_all_inputs_from_file(
     file_name: str = "my_trading.json",
-) -> FileInput:
+) -> list[FileInput]:
     with open(file=file_name, mode="r", encoding="utf-8-sig") as f:
         read = f.read()
         data = json.loads(read)
-        return FileInput(**data)
+    if isinstance(data, dict) and "strategies" in data:
+        shared = {k: v for k, v in data.items() if k in PROCESS_FIELDS}
+        data = [{**shared, **i} for i in data["strategies"]]
+    elif isinstance(data, dict):
+        data = [data]
+    return check_inputs([FileInput(**i) for i in data], file_name)
+
+
+def get_accounts_from_file(
+    file_name: str = "accounts.json",
+) -> list[AccountInput]:
+    with open(file=file_name, mode="r", encoding="utf-8-sig") as f:
+        read = f.read()
+        data = json.loads(read)
+    accounts = [AccountInput(**i) for i in data]
+    names = [account.name for account in accounts]
+    if len(set(names)) != len(names):
+        raise ValueError(f"{file_name} has duplicate account names")
+    for account in accounts:
+        check_inputs(account.strategies, f"{file_name}:{account.name}")
+    return accounts
+
+
+def get_inputs_from_file(
+    file_name: str = "my_trading.json",
+) -> FileInput:
+    return get_all_inputs_from_file(file_name=file_name)[0]
@@ -1,3 +1,6 @@
+from decimal import Decimal
+from functools import lru_cache
+
 import numpy as np
 
 from data.enums import PositionSide
@@ -39,8 +42,9 @@ def get_scaled_mults(scaled: list[float], sum_scaled: float) -> list[float]:
 
 
 def make_it_smaller(total_amount: float, final_scaled: list[float]) -> list[float]:
-    while sum(final_scaled) > total_amount:
-        final_scaled[-1] -= sum(final_scaled) - total_amount
+    excess = sum(final_scaled) - total_amount
+    if excess > 0.0:
+        final_scaled[-1] -= excess
     return final_scaled
 
 
@@ -108,3 +112,92 @@ def cost_to_open_position(
         min(0, direction_of_order * (mark_price - order_price))
     )
     return round(initial_margin + open_loss, precision)
+
+
+@lru_cache(maxsize=None)
+def get_increment_scale(increment: float) -> tuple[int, int]:
+    if increment <= 0.0:
+        raise ValueError("increment must be greater than 0.0")
+    decimals = max(-Decimal(str(increment)).normalize().as_tuple().exponent, 0)
+    scale = 10**decimals
+    return scale, round(increment * scale)
+
+
+def to_ticks(values, increment: float, mode: str = "nearest") -> np.ndarray:
+    scale, units = get_increment_scale(increment)
+    scaled = np.asarray(values, dtype=np.float64) * scale / units
+    if mode == "floor":
+        scaled = np.floor(scaled + 1e-9)
+    elif mode == "ceil":
+        scaled = np.ceil(scaled - 1e-9)
+    else:
+        scaled = np.rint(scaled)
+    return scaled.astype(np.int64)
+
+
+def from_ticks(ticks, increment: float) -> np.ndarray:
+    scale, units = get_increment_scale(increment)
+    return np.asarray(ticks, dtype=np.int64) * units / scale
+
+
+def round_to_increment(values, increment: float, mode: str = "nearest"):
+    result = from_ticks(to_ticks(values, increment, mode), increment)
+    return float(result) if result.ndim == 0 else result
+
+
+def get_scale_weights(volume_scale: float, num: int) -> np.ndarray:
+    if volume_scale <= 0.0:
+        raise ValueError("volume_scale must be greater than 0.0")
+    if num <= 0:
+        raise ValueError("num must be greater than 0")
+    exponents = np.arange(num, dtype=np.float64)
+    if volume_scale > 1.0:
+        exponents -= num - 1
+    weights = np.exp(exponents * np.log(volume_scale))
+    return weights / weights.sum()
+
+
+def get_capped_shares(weights: np.ndarray, total: int, caps) -> np.ndarray:
+    caps = np.broadcast_to(np.asarray(caps, dtype=np.float64), weights.shape)
+    total = min(total, caps.sum())
+    if total <= 0:
+        return np.zeros(len(weights), dtype=np.float64)
+    order = np.argsort(caps / weights, kind="stable")
+    ratios = caps[order] / weights[order]
+    capped_total = np.concatenate(([0.0], np.cumsum(caps[order])[:-1]))
+    uncapped = np.cumsum(weights[order][::-1])[::-1]
+    scales = (total - capped_total) / uncapped
+    capped = int(np.argmax(scales <= ratios * (1.0 + 1e-12) + 1e-9))
+    return np.minimum(weights * scales[capped], caps)
+
+
+def get_scaled_quantities(
+    total_amount: float,
+    volume_scale: float,
+    num: int,
+    step_size: float,
+    min_quantity: float = 0.0,
+    max_quantity: float | np.ndarray = np.inf,
+) -> np.ndarray:
+    if total_amount < 0.0:
+        raise ValueError("total_amount must be positive")
+    total_steps = int(to_ticks(total_amount, step_size, "floor"))
+    min_steps = max(int(to_ticks(min_quantity, step_size, "ceil")), 1)
+    num = min(num, total_steps // min_steps)
+    if num <= 0:
+        return np.empty(0, dtype=np.float64)
+    remaining = total_steps - num * min_steps
+    weights = get_scale_weights(volume_scale, num)
+    if not np.all(np.isinf(max_quantity)):
+        max_quantities = np.minimum(max_quantity, total_amount)
+        if np.ndim(max_quantities):
+            max_quantities = max_quantities[:num]
+        max_steps = np.maximum(to_ticks(max_quantities, step_size, "floor"), min_steps)
+        shares = get_capped_shares(weights, remaining, max_steps - min_steps)
+    else:
+        shares = weights * remaining
+    steps = np.floor(shares).astype(np.int64)
+    leftover = round(float(shares.sum())) - int(steps.sum())
+    if leftover > 0:
+        steps[np.argsort(steps - shares, kind="stable")[:leftover]] += 1
+    return from_ticks(steps + min_steps, step_size)
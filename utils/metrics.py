@@ -0,0 +1,261 @@
+import functools
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+
+from base.helpers import Singleton
+
+SUB_BUCKET_BITS = 7
+SUB_BUCKET_HALF = 1 << (SUB_BUCKET_BITS - 1)
+MAX_VALUE_BITS = 44
+BUCKETS = (MAX_VALUE_BITS - SUB_BUCKET_BITS + 2) * SUB_BUCKET_HALF
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+TICK_TO_ORDER = "tick_to_order"
+RATE_LIMIT_HEADROOM = "rate_limit.headroom"
+
+
+def get_bucket_index(value: int) -> int:
+    bits = value.bit_length()
+    if bits <= SUB_BUCKET_BITS:
+        return value
+    if bits > MAX_VALUE_BITS:
+        return BUCKETS - 1
+    exponent = bits - SUB_BUCKET_BITS
+    return exponent * SUB_BUCKET_HALF + (value >> exponent)
+
+
+def get_bucket_upper_bound(index: int) -> int:
+    if index < 2 * SUB_BUCKET_HALF:
+        return index
+    exponent = index // SUB_BUCKET_HALF - 1
+    return ((index - exponent * SUB_BUCKET_HALF + 1) << exponent) - 1
+
+
+class LatencyHistogram:
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * BUCKETS
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value_ns: int) -> None:
+        value_ns = max(value_ns, 0)
+        self.counts[get_bucket_index(value_ns)] += 1
+        if not self.count or value_ns < self.min:
+            self.min = value_ns
+        if value_ns > self.max:
+            self.max = value_ns
+        self.count += 1
+        self.total += value_ns
+
+    def percentile(self, percentile: float) -> int:
+        if not self.count:
+            return 0
+        target = max(1, int(self.count * percentile / 100.0 + 0.5))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(get_bucket_upper_bound(index), self.max)
+        return self.max
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if not other.count:
+            return
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.min = min(self.min, other.min) if self.count else other.min
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+
+class EndpointStats:
+    __slots__ = ("histogram", "errors", "bytes")
+
+    def __init__(self) -> None:
+        self.histogram = LatencyHistogram()
+        self.errors = 0
+        self.bytes = 0
+
+    def summary(self) -> dict[str, Any]:
+        histogram = self.histogram
+        summary = {
+            "count": histogram.count,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "mean_us": histogram.mean() / 1000.0,
+            "min_us": histogram.min / 1000.0,
+            "max_us": histogram.max / 1000.0,
+        }
+        for percentile in PERCENTILES:
+            summary[f"p{percentile:g}_us"] = histogram.percentile(percentile) / 1000.0
+        return summary
+
+
+class Metrics(metaclass=Singleton):
+    def __init__(self) -> None:
+        self.stats: dict[str, EndpointStats] = {}
+        self.gauges: dict[str, Callable[[], float | dict[str, float]]] = {}
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+    def record(
+        self, name: str, elapsed_ns: int, size: int = 0, error: bool = False
+    ) -> None:
+        with self._lock:
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = EndpointStats()
+            stats.histogram.record(elapsed_ns)
+            stats.bytes += size
+            stats.errors += error
+
+    def get(self, name: str) -> EndpointStats | None:
+        return self.stats.get(name)
+
+    def register_gauge(
+        self, name: str, getter: Callable[[], float | dict[str, float]]
+    ) -> None:
+        with self._lock:
+            self.gauges[name] = getter
+
+    def remove_gauge(self, name: str) -> None:
+        with self._lock:
+            self.gauges.pop(name, None)
+
+    def read_gauges(self) -> dict[str, float]:
+        with self._lock:
+            gauges = sorted(self.gauges.items())
+        values = {}
+        for name, getter in gauges:
+            value = getter()
+            if isinstance(value, dict):
+                values.update({f"{name}.{k}": v for k, v in sorted(value.items())})
+            else:
+                values[name] = value
+        return values
+
+    def summary(self) -> dict[str, Any]:
+        with self._lock:
+            stats = {name: s.summary() for name, s in sorted(self.stats.items())}
+        return {
+            "uptime_seconds": time.time() - self.started_at,
+            "metrics": stats,
+            "gauges": self.read_gauges(),
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stats = {}
+            self.gauges = {}
+            self.started_at = time.time()
+
+
+def timed(name: str) -> Callable:
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter_ns()
+            error = True
+            try:
+                response = function(*args, **kwargs)
+                error = False
+                return response
+            finally:
+                Metrics().record(name, time.perf_counter_ns() - started, error=error)
+
+        return wrapper
+
+    return decorator
+
+
+def record_response(response, *args, **kwargs) -> None:
+    path = response.request.path_url.split("?", 1)[0]
+    Metrics().record(
+        f"http {response.request.method} {path}",
+        int(response.elapsed.total_seconds() * 1e9),
+        size=len(response.content),
+        error=response.status_code >= 400,
+    )
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] not in ["/", "/metrics"]:
+            self.send_error(404)
+            return
+        body = json.dumps(Metrics().summary()).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class MetricsServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int | None = None,
+        summary_seconds: float = 0.0,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.summary_seconds = summary_seconds
+        self.logger = logger if logger is not None else logging.getLogger("metrics")
+        self.server: ThreadingHTTPServer | None = None
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    @property
+    def address(self) -> tuple[str, int] | None:
+        return self.server.server_address[:2] if self.server is not None else None
+
+    def start(self) -> "MetricsServer":
+        self._stop.clear()
+        if self.port is not None:
+            self.server = ThreadingHTTPServer(
+                (self.host, self.port), MetricsRequestHandler
+            )
+            self.server.daemon_threads = True
+            self._threads.append(
+                threading.Thread(
+                    target=self.server.serve_forever, name="metrics-http", daemon=True
+                )
+            )
+        if self.summary_seconds > 0.0:
+            self._threads.append(
+                threading.Thread(
+                    target=self._summary_loop, name="metrics-summary", daemon=True
+                )
+            )
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _summary_loop(self) -> None:
+        while not self._stop.wait(self.summary_seconds):
+            self.logger.info(json.dumps(Metrics().summary()))
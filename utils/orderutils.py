@@ -1,5 +1,7 @@
 from typing import Any
 
+import numpy as np
+
 from data.enums import (
     AmountSpacing,
     OrderType,
@@ -11,7 +13,14 @@ from data.enums import (
     TickerSymbol,
     TimeInForce,
 )
-from utils.mathutils import get_geom_scale, get_linear_scale
+from utils.mathutils import (
+    get_geom_scale,
+    get_linear_scale,
+    get_scaled_quantities,
+    round_to_increment,
+)
+
+ORDER_DTYPE = np.dtype([("price", np.float64), ("quantity", np.float64)])
 
 
 def create_order(
@@ -91,7 +100,42 @@ def create_multiple_orders(
     return result
 
 
-def get_buy_orders_quantities_and_prices(
+def create_orders_from_array(
+    symbol: TickerSymbol,
+    side: Side,
+    orders: np.ndarray,
+    position_side: PositionSide,
+    order_type: OrderType = OrderType.LIMIT,
+    time_in_force: TimeInForce = TimeInForce.GTC,
+) -> list[dict[str, Any]]:
+    return [
+        {
+            "symbol": symbol,
+            "side": side,
+            "type": order_type,
+            "quantity": quantity,
+            "timeInForce": time_in_force,
+            "positionSide": position_side,
+            "price": price,
+        }
+        for price, quantity in zip(
+            orders["price"].tolist(), orders["quantity"].tolist()
+        )
+    ]
+
+
+def create_order_array(prices: np.ndarray, quantities: np.ndarray) -> np.ndarray:
+    orders = np.empty(len(prices), dtype=ORDER_DTYPE)
+    orders["price"] = prices
+    orders["quantity"] = quantities
+    return orders
+
+
+def order_array_to_list(orders: np.ndarray) -> list[tuple[float, float]]:
+    return list(zip(orders["price"].tolist(), orders["quantity"].tolist()))
+
+
+def get_buy_orders_array(
     orders_num: int,
     high_price: float,
     low_price: float,
@@ -107,34 +151,59 @@ def get_buy_orders_quantities_and_prices(
     amount_spacing: AmountSpacing = AmountSpacing.LINEAR,
     market_making: bool = False,
     mm_buy_quantity: float = 0.0,
-) -> list[tuple[float, float]]:
+    tick_size: float = 0.1,
+    step_size: float | None = None,
+    volume_scale: float = 0.0,
+) -> np.ndarray:
     if orders_num == 0:
-        return []
-    prices = get_prices_list(orders_num, high_price, low_price, amount_spacing)
-    order_dollar_amount = available_balance / orders_num
-    quantities_and_prices = []
-    for i in prices:
-        order_price = round(i, 1)
-        max_quantity = max_open_quantity(
+        return np.empty(0, dtype=ORDER_DTYPE)
+    prices = round_to_increment(
+        get_prices_array(orders_num, high_price, low_price, amount_spacing), tick_size
+    )
+    quantities = max_open_quantities(
+        leverage=leverage,
+        available_balance=available_balance / orders_num,
+        order_prices=prices,
+        mark_price=mark_price,
+        max_notional_value=max_notional_value,
+        notional=notional,
+        side=side,
+        precision=precision,
+    )
+    step_size = step_size or 10.0**-precision
+    max_quantity = (
+        min(order_quantity_max, mm_buy_quantity)
+        if market_making
+        else order_quantity_max
+    )
+    if volume_scale > 0.0:
+        total_amount = round_to_increment(
+            np.maximum(quantities, order_quantity_min), step_size
+        ).sum()
+        level_quantities = max_open_quantities(
             leverage=leverage,
-            available_balance=order_dollar_amount,
-            order_price=order_price,
+            available_balance=available_balance,
+            order_prices=prices,
             mark_price=mark_price,
             max_notional_value=max_notional_value,
             notional=notional,
             side=side,
             precision=precision,
         )
-        order_quantity = (
-            min(mm_buy_quantity, max_quantity) if market_making else max_quantity
-        )
-        order_quantity = min(order_quantity, order_quantity_max)
-        order_quantity = max(order_quantity, order_quantity_min)
-        quantities_and_prices.append((order_price, round(order_quantity, precision)))
-    return quantities_and_prices
+        quantities = get_scaled_quantities(
+            total_amount=float(total_amount),
+            volume_scale=volume_scale,
+            num=orders_num,
+            step_size=step_size,
+            min_quantity=order_quantity_min,
+            max_quantity=np.minimum(level_quantities, max_quantity)[::-1],
+        )[::-1]
+        return create_order_array(prices[len(prices) - len(quantities) :], quantities)
+    quantities = np.maximum(np.minimum(quantities, max_quantity), order_quantity_min)
+    return create_order_array(prices, round_to_increment(quantities, step_size))
 
 
-def get_sell_orders_quantities_and_prices(
+def get_sell_orders_array(
     orders_num: int,
     high_price: float,
     low_price: float,
@@ -143,13 +212,31 @@ def get_sell_orders_quantities_and_prices(
     amount_spacing: AmountSpacing = AmountSpacing.LINEAR,
     market_making: bool = False,
     mm_sell_quantity: float = 0.0,
-) -> list[tuple[float, float]]:
+    tick_size: float = 0.1,
+    step_size: float = 0.001,
+    volume_scale: float = 0.0,
+) -> np.ndarray:
     if orders_num < 0:
         raise ValueError("orders_num must be positive")
     if amount < 0.0:
         raise ValueError("amount must be positive")
     if orders_num == 0 or amount < order_quantity_min:
-        return []
+        return np.empty(0, dtype=ORDER_DTYPE)
+    if volume_scale > 0.0:
+        quantities = get_scaled_quantities(
+            total_amount=amount,
+            volume_scale=volume_scale,
+            num=orders_num,
+            step_size=step_size,
+            min_quantity=max(mm_sell_quantity, order_quantity_min)
+            if market_making
+            else order_quantity_min,
+        )
+        prices = round_to_increment(
+            get_prices_array(len(quantities), high_price, low_price, amount_spacing),
+            tick_size,
+        )
+        return create_order_array(prices, quantities)
     order_amount = max(
         max(mm_sell_quantity, (amount / orders_num))
         if market_making
@@ -157,8 +244,109 @@ def get_sell_orders_quantities_and_prices(
         order_quantity_min,
     )
     orders_num = int(amount / order_amount)
-    prices = get_prices_list(orders_num, high_price, low_price, amount_spacing)
-    return [(round(i, 1), round(order_amount, 3)) for i in prices]
+    prices = round_to_increment(
+        get_prices_array(orders_num, high_price, low_price, amount_spacing), tick_size
+    )
+    return create_order_array(
+        prices, np.full(orders_num, round_to_increment(order_amount, step_size))
+    )
+
+
+def get_buy_orders_quantities_and_prices(
+    orders_num: int,
+    high_price: float,
+    low_price: float,
+    available_balance: float,
+    leverage: int,
+    mark_price: float,
+    max_notional_value: float,
+    notional: float,
+    side: PositionSide,
+    precision: int,
+    order_quantity_min: float,
+    order_quantity_max: float,
+    amount_spacing: AmountSpacing = AmountSpacing.LINEAR,
+    market_making: bool = False,
+    mm_buy_quantity: float = 0.0,
+    tick_size: float = 0.1,
+    step_size: float | None = None,
+    volume_scale: float = 0.0,
+) -> list[tuple[float, float]]:
+    return order_array_to_list(
+        get_buy_orders_array(
+            orders_num=orders_num,
+            high_price=high_price,
+            low_price=low_price,
+            available_balance=available_balance,
+            leverage=leverage,
+            mark_price=mark_price,
+            max_notional_value=max_notional_value,
+            notional=notional,
+            side=side,
+            precision=precision,
+            order_quantity_min=order_quantity_min,
+            order_quantity_max=order_quantity_max,
+            amount_spacing=amount_spacing,
+            market_making=market_making,
+            mm_buy_quantity=mm_buy_quantity,
+            tick_size=tick_size,
+            step_size=step_size,
+            volume_scale=volume_scale,
+        )
+    )
+
+
+def get_sell_orders_quantities_and_prices(
+    orders_num: int,
+    high_price: float,
+    low_price: float,
+    amount: float,
+    order_quantity_min: float = -1.0,
+    amount_spacing: AmountSpacing = AmountSpacing.LINEAR,
+    market_making: bool = False,
+    mm_sell_quantity: float = 0.0,
+    tick_size: float = 0.1,
+    step_size: float = 0.001,
+    volume_scale: float = 0.0,
+) -> list[tuple[float, float]]:
+    return order_array_to_list(
+        get_sell_orders_array(
+            orders_num=orders_num,
+            high_price=high_price,
+            low_price=low_price,
+            amount=amount,
+            order_quantity_min=order_quantity_min,
+            amount_spacing=amount_spacing,
+            market_making=market_making,
+            mm_sell_quantity=mm_sell_quantity,
+            tick_size=tick_size,
+            step_size=step_size,
+            volume_scale=volume_scale,
+        )
+    )
+
+
+def max_open_quantities(
+    leverage: int,
+    available_balance: float,
+    order_prices: np.ndarray,
+    mark_price: float,
+    max_notional_value: float,
+    notional: float,
+    side: PositionSide,
+    precision: int,
+) -> np.ndarray:
+    sign = 1.0 if side == PositionSide.LONG else -1.0
+    leveraged_balance = float(leverage) * available_balance
+    leveraged_order_mark_diff = sign * leverage * (order_prices - mark_price)
+    leveraged_gap = order_prices + np.maximum(leveraged_order_mark_diff, 0.0)
+    remaining_notional = max_notional_value - notional
+    return np.round(
+        np.minimum(
+            leveraged_balance / leveraged_gap, remaining_notional / order_prices
+        ),
+        precision,
+    )
 
 
 def max_open_quantity(
@@ -199,3 +387,15 @@ def get_prices_list(
             orders_num=orders_num, high_price=high_price, low_price=low_price
         )
     )
+
+
+def get_prices_array(
+    orders_num: int, high_price: float, low_price: float, amount_spacing: AmountSpacing
+) -> np.ndarray:
+    if amount_spacing is AmountSpacing.LINEAR:
+        return np.linspace(
+            start=low_price, stop=high_price, num=orders_num, dtype=np.float64
+        )
+    return np.geomspace(
+        start=low_price, stop=high_price, num=orders_num, dtype=np.float64
+    )
@@ -0,0 +1,147 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from utils.mathutils import round_to_increment
+
+
+@dataclass
+class ReconcilePlan:
+    cancels: list[int] = field(default_factory=list)
+    amends: list[dict[str, Any]] = field(default_factory=list)
+    new_orders: list[dict[str, Any]] = field(default_factory=list)
+    kept: list[int] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (self.cancels or self.amends or self.new_orders)
+
+
+def enum_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def order_key(side: Any, position_side: Any) -> tuple[str, str]:
+    return str(enum_value(side)), str(enum_value(position_side))
+
+
+def open_order_remaining_quantity(open_order: dict[str, Any]) -> float:
+    return float(open_order["origQty"]) - float(open_order.get("executedQty", 0.0))
+
+
+def is_reconcilable_open_order(open_order: dict[str, Any]) -> bool:
+    return open_order.get("type", "LIMIT") == "LIMIT" and open_order.get(
+        "priceMatch", "NONE"
+    ) in ["NONE", None]
+
+
+def group_target_orders(
+    target_orders: list[dict[str, Any]]
+) -> dict[tuple[str, str], list[dict[str, Any]]]:
+    groups: dict[tuple[str, str], list[dict[str, Any]]] = {}
+    for order in target_orders:
+        key = order_key(order["side"], order["positionSide"])
+        groups.setdefault(key, []).append(order)
+    for orders in groups.values():
+        orders.sort(key=lambda o: float(o["price"]))
+    return groups
+
+
+def group_open_orders(
+    open_orders: list[dict[str, Any]]
+) -> dict[tuple[str, str], list[dict[str, Any]]]:
+    groups: dict[tuple[str, str], list[dict[str, Any]]] = {}
+    for order in open_orders:
+        key = order_key(order["side"], order.get("positionSide", "BOTH"))
+        groups.setdefault(key, []).append(order)
+    for orders in groups.values():
+        orders.sort(key=lambda o: float(o["price"]))
+    return groups
+
+
+def create_amend(
+    open_order: dict[str, Any], target_order: dict[str, Any], step_size: float = 0.001
+) -> dict[str, Any]:
+    executed_quantity = float(open_order.get("executedQty", 0.0))
+    return {
+        "orderId": open_order["orderId"],
+        "symbol": open_order["symbol"],
+        "side": open_order["side"],
+        "quantity": round_to_increment(
+            float(target_order["quantity"]) + executed_quantity, step_size
+        ),
+        "price": float(target_order["price"]),
+    }
+
+
+def match_side(
+    targets: list[dict[str, Any]],
+    opens: list[dict[str, Any]],
+    price_tolerance: float,
+    quantity_tolerance: float,
+    plan: ReconcilePlan,
+    step_size: float = 0.001,
+) -> None:
+    unmatched_targets = []
+    unmatched_opens = []
+    i = j = 0
+    while i < len(targets) and j < len(opens):
+        target_price = float(targets[i]["price"])
+        open_price = float(opens[j]["price"])
+        if abs(target_price - open_price) <= price_tolerance:
+            quantity_diff = float(targets[i]["quantity"]) - open_order_remaining_quantity(
+                opens[j]
+            )
+            if abs(quantity_diff) <= quantity_tolerance:
+                plan.kept.append(opens[j]["orderId"])
+            else:
+                plan.amends.append(create_amend(opens[j], targets[i], step_size))
+            i += 1
+            j += 1
+        elif target_price < open_price:
+            unmatched_targets.append(targets[i])
+            i += 1
+        else:
+            unmatched_opens.append(opens[j])
+            j += 1
+    unmatched_targets.extend(targets[i:])
+    unmatched_opens.extend(opens[j:])
+    amend_num = min(len(unmatched_targets), len(unmatched_opens))
+    plan.amends.extend(
+        create_amend(open_order, target_order, step_size)
+        for open_order, target_order in zip(
+            unmatched_opens[:amend_num], unmatched_targets[:amend_num]
+        )
+    )
+    plan.cancels.extend(o["orderId"] for o in unmatched_opens[amend_num:])
+    plan.new_orders.extend(unmatched_targets[amend_num:])
+
+
+def reconcile_orders(
+    target_orders: list[dict[str, Any]],
+    open_orders: list[dict[str, Any]],
+    price_tolerance: float = 0.0,
+    quantity_tolerance: float = 0.0,
+    step_size: float = 0.001,
+) -> ReconcilePlan:
+    if price_tolerance < 0.0:
+        raise ValueError("price_tolerance must be positive")
+    if quantity_tolerance < 0.0:
+        raise ValueError("quantity_tolerance must be positive")
+    plan = ReconcilePlan()
+    plan.cancels.extend(
+        o["orderId"] for o in open_orders if not is_reconcilable_open_order(o)
+    )
+    target_groups = group_target_orders(target_orders)
+    open_groups = group_open_orders(
+        [o for o in open_orders if is_reconcilable_open_order(o)]
+    )
+    for key in sorted(target_groups.keys() | open_groups.keys()):
+        match_side(
+            targets=target_groups.get(key, []),
+            opens=open_groups.get(key, []),
+            price_tolerance=price_tolerance,
+            quantity_tolerance=quantity_tolerance,
+            plan=plan,
+            step_size=step_size,
+        )
+    return plan
@@ -8,3 +8,34 @@ def get_timestamp():
 
 def get_date_and_time() -> str:
     return f"{datetime.datetime.now().strftime('%d/%m/%Y %H:%M:%S')}"
+
+
+class VirtualClock:
+    def __init__(self, speed: float = 1.0, sleep=time.sleep, wall=time.monotonic):
+        if speed < 0.0:
+            raise ValueError("speed must not be negative")
+        self.speed = speed
+        self.sleep = sleep
+        self.wall = wall
+        self.now_ns = 0
+        self._start_ns: int | None = None
+        self._start_wall = 0.0
+
+    def advance_to(self, timestamp_ns: int) -> None:
+        if self._start_ns is None:
+            self._start_ns = timestamp_ns
+            self._start_wall = self.wall()
+        self.now_ns = max(self.now_ns, timestamp_ns)
+        if self.speed > 0.0:
+            target = self._start_wall + (self.now_ns - self._start_ns) / 1e9 / self.speed
+            delay = target - self.wall()
+            if delay > 0.0:
+                self.sleep(delay)
+
+    def time(self) -> float:
+        return self.now_ns / 1e9
+
+    def elapsed(self) -> float:
+        if self._start_ns is None:
+            return 0.0
+        return (self.now_ns - self._start_ns) / 1e9